@@ -0,0 +1,1702 @@
+"""
+Benchmarks Module
+Timing and parity checks for the faster code paths against the reference implementations
+Run with: python benchmarks.py
+"""
+
+import math
+import os
+import pickle
+import time
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# portfolios must be imported before new12 to resolve the new12 <-> inputs circular import
+from portfolios import Portfolio, MultiTickerPortfolio
+import new12
+from engine import execute_trading_strategy_arrays, execute_trading_strategy_auto
+from market_data import LocalFileProvider, MarketDataCache, market_data_cache, utc_now
+from inputs import download_and_prepare_data, download_tickers
+import ta_strategies_combinations_TVLibrary as strategy_combinations
+import ta_strategies_TVLibrary as strategy_library
+from ta_strategies_TVLibrary import (
+    FibonacciWeightedMovingAverageStrategies, PascalsWeightedMovingAverageStrategies,
+    SymmetricWeightedMovingAverageStrategies, WeightedMovingAverageStrategies, SineWeightedMovingAverageStrategies,
+    DoubleExponentialMovingAverageStrategies, EhlersSuperSmootherFilterStrategies, WildersMovingAverageStrategies,
+    GannHighLowActivatorStrategies, KDJIndicatorStrategies, MovingStandardDeviationStrategies,
+    LinearRegressionStrategies, LinearRegressionAngleStrategies, LinearRegressionInterceptStrategies,
+    LinearRegressionSlopeStrategies, SlopeStrategies, VolumeProfileStrategies, AberrationStrategies
+)
+import kernels
+import primitives
+import streaming
+from signal_expressions import ExpressionEvaluator, parse_expression, compile_conditions, expression_comparisons
+from packed_signals import PackedSignal
+
+
+def make_synthetic_ohlcv(n_bars=5000, seed=42, start_price=100.0):
+    """Build a random-walk OHLCV frame shaped like download_and_prepare_data output"""
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0002, 0.01, n_bars)
+    close = start_price * np.exp(np.cumsum(returns))
+    open_ = np.concatenate(([start_price], close[:-1]))
+    spread = np.abs(rng.normal(0, 0.005, n_bars)) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    volume = rng.integers(1_000, 100_000, n_bars).astype(float)
+    dates = pd.date_range('2020-01-01', periods=n_bars, freq='h')
+    return pd.DataFrame({
+        'Datetime': dates,
+        'Open': open_,
+        'High': high,
+        'Low': low,
+        'Close': close,
+        'Volume': volume,
+        'Date': dates.date
+    })
+
+
+def add_crossover_signals(data, fast=10, slow=30):
+    """Attach SMA crossover Entry_Signal / Exit_Signal columns"""
+    fast_sma = data['Close'].rolling(window=fast).mean()
+    slow_sma = data['Close'].rolling(window=slow).mean()
+    data['Entry_Signal'] = (fast_sma.shift(1) < slow_sma.shift(1)) & (fast_sma > slow_sma)
+    data['Exit_Signal'] = (fast_sma.shift(1) > slow_sma.shift(1)) & (fast_sma < slow_sma)
+    return data
+
+
+def make_portfolio(stop_loss=None, take_profit=None, trailing_stop=None, trade_size=100):
+    """Portfolio with optional percentage risk orders"""
+    portfolio = Portfolio(10000, trade_size_percentage=trade_size)
+    if stop_loss is not None:
+        portfolio.set_stop_loss(percentage=stop_loss)
+    if take_profit is not None:
+        portfolio.set_take_profit(percentage=take_profit)
+    if trailing_stop is not None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            portfolio.set_trailing_stop(percentage=trailing_stop)
+    return portfolio
+
+
+def timed(func, *args, **kwargs):
+    """Run func with stdout silenced and return (result, seconds)"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def assert_same_tracking(expected, actual):
+    """Check two executed frames carry identical tracking columns"""
+    for column in ['Position', 'Action', 'Reason', 'Position_Type']:
+        if list(expected[column].astype(object)) != list(actual[column].astype(object)):
+            raise AssertionError(f"Column {column} differs between engines")
+    for column in ['Portfolio_Value', 'Cash', 'Shares', 'Long_Shares', 'Short_Shares']:
+        np.testing.assert_allclose(expected[column].to_numpy(dtype=float),
+                                   actual[column].to_numpy(dtype=float), rtol=0, atol=0,
+                                   err_msg=f"Column {column} differs between engines")
+
+
+def benchmark_execution_engines(n_bars=5000):
+    """Compare the data.loc loop engines with the array-backed engine"""
+    base = add_crossover_signals(make_synthetic_ohlcv(n_bars))
+    cases = [
+        ("Long Only", {}),
+        ("Long Only", {'stop_loss': 2.0, 'take_profit': 4.0, 'trailing_stop': 3.0}),
+        ("Short Only", {}),
+        ("Short Only", {'stop_loss': 2.0, 'take_profit': 4.0}),
+        ("Long/Short Reversal", {}),
+        ("Long/Short Reversal", {'stop_loss': 2.0, 'take_profit': 4.0}),
+    ]
+    print(f"\nEXECUTION ENGINES ({n_bars} bars)")
+    print(f"{'Direction':<22} {'Risk':<6} {'Loop (s)':>10} {'Array (s)':>10} {'Speedup':>9}")
+    for direction, risk in cases:
+        loop_portfolio = make_portfolio(**risk)
+        array_portfolio = make_portfolio(**risk)
+        if direction == "Long/Short Reversal":
+            loop_data, loop_time = timed(new12.execute_trading_strategy, base.copy(), loop_portfolio)
+        else:
+            loop_data, loop_time = timed(new12.execute_trading_strategy_original, base.copy(), loop_portfolio, direction)
+        array_data, array_time = timed(execute_trading_strategy_arrays, base.copy(), array_portfolio, direction)
+
+        assert_same_tracking(loop_data, array_data)
+        if loop_portfolio.trades != array_portfolio.trades:
+            raise AssertionError(f"Trade ledgers differ for {direction}")
+        print(f"{direction:<22} {'yes' if risk else 'no':<6} {loop_time:>10.3f} {array_time:>10.3f} {loop_time / array_time:>8.1f}x")
+
+
+def benchmark_vectorized_path(n_bars=200000):
+    """Compare the array bar loop with the vectorized Long Only / Short Only fast path"""
+    base = add_crossover_signals(make_synthetic_ohlcv(n_bars))
+    print(f"\nVECTORIZED FAST PATH ({n_bars} bars)")
+    print(f"{'Direction':<12} {'Trade %':>8} {'Path':<11} {'Array (s)':>10} {'Auto (s)':>10} {'Speedup':>9}")
+    for direction in ["Long Only", "Short Only"]:
+        for trade_size in [100, 25]:
+            loop_portfolio = make_portfolio(trade_size=trade_size)
+            fast_portfolio = make_portfolio(trade_size=trade_size)
+            loop_data, loop_time = timed(execute_trading_strategy_arrays, base.copy(), loop_portfolio, direction)
+            fast_data, fast_time = timed(execute_trading_strategy_auto, base.copy(), fast_portfolio, direction)
+
+            assert_same_tracking(loop_data, fast_data)
+            if loop_portfolio.trades != fast_portfolio.trades:
+                raise AssertionError(f"Trade ledgers differ for {direction}")
+            path = fast_data.attrs['execution_path']
+            print(f"{direction:<12} {trade_size:>8} {path:<11} {loop_time:>10.3f} {fast_time:>10.3f} {loop_time / fast_time:>8.1f}x")
+
+
+def make_crossover_configs(fast_periods, slow_periods, indicators=("SMA", "EMA")):
+    """strategy_config dicts for every fast/slow moving average crossover pair"""
+    configs = []
+    for indicator in indicators:
+        for fast in fast_periods:
+            for slow in slow_periods:
+                if fast >= slow:
+                    continue
+                fast_side = ('INDICATOR', indicator, (fast,), 0)
+                slow_side = ('INDICATOR', indicator, (slow,), 0)
+                config = {}
+                for prefix, strategy in (('entry', 'CROSSED UP'), ('exit', 'CROSSED DOWN')):
+                    for slot, (comp_type, name, params, ago) in (('comp1', fast_side), ('comp2', slow_side)):
+                        config[f'{prefix}_{slot}_type'] = comp_type
+                        config[f'{prefix}_{slot}_name'] = name
+                        config[f'{prefix}_{slot}_params'] = params
+                        config[f'{prefix}_{slot}_candles_ago'] = ago
+                    config[f'{prefix}_strategy'] = strategy
+                configs.append(config)
+    return configs
+
+
+def run_single_config(data, config, direction, trade_size):
+    """Reference result for one config through detect_strategy_signals and the array engine"""
+    portfolio = Portfolio(10000, trade_size_percentage=trade_size)
+    data, *_ = new12.detect_strategy_signals(
+        data.copy(),
+        config['entry_comp1_type'], config['entry_comp1_name'], config['entry_comp1_params'],
+        config['entry_comp2_type'], config['entry_comp2_name'], config['entry_comp2_params'],
+        config['exit_comp1_type'], config['exit_comp1_name'], config['exit_comp1_params'],
+        config['exit_comp2_type'], config['exit_comp2_name'], config['exit_comp2_params'],
+        config['entry_strategy'], config['exit_strategy'],
+        config['entry_comp1_candles_ago'], config['entry_comp2_candles_ago'],
+        config['exit_comp1_candles_ago'], config['exit_comp2_candles_ago'])
+    data = execute_trading_strategy_arrays(data, portfolio, direction)
+    return data['Portfolio_Value'].iloc[-1], len(portfolio.trades)
+
+
+def benchmark_batch_backtest(n_bars=5000, sample_size=12):
+    """Run ~1,000 SMA/EMA crossover variants in one batch and spot-check against single runs"""
+    data = make_synthetic_ohlcv(n_bars)
+    configs = make_crossover_configs(range(2, 32), range(10, 60, 2))
+    directions = ["Long Only", "Short Only", "Long/Short Reversal"]
+    trade_sizes = [100, 25]
+    rng = np.random.default_rng(0)
+    for row, config in enumerate(configs):
+        config['strategy_direction'] = directions[row % 3]
+        config['trade_size_percentage'] = trade_sizes[(row // 3) % 2]
+
+    summary, batch_time = timed(new12.run_batch_backtest, data, configs)
+
+    sample = rng.choice(len(configs), size=sample_size, replace=False)
+    single_time = 0.0
+    for row in sample:
+        config = configs[row]
+        (value, trades), elapsed = timed(run_single_config, data, config,
+                                         config['strategy_direction'], config['trade_size_percentage'])
+        single_time += elapsed
+        if value != summary['current_value'].iloc[row] or trades != summary['total_trades'].iloc[row]:
+            raise AssertionError(f"Batch result differs from single run for config {row}: {summary.iloc[row].to_dict()}")
+
+    per_config = single_time / sample_size
+    print(f"\nBATCH BACKTEST ({len(configs)} configs x {n_bars} bars)")
+    print(f"Batch: {batch_time:.2f}s | Single runs (array engine, estimated): {per_config * len(configs):.2f}s "
+          f"| Speedup: {per_config * len(configs) / batch_time:.1f}x")
+    print(summary.sort_values('return_pct', ascending=False).head(5).to_string(index=False))
+
+
+def benchmark_indicator_cache(n_bars=20000, repeats=5):
+    """Repeated indicator requests with and without the calculate_indicator cache"""
+    data = make_synthetic_ohlcv(n_bars)
+    requests = [("RSI", (14, 70, 30)), ("KAMA", (10, 2, 30, 0.01)), ("HULL_MA", (14, 0.01)), ("SMA", (50,))]
+
+    new12.indicator_cache.disable()
+    uncached, uncached_time = timed(lambda: [new12.calculate_indicator(data, name, params)
+                                             for _ in range(repeats) for name, params in requests])
+    new12.indicator_cache.enable()
+    new12.indicator_cache.clear()
+    cached, cached_time = timed(lambda: [new12.calculate_indicator(data, name, params)
+                                         for _ in range(repeats) for name, params in requests])
+
+    for expected, actual in zip(uncached, cached):
+        pd.testing.assert_series_equal(expected, actual)
+    stats = new12.indicator_cache.stats()
+    print(f"\nINDICATOR CACHE ({n_bars} bars, {len(requests)} indicators x {repeats} requests)")
+    print(f"Uncached: {uncached_time:.3f}s | Cached: {cached_time:.3f}s | Speedup: {uncached_time / cached_time:.1f}x")
+    print(f"Hits: {stats['hits']} | Misses: {stats['misses']} | Entries: {stats['entries']} | Bytes: {stats['bytes']:,}")
+
+
+def benchmark_market_data_cache(n_bars=20000):
+    """Cold fetch, disk hit and tail append through MarketDataCache with a local file provider"""
+    history = make_synthetic_ohlcv(n_bars).set_index('Datetime').drop(columns='Date')
+    history.index = history.index.tz_localize('UTC')
+    clock_state = {'now': history.index[n_bars // 2]}
+    clock = lambda: clock_state['now']
+
+    with tempfile.TemporaryDirectory() as directory:
+        history.to_csv(f"{directory}/SYN_1h.csv")
+        provider = LocalFileProvider(directory, clock=clock)
+        cache = MarketDataCache(f"{directory}/cache", provider, clock=clock)
+
+        _, cold_time = timed(cache.get_history, 'SYN', '1y', '1h')
+        _, warm_time = timed(cache.get_history, 'SYN', '1y', '1h')
+        clock_state['now'] = history.index[-1]
+        appended, tail_time = timed(cache.get_history, 'SYN', '1y', '1h')
+
+        pd.testing.assert_frame_equal(appended, provider.fetch('SYN', '1h', period='1y'))
+
+        # A plain hit leaves the index file alone (save_index replaces it, giving a new inode)
+        index_inode = os.stat(cache.index_path()).st_ino
+        cache.get_history('SYN', '1y', '1h')
+        if os.stat(cache.index_path()).st_ino != index_inode:
+            raise AssertionError("A disk hit rewrote the cache index")
+
+        # An empty tail still counts as a refresh: the next call inside the interval fetches nothing
+        class EmptyTail:
+            fetch_count = 0
+
+            def fetch(self, ticker, interval, period=None, start=None):
+                self.fetch_count += 1
+                return pd.DataFrame()
+
+        class FailingTail:
+            def fetch(self, ticker, interval, period=None, start=None):
+                raise ConnectionError("offline")
+
+        cache.provider = EmptyTail()
+        clock_state['now'] += pd.Timedelta(hours=2)
+        pd.testing.assert_frame_equal(provider.fetch('SYN', '1h', period='1y'), cache.get_history('SYN', '1y', '1h'))
+        cache.get_history('SYN', '1y', '1h')
+        if cache.provider.fetch_count != 1 or cache.load_index()['SYN|1h']['fetched_at'] != str(clock_state['now']):
+            raise AssertionError("An empty tail fetch did not advance fetched_at")
+
+        # A failed tail serves the cached bars, is counted and is retried on the next call
+        cache.provider = FailingTail()
+        clock_state['now'] += pd.Timedelta(hours=2)
+        with contextlib.redirect_stdout(io.StringIO()):
+            pd.testing.assert_frame_equal(provider.fetch('SYN', '1h', period='1y'), cache.get_history('SYN', '1y', '1h'))
+        cache.provider = EmptyTail()
+        cache.get_history('SYN', '1y', '1h')
+        if cache.provider.fetch_count != 1:
+            raise AssertionError("A failed tail fetch was not retried")
+        stats = cache.stats()
+    print(f"\nMARKET DATA CACHE ({n_bars} hourly bars)")
+    print(f"Cold fetch: {cold_time:.3f}s | Disk hit: {warm_time:.3f}s | Tail append: {tail_time:.3f}s")
+    print(f"Hits: {stats['hits']} | Tail fetches: {stats['tail_fetches']} | Full fetches: {stats['full_fetches']} | "
+          f"Failed refreshes: {stats['failed_refreshes']}")
+
+
+def benchmark_concurrent_download(n_tickers=10, latency=0.25, max_workers=8):
+    """Serial vs bounded-pool download of several tickers through a slow local provider"""
+    tickers = [f"SYN{i}" for i in range(n_tickers)]
+    saved = (market_data_cache.cache_dir, market_data_cache.provider)
+    with tempfile.TemporaryDirectory() as directory:
+        for seed, ticker in enumerate(tickers):
+            history = make_synthetic_ohlcv(2000, seed=seed).set_index('Datetime').drop(columns='Date')
+            history.index = history.index.tz_localize('UTC')
+            history.to_csv(f"{directory}/{ticker}_1h.csv")
+        last_bar = history.index[-1]
+        market_data_cache.provider = LocalFileProvider(directory, clock=lambda: last_bar, latency=latency)
+        market_data_cache.clock = lambda: last_bar
+        try:
+            market_data_cache.cache_dir = f"{directory}/serial"
+            serial, serial_time = timed(lambda: {ticker: download_and_prepare_data(ticker, '60d', '1h')
+                                                 for ticker in tickers})
+            market_data_cache.cache_dir = f"{directory}/pooled"
+            (pooled, report), pooled_time = timed(download_tickers, tickers + ['MISSING'], '60d', '1h',
+                                                  max_workers=max_workers)
+        finally:
+            market_data_cache.cache_dir, market_data_cache.provider = saved
+            market_data_cache.clock = utc_now
+
+    for ticker in tickers:
+        pd.testing.assert_frame_equal(serial[ticker], pooled[ticker])
+    if report['MISSING']['error'] is None or 'MISSING' in pooled:
+        raise AssertionError("Missing ticker should be reported as a failure")
+    print(f"\nCONCURRENT DOWNLOAD ({n_tickers} tickers, {latency:.2f}s simulated latency, {max_workers} workers)")
+    print(f"Serial: {serial_time:.2f}s | Pooled: {pooled_time:.2f}s | Speedup: {serial_time / pooled_time:.1f}x")
+    print(f"Failures reported: {[ticker for ticker, entry in report.items() if entry['error']]}")
+
+
+def benchmark_parallel_tickers(n_tickers=4, n_bars=3000, workers=4, engine="loop"):
+    """Serial vs process-pool MultiTickerPortfolio backtests with ledger / performance parity"""
+    tickers = [f"SYN{i}" for i in range(n_tickers)]
+    config = make_crossover_configs([10], [30], ["SMA"])[0]
+    config['strategy_direction'] = "Long/Short Reversal"
+    allocations = {ticker: 100 / n_tickers for ticker in tickers}
+    reversal_executor, directional_executor = new12.select_execution_engine(engine)
+
+    def build():
+        portfolio = MultiTickerPortfolio(100000, allocations)
+        for seed, ticker in enumerate(tickers):
+            portfolio.ticker_data[ticker] = make_synthetic_ohlcv(n_bars, seed=seed)
+        return portfolio
+
+    serial = build()
+    _, serial_time = timed(lambda: [serial.run_strategy_on_ticker(ticker, '1y', '1h', config, new12.detect_strategy_signals,
+                                                                  reversal_executor, directional_executor)
+                                    for ticker in tickers])
+    parallel = build()
+    _, parallel_time = timed(parallel.run_strategies_parallel, tickers, '1y', '1h', config, new12.detect_strategy_signals,
+                             reversal_executor, directional_executor, max_workers=workers)
+
+    for ticker in tickers:
+        if serial.portfolios[ticker].trades != parallel.portfolios[ticker].trades:
+            raise AssertionError(f"Trade ledgers differ for {ticker}")
+        if serial.ticker_performance[ticker] != parallel.ticker_performance[ticker]:
+            raise AssertionError(f"Performance differs for {ticker}")
+        pd.testing.assert_frame_equal(serial.ticker_data[ticker], parallel.ticker_data[ticker])
+    if list(serial.portfolios) != list(parallel.portfolios):
+        raise AssertionError("Ticker order differs between serial and parallel runs")
+    print(f"\nPARALLEL TICKERS ({n_tickers} tickers x {n_bars} bars, engine={engine}, {workers} workers)")
+    print(f"Serial: {serial_time:.2f}s | Process pool: {parallel_time:.2f}s | Speedup: {serial_time / parallel_time:.1f}x")
+
+
+def benchmark_all_strategies(n_bars=1500, workers=4):
+    """Serial vs thread vs process-pool AllStrategies with column-order and value parity"""
+    data = make_synthetic_ohlcv(n_bars)
+    # Several strategy classes fail on synthetic data; their errors are not what this measures
+    logging.getLogger(strategy_combinations.__name__).setLevel(logging.CRITICAL)
+    reference = strategy_combinations.AllStrategies()
+
+    def run_serial():
+        results = [strategy_combinations._run_single_strategy(item, data.copy(), True, False, True, False, False)[1]
+                   for item in reference.strategy_instances.items()]
+        return pd.concat([result for result in results if not result.empty], axis=1)
+
+    serial, serial_time = timed(run_serial)
+    print(f"\nALL STRATEGIES ({len(reference.strategy_instances)} classes x {n_bars} bars, {workers} workers)")
+    print(f"Serial: {serial_time:.2f}s")
+    for mode in strategy_combinations.EXECUTION_MODES:
+        frame = data.copy()
+        combined, elapsed = timed(strategy_combinations.AllStrategies(max_workers=workers, mode=mode).run_all_strategies, frame)
+        if list(combined.columns) != list(serial.columns):
+            raise AssertionError(f"{mode} mode column order differs from the serial run")
+        pd.testing.assert_frame_equal(serial, combined)
+        if not frame.columns[:len(data.columns)].equals(data.columns) or frame.shape[1] <= data.shape[1]:
+            raise AssertionError(f"{mode} mode did not append result columns to the input frame")
+        print(f"{mode.capitalize()} pool: {elapsed:.2f}s | Speedup: {serial_time / elapsed:.1f}x")
+
+
+"""THE FIR MOVING AVERAGES USED TO LOOP IN PYTHON OVER EVERY WINDOW. THE LOOPS BELOW ARE THE OLD
+IMPLEMENTATIONS KEPT AS REFERENCES; THE LIBRARY VERSIONS MUST MATCH THEM BIT FOR BIT (SINE WITHIN
+FLOATING-POINT TOLERANCE, SINCE ITS FULL WINDOWS USED np.dot) INCLUDING THE PARTIAL-WINDOW WARM-UP"""
+
+def legacy_fibonacci_wma(df, period):
+    """Original FibonacciWeightedMovingAverageStrategies.compute_values loop"""
+    prices = df['Close']
+    fib_sequence = []
+    for i in range(period):
+        fib_sequence.append(1 if i < 2 else fib_sequence[-1] + fib_sequence[-2])
+    total_weight = sum(fib_sequence)
+    fwma_list = [np.nan] * (period - 1)
+    for i in range(period - 1, len(prices)):
+        window = prices.iloc[i - period + 1:i + 1].tolist()
+        fwma_list.append(sum(fib_sequence[j] * window[j] for j in range(period)) / total_weight)
+    return pd.Series(fwma_list, index=df.index)
+
+
+def legacy_pascals_wma(df, period):
+    """Original PascalsWeightedMovingAverageStrategies.compute_values loop"""
+    values = []
+    for i in range(len(df)):
+        window = df['Close'].iloc[:i + 1] if i < period - 1 else df['Close'].iloc[i - period + 1:i + 1]
+        n = len(window)
+        weights = [math.comb(n - 1, k) for k in range(n)]
+        values.append(sum(w * p for w, p in zip(weights, window)) / sum(weights))
+    return pd.Series(values, index=df.index)
+
+
+def legacy_symmetric_wma(df, period):
+    """Original SymmetricWeightedMovingAverageStrategies.compute_values loop"""
+    weights = SymmetricWeightedMovingAverageStrategies(period=period).compute_weights()
+    price_series = df['Close']
+    swma_list = []
+    for i in range(len(price_series)):
+        if i < period - 1:
+            swma_list.append(None)
+        else:
+            window = price_series.iloc[i - period + 1:i + 1]
+            swma_list.append(sum(w * price for w, price in zip(weights, window)) / sum(weights))
+    return pd.Series(swma_list, index=df.index)
+
+
+def legacy_wma(df, period):
+    """Original WeightedMovingAverageStrategies.compute_values rolling apply"""
+    w = list(range(1, period + 1))
+    return df['Close'].rolling(window=period, min_periods=1).apply(
+        lambda series: sum(series[i] * w[i] for i in range(len(series))) / sum(w), raw=True)
+
+
+def legacy_sine_wma(df, period):
+    """Original SineWeightedMovingAverageStrategies.compute_values rolling apply"""
+    full_weights = np.sin(np.arange(1, period + 1) * np.pi / (period + 1))
+    swma = df['Close'].rolling(window=period, min_periods=1).apply(
+        lambda x: np.dot(x, full_weights[-len(x):]) / np.sum(full_weights[-len(x):]), raw=True)
+    return pd.Series(swma, index=df.index)
+
+
+def benchmark_fir_moving_averages(n_bars=20000, periods=(1, 2, 5, 10, 14, 30)):
+    """Convolution-style FIR moving averages vs the original per-window loops"""
+    cases = [
+        ("FWMA", legacy_fibonacci_wma, lambda p: FibonacciWeightedMovingAverageStrategies(period=p), True),
+        ("PWMA", legacy_pascals_wma, lambda p: PascalsWeightedMovingAverageStrategies(period=p), True),
+        ("SYMWMA", legacy_symmetric_wma, lambda p: SymmetricWeightedMovingAverageStrategies(period=p), True),
+        ("WMA", legacy_wma, lambda p: WeightedMovingAverageStrategies(period=p), True),
+        ("SINEWMA", legacy_sine_wma, lambda p: SineWeightedMovingAverageStrategies(period=p), False)
+    ]
+    short = make_synthetic_ohlcv(25)
+    data = make_synthetic_ohlcv(n_bars)
+    print(f"\nFIR MOVING AVERAGES ({n_bars} bars, period {periods[-2]} timed)")
+    for label, legacy, build, exact in cases:
+        # Parity across warm-up-only frames (shorter than the period) and full-length frames
+        for frame in (short, short.head(3), data.head(2000)):
+            for period in periods:
+                try:
+                    expected = legacy(frame, period)
+                except ValueError:
+                    # The old Fibonacci loop could not build a frame shorter than its period
+                    continue
+                actual = build(period).compute_values(frame)
+                if exact:
+                    np.testing.assert_array_equal(expected.to_numpy(dtype=float), actual.to_numpy())
+                else:
+                    np.testing.assert_allclose(expected.to_numpy(dtype=float), actual.to_numpy(), rtol=1e-12)
+        period = periods[-2]
+        _, legacy_time = timed(legacy, data, period)
+        _, fast_time = timed(build(period).compute_values, data)
+        print(f"{label:<8} Loop: {legacy_time:.3f}s | Vectorized: {fast_time:.4f}s | "
+              f"Speedup: {legacy_time / fast_time:.0f}x | {'bit-exact' if exact else 'rtol 1e-12'}")
+
+
+def legacy_dema(df, period):
+    """Original DoubleExponentialMovingAverageStrategies EMA loop applied twice"""
+    def compute_ema(values):
+        alpha = 2 / (period + 1)
+        ema = np.empty(len(values))
+        ema[0] = values[0]
+        for i in range(1, len(values)):
+            ema[i] = alpha * values[i] + (1 - alpha) * ema[i - 1]
+        return ema
+    ema1 = compute_ema(df['Close'].values.astype(float))
+    return pd.Series(2 * ema1 - compute_ema(ema1), index=df.index)
+
+
+def legacy_super_smoother(df, period):
+    """Original EhlersSuperSmootherFilterStrategies.compute_values loop"""
+    prices = df['Close'].values.astype(float)
+    result = np.empty(len(prices))
+    a = np.exp(-1.414 * np.pi / period)
+    c2 = 2 * a * np.cos(1.414 * np.pi / period)
+    c3 = -a * a
+    c1 = 1 - c2 - c3
+    result[0] = prices[0]
+    if len(prices) > 1:
+        result[1] = prices[1]
+    for i in range(2, len(prices)):
+        result[i] = c1 * (prices[i] + prices[i-1]) / 2 + c2 * result[i-1] + c3 * result[i-2]
+    return pd.Series(result, index=df.index)
+
+
+def legacy_wilders(df, period):
+    """Original WildersMovingAverageStrategies.compute_values loop"""
+    close = df['Close']
+    wma = pd.Series(index=close.index, dtype=float)
+    for i in range(len(close)):
+        if i < period:
+            wma.iloc[i] = close.iloc[:i+1].mean()
+        else:
+            wma.iloc[i] = (wma.iloc[i-1]*(period - 1) + close.iloc[i]) / period
+    return wma
+
+
+def legacy_gann_activator(df, period=None):
+    """Original GannHighLowActivatorStrategies.compute_values loop"""
+    activator = []
+    for i in range(len(df)):
+        if i == 0:
+            activator.append(df['Close'].iloc[i])
+        elif df['Close'].iloc[i] > activator[i - 1]:
+            activator.append(min(df['Low'].iloc[i], activator[i - 1]))
+        elif df['Close'].iloc[i] < activator[i - 1]:
+            activator.append(max(df['High'].iloc[i], activator[i - 1]))
+        else:
+            activator.append(activator[i - 1])
+    return pd.Series(activator, index=df.index)
+
+
+def legacy_kdj(df, period):
+    """Original KDJIndicatorStrategies.compute_values loop (returns J, which depends on K and D)"""
+    j_values = []
+    k_prev = d_prev = 50
+    for i in range(len(df)):
+        window_start = max(0, i - period + 1)
+        high_max = df['High'].iloc[window_start:i+1].max()
+        low_min = df['Low'].iloc[window_start:i+1].min()
+        rsv = 0 if high_max == low_min else (df['Close'].iloc[i] - low_min) / (high_max - low_min) * 100
+        k_prev = (2/3)*k_prev + (1/3)*rsv
+        d_prev = (2/3)*d_prev + (1/3)*k_prev
+        j_values.append(3*k_prev - 2*d_prev)
+    return pd.Series(j_values, index=df.index)
+
+
+def benchmark_recursive_filters(n_bars=20000, periods=(1, 2, 9, 14, 30)):
+    """Shared recursive-filter kernels vs the original per-bar loops"""
+    cases = [
+        ("DEMA", legacy_dema, lambda frame, p: DoubleExponentialMovingAverageStrategies(period=p).compute_values(frame)),
+        ("SUPERSM", legacy_super_smoother, lambda frame, p: EhlersSuperSmootherFilterStrategies(period=p).compute_values(frame)),
+        ("WILDERS", legacy_wilders, lambda frame, p: WildersMovingAverageStrategies(period=p).compute_values(frame)),
+        ("GANNHLA", legacy_gann_activator, lambda frame, p: GannHighLowActivatorStrategies().compute_values(frame)),
+        ("KDJ", legacy_kdj, lambda frame, p: KDJIndicatorStrategies(period=p).compute_values(frame)[2])
+    ]
+    # The scipy lfilter backend reorders the arithmetic; numba and the loop fallback reproduce it exactly
+    exact = kernels.FILTER_BACKEND != 'scipy'
+    data = make_synthetic_ohlcv(n_bars)
+    with_gaps = make_synthetic_ohlcv(300, seed=7)
+    with_gaps.loc[[0, 5, 100], 'Close'] = np.nan
+    print(f"\nRECURSIVE FILTERS ({n_bars} bars, backend={kernels.FILTER_BACKEND}, period 14 timed)")
+    for label, legacy, build in cases:
+        for frame in (data.head(3), data.head(5), data.head(8), data.head(20), data.head(2000), with_gaps):
+            for period in periods:
+                expected, actual = legacy(frame, period).to_numpy(dtype=float), build(frame, period).to_numpy(dtype=float)
+                if exact:
+                    np.testing.assert_array_equal(expected, actual)
+                else:
+                    np.testing.assert_allclose(expected, actual, rtol=1e-9, equal_nan=True)
+        _, legacy_time = timed(legacy, data, 14)
+        _, fast_time = timed(build, data, 14)
+        print(f"{label:<8} Loop: {legacy_time:.3f}s | Kernel: {fast_time:.4f}s | Speedup: {legacy_time / fast_time:.0f}x")
+
+    # The generic IIR kernel must agree with the dedicated first-order one
+    x = data['Close'].to_numpy()
+    np.testing.assert_allclose(kernels.iir_filter([1/3], [1.0, -2/3], x, y_history=[50.0]),
+                               kernels.exponential_filter(x, 1/3, 2/3, initial=50), rtol=1e-12)
+
+
+def legacy_moving_std(df, period):
+    """Original MovingStandardDeviationStrategies.compute_values loop"""
+    prices = df['Close'].tolist()
+    std_values = []
+    for i in range(len(prices)):
+        window = prices[:i + 1] if i < period - 1 else prices[i - period + 1:i + 1]
+        mean_val = sum(window) / len(window)
+        std_values.append((sum((x - mean_val) ** 2 for x in window) / len(window)) ** 0.5)
+    return pd.Series(std_values, index=df.index)
+
+
+def legacy_regression(output):
+    """Original LinearRegression* rolling apply, returning the 'line', 'angle', 'intercept' or 'slope' output"""
+    def regression(y):
+        n = len(y)
+        x = np.arange(n)
+        denom = n * np.sum(x**2) - (np.sum(x))**2
+        slope = (n * np.dot(x, y) - np.sum(x) * np.sum(y)) / denom if denom != 0 else 0
+        intercept = (np.sum(y) - slope * np.sum(x)) / n
+        return {'line': intercept + slope * (n - 1), 'angle': np.degrees(np.arctan(slope)),
+                'intercept': intercept, 'slope': slope}[output]
+    return lambda df, period: df['Close'].rolling(window=period, min_periods=period).apply(regression, raw=True)
+
+
+def legacy_slope(df, period):
+    """Original SlopeStrategies.compute_values rolling apply (partial windows from the first bar)"""
+    def linreg_slope(arr):
+        n = len(arr)
+        x = np.arange(n)
+        denominator = n * (x * x).sum() - x.sum() ** 2
+        return 0 if denominator == 0 else (n * (x * arr).sum() - x.sum() * arr.sum()) / denominator
+    return df['Close'].rolling(window=period, min_periods=1).apply(linreg_slope, raw=True)
+
+
+def benchmark_rolling_kernels(n_bars=20000, large_bars=500000, periods=(1, 2, 9, 14, 30)):
+    """O(n) rolling min/max, std and least-squares kernels vs the original per-window code"""
+    cases = [
+        ("KDJ", legacy_kdj, lambda frame, p: KDJIndicatorStrategies(period=p).compute_values(frame)[2], 0),
+        ("MSTD", legacy_moving_std, lambda frame, p: MovingStandardDeviationStrategies(period=p).compute_values(frame), 1e-12),
+        ("LINREG", legacy_regression('line'), lambda frame, p: LinearRegressionStrategies(period=p).compute_values(frame), 1e-9),
+        ("LRANGLE", legacy_regression('angle'), lambda frame, p: LinearRegressionAngleStrategies(period=p).compute_values(frame), 1e-9),
+        ("LRINTCPT", legacy_regression('intercept'), lambda frame, p: LinearRegressionInterceptStrategies(period=p).compute_values(frame), 1e-9),
+        ("LRSLOPE", legacy_regression('slope'), lambda frame, p: LinearRegressionSlopeStrategies(period=p).compute_values(frame), 1e-9),
+        ("SLOPE", legacy_slope, lambda frame, p: SlopeStrategies(period=p).compute_values(frame), 1e-9)
+    ]
+    data = make_synthetic_ohlcv(n_bars)
+    large = make_synthetic_ohlcv(large_bars)
+    with_gaps = make_synthetic_ohlcv(300, seed=7)
+    with_gaps.loc[[0, 5, 100, 101], ['Close', 'High', 'Low']] = np.nan
+    print(f"\nROLLING KERNELS (loop timed on {n_bars} bars, kernel on {large_bars} bars, period 14)")
+    for label, legacy, build, tolerance in cases:
+        for frame in (data.head(3), data.head(2000), with_gaps):
+            for period in periods:
+                expected, actual = legacy(frame, period).to_numpy(dtype=float), build(frame, period).to_numpy(dtype=float)
+                if tolerance:
+                    # Slopes are small differences of large sums, so compare against the price scale
+                    np.testing.assert_allclose(expected, actual, rtol=tolerance, atol=tolerance * 100, equal_nan=True)
+                else:
+                    np.testing.assert_array_equal(expected, actual)
+        _, legacy_time = timed(legacy, data, 14)
+        _, fast_time = timed(build, large, 14)
+        per_bar_speedup = (legacy_time / n_bars) / (fast_time / large_bars)
+        print(f"{label:<8} Loop: {legacy_time:.3f}s | Kernel: {fast_time * 1000:.1f}ms | Per-bar speedup: {per_bar_speedup:.0f}x")
+
+    # Deque (numba) and block (numpy) rolling max must agree with each other and with pandas
+    values = with_gaps['High'].to_numpy()
+    for period in periods:
+        expected = with_gaps['High'].rolling(period, min_periods=1).max().to_numpy()
+        queue = np.zeros(len(values), dtype=np.int64)
+        np.testing.assert_array_equal(expected, kernels.rolling_max(values, period, backend='numpy'))
+        np.testing.assert_array_equal(expected, kernels.run_loop(kernels._rolling_max_loop, None, 'numpy', len(values),
+                                                                 values, period, queue))
+        # Frames shorter than the window, including those between half the period and the period
+        for length in range(1, 2 * period + 2):
+            head = with_gaps['High'].iloc[:length]
+            np.testing.assert_array_equal(head.rolling(period, min_periods=1).max().to_numpy(),
+                                          kernels.rolling_max(head.to_numpy(), period, backend='numpy'))
+            np.testing.assert_array_equal(head.rolling(period, min_periods=1).min().to_numpy(),
+                                          kernels.rolling_min(head.to_numpy(), period, backend='numpy'))
+
+
+def legacy_rolling_poc(df, period, bin_size=1):
+    """Original VolumeProfileStrategies.compute_rolling_poc (groupby per window)"""
+    rolling_poc = []
+    for i in range(len(df)):
+        if i < period - 1:
+            rolling_poc.append(np.nan)
+        else:
+            window_df = df.iloc[i - period + 1:i + 1]
+            bins = np.floor(window_df['Close'] / bin_size) * bin_size
+            profile = pd.DataFrame({'PriceBin': bins, 'Volume': window_df['Volume']}).groupby('PriceBin')['Volume'].sum()
+            # The original raised on a window without any price; the kernel reports NaN there
+            rolling_poc.append(profile.sort_index().idxmax() if len(profile) else np.nan)
+    return pd.Series(rolling_poc, index=df.index)
+
+
+def benchmark_rolling_volume_profile(n_bars=5000, periods=(1, 3, 14, 50), bin_sizes=(0.25, 1, 5)):
+    """Sliding-accumulator rolling POC / value area vs a groupby per window"""
+    data = make_synthetic_ohlcv(n_bars)
+    # Whole-number volumes with many exact ties and zero-volume bars stress the tie-break and bin presence rules
+    data['Volume'] = np.random.default_rng(3).integers(0, 5, n_bars) * 1000.0
+    with_gaps = data.head(400).copy()
+    with_gaps.loc[[0, 20, 21, 22], 'Close'] = np.nan
+    with_gaps.loc[[7, 30], 'Volume'] = np.nan
+    for frame in (data.head(2000), with_gaps):
+        for period in periods:
+            for bin_size in bin_sizes:
+                expected = legacy_rolling_poc(frame, period, bin_size)
+                actual = VolumeProfileStrategies(period=period, bin_size=bin_size).compute_rolling_poc(frame)
+                pd.testing.assert_series_equal(expected, actual, check_names=False)
+
+    # Rolling value area must equal the whole-frame value area of every window on its own
+    period, bin_size = 14, 1
+    profile = kernels.rolling_volume_profile(data['Close'], data['Volume'], period, bin_size, value_area_percentage=0.7)
+    for end in range(period - 1, 1500, 7):
+        window = VolumeProfileStrategies(period=period, bin_size=bin_size)
+        window.compute_values(data.iloc[end - period + 1:end + 1])
+        if (window.poc, window.value_area_low, window.value_area_high) != (
+                profile['poc'][end], profile['value_area_low'][end], profile['value_area_high'][end]):
+            raise AssertionError(f"Rolling value area differs from the window profile at bar {end}")
+
+    _, legacy_time = timed(legacy_rolling_poc, data, period, bin_size)
+    _, fast_time = timed(VolumeProfileStrategies(period=period, bin_size=bin_size).compute_rolling_poc, data)
+    _, area_time = timed(kernels.rolling_volume_profile, data['Close'], data['Volume'], period, bin_size, 0.7)
+    print(f"\nROLLING VOLUME PROFILE ({n_bars} bars, period {period}, bin size {bin_size}, backend={kernels.FILTER_BACKEND})")
+    print(f"Groupby per bar: {legacy_time:.2f}s | Sliding POC: {fast_time * 1000:.1f}ms | "
+          f"Speedup: {legacy_time / fast_time:.0f}x | POC + value area: {area_time * 1000:.1f}ms")
+
+
+def benchmark_strategy_value_cache(n_bars=1000, workers=2):
+    """Shared AllStrategies across tickers: no stale values, unchanged templates, cached repeat runs"""
+    logging.getLogger(strategy_combinations.__name__).setLevel(logging.CRITICAL)
+    first, second = make_synthetic_ohlcv(n_bars, seed=1), make_synthetic_ohlcv(n_bars, seed=2)
+
+    # The old failure: an instance memoized on self and silently reused the first frame's values.
+    # Every library class run directly on a second frame must now match a fresh instance
+    classes = [cls for name, cls in vars(strategy_library).items()
+               if isinstance(cls, type) and name.endswith('Strategies') and cls.__module__ == strategy_library.__name__]
+    checked = 0
+    for cls in classes:
+        try:
+            expected = cls().run_all_strategies(second.copy(), append=False)
+        except Exception:
+            continue  # classes needing extra inputs (Benchmark column) or broken on this pandas version
+        shared = cls()
+        shared.run_all_strategies(first.copy(), append=False)
+        pd.testing.assert_frame_equal(expected, shared.run_all_strategies(second.copy(), append=False))
+        checked += 1
+
+    # An in-place edit of the same frame, a pickled copy and threads sharing one instance
+    shared, edited = AberrationStrategies(), first.copy()
+    shared.run_all_strategies(edited, append=False)
+    edited['Close'] *= 1.5
+    pd.testing.assert_frame_equal(AberrationStrategies().run_all_strategies(edited.copy(), append=False),
+                                  shared.run_all_strategies(edited, append=False))
+    if pickle.loads(pickle.dumps(shared)).aberration is not None:
+        raise AssertionError("A pickled strategy instance carries its memoized values")
+    frames = [first.copy(), second.copy()] * 4
+    expected = [AberrationStrategies().run_all_strategies(frame.copy(), append=False) for frame in frames]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda frame: shared.run_all_strategies(frame, append=False), frames))
+    for result, frame_expected in zip(results, expected):
+        pd.testing.assert_frame_equal(frame_expected, result)
+    print(f"\nSTRATEGY VALUE CACHE ({n_bars} bars, {workers} workers)")
+    print(f"Directly reused instances match fresh ones: {checked} classes, in-place edit, pickle, 4 threads")
+
+    strategy_combinations.strategy_value_cache.clear()
+    runner = strategy_combinations.AllStrategies(max_workers=workers)
+    first_result, first_time = timed(runner.run_all_strategies, first.copy(), append=False)
+    second_result, second_time = timed(runner.run_all_strategies, second.copy(), append=False)
+    repeat_result, repeat_time = timed(runner.run_all_strategies, first.copy(), append=False)
+    stats = strategy_combinations.strategy_value_cache.stats()
+
+    strategy_combinations.strategy_value_cache.disable()
+    try:
+        expected_second = strategy_combinations.AllStrategies(max_workers=workers).run_all_strategies(second.copy(), append=False)
+    finally:
+        strategy_combinations.strategy_value_cache.enable()
+    pd.testing.assert_frame_equal(expected_second, second_result)
+    pd.testing.assert_frame_equal(first_result, repeat_result)
+    for name, instance in runner.strategy_instances.items():
+        if strategy_combinations.strategy_settings(instance) != runner.strategy_settings[name]:
+            raise AssertionError(f"{name} template instance was modified by a run")
+    print(f"First ticker: {first_time:.2f}s | Second ticker: {second_time:.2f}s | "
+          f"Repeat first ticker: {repeat_time:.2f}s | Cache hits: {stats['hits']} / {stats['hits'] + stats['misses']}")
+
+
+def benchmark_lazy_signal_labels(n_bars=5000, large_bars=1000000):
+    """Score-only runs skip the labels; requested labels are Categorical and match the legacy string map"""
+    df = make_synthetic_ohlcv(n_bars, seed=4)
+    classes = [cls for name, cls in vars(strategy_library).items()
+               if isinstance(cls, type) and name.endswith('Strategies') and cls.__module__ == strategy_library.__name__]
+    score_time = label_time = 0.0
+    label_bytes = string_bytes = label_columns = 0
+    for cls in classes:
+        try:
+            scores, elapsed = timed(cls().run_all_strategies, df.copy(), append=False)
+        except Exception:
+            continue  # classes needing extra inputs (Benchmark column) or broken on this pandas version
+        score_time += elapsed
+        labelled, elapsed = timed(cls().run_all_strategies, df.copy(), append=False, signal_value=True, signal_explanation=True)
+        label_time += elapsed
+        if not all(dtype == np.int8 for dtype in scores.dtypes):
+            raise AssertionError(f"{cls.__name__} returned non-int8 scores")
+        for position in range(labelled.shape[1]):
+            column = labelled.iloc[:, position]
+            if column.dtype == np.int8:
+                score = column
+                continue
+            if not isinstance(column.dtype, pd.CategoricalDtype) or len(column.cat.categories) > 3:
+                raise AssertionError(f"{cls.__name__} {labelled.columns[position]} is not a three-entry categorical")
+            # The legacy Series.map of the same three-entry mapping, rebuilt from the score -> label pairs
+            mapping = dict(zip(score, column.astype(object)))
+            if not score.map(mapping).astype(object).equals(column.astype(object)):
+                raise AssertionError(f"{cls.__name__} {labelled.columns[position]} labels disagree with the scores")
+            label_bytes += column.memory_usage(deep=True)
+            string_bytes += column.astype(object).memory_usage(deep=True)
+            label_columns += 1
+
+    print(f"\nLAZY SIGNAL LABELS ({len(classes)} classes x {n_bars} bars)")
+    print(f"Scores only: {score_time:.2f}s | Scores + Value/Explanation: {label_time:.2f}s")
+    print(f"{label_columns} label columns: categorical {label_bytes / 1e6:.1f} MB vs strings {string_bytes / 1e6:.1f} MB")
+
+    scores = pd.Series(np.random.default_rng(0).integers(-1, 2, large_bars).astype(np.int8))
+    mapping = {1: 'Aberration_Oversold', -1: 'Aberration_Overbought', 0: 'Aberration_Neutral'}
+    legacy, legacy_time = timed(scores.map, mapping)
+    labels, labels_time = timed(strategy_library.signal_labels, scores, mapping)
+    if not legacy.astype(object).equals(labels.astype(object)):
+        raise AssertionError("signal_labels disagrees with Series.map")
+    print(f"{large_bars} bars: Series.map {legacy_time * 1000:.1f}ms | signal_labels {labels_time * 1000:.1f}ms")
+
+
+def benchmark_score_matrix(n_bars=3000, workers=2):
+    """int8 score matrix + metadata matches the score frame column for column"""
+    logging.getLogger(strategy_combinations.__name__).setLevel(logging.CRITICAL)
+    df = make_synthetic_ohlcv(n_bars, seed=6)
+    runner = strategy_combinations.AllStrategies(max_workers=workers)
+    strategy_combinations.strategy_value_cache.disable()
+    try:
+        frame, frame_time = timed(runner.run_all_strategies, df.copy(), append=False)
+        # The first matrix run also takes each score column name from its calculate_<sub>_values once
+        strategy_combinations.score_column_names.clear()
+        _, first_matrix_time = timed(runner.run_score_matrix, df.copy())
+        (scores, metadata), matrix_time = timed(runner.run_score_matrix, df.copy())
+        process_scores, process_metadata = strategy_combinations.AllStrategies(
+            max_workers=workers, mode='process').run_score_matrix(df.copy())
+    finally:
+        strategy_combinations.strategy_value_cache.enable()
+
+    if list(metadata['column']) != list(frame.columns) or not np.array_equal(frame.to_numpy(), scores):
+        raise AssertionError("Score matrix differs from the run_all_strategies frame")
+    if not np.array_equal(process_scores, scores) or not process_metadata.equals(metadata):
+        raise AssertionError("Process-mode score matrix differs from thread mode")
+    if scores.dtype != np.int8 or not scores.flags['C_CONTIGUOUS']:
+        raise AssertionError("Score matrix is not a contiguous int8 array")
+
+    # The score frame used to hold int64 columns; the matrix is one int8 block
+    legacy_bytes = frame.shape[0] * frame.shape[1] * np.dtype(np.int64).itemsize
+    _, frame_vote_time = timed(frame.sum, axis=1)
+    _, matrix_vote_time = timed(scores.sum, axis=1, dtype=np.int16)
+    print(f"\nSCORE MATRIX ({scores.shape[1]} signals x {n_bars} bars, {workers} workers)")
+    print(f"Frame: {frame_time:.2f}s | Matrix: {matrix_time:.2f}s (first run {first_matrix_time:.2f}s) | "
+          f"Memory: {legacy_bytes / 1e6:.1f} MB as int64 columns vs {scores.nbytes / 1e6:.1f} MB")
+    print(f"Vote (row sum): frame {frame_vote_time * 1000:.1f}ms | matrix {matrix_vote_time * 1000:.1f}ms | "
+          f"{metadata['strategy'].nunique()} strategies, {metadata['sub_strategy'].nunique()} sub-strategy kinds")
+
+
+def benchmark_strategy_selection(n_bars=3000, workers=2):
+    """Selected threshold signals of the oscillators equal the same columns of a full run, at a fraction of the cost"""
+    logging.getLogger(strategy_combinations.__name__).setLevel(logging.CRITICAL)
+    df = make_synthetic_ohlcv(n_bars, seed=7)
+    runner = strategy_combinations.AllStrategies(max_workers=workers)
+    selection = dict(include=['*Oscillator*', '*Index*', '*Stochastic*'], exclude='*Volume*', sub_strategies='threshold')
+    strategy_combinations.strategy_value_cache.disable()
+    try:
+        (scores, metadata), full_time = timed(runner.run_score_matrix, df.copy())
+        (selected, selected_metadata), selected_time = timed(runner.run_score_matrix, df.copy(), **selection)
+        frame = runner.run_all_strategies(df.copy(), append=False, **selection)
+    finally:
+        strategy_combinations.strategy_value_cache.enable()
+    report = runner.selection_report
+
+    positions = {key: position for position, key in enumerate(zip(metadata['strategy'], metadata['column']))}
+    for position, key in enumerate(zip(selected_metadata['strategy'], selected_metadata['column'])):
+        if not np.array_equal(selected[:, position], scores[:, positions[key]]):
+            raise AssertionError(f"Selected signal {key} differs from the full run")
+    if set(selected_metadata['sub_strategy']) != {'threshold'} or not np.array_equal(frame.to_numpy(), selected):
+        raise AssertionError("Filtered run_all_strategies disagrees with the filtered score matrix")
+
+    print(f"\nSTRATEGY SELECTION ({n_bars} bars, {workers} workers)")
+    print(f"All signals: {scores.shape[1]} in {full_time:.2f}s | Selected: {selected.shape[1]} threshold signals "
+          f"from {report['strategies']} strategies in {selected_time:.2f}s | Speedup: {full_time / selected_time:.1f}x")
+    print(f"Skipped {report['strategies_skipped']} strategies and {report['sub_strategies_skipped']} sub-strategies "
+          f"({report['skipped_fraction']:.0%} of the signals)")
+
+
+def benchmark_shared_primitives(n_bars=5000, large_bars=200000, workers=2):
+    """Classes reading TR/ATR/EMA/std/typical price/DM from one shared store match their standalone values"""
+    logging.getLogger(strategy_combinations.__name__).setLevel(logging.CRITICAL)
+    df = make_synthetic_ohlcv(n_bars, seed=10)
+    classes = [cls for name, cls in vars(strategy_library).items()
+               if isinstance(cls, type) and hasattr(cls, 'required_primitives') and cls.__module__ == strategy_library.__name__]
+
+    store = primitives.PrimitiveStore(df)
+    store.prepare(primitives.plan_primitives(cls() for cls in classes)[0])
+    for cls in classes:
+        shared = cls()
+        shared.primitive_store = store
+        expected, actual = cls().compute_values(df), shared.compute_values(df)
+        for left, right in zip(*(value if isinstance(value, tuple) else (value,) for value in (expected, actual))):
+            if isinstance(left, dict):
+                left, right = pd.DataFrame(left), pd.DataFrame(right)
+            if isinstance(left, pd.DataFrame):
+                pd.testing.assert_frame_equal(left, right)
+            else:
+                pd.testing.assert_series_equal(pd.Series(left), pd.Series(right))
+
+    # Primitive work alone: every class building its own versus one planned pass over the union
+    large = make_synthetic_ohlcv(large_bars, seed=11)
+    declarations = [cls().required_primitives() for cls in classes]
+
+    def private_primitives():
+        for keys in declarations:
+            private = primitives.PrimitiveStore(large)
+            for key in keys:
+                private.get(key)
+
+    plan, demand = primitives.plan_primitives(cls() for cls in classes)
+    _, private_time = timed(private_primitives)
+    _, shared_time = timed(primitives.PrimitiveStore(large).prepare, plan)
+
+    run_store = primitives.PrimitiveStore(df)
+    strategy_combinations.strategy_value_cache.disable()
+    try:
+        strategy_combinations.run_score_matrix({cls.__name__: cls() for cls in classes}, df,
+                                               max_workers=workers, primitives=run_store)
+    finally:
+        strategy_combinations.strategy_value_cache.enable()
+    stats = run_store.stats()
+
+    print(f"\nSHARED PRIMITIVES ({len(classes)} classes)")
+    print(f"Primitive work at {large_bars} bars: per class {private_time:.2f}s | planned once {shared_time:.2f}s | "
+          f"Speedup: {private_time / shared_time:.1f}x")
+    print(f"Strategy run: {stats['computed']} primitives computed once for {stats['requests']} requests "
+          f"({sum(demand.values())} declarations)")
+
+
+def benchmark_batch_indicators(n_bars=200000, periods=tuple(range(5, 205, 5))):
+    """SMA / EMA / RSI / WMA over many periods in one call versus one calculate_indicator call per period"""
+    data = make_synthetic_ohlcv(n_bars, seed=12)
+    gapped = make_synthetic_ohlcv(2000, seed=13)
+    gapped.loc[[0, 1, 500, 501, 502, 1500], 'Close'] = np.nan
+    rounded = data.iloc[:5000].assign(Close=data['Close'].iloc[:5000].round(2))
+    periods = list(periods)
+
+    print(f"\nBATCH INDICATORS ({n_bars} bars x {len(periods)} periods)")
+    for name, (_, params) in new12.BATCH_INDICATORS.items():
+        # Bit for bit the per-period values, so the cache holds the same value whichever call filled it
+        new12.indicator_cache.disable()
+        for frame in (gapped, rounded, data.iloc[:3000], data.iloc[:3]):
+            all_periods = [1, 2] + periods + [len(frame) + 5]
+            batch = new12.calculate_indicator_batch(frame, name, all_periods)
+            for column, period in enumerate(all_periods):
+                expected = new12.compute_indicator(frame, name, (period,) + params).to_numpy(dtype=float)
+                np.testing.assert_array_equal(batch[:, column], expected, err_msg=f"{name} period {period}")
+
+        singles, single_time = timed(lambda: [new12.compute_indicator(data, name, (period,) + params)
+                                              for period in periods])
+        batch, batch_time = timed(new12.calculate_indicator_batch, data, name, periods)
+        np.testing.assert_array_equal(batch, np.column_stack(singles))
+
+        # Every column is registered, so the per-period calls that follow are hits returning the uncached Series
+        new12.indicator_cache.enable()
+        new12.indicator_cache.clear()
+        for frame in (data, rounded):
+            new12.calculate_indicator_batch(frame, name, periods)
+            before = new12.indicator_cache.stats()
+            for period in periods:
+                pd.testing.assert_series_equal(new12.calculate_indicator(frame, name, (period,) + params),
+                                               new12.compute_indicator(frame, name, (period,) + params),
+                                               check_exact=True, obj=f"{name} period {period} after the batch")
+            after = new12.indicator_cache.stats()
+            if after['misses'] != before['misses'] or after['hits'] - before['hits'] != len(periods):
+                raise AssertionError(f"{name}: calculate_indicator missed the batch entries")
+        new12.indicator_cache.clear()
+        print(f"{name:>4}: per period {single_time:.2f}s | batch {batch_time:.2f}s | "
+              f"Speedup: {single_time / batch_time:.1f}x | follow-up calls: {len(periods)} exact hits")
+
+    # The multi-period banks in kernels stay within floating-point tolerance of pandas, infinities included
+    close = data['Close'].iloc[:5000].copy()
+    close.iloc[[10, 2000]] = [np.inf, -np.inf]
+    sums = kernels.rolling_sums(close, periods)
+    for column, period in enumerate(periods):
+        expected = close.rolling(period).sum().to_numpy()
+        windows = np.lib.stride_tricks.sliding_window_view(close.to_numpy(), period)
+        infinite = np.zeros(len(close), dtype=bool)
+        infinite[period - 1:] = np.isinf(windows).any(axis=1)
+        np.testing.assert_allclose(sums[~infinite, column], expected[~infinite], rtol=1e-12, equal_nan=True)
+        np.testing.assert_array_equal(sums[infinite, column], np.where(np.isinf(windows).sum(axis=1) > 1, np.nan,
+                                                                       windows.sum(axis=1))[infinite[period - 1:]])
+
+    # A parameter sweep batches its indicators before evaluating the signals
+    configs = make_crossover_configs(range(2, 32), range(10, 60, 2))
+    frame = data.iloc[:20000]
+    new12.indicator_cache.clear()
+    (entry, exit_, _, _), batched_time = timed(new12.build_signal_matrices, frame, configs)
+    evaluated = new12.indicator_cache.stats()
+    new12.indicator_cache.disable()
+    (plain_entry, plain_exit, _, _), plain_time = timed(new12.build_signal_matrices, frame, configs)
+    new12.indicator_cache.enable()
+    np.testing.assert_array_equal(entry, plain_entry)
+    np.testing.assert_array_equal(exit_, plain_exit)
+    print(f"Sweep of {len(configs)} configs: signal matrices {batched_time:.2f}s with batched indicators "
+          f"({evaluated['hits']} operand reads hit the batch, {evaluated['misses'] - evaluated['entries']} missed) "
+          f"vs {plain_time:.2f}s uncached, identical signals")
+
+
+def streaming_references():
+    """(name, params, batch function returning {output: values}) for every streaming indicator"""
+    lib = strategy_library
+
+    def adx(df, period):
+        instance = lib.AverageDirectionalIndexStrategies(period=period)
+        return {'ADX': instance.compute_values(df), 'DI+': instance.di_plus, 'DI-': instance.di_minus}
+
+    def supertrend(df, period, multiplier):
+        line, trend = lib.SupertrendStrategies(period=period, multiplier=multiplier).compute_values(df)
+        return {'Supertrend': line, 'Trend': trend}
+
+    return [
+        ("SMA", {'period': 20}, lambda df: {None: new12.sma(df, 20)}),
+        ("EMA", {'period': 20}, lambda df: {None: lib.ExponentialMovingAverageStrategies(period=20).compute_values(df)}),
+        ("RSI", {'period': 14}, lambda df: {None: lib.RelativeStrengthIndexStrategies(period=14).compute_values(df)}),
+        ("WMA", {'period': 14}, lambda df: {None: lib.WeightedMovingAverageStrategies(period=14).compute_values(df)}),
+        ("OBV", {}, lambda df: {None: lib.OnBalanceVolumeStrategies().compute_values(df)}),
+        ("VWAP", {}, lambda df: {None: lib.VolumeWeightedAveragePriceStrategies().compute_values(df)}),
+        ("ATR", {'period': 14}, lambda df: {None: lib.AverageTrueRangeStrategies(period=14).compute_values(df)}),
+        ("BOLLINGER", {'period': 20, 'multiplier': 2},
+         lambda df: {'PercentB': lib.BollingerBandsStrategies(period=20, multiplier=2).compute_values(df)}),
+        ("MACD", {}, lambda df: dict(lib.MACDStrategies().compute_values(df).items())),
+        ("STOCHASTIC", {'period': 14}, lambda df: {None: lib.StochasticStrategies(period=14).compute_values(df)}),
+        ("ADX", {'period': 14}, lambda df: adx(df, 14)),
+        ("SUPERTREND", {'period': 10, 'multiplier': 3.0}, lambda df: supertrend(df, 10, 3.0)),
+        ("PSAR", {}, lambda df: {None: lib.ParabolicStopAndReverseStrategies().compute_values(df)})
+    ]
+
+
+def benchmark_streaming_indicators(n_bars=3000, tail_bars=200):
+    """Bar-by-bar streaming indicators (with a JSON state round trip mid-stream) against batch compute_values"""
+    frames = [make_synthetic_ohlcv(n_bars, seed=14)]
+    gapped = make_synthetic_ohlcv(n_bars, seed=15)
+    gapped.loc[[40, 41, 1000, 2500], ['Close', 'High']] = np.nan
+    frames.append(gapped)
+
+    print(f"\nSTREAMING INDICATORS ({n_bars} bars, per-bar cost of the last {tail_bars} bars)")
+    for name, params, reference in streaming_references():
+        for frame in frames:
+            bars = frame.to_dict('records')
+            indicator = streaming.create_streaming_indicator(name, **params)
+            values = [indicator.update(bar) for bar in bars[:n_bars // 2]]
+            indicator = streaming.restore_indicator(json.loads(json.dumps(indicator.state)))
+            values += [indicator.update(bar) for bar in bars[n_bars // 2:]]
+            # The batch PSAR of the first bar looks one bar ahead, so the stream starts at the second bar
+            start = 1 if name == "PSAR" else 0
+            for output, expected in reference(frame).items():
+                actual = [value if output is None else value[output] for value in values]
+                np.testing.assert_allclose(np.asarray(actual[start:], dtype=float),
+                                           pd.Series(expected).to_numpy(dtype=float)[start:],
+                                           rtol=1e-9, atol=1e-9, equal_nan=True, err_msg=f"{name} {output}")
+
+        # Extending the history by one bar: one update versus recomputing the whole frame
+        frame = frames[0]
+        indicator = streaming.create_streaming_indicator(name, **params)
+        bars = frame.to_dict('records')
+        indicator.run(frame.iloc[:n_bars - tail_bars])
+        start = time.perf_counter()
+        for bar in bars[n_bars - tail_bars:]:
+            indicator.update(bar)
+        update_time = (time.perf_counter() - start) / tail_bars
+        _, batch_time = timed(reference, frame)
+        print(f"{name:>10}: update {update_time * 1e6:.1f}us | batch recompute {batch_time * 1e3:.1f}ms | "
+              f"Speedup per new bar: {batch_time / update_time:,.0f}x")
+
+
+def make_strategy_config(entry, exit_):
+    """strategy_config dict from ((type, name, params, candles_ago) x 2, strategy) pairs for entry and exit"""
+    config = {}
+    for prefix, (comp1, comp2, strategy) in (('entry', entry), ('exit', exit_)):
+        for slot, (comp_type, name, params, ago) in (('comp1', comp1), ('comp2', comp2)):
+            config[f'{prefix}_{slot}_type'] = comp_type
+            config[f'{prefix}_{slot}_name'] = name
+            config[f'{prefix}_{slot}_params'] = params
+            config[f'{prefix}_{slot}_candles_ago'] = ago
+        config[f'{prefix}_strategy'] = strategy
+    return config
+
+
+def benchmark_streaming_runner(n_bars=5000, latency_bars=20000, window=2000):
+    """Replay history through the streaming runner against the batch engine, then per-bar latency p50 / p99"""
+    data = make_synthetic_ohlcv(n_bars, seed=16)
+    cases = [
+        ("Long Only", {'stop_loss': 2.0, 'take_profit': 4.0, 'trailing_stop': 3.0},
+         make_strategy_config((('INDICATOR', 'SMA', (10,), 0), ('INDICATOR', 'SMA', (30,), 0), 'CROSSED UP'),
+                              (('INDICATOR', 'SMA', (10,), 0), ('INDICATOR', 'SMA', (30,), 0), 'CROSSED DOWN'))),
+        ("Short Only", {},
+         make_strategy_config((('INDICATOR', 'EMA', (12,), 0), ('INDICATOR', 'EMA', (26,), 1), 'CROSSED'),
+                              (('INDICATOR', 'RSI', (14, 70, 30), 0), ('CONSTANT', '60', (60,), 0), 'GREATER THAN'))),
+        ("Long/Short Reversal", {'stop_loss': 2.0, 'take_profit': 4.0},
+         make_strategy_config((('PRICE', 'Close', ('Close',), 0), ('INDICATOR', 'WMA', (20, 0.01), 2), 'CROSSED UP'),
+                              (('INDICATOR', 'ADX', (14, 25), 0), ('CONSTANT', '25', (25,), 0), 'LESS THAN'))),
+        ("Long/Short Reversal", {},
+         make_strategy_config((('INDICATOR', 'OBV', (0, 100000, -100000), 0), ('CONSTANT', '0', (0,), 0), 'INCREASED'),
+                              (('PRICE', 'Close', ('Close',), 1), ('INDICATOR', 'VWAP', (0.01,), 0), 'DECREASED')))
+    ]
+
+    print(f"\nSTREAMING RUNNER ({n_bars} bars replayed, latency over {latency_bars} bars)")
+    for direction, risk, config in cases:
+        batch_portfolio, stream_portfolio = make_portfolio(**risk), make_portfolio(**risk)
+        batch, *_ = new12.detect_strategy_signals(
+            data.copy(), *(config[f'{side}_{slot}_{field}'] for side in ('entry', 'exit')
+                           for slot in ('comp1', 'comp2') for field in ('type', 'name', 'params')),
+            config['entry_strategy'], config['exit_strategy'],
+            *(config[f'{side}_{slot}_candles_ago'] for side in ('entry', 'exit') for slot in ('comp1', 'comp2')))
+        with contextlib.redirect_stdout(io.StringIO()):
+            batch = execute_trading_strategy_arrays(batch, batch_portfolio, direction)
+            runner = streaming.StreamingStrategyRunner(config, stream_portfolio, direction)
+            rows = pd.DataFrame(list(runner.run(zip(data.index, data.to_dict('records')))), index=data.index)
+        for column in ['Entry_Signal', 'Exit_Signal']:
+            if not np.array_equal(batch[column].to_numpy(dtype=bool), rows[column].to_numpy(dtype=bool)):
+                raise AssertionError(f"{column} differs between the streaming runner and the batch signals")
+        assert_same_tracking(batch, rows)
+        if batch_portfolio.trades != stream_portfolio.trades:
+            raise AssertionError(f"Trade ledgers differ for {direction}")
+        print(f"{direction:<20} replay matches the batch engine ({len(stream_portfolio.trades)} trades)")
+
+    # The same stream fed through an asyncio queue
+    async def feed(runner, bars):
+        queue = asyncio.Queue()
+        for item in bars:
+            queue.put_nowait(item)
+        queue.put_nowait(None)
+        return [row async for row in runner.run_async(queue)]
+
+    direction, risk, config = cases[0]
+    bars = list(zip(data.index, data.to_dict('records')))
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = list(streaming.StreamingStrategyRunner(config, make_portfolio(**risk), direction).run(bars))
+        actual = asyncio.run(feed(streaming.StreamingStrategyRunner(config, make_portfolio(**risk), direction), bars))
+    if pd.DataFrame(expected).drop(columns='Date').to_dict() != pd.DataFrame(actual).drop(columns='Date').to_dict():
+        raise AssertionError("asyncio queue rows differ from the iterator rows")
+
+    # Per-bar latency early and late in a long stream: it must not grow with the history
+    history = make_synthetic_ohlcv(latency_bars, seed=17)
+    runner = streaming.StreamingStrategyRunner(config, make_portfolio(**risk), direction)
+    latencies = np.empty(latency_bars)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i, item in enumerate(zip(history.index, history.to_dict('records'))):
+            start = time.perf_counter()
+            runner.on_bar(*item)
+            latencies[i] = time.perf_counter() - start
+    _, batch_time = timed(run_single_config, history, config, direction, 100)
+    for label, sample in (("first", latencies[window:2 * window]), ("last", latencies[-window:])):
+        p50, p99 = np.percentile(sample, [50, 99]) * 1e6
+        print(f"Latency, {label} {window} bars: p50 {p50:.1f}us | p99 {p99:.1f}us")
+    print(f"Batch rerun for one new bar ({latency_bars} bars): {batch_time * 1e3:.0f}ms")
+
+def legacy_parabolic_sar(df, initial_af=0.02, max_af=0.2):
+    """Original ParabolicStopAndReverseStrategies.compute_values loop"""
+    psar_list = []
+    if len(df) < 2:
+        return pd.Series([None] * len(df), index=df.index)
+    if df['Close'].iloc[1] > df['Close'].iloc[0]:
+        trend = 'up'
+        psar = df['Low'].iloc[0]
+    else:
+        trend = 'down'
+        psar = df['High'].iloc[0]
+    af = initial_af
+    psar_list.append(psar)
+    if trend == 'up':
+        psar = df['Low'].iloc[0]
+        ep = max(df['High'].iloc[0], df['High'].iloc[1])
+    else:
+        psar = df['High'].iloc[0]
+        ep = min(df['Low'].iloc[0], df['Low'].iloc[1])
+    psar_list.append(psar)
+    for i in range(2, len(df)):
+        prev_psar = psar
+        if trend == 'up':
+            psar = prev_psar + af * (ep - prev_psar)
+            psar = min(psar, df['Low'].iloc[i - 1], df['Low'].iloc[i - 2])
+            if df['High'].iloc[i] > ep:
+                ep = df['High'].iloc[i]
+                af = min(af + initial_af, max_af)
+            if df['Low'].iloc[i] < psar:
+                trend = 'down'
+                psar = ep
+                ep = df['Low'].iloc[i]
+                af = initial_af
+        else:
+            psar = prev_psar - af * (prev_psar - ep)
+            psar = max(psar, df['High'].iloc[i - 1], df['High'].iloc[i - 2])
+            if df['Low'].iloc[i] < ep:
+                ep = df['Low'].iloc[i]
+                af = min(af + initial_af, max_af)
+            if df['High'].iloc[i] > psar:
+                trend = 'up'
+                psar = ep
+                ep = df['High'].iloc[i]
+                af = initial_af
+        psar_list.append(psar)
+    return pd.Series(psar_list, index=df.index)
+
+
+def legacy_stop_and_reverse(df, initial_af=0.02, max_af=0.2):
+    """Original StopAndReverseStrategies.compute_values loop"""
+    n = len(df)
+    sar = [0] * n
+    if df['Close'].iloc[1] > df['Close'].iloc[0]:
+        trend = 1
+        sar[0] = df['Low'].iloc[0]
+        ep = df['High'].iloc[0]
+    else:
+        trend = -1
+        sar[0] = df['High'].iloc[0]
+        ep = df['Low'].iloc[0]
+    af = initial_af
+    for i in range(1, n):
+        current_high = df['High'].iloc[i]
+        current_low = df['Low'].iloc[i]
+        previous_sar = sar[i - 1]
+        if trend == 1:
+            sar_i = previous_sar + af * (ep - previous_sar)
+            if i >= 2:
+                sar_i = min(sar_i, df['Low'].iloc[i - 1], df['Low'].iloc[i - 2])
+            else:
+                sar_i = min(sar_i, df['Low'].iloc[i - 1])
+            if current_low < sar_i:
+                trend = -1
+                sar_i = ep
+                af = initial_af
+                ep = current_low
+            elif current_high > ep:
+                ep = current_high
+                af = min(af + initial_af, max_af)
+            sar[i] = sar_i
+        else:
+            sar_i = previous_sar - af * (previous_sar - ep)
+            if i >= 2:
+                sar_i = max(sar_i, df['High'].iloc[i - 1], df['High'].iloc[i - 2])
+            else:
+                sar_i = max(sar_i, df['High'].iloc[i - 1])
+            if current_high > sar_i:
+                trend = 1
+                sar_i = ep
+                af = initial_af
+                ep = current_high
+            elif current_low < ep:
+                ep = current_low
+                af = min(af + initial_af, max_af)
+            sar[i] = sar_i
+    return pd.Series(sar, index=df.index)
+
+
+def legacy_supertrend(df, period=10, multiplier=3.0):
+    """Original SupertrendStrategies.compute_values band and trend loops"""
+    atr = primitives.PrimitiveStore(df).compute(('ATR', period, 1, True))
+    typical_price = (df['High'] + df['Low']) / 2
+    basic_ub = typical_price + multiplier * atr
+    basic_lb = typical_price - multiplier * atr
+    final_ub_list = [0] * len(df)
+    final_lb_list = [0] * len(df)
+    for i in range(len(df)):
+        if i == 0:
+            final_ub_list[i] = basic_ub.iloc[i]
+            final_lb_list[i] = basic_lb.iloc[i]
+        else:
+            if (basic_ub.iloc[i] < final_ub_list[i-1]) or (df['Close'].iloc[i-1] > final_ub_list[i-1]):
+                final_ub_list[i] = basic_ub.iloc[i]
+            else:
+                final_ub_list[i] = final_ub_list[i-1]
+            if (basic_lb.iloc[i] > final_lb_list[i-1]) or (df['Close'].iloc[i-1] < final_lb_list[i-1]):
+                final_lb_list[i] = basic_lb.iloc[i]
+            else:
+                final_lb_list[i] = final_lb_list[i-1]
+    supertrend_list = [None] * len(df)
+    trend_list = [0] * len(df)
+    for i in range(len(df)):
+        if i == 0:
+            trend_list[i] = 1
+        elif df['Close'].iloc[i] <= final_ub_list[i]:
+            supertrend_list[i] = final_ub_list[i]
+            trend_list[i] = -1
+        elif df['Close'].iloc[i] >= final_lb_list[i]:
+            supertrend_list[i] = final_lb_list[i]
+            trend_list[i] = 1
+        else:
+            supertrend_list[i] = supertrend_list[i-1]
+            trend_list[i] = trend_list[i-1]
+    return pd.Series(supertrend_list, index=df.index), pd.Series(trend_list, index=df.index)
+
+
+def legacy_td_sequential(df):
+    """Original TDSequentialStrategies.compute_values loop"""
+    buy_counts = [0] * len(df)
+    sell_counts = [0] * len(df)
+    closes = df['Close'].tolist()
+    for i in range(4, len(df)):
+        buy_counts[i] = buy_counts[i - 1] + 1 if closes[i] < closes[i - 4] else 0
+        sell_counts[i] = sell_counts[i - 1] + 1 if closes[i] > closes[i - 4] else 0
+    return pd.Series(buy_counts, index=df.index), pd.Series(sell_counts, index=df.index)
+
+
+def benchmark_state_machines(n_bars=20000, large_bars=1000000):
+    """Array kernels for SAR, Supertrend, TD Sequential and the Gann activator vs the original .iloc loops"""
+    cases = [
+        ("PSAR", legacy_parabolic_sar, lambda frame: strategy_library.ParabolicStopAndReverseStrategies().compute_values(frame)),
+        ("SAR", legacy_stop_and_reverse, lambda frame: strategy_library.StopAndReverseStrategies().compute_values(frame)),
+        ("SUPERTR", legacy_supertrend, lambda frame: strategy_library.SupertrendStrategies().compute_values(frame)),
+        ("TDSEQ", legacy_td_sequential, lambda frame: strategy_library.TDSequentialStrategies().compute_values(frame)),
+        ("GANNHLA", legacy_gann_activator, lambda frame: GannHighLowActivatorStrategies().compute_values(frame))
+    ]
+    data = make_synthetic_ohlcv(n_bars)
+    large = make_synthetic_ohlcv(large_bars)
+    with_gaps = make_synthetic_ohlcv(300, seed=7)
+    with_gaps.loc[[1, 5, 100, 101], ['Close', 'High', 'Low']] = np.nan
+    # Flat stretches exercise the equality branches (no new extreme, close on the band)
+    flat = make_synthetic_ohlcv(500, seed=3)
+    flat.loc[200:260, ['Open', 'High', 'Low', 'Close']] = 100.0
+    print(f"\nSTATE MACHINES (loop timed on {n_bars} bars, kernel on {large_bars} bars, backend={kernels.FILTER_BACKEND})")
+    for label, legacy, build in cases:
+        for frame in (data.head(2), data.head(5), data.head(2000), with_gaps, flat):
+            expected, actual = legacy(frame), build(frame)
+            expected = expected if isinstance(expected, tuple) else (expected,)
+            actual = actual if isinstance(actual, tuple) else (actual,)
+            for expected_series, actual_series in zip(expected, actual):
+                np.testing.assert_array_equal(expected_series.to_numpy(dtype=float), actual_series.to_numpy(dtype=float))
+                if expected_series.dtype.kind in 'iu':
+                    assert actual_series.dtype == expected_series.dtype, (label, actual_series.dtype)
+        _, legacy_time = timed(legacy, data)
+        _, fast_time = timed(build, large)
+        per_bar_speedup = (legacy_time / n_bars) / (fast_time / large_bars)
+        print(f"{label:<8} Loop: {legacy_time:.3f}s | Kernel: {fast_time:.3f}s | Per-bar speedup: {per_bar_speedup:.0f}x")
+
+    # Run lengths agree with the obvious counter on random runs
+    condition = np.random.default_rng(0).random(1000) < 0.7
+    counts, running = [], 0
+    for flag in condition:
+        running = running + 1 if flag else 0
+        counts.append(running)
+    np.testing.assert_array_equal(kernels.run_lengths(condition), counts)
+
+
+def make_condition(comp1, comp2, strategy):
+    """MultiConditionDetector condition dict from two (type, name, params, candles_ago) operands"""
+    condition = {'strategy': strategy}
+    for slot, (comp_type, name, params, ago) in (('comp1', comp1), ('comp2', comp2)):
+        condition.update({f'{slot}_type': comp_type, f'{slot}_name': name, f'{slot}_params': params,
+                          f'{slot}_candles_ago': ago})
+    return condition
+
+
+def legacy_detect_all_conditions(data, conditions, logic_type='AND'):
+    """Original MultiConditionDetector.detect_all_conditions: Signal columns per condition folded with & or |"""
+    all_signals = []
+    for condition in conditions:
+        data, col1, col2 = new12.signal_detector.detect_signals(
+            data, condition['comp1_type'], condition['comp1_name'], condition['comp1_params'],
+            condition['comp2_type'], condition['comp2_name'], condition['comp2_params'], condition['strategy'],
+            condition.get('comp1_candles_ago', 0), condition.get('comp2_candles_ago', 0))
+        data[f"Condition_{len(all_signals) + 1}_{col1}"] = data[col1]
+        data[f"Condition_{len(all_signals) + 1}_{col2}"] = data[col2]
+        all_signals.append(data['Signal'])
+    combined_signal = all_signals[0]
+    for signal in all_signals[1:]:
+        combined_signal = combined_signal & signal if logic_type == 'AND' else combined_signal | signal
+    return combined_signal
+
+
+def benchmark_signal_expressions(n_bars=200000):
+    """Compiled condition trees vs the column-writing MultiConditionDetector path"""
+    ema12, ema26 = ('INDICATOR', 'EMA', (12,), 0), ('INDICATOR', 'EMA', (26,), 0)
+    sma10, sma50 = ('INDICATOR', 'SMA', (10,), 0), ('INDICATOR', 'SMA', (50,), 0)
+    rsi14 = ('INDICATOR', 'RSI', (14, 70, 30), 0)
+    close, close_ago = ('PRICE', 'Close', ('Close',), 0), ('PRICE', 'Close', ('Close',), 2)
+    cases = [
+        ("AND", 'AND', [make_condition(ema12, ema26, 'CROSSED UP'), make_condition(rsi14, ('CONSTANT', 'CONSTANT', (70,), 0), 'LESS THAN'),
+                        make_condition(close, sma50, 'GREATER THAN')]),
+        ("OR", 'OR', [make_condition(sma10, sma50, 'CROSSED DOWN'), make_condition(close, sma10, 'WITHIN RANGE'),
+                      make_condition(close_ago, close, 'INCREASED'), make_condition(('INDICATOR', 'EMA', (12,), 1), ema12, 'CROSSED'),
+                      make_condition(rsi14, ('CONSTANT', 'CONSTANT', (30,), 3), 'LESS OR EQUAL')]),
+        ("NEVER", 'AND', [make_condition(ema12, ema26, 'CROSSED'), make_condition(sma10, sma50, 'GREATER OR EQUAL'),
+                          make_condition(close, ('CONSTANT', 'CONSTANT', (0,), 0), 'LESS THAN'), make_condition(rsi14, rsi14, 'EQUAL')])
+    ]
+    data = make_synthetic_ohlcv(n_bars)
+    with_gaps = make_synthetic_ohlcv(400, seed=7)
+    with_gaps.loc[[0, 5, 100, 101], 'Close'] = np.nan
+    detector = new12.MultiConditionDetector()
+    print(f"\nSIGNAL EXPRESSIONS ({n_bars} bars)")
+    for label, logic, conditions in cases:
+        detector.clear_conditions()
+        detector.set_logic_type(logic)
+        for condition in conditions:
+            detector.add_condition(*(condition[key] for key in ('comp1_type', 'comp1_name', 'comp1_params', 'comp2_type',
+                                                                'comp2_name', 'comp2_params', 'strategy', 'comp1_candles_ago',
+                                                                'comp2_candles_ago')))
+        for frame in (data.head(3), data.head(3000), with_gaps, data):
+            expected = legacy_detect_all_conditions(frame.copy(), conditions, logic)
+            actual, _ = detector.detect_all_conditions(frame.copy())
+            np.testing.assert_array_equal(expected.to_numpy(), actual['Combined_Signal'].to_numpy())
+        # Indicators are cached by now, so the timings compare the signal work itself
+        _, legacy_time = timed(legacy_detect_all_conditions, data.copy(), conditions, logic)
+        evaluator = ExpressionEvaluator(data, new12.signal_detector.strategies)
+        _, compiled_time = timed(detector.detect_all_conditions, data.copy(), evaluator)
+        print(f"{label:<6} Columns: {legacy_time * 1000:.1f}ms | Compiled: {compiled_time * 1000:.1f}ms | "
+              f"Speedup: {legacy_time / compiled_time:.1f}x | {evaluator.stats()}")
+
+    # Text rules with nesting and NOT agree with the same comparisons folded by hand
+    rule = 'crossed_up(EMA(12), EMA(26)) AND RSI(14, 70, 30) < 70 OR NOT (Close[2] > SMA(50) OR increased(Close))'
+    expression = parse_expression(rule)
+    for frame in (data.head(3), with_gaps, data.head(5000)):
+        single = lambda *condition: legacy_detect_all_conditions(frame.copy(), [make_condition(*condition)])
+        expected = ((single(ema12, ema26, 'CROSSED UP') & single(rsi14, ('CONSTANT', 'CONSTANT', (70,), 0), 'LESS THAN'))
+                    | ~(single(close_ago, sma50, 'GREATER THAN') | single(close, close, 'INCREASED')))
+        np.testing.assert_array_equal(expected.to_numpy(), ExpressionEvaluator(frame).evaluate(expression).unpack())
+
+    # The rules as documented: omitted trailing parameters take the indicator's defaults
+    documented = {
+        'crossed_up(EMA(12), EMA(26)) AND RSI(14) < 70':
+            'crossed_up(EMA(12), EMA(26)) AND RSI(14, 70, 30) < 70',
+        'crossed_up(EMA(12), EMA(26)) AND RSI(14) < 70 OR NOT Close[1] > SMA(200)':
+            'crossed_up(EMA(12), EMA(26)) AND RSI(14, 70, 30) < 70 OR NOT Close[1] > SMA(200)',
+        'RSI() > 50 AND WMA(20) > WMA(40)': 'RSI(14, 70, 30) > 50 AND WMA(20, 0.01) > WMA(40, 0.01)'
+    }
+    for short, full in documented.items():
+        expression = parse_expression(short)
+        assert expression.key == parse_expression(full).key, short
+        np.testing.assert_array_equal(ExpressionEvaluator(data).evaluate(expression).unpack(),
+                                      ExpressionEvaluator(data).evaluate(parse_expression(full)).unpack())
+
+    # A custom registered strategy falls back to a two-column frame
+    strategies = dict(new12.signal_detector.strategies, **{"SPREAD ABOVE": lambda frame, col1, col2: frame[col1] - frame[col2] > 1})
+    expression = parse_expression('spread_above(Close, SMA(10)) AND NOT spread_above(Close, SMA(10))', strategies)
+    assert not ExpressionEvaluator(data, strategies).evaluate(expression).any()
+    spread = ExpressionEvaluator(data, strategies).evaluate(parse_expression('spread_above(High, Low)', strategies)).unpack()
+    np.testing.assert_array_equal(spread, (data['High'] - data['Low'] > 1).to_numpy())
+
+
+def benchmark_packed_signals(n_bars=2000000, n_conditions=20, parity_bars=200000):
+    """Bit-packed condition masks vs bool columns: memory, AND / OR combine time and detector parity"""
+    rng = np.random.default_rng(1)
+    # Packing round-trips and the padding bits stay clear for every tail length
+    for length in (0, 1, 7, 8, 63, 64, 65, 1000):
+        mask = rng.random(length) < 0.5
+        packed = PackedSignal.pack(mask)
+        np.testing.assert_array_equal(packed.unpack(), mask)
+        np.testing.assert_array_equal((~packed).unpack(), ~mask)
+        assert (~packed).count() == length - mask.sum() and packed.any() == mask.any() and packed.all() == mask.all()
+        assert PackedSignal.filled(length, True).all() and not PackedSignal.filled(length, False).any()
+
+    # Twenty conditions over price, constants and moving averages, as a minute-data rule set would have
+    close = ('PRICE', 'Close', ('Close',), 0)
+    conditions = []
+    for i in range(n_conditions):
+        average = ('INDICATOR', 'SMA' if i % 2 else 'EMA', (5 + 5 * i,), i % 3)
+        strategy = ('GREATER THAN', 'LESS THAN', 'CROSSED UP', 'GREATER OR EQUAL')[i % 4]
+        conditions.append(make_condition(close, average, strategy))
+    data = make_synthetic_ohlcv(n_bars)
+    detector = new12.MultiConditionDetector()
+    for logic in ('AND', 'OR'):
+        detector.clear_conditions()
+        detector.set_logic_type(logic)
+        detector.conditions = list(conditions)
+        frame = data.head(parity_bars)
+        expected = legacy_detect_all_conditions(frame.copy(), conditions, logic)
+        actual, _ = detector.detect_all_conditions(frame.copy())
+        np.testing.assert_array_equal(expected.to_numpy(), actual['Combined_Signal'].to_numpy())
+
+    evaluator = ExpressionEvaluator(data)
+    with contextlib.redirect_stdout(io.StringIO()):
+        packed = [evaluator.evaluate(comparison) for comparison in expression_comparisons(compile_conditions(conditions))]
+    masks = [signal.unpack() for signal in packed]
+    columns = pd.DataFrame({f'Condition_{i + 1}': mask for i, mask in enumerate(masks)})
+
+    def fold(signals, logic):
+        combined = signals[0]
+        for signal in signals[1:]:
+            combined = combined & signal if logic == 'AND' else combined | signal
+        return combined
+
+    series = [columns[column] for column in columns.columns]
+    print(f"\nPACKED SIGNALS ({n_bars} bars, {n_conditions} conditions)")
+    bool_bytes = int(columns.memory_usage(index=False).sum())
+    packed_bytes = sum(signal.nbytes for signal in packed)
+    print(f"Memory   bool columns: {bool_bytes / 1e6:.1f}MB | Packed: {packed_bytes / 1e6:.2f}MB | "
+          f"Ratio: {bool_bytes / packed_bytes:.1f}x")
+    for logic in ('AND', 'OR'):
+        expected = fold(series, logic).to_numpy()
+        np.testing.assert_array_equal(fold(masks, logic), expected)
+        np.testing.assert_array_equal(fold(packed, logic).unpack(), expected)
+        _, series_time = timed(fold, series, logic)
+        _, array_time = timed(fold, masks, logic)
+        _, packed_time = timed(fold, packed, logic)
+        _, unpack_time = timed(fold(packed, logic).unpack)
+        print(f"{logic:<4}     Series: {series_time * 1000:.1f}ms | bool arrays: {array_time * 1000:.1f}ms | "
+              f"Packed: {packed_time * 1000:.2f}ms (+{unpack_time * 1000:.1f}ms to unpack once) | "
+              f"vs arrays: {array_time / packed_time:.1f}x")
+
+
+def legacy_detect_strategy_signals(data, config):
+    """Original detect_strategy_signals: shifted comparison columns, a Signal column and Entry_* / Exit_* copies"""
+    columns = []
+    for side, prefix in (('entry', 'Entry'), ('exit', 'Exit')):
+        data, col1, col2 = new12.signal_detector.detect_signals(
+            data, config[f'{side}_comp1_type'], config[f'{side}_comp1_name'], config[f'{side}_comp1_params'],
+            config[f'{side}_comp2_type'], config[f'{side}_comp2_name'], config[f'{side}_comp2_params'],
+            config[f'{side}_strategy'], config[f'{side}_comp1_candles_ago'], config[f'{side}_comp2_candles_ago'])
+        data[f'{prefix}_Signal'] = data['Signal']
+        for col in (col1, col2):
+            data[f'{prefix}_{col}'] = data[col]
+            columns.append(f'{prefix}_{col}')
+    return (data, *columns)
+
+
+def benchmark_lagged_comparisons(n_bars=1000000, parity_bars=5000):
+    """candles_ago read through array views vs shifted comparison columns: parity, time and peak allocation"""
+    import tracemalloc
+    ema, sma = ('INDICATOR', 'EMA', (12,), 0), ('INDICATOR', 'SMA', (30,), 0)
+    rsi = ('INDICATOR', 'RSI', (14, 70, 30), 0)
+    close, high = ('PRICE', 'Close', ('Close',), 0), ('PRICE', 'High', ('High',), 0)
+    lag = lambda operand, candles_ago: operand[:3] + (candles_ago,)
+    configs = []
+    for strategy in new12.signal_detector.strategies:
+        for ago1, ago2 in ((0, 0), (1, 0), (0, 3), (2, 5)):
+            configs.append(make_strategy_config((lag(ema, ago1), lag(sma, ago2), strategy),
+                                                (lag(close, ago1), lag(high, ago2), strategy)))
+            configs.append(make_strategy_config((lag(rsi, ago1), ('CONSTANT', 'CONSTANT', (50,), ago2), strategy),
+                                                (lag(close, ago1), lag(ema, ago2), strategy)))
+    data = make_synthetic_ohlcv(n_bars)
+    with_gaps = make_synthetic_ohlcv(300, seed=7)
+    with_gaps.loc[[0, 5, 100, 101], ['Close', 'High']] = np.nan
+    for frame in (data.head(2), data.head(parity_bars), with_gaps):
+        for config in configs:
+            expected = legacy_detect_strategy_signals(frame.copy(), config)
+            arguments = [config[f'{side}_{field}'] for side in ('entry', 'exit')
+                         for field in ('comp1_type', 'comp1_name', 'comp1_params', 'comp2_type', 'comp2_name', 'comp2_params')]
+            arguments = [*arguments, config['entry_strategy'], config['exit_strategy'],
+                         *(config[f'{side}_{slot}_candles_ago'] for side in ('entry', 'exit') for slot in ('comp1', 'comp2'))]
+            actual = new12.detect_strategy_signals(frame.copy(), *arguments, diagnostics=True)
+            assert list(actual[1:]) == list(expected[1:]), (actual[1:], expected[1:])
+            for column in ('Entry_Signal', 'Exit_Signal'):
+                np.testing.assert_array_equal(expected[0][column].to_numpy(), actual[0][column].to_numpy())
+            for column in expected[1:]:
+                np.testing.assert_array_equal(expected[0][column].to_numpy(dtype=float), actual[0][column].to_numpy(dtype=float))
+
+    def measured(detect, *arguments, **options):
+        # Indicators come from the warm cache, so this measures the comparison work itself
+        frame = data.copy()
+        tracemalloc.start()
+        start = time.perf_counter()
+        detect(frame, *arguments, **options)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return elapsed, peak
+
+    config = next(config for config in configs if config['entry_strategy'] == 'CROSSED UP'
+                  and config['entry_comp1_name'] == 'EMA' and config['entry_comp2_candles_ago'] == 5)
+    arguments = [config[key] for key in ('entry_comp1_type', 'entry_comp1_name', 'entry_comp1_params', 'entry_comp2_type',
+                                         'entry_comp2_name', 'entry_comp2_params', 'exit_comp1_type', 'exit_comp1_name',
+                                         'exit_comp1_params', 'exit_comp2_type', 'exit_comp2_name', 'exit_comp2_params',
+                                         'entry_strategy', 'exit_strategy', 'entry_comp1_candles_ago',
+                                         'entry_comp2_candles_ago', 'exit_comp1_candles_ago', 'exit_comp2_candles_ago')]
+    legacy_detect_strategy_signals(data.copy(), config)
+    legacy_time, legacy_peak = measured(legacy_detect_strategy_signals, config)
+    view_time, view_peak = measured(new12.detect_strategy_signals, *arguments)
+    diagnostic_time, diagnostic_peak = measured(new12.detect_strategy_signals, *arguments, diagnostics=True)
+    print(f"\nLAGGED COMPARISONS ({n_bars} bars, {config['entry_strategy']} with candles_ago 2 / 5)")
+    print(f"Shifted columns: {legacy_time * 1000:.1f}ms, peak {legacy_peak / 1e6:.1f}MB | "
+          f"Views: {view_time * 1000:.1f}ms, peak {view_peak / 1e6:.1f}MB | "
+          f"Views + diagnostics: {diagnostic_time * 1000:.1f}ms, peak {diagnostic_peak / 1e6:.1f}MB")
+    print(f"Speedup: {legacy_time / view_time:.1f}x | Peak allocation: {legacy_peak / view_peak:.1f}x lower")
+
+
+def legacy_create_comparison_column(data, comp_type, comp_name, comp_params, candles_ago=0):
+    """Original create_comparison_column: indicator columns named by period only and always rewritten"""
+    suffix = f'_{candles_ago}_ago' if candles_ago else ''
+    if comp_type == 'INDICATOR':
+        period = comp_params.get('period', 20) if isinstance(comp_params, dict) else comp_params[0]
+        column = f'{comp_name}_{period}{suffix}'
+        data[column] = new12.calculate_indicator(data, comp_name, comp_params).shift(candles_ago)
+    elif comp_type == 'CONSTANT':
+        value = new12.constant_value(comp_params)
+        column = f'Constant_{value}{suffix}'
+        data[column] = value
+    else:
+        source = new12.price_column(comp_params)
+        column = f'Price_{source}{suffix}'
+        data[column] = data[source].shift(candles_ago)
+    return data, column
+
+
+def legacy_detect_signals(data, comp1_type, comp1_name, comp1_params, comp2_type, comp2_name, comp2_params, strategy,
+                          comp1_candles_ago=0, comp2_candles_ago=0):
+    """Original detect_signals on legacy_create_comparison_column"""
+    data, col1 = legacy_create_comparison_column(data, comp1_type, comp1_name, comp1_params, comp1_candles_ago)
+    data, col2 = legacy_create_comparison_column(data, comp2_type, comp2_name, comp2_params, comp2_candles_ago)
+    strategy_func = new12.signal_detector.strategies[strategy]
+    if strategy == "WITHIN RANGE":
+        data['Signal'] = strategy_func(data, col1, col2, tolerance=0.01)
+    else:
+        data['Signal'] = strategy_func(data, col1, col2)
+    return data, col1, col2
+
+
+def benchmark_comparison_columns(n_bars=200000, parity_bars=5000):
+    """Comparison columns keyed on full parameters: collisions of the period-only names, parity and reuse"""
+    data = make_synthetic_ohlcv(n_bars)
+    greater_than = new12.signal_detector.strategies['GREATER THAN']
+
+    print(f"\nCOMPARISON COLUMNS ({n_bars} bars)")
+    for name, params1, params2 in (('KAMA', (10, 2, 30, 0.01), (10, 5, 60, 0.01)), ('APO', (12, 26, 0, 0), (12, 50, 0, 0))):
+        pair = pd.DataFrame({'first': new12.calculate_indicator(data, name, params1),
+                             'second': new12.calculate_indicator(data, name, params2)})
+        expected = greater_than(pair, 'first', 'second')
+        comparison = ('INDICATOR', name, params1, 'INDICATOR', name, params2, 'GREATER THAN')
+        legacy, old1, old2 = legacy_detect_signals(data.copy(), *comparison)
+        keyed, col1, col2 = new12.signal_detector.detect_signals(data.copy(), *comparison)
+        assert old1 == old2 and col1 != col2
+        np.testing.assert_array_equal(keyed['Signal'].to_numpy(), expected.to_numpy())
+        np.testing.assert_array_equal(keyed[col1].to_numpy(), pair['first'].to_numpy())
+        np.testing.assert_array_equal(keyed[col2].to_numpy(), pair['second'].to_numpy())
+        print(f"{name} {params1} > {params2}: period-only {old1} vs {old2} -> {int(legacy['Signal'].sum())} signals | "
+              f"keyed {col1} vs {col2} -> {int(keyed['Signal'].sum())} signals (expected {int(expected.sum())})")
+
+    # A column of the canonical name that the store did not add, or added before the prices changed, is recomputed
+    frame = data.head(parity_bars).copy()
+    frame['EMA_12'] = 0.0
+    comparison = ('INDICATOR', 'EMA', (12,), 'PRICE', 'Close', ('Close',), 'GREATER THAN')
+    edits = [None, lambda frame: frame.__setitem__(['Open', 'High', 'Low', 'Close'], frame[['Open', 'High', 'Low', 'Close']] * 1.01),
+             None, lambda frame: frame.loc.__setitem__((frame.index[7], 'Close'), 1e6),
+             lambda frame: frame.iloc.__setitem__((slice(0, 50), frame.columns.get_loc('Close')), 1.0),
+             lambda frame: setattr(frame, 'index', frame.index + 1), None]
+    for step, edit in enumerate(edits):
+        if edit is not None:
+            edit(frame)
+        before = new12.comparison_columns.stats()['computed']
+        frame = new12.signal_detector.detect_signals(frame, *comparison)[0]
+        np.testing.assert_array_equal(frame['EMA_12'].to_numpy(), new12.compute_indicator(frame, 'EMA', (12,)).to_numpy())
+        np.testing.assert_array_equal(frame['Price_Close'].to_numpy(), frame['Close'].to_numpy())
+        if (new12.comparison_columns.stats()['computed'] == before) != (edit is None and step > 0):
+            raise AssertionError("A column was recomputed without a price edit or reused after one")
+    copied = frame.copy()
+    np.testing.assert_array_equal(new12.signal_detector.detect_signals(copied, *comparison)[0]['EMA_12'].to_numpy(),
+                                  new12.compute_indicator(copied, 'EMA', (12,)).to_numpy())
+    print("A user column and the columns left from before a price edit (columns, loc, iloc, index) are recomputed")
+
+    # Distinct periods, so the period-only names do not collide and the signals must match
+    operands = [('INDICATOR', 'EMA', (12,), 0), ('INDICATOR', 'SMA', (30,), 0), ('INDICATOR', 'RSI', (14, 70, 30), 0),
+                ('INDICATOR', 'EMA', (12,), 2), ('PRICE', 'Close', ('Close',), 0), ('PRICE', 'Close', ('Close',), 1),
+                ('CONSTANT', 'CONSTANT', (50,), 0)]
+    comparisons = [(*first[:3], *second[:3], strategy, first[3], second[3])
+                   for first in operands for second in operands if first != second
+                   for strategy in ('CROSSED UP', 'GREATER THAN', 'LESS THAN', 'WITHIN RANGE')]
+    legacy, keyed = data.head(parity_bars).copy(), data.head(parity_bars).copy()
+    for comparison in comparisons:
+        legacy = legacy_detect_signals(legacy, *comparison)[0]
+        keyed = new12.signal_detector.detect_signals(keyed, *comparison)[0]
+        np.testing.assert_array_equal(keyed['Signal'].to_numpy(), legacy['Signal'].to_numpy())
+
+    def sweep(detect):
+        frame = data.copy()
+        for comparison in comparisons:
+            frame = detect(frame, *comparison)[0]
+        return frame
+
+    sweep(legacy_detect_signals)  # warm the indicator cache for both
+    _, legacy_time = timed(sweep, legacy_detect_signals)
+    new12.comparison_columns.reset()
+    _, keyed_time = timed(sweep, new12.signal_detector.detect_signals)
+    stats = new12.comparison_columns.stats()
+    print(f"Sweep of {len(comparisons)} comparisons on one frame: rewritten columns {legacy_time * 1000:.1f}ms | "
+          f"keyed store {keyed_time * 1000:.1f}ms ({legacy_time / keyed_time:.1f}x)")
+    print(f"Columns computed: {stats['computed']} | reused: {stats['reused']} ({stats['reuse_rate']:.1f}%)")
+
+
+if __name__ == "__main__":
+    benchmark_execution_engines()
+    benchmark_vectorized_path()
+    benchmark_batch_backtest()
+    benchmark_indicator_cache()
+    benchmark_market_data_cache()
+    benchmark_concurrent_download()
+    benchmark_parallel_tickers()
+    benchmark_all_strategies()
+    benchmark_fir_moving_averages()
+    benchmark_recursive_filters()
+    benchmark_rolling_kernels()
+    benchmark_rolling_volume_profile()
+    benchmark_strategy_value_cache()
+    benchmark_lazy_signal_labels()
+    benchmark_score_matrix()
+    benchmark_strategy_selection()
+    benchmark_shared_primitives()
+    benchmark_batch_indicators()
+    benchmark_streaming_indicators()
+    benchmark_streaming_runner()
+    benchmark_state_machines()
+    benchmark_signal_expressions()
+    benchmark_packed_signals()
+    benchmark_lagged_comparisons()
+    benchmark_comparison_columns()
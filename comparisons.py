@@ -47,3 +47,18 @@ def crossed(data, col1, col2):
     """Check if col1 crossed col2 (either direction)"""
     return ((data[col1].shift(1) < data[col2].shift(1)) & (data[col1] > data[col2])) | \
            ((data[col1].shift(1) > data[col2].shift(1)) & (data[col1] < data[col2]))
+
+# Signal detector strategy name -> comparison function
+COMPARISON_STRATEGIES = {
+    "CROSSED UP": crossed_up,
+    "CROSSED DOWN": crossed_down,
+    "CROSSED": crossed,
+    "EQUAL": equal_comparison,
+    "GREATER THAN": greater_than,
+    "GREATER OR EQUAL": greater_or_equal,
+    "LESS THAN": less_than,
+    "LESS OR EQUAL": less_or_equal,
+    "WITHIN RANGE": within_range,
+    "INCREASED": increased,
+    "DECREASED": decreased
+}
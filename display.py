@@ -45,6 +45,18 @@ def display_advanced_metrics_summary(ticker_performance):
         print(f"  Average Sharpe Ratio: {avg_sharpe:.3f}")
         print(f"  Maximum Drawdown: {max_drawdown:.2f}%")
 
+def display_download_report(report, elapsed=None):
+    """Display per-ticker download timings and failures"""
+    print(f"\n📥 DOWNLOAD REPORT:")
+    print(f"{'Ticker':<8} {'Status':<8} {'Rows':>8} {'Seconds':>9}  Error")
+    print("-" * 60)
+    for ticker, entry in report.items():
+        status = 'OK' if entry['error'] is None else 'FAILED'
+        print(f"{ticker:<8} {status:<8} {entry['rows']:>8} {entry['seconds']:>9.2f}  {entry['error'] or ''}")
+    if elapsed is not None:
+        serial = sum(entry['seconds'] for entry in report.values())
+        print(f"Wall time: {elapsed:.2f}s (sum of per-ticker times: {serial:.2f}s)")
+
 def display_current_position(performance, final_price):
     """Display current position"""
     print(f"\n📊 CURRENT POSITION:")
@@ -0,0 +1,581 @@
+"""
+Execution Engine Module
+Array-backed bar loops that run the portfolio state machine without per-row DataFrame writes
+"""
+
+import numpy as np
+import pandas as pd
+
+
+"""THE LOOP ENGINES IN new12.py WRITE EVERY BAR WITH data.loc[i, ...] AND READ WITH .iloc[i],
+WHICH IS A PANDAS CALL PER CELL. THE ARRAY ENGINE PULLS Close/Entry_Signal/Exit_Signal INTO
+NUMPY ONCE, FILLS PREALLOCATED OUTPUT ARRAYS AND ATTACHES THEM TO THE FRAME IN ONE ASSIGNMENT"""
+
+POSITION_LABELS = ['OUT', 'IN', 'LONG', 'SHORT']
+ACTION_LABELS = ['', 'BUY', 'SELL', 'EXIT', 'LONG', 'SHORT', 'EXIT_LONG', 'EXIT_SHORT', 'LIQUIDATION']
+
+POSITION_CODES = {label: code for code, label in enumerate(POSITION_LABELS)}
+ACTION_CODES = {label: code for code, label in enumerate(ACTION_LABELS)}
+STATE_CODES = tuple(POSITION_CODES[label] for label in ('OUT', 'IN', 'LONG', 'SHORT'))
+
+TRACKING_COLUMNS = ['Position', 'Action', 'Portfolio_Value', 'Cash', 'Shares',
+                    'Long_Shares', 'Short_Shares', 'Position_Type', 'Reason']
+
+
+class ReasonCodes:
+    """Interns reason strings so the bar loop only stores small integer codes"""
+
+    def __init__(self):
+        self.labels = ['']
+        self.codes = {'': 0}
+
+    def code(self, reason):
+        """Return the integer code for a reason, adding it on first use"""
+        code = self.codes.get(reason)
+        if code is None:
+            code = len(self.labels)
+            self.labels.append(reason)
+            self.codes[reason] = code
+        return code
+
+    def decode(self, codes):
+        """Turn an array of codes back into reason strings"""
+        return np.array(self.labels, dtype=object)[codes]
+
+
+def attach_tracking_columns(data, position, action, portfolio_value, cash, shares,
+                            long_shares, short_shares, position_type, reason, reasons):
+    """Attach the engine output arrays to the DataFrame in one bulk assignment"""
+    position_labels = np.array(POSITION_LABELS, dtype=object)
+    action_labels = np.array(ACTION_LABELS, dtype=object)
+    tracking = pd.DataFrame({
+        'Position': position_labels[position],
+        'Action': action_labels[action],
+        'Portfolio_Value': portfolio_value,
+        'Cash': cash,
+        'Shares': shares,
+        'Long_Shares': long_shares,
+        'Short_Shares': short_shares,
+        'Position_Type': position_labels[position_type],
+        'Reason': reasons.decode(reason)
+    }, index=data.index)
+    data[TRACKING_COLUMNS] = tracking
+    return data
+
+
+def step_bar(portfolio, current_position, current_price, current_date, entry, exit_, strategy_direction, reasons):
+    """One bar of the portfolio state machine
+
+    Returns the new position state and the bar's tracking row (position code, action code,
+    reason code, portfolio value, cash, shares, long shares, short shares, position type code).
+    Fields a branch does not write stay 0, exactly like the preallocated engine arrays."""
+    OUT, IN, LONG, SHORT = STATE_CODES
+    reversal = strategy_direction == "Long/Short Reversal"
+    position = action = reason = 0
+
+    # LIQUIDATION CHECK (highest priority for short positions)
+    if portfolio.check_liquidation(current_price):
+        if portfolio.liquidate_position(current_price, current_date):
+            print(f"🚨 LIQUIDATION: Position closed at ${current_price:.2f}")
+            return 'OUT', (OUT, ACTION_CODES['LIQUIDATION'],
+                           reasons.code('Liquidation - Loss exceeded 100% of available cash'),
+                           portfolio.get_portfolio_value(current_price), portfolio.cash, portfolio.shares, 0.0, 0.0, 0)
+
+    # Trailing stop (only reachable for the legacy 'IN' state)
+    if current_position == 'IN':
+        trailing_result = portfolio.update_trailing_stop(current_price)
+        if trailing_result == "trailing_stop_triggered":
+            if portfolio.sell(current_price, current_date, reason="Trailing stop triggered"):
+                return 'OUT', (OUT, ACTION_CODES['SELL'], reasons.code('Trailing stop triggered'),
+                               portfolio.get_portfolio_value(current_price), portfolio.cash, portfolio.shares, 0.0, 0.0, 0)
+
+    # Stop-loss / take-profit orders
+    if reversal:
+        if current_position in ['IN', 'LONG', 'SHORT']:
+            risk_action, risk_reason = portfolio.check_risk_orders(current_price, current_date)
+            if risk_action == "EXIT":
+                if portfolio.exit_position(current_price, current_date, reason=risk_reason):
+                    return 'OUT', (OUT, ACTION_CODES['EXIT'], reasons.code(risk_reason), 0.0, 0.0, 0.0, 0.0, 0.0, 0)
+            elif risk_action == "SELL":
+                if portfolio.sell(current_price, current_date, reason=risk_reason):
+                    return 'OUT', (OUT, ACTION_CODES['SELL'], reasons.code(risk_reason), 0.0, 0.0, 0.0, 0.0, 0.0, 0)
+    elif current_position == 'IN':
+        risk_action, risk_reason = portfolio.check_risk_orders(current_price, current_date)
+        if risk_action in ("EXIT", "SELL"):
+            if portfolio.sell(current_price, current_date, reason=risk_reason):
+                return 'OUT', (OUT, ACTION_CODES['SELL'], reasons.code(risk_reason), 0.0, 0.0, 0.0, 0.0, 0.0, 0)
+
+    if reversal:
+        # Entry Signal - Enter LONG or flip from SHORT to LONG
+        if entry:
+            if current_position == 'OUT' or current_position == 'SHORT':
+                if current_position == 'SHORT':
+                    if portfolio.exit_position(current_price, current_date, reason="Short to Long Flip"):
+                        action = ACTION_CODES['EXIT_SHORT']
+                        reason = reasons.code('Short to Long Flip')
+                if portfolio.enter_long(current_price, current_date):
+                    position = LONG
+                    action = ACTION_CODES['LONG']
+                    reason = reasons.code('Long Strategy Entry' if current_position == 'OUT' else 'Short to Long Flip')
+                    current_position = 'LONG'
+        # Exit Signal - Enter SHORT or flip from LONG to SHORT
+        elif exit_:
+            if current_position == 'OUT' or current_position == 'LONG':
+                if current_position == 'LONG':
+                    if portfolio.exit_position(current_price, current_date, reason="Long to Short Flip"):
+                        action = ACTION_CODES['EXIT_LONG']
+                        reason = reasons.code('Long to Short Flip')
+                if portfolio.enter_short(current_price, current_date):
+                    position = SHORT
+                    action = ACTION_CODES['SHORT']
+                    reason = reasons.code('Short Strategy Entry' if current_position == 'OUT' else 'Long to Short Flip')
+                    current_position = 'SHORT'
+        else:
+            position = POSITION_CODES[current_position]
+            action = ACTION_CODES['']
+            reason = reasons.code('Hold')
+
+    elif strategy_direction == "Long Only":
+        if current_position == 'OUT' and entry:
+            if portfolio.buy(current_price, current_date):
+                position = IN
+                action = ACTION_CODES['BUY']
+                reason = reasons.code('Strategy Entry')
+                current_position = 'IN'
+        elif current_position == 'IN' and exit_:
+            if portfolio.sell(current_price, current_date, reason="Strategy Exit"):
+                position = OUT
+                action = ACTION_CODES['SELL']
+                reason = reasons.code('Strategy Exit')
+                current_position = 'OUT'
+
+    elif strategy_direction == "Short Only":
+        if current_position == 'OUT' and exit_:
+            if portfolio.enter_short(current_price, current_date):
+                position = SHORT
+                action = ACTION_CODES['SHORT']
+                reason = reasons.code('Short Strategy Entry')
+                current_position = 'SHORT'
+        elif current_position == 'SHORT' and entry:
+            if portfolio.exit_position(current_price, current_date, reason="Short Strategy Exit"):
+                position = OUT
+                action = ACTION_CODES['EXIT_SHORT']
+                reason = reasons.code('Short Strategy Exit')
+                current_position = 'OUT'
+
+    else:
+        position = POSITION_CODES[current_position]
+        action = ACTION_CODES['']
+        reason = reasons.code('Hold')
+
+    # Update portfolio tracking
+    return current_position, (position, action, reason, portfolio.get_portfolio_value(current_price),
+                              portfolio.cash, portfolio.shares, portfolio.long_shares, portfolio.short_shares,
+                              POSITION_CODES[portfolio.position])
+
+
+def execute_trading_strategy_arrays(data, portfolio, strategy_direction="Long/Short Reversal"):
+    """Execute the trading strategy over NumPy arrays - same results as the loop engines
+
+    Long/Short Reversal follows execute_trading_strategy, Long Only and Short Only follow
+    execute_trading_strategy_original. The signature accepts both call forms so it can be
+    passed wherever either loop engine is expected."""
+    n = len(data)
+    close = data['Close'].to_numpy()
+    entry_signal = data['Entry_Signal'].to_numpy(dtype=bool)
+    exit_signal = data['Exit_Signal'].to_numpy(dtype=bool)
+    dates = data.index
+
+    # Preallocated outputs, initialised to the same defaults the loop engines write up front
+    position = np.zeros(n, dtype=np.int8)
+    action = np.zeros(n, dtype=np.int8)
+    portfolio_value = np.zeros(n)
+    cash = np.zeros(n)
+    shares = np.zeros(n)
+    long_shares = np.zeros(n)
+    short_shares = np.zeros(n)
+    position_type = np.zeros(n, dtype=np.int8)
+    reason = np.zeros(n, dtype=np.int32)
+    reasons = ReasonCodes()
+
+    current_position = 'OUT'
+    for i in range(n):
+        current_position, row = step_bar(portfolio, current_position, close[i], dates[i],
+                                         entry_signal[i], exit_signal[i], strategy_direction, reasons)
+        (position[i], action[i], reason[i], portfolio_value[i], cash[i], shares[i],
+         long_shares[i], short_shares[i], position_type[i]) = row
+
+    return attach_tracking_columns(data, position, action, portfolio_value, cash, shares,
+                                   long_shares, short_shares, position_type, reason, reasons)
+
+
+# =============================================================================
+# VECTORIZED FAST PATH (Long Only / Short Only without risk orders)
+# =============================================================================
+
+"""WITHOUT STOP-LOSS, TAKE-PROFIT OR TRAILING STOP THE LONG ONLY / SHORT ONLY STATE MACHINE ONLY
+DEPENDS ON THE SIGNAL SEQUENCE, SO POSITION EPISODES CAN BE FOUND WITH INDEX SEARCHES OVER THE
+SIGNAL BARS. PYTHON ONLY RUNS ONCE PER TRADE (TO REPLAY IT ON THE PORTFOLIO FOR THE LEDGER),
+EVERY PER-BAR COLUMN IS BUILT WITH NUMPY"""
+
+SCAN_BLOCK = 256
+
+
+def vectorized_path_blockers(portfolio, strategy_direction):
+    """Return the reasons the vectorized fast path cannot run (empty list means it can)"""
+    blockers = []
+    if strategy_direction not in ("Long Only", "Short Only"):
+        blockers.append(f"direction '{strategy_direction}' needs the bar loop")
+    if portfolio.stop_loss_percentage is not None or portfolio.stop_loss_dollars is not None:
+        blockers.append("stop-loss configured")
+    if portfolio.take_profit_percentage is not None or portfolio.take_profit_dollars is not None:
+        blockers.append("take-profit configured")
+    if portfolio.trailing_stop_active:
+        blockers.append("trailing stop configured")
+    if portfolio.position != "OUT" or portfolio.shares != 0:
+        blockers.append("portfolio already holds a position")
+    return blockers
+
+
+def _first_match(start, n, block_mask):
+    """Scan forward from start in growing blocks; block_mask(lo, hi) returns a bool array for bars lo..hi-1"""
+    lo = start
+    size = SCAN_BLOCK
+    while lo < n:
+        hi = min(n, lo + size)
+        hits = np.flatnonzero(block_mask(lo, hi))
+        if len(hits):
+            return lo + hits[0]
+        lo = hi
+        size *= 2
+    return None
+
+
+def _next_signal(signal_idx, start):
+    """First signal bar at or after start"""
+    k = np.searchsorted(signal_idx, start)
+    return signal_idx[k] if k < len(signal_idx) else None
+
+
+def _step_values(n, event_bars, event_values, initial):
+    """Piecewise-constant series that takes event_values[k] from event_bars[k] onwards"""
+    values = np.concatenate(([initial], np.asarray(event_values, dtype=float)))
+    if len(event_bars) == 0:
+        return np.full(n, float(initial))
+    slot = np.searchsorted(np.asarray(event_bars), np.arange(n), side='right')
+    return values[slot]
+
+
+def _replay_long_only(portfolio, close, dates, entry_signal, exit_signal):
+    """Walk Long Only episodes; returns (bar, action, reason) events in order"""
+    entry_idx = np.flatnonzero(entry_signal)
+    exit_idx = np.flatnonzero(exit_signal)
+    events = []
+    start = 0
+    while True:
+        i = _next_signal(entry_idx, start)
+        if i is None:
+            break
+        if not portfolio.buy(close[i], dates[i]):
+            start = i + 1
+            continue
+        events.append((i, 'BUY', 'Strategy Entry'))
+        j = _next_signal(exit_idx, i + 1)
+        if j is None:
+            break
+        portfolio.sell(close[j], dates[j], reason="Strategy Exit")
+        events.append((j, 'SELL', 'Strategy Exit'))
+        start = j + 1
+    return events
+
+
+def _replay_short_only(portfolio, close, dates, entry_signal, exit_signal):
+    """Walk Short Only episodes, including the liquidation check; returns (bar, action, reason) events"""
+    n = len(close)
+    exit_idx = np.flatnonzero(exit_signal)
+    events = []
+    start = 0
+    while True:
+        i = _next_signal(exit_idx, start)
+        if i is None:
+            break
+        if not portfolio.enter_short(close[i], dates[i]):
+            start = i + 1
+            continue
+        events.append((i, 'SHORT', 'Short Strategy Entry'))
+
+        # Same arithmetic as check_liquidation / liquidate_position / exit_position
+        entry_price = portfolio.entry_price
+        shares_abs = abs(portfolio.short_shares)
+        margin_used = portfolio.margin_used
+        cash = portfolio.cash
+
+        def close_mask(lo, hi):
+            prices = close[lo:hi]
+            affordable = shares_abs * prices <= cash
+            liquidation = (prices - entry_price) * shares_abs >= margin_used * 1.0
+            return affordable & (liquidation | entry_signal[lo:hi])
+
+        j = _first_match(i + 1, n, close_mask)
+        if j is None:
+            break
+        if (close[j] - entry_price) * shares_abs >= margin_used * 1.0:
+            portfolio.liquidate_position(close[j], dates[j])
+            print(f"🚨 LIQUIDATION: Position closed at ${close[j]:.2f}")
+            events.append((j, 'LIQUIDATION', 'Liquidation - Loss exceeded 100% of available cash'))
+        else:
+            portfolio.exit_position(close[j], dates[j], reason="Short Strategy Exit")
+            events.append((j, 'EXIT_SHORT', 'Short Strategy Exit'))
+        start = j + 1
+    return events
+
+
+def execute_trading_strategy_vectorized(data, portfolio, strategy_direction="Long Only"):
+    """Execute Long Only / Short Only without risk orders - no per-bar Python loop
+
+    Gives the same tracking columns and trade ledger as execute_trading_strategy_original.
+    Callers must check vectorized_path_blockers first (execute_trading_strategy_auto does)."""
+    n = len(data)
+    close = data['Close'].to_numpy()
+    entry_signal = data['Entry_Signal'].to_numpy(dtype=bool)
+    exit_signal = data['Exit_Signal'].to_numpy(dtype=bool)
+    dates = data.index
+    initial_cash = portfolio.cash
+
+    # Replay each episode on the portfolio; every event appends exactly one ledger entry
+    replay = _replay_long_only if strategy_direction == "Long Only" else _replay_short_only
+    trade_count = len(portfolio.trades)
+    events = replay(portfolio, close, dates, entry_signal, exit_signal)
+    ledger = portfolio.trades[trade_count:]
+
+    event_bars = np.array([bar for bar, _, _ in events], dtype=np.int64)
+    opens = np.array([event_action in ('BUY', 'SHORT') for _, event_action, _ in events], dtype=bool)
+
+    # State after each event: an opening event holds the entry trade's shares, a closing one is flat
+    cash_after = [trade['cash_remaining'] for trade in ledger]
+    entry_shares = np.array([trade['shares'] for trade in ledger], dtype=float)
+    entry_margin = np.array([trade.get('cost', 0.0) for trade in ledger], dtype=float)
+    long_after = np.where(opens & (strategy_direction == "Long Only"), entry_shares, 0.0)
+    short_after = np.where(opens & (strategy_direction == "Short Only"), entry_shares, 0.0)
+    margin_after = np.where(opens & (strategy_direction == "Short Only"), entry_margin, 0.0)
+
+    cash = _step_values(n, event_bars, cash_after, initial_cash)
+    long_shares = _step_values(n, event_bars, long_after, 0.0)
+    short_shares = _step_values(n, event_bars, short_after, 0.0)
+    margin_used = _step_values(n, event_bars, margin_after, 0.0)
+    in_position = _step_values(n, event_bars, opens.astype(float), 0.0).astype(bool)
+
+    # Equity: cash while flat, cash plus marked-to-market position while in an episode
+    if strategy_direction == "Long Only":
+        portfolio_value = np.where(in_position, cash + long_shares * close, cash)
+        held_type = POSITION_CODES['LONG']
+    else:
+        portfolio_value = np.where(in_position, cash + (margin_used + short_shares * close), cash)
+        held_type = POSITION_CODES['SHORT']
+    shares = long_shares.copy()
+    position_type = np.where(in_position, held_type, POSITION_CODES['OUT']).astype(np.int8)
+
+    # Event bars carry the Position/Action/Reason labels, every other bar keeps the loop defaults
+    position = np.zeros(n, dtype=np.int8)
+    action = np.zeros(n, dtype=np.int8)
+    reason = np.zeros(n, dtype=np.int32)
+    reasons = ReasonCodes()
+    event_position = {'BUY': 'IN', 'SELL': 'OUT', 'SHORT': 'SHORT', 'EXIT_SHORT': 'OUT', 'LIQUIDATION': 'OUT'}
+    for bar, event_action, event_reason in events:
+        position[bar] = POSITION_CODES[event_position[event_action]]
+        action[bar] = ACTION_CODES[event_action]
+        reason[bar] = reasons.code(event_reason)
+
+    return attach_tracking_columns(data, position, action, portfolio_value, cash, shares,
+                                   long_shares, short_shares, position_type, reason, reasons)
+
+
+def execute_trading_strategy_auto(data, portfolio, strategy_direction="Long/Short Reversal"):
+    """Use the vectorized fast path when the portfolio config allows it, else the array bar loop
+
+    The path taken is reported in data.attrs['execution_path'] ('vectorized' or 'loop') and the
+    reasons for falling back in data.attrs['execution_path_blockers']."""
+    blockers = vectorized_path_blockers(portfolio, strategy_direction)
+    if blockers:
+        data = execute_trading_strategy_arrays(data, portfolio, strategy_direction)
+        data.attrs['execution_path'] = 'loop'
+    else:
+        data = execute_trading_strategy_vectorized(data, portfolio, strategy_direction)
+        data.attrs['execution_path'] = 'vectorized'
+    data.attrs['execution_path_blockers'] = blockers
+    return data
+
+
+# =============================================================================
+# BATCHED MULTI-CONFIGURATION ENGINE
+# =============================================================================
+
+"""A PARAMETER STUDY RUNS THE SAME PRICE SERIES THROUGH MANY CONFIGS. INSTEAD OF ONE PORTFOLIO
+OBJECT PER CONFIG, THE BATCH ENGINE KEEPS EVERY PORTFOLIO FIELD AS A LENGTH-N VECTOR AND
+ADVANCES ALL N CONFIGS TOGETHER, ONE BAR AT A TIME. THE ARITHMETIC IS DONE IN THE SAME ORDER
+AS Portfolio.buy / sell / enter_long / enter_short / exit_position / liquidate_position,
+SO EVERY CONFIG ENDS WITH THE SAME CASH AND TRADE COUNT AS A SINGLE PORTFOLIO RUN"""
+
+STRATEGY_DIRECTIONS = ["Long Only", "Short Only", "Long/Short Reversal"]
+
+
+def execute_batch_arrays(close, entry_matrix, exit_matrix, strategy_directions,
+                         initial_cash=10000, trade_size_percentages=100):
+    """Run N percentage-sized portfolios over one price series at once
+
+    entry_matrix / exit_matrix are (N x bars) boolean signal matrices, strategy_directions
+    holds one direction per row. Risk orders are not modelled. Returns a dict of length-N
+    result vectors."""
+    close = np.asarray(close, dtype=float)
+    entry_matrix = np.asarray(entry_matrix, dtype=bool)
+    exit_matrix = np.asarray(exit_matrix, dtype=bool)
+    n_configs, n_bars = entry_matrix.shape
+    if exit_matrix.shape != entry_matrix.shape or len(close) != n_bars:
+        raise ValueError("Signal matrices must both be (configs x bars) and match the price series")
+    for direction in set(strategy_directions):
+        if direction not in STRATEGY_DIRECTIONS:
+            raise ValueError(f"Unknown strategy direction: {direction}")
+
+    directions = np.asarray(strategy_directions, dtype=object)
+    long_only = directions == "Long Only"
+    short_only = directions == "Short Only"
+    reversal = directions == "Long/Short Reversal"
+    size_fraction = np.broadcast_to(np.asarray(trade_size_percentages, dtype=float), (n_configs,)) / 100
+
+    # Portfolio fields, one slot per config
+    cash = np.full(n_configs, float(initial_cash))
+    available_cash = cash.copy()
+    shares = np.zeros(n_configs)          # legacy Long Only shares
+    long_shares = np.zeros(n_configs)
+    short_shares = np.zeros(n_configs)
+    margin_used = np.zeros(n_configs)
+    entry_price = np.zeros(n_configs)
+    is_long = np.zeros(n_configs, dtype=bool)    # portfolio.position == "LONG"
+    is_short = np.zeros(n_configs, dtype=bool)   # portfolio.position == "SHORT"
+    # The loop engines' current_position: 1 for 'IN' / 'LONG', -1 for 'SHORT', 0 for 'OUT'.
+    # It only moves on a successful entry, so after a cover whose re-entry fails it can
+    # still read 'SHORT' while the portfolio is flat.
+    loop_state = np.zeros(n_configs, dtype=np.int8)
+    total_trades = np.zeros(n_configs, dtype=np.int64)
+
+    # Running statistics
+    peak_value = cash.copy()
+    max_drawdown = np.zeros(n_configs)
+    bars_in_market = np.zeros(n_configs, dtype=np.int64)
+    portfolio_value = cash.copy()
+
+    for i in range(n_bars):
+        price = close[i]
+        entry = entry_matrix[:, i]
+        exit_ = exit_matrix[:, i]
+
+        # LIQUIDATION CHECK - a liquidated config skips the rest of the bar
+        acted = np.zeros(n_configs, dtype=bool)
+        if is_short.any():
+            cover = -short_shares * price
+            liquidate = is_short & ((price - entry_price) * -short_shares >= margin_used) & (cover <= cash)
+            if liquidate.any():
+                # liquidate_position leaves available_cash untouched (the margin stays reserved)
+                cash[liquidate] -= cover[liquidate]
+                short_shares[liquidate] = 0
+                margin_used[liquidate] = 0
+                entry_price[liquidate] = 0
+                is_short[liquidate] = False
+                loop_state[liquidate] = 0
+                total_trades[liquidate] += 1
+                acted = liquidate
+
+        # Long Only: buy on entry when OUT, sell on exit when IN
+        buy = long_only & ~acted & (loop_state == 0) & entry
+        sell = long_only & ~acted & (loop_state == 1) & exit_ & (shares > 0)
+        # Short Only: short on exit when OUT, cover on entry when SHORT
+        open_short = short_only & ~acted & (loop_state == 0) & exit_
+        cover_short = short_only & ~acted & (loop_state == -1) & entry
+        # Reversal: entry flips to LONG, otherwise exit flips to SHORT
+        flip_long = reversal & ~acted & entry & (loop_state != 1)
+        flip_short = reversal & ~acted & ~entry & exit_ & (loop_state != -1)
+        cover_short = (cover_short | flip_long) & is_short & (short_shares < 0)
+        sell_long = flip_short & is_long & (long_shares > 0)
+
+        if sell.any():
+            proceeds = shares[sell] * price
+            cash[sell] += proceeds
+            available_cash[sell] += proceeds
+            shares[sell] = 0
+            long_shares[sell] = 0
+            short_shares[sell] = 0
+            entry_price[sell] = 0
+            is_long[sell] = False
+            loop_state[sell] = 0
+            total_trades[sell] += 1
+
+        if sell_long.any():
+            proceeds = long_shares[sell_long] * price
+            cash[sell_long] += proceeds
+            available_cash[sell_long] += proceeds
+            long_shares[sell_long] = 0
+            entry_price[sell_long] = 0
+            margin_used[sell_long] = 0
+            is_long[sell_long] = False
+            total_trades[sell_long] += 1
+
+        if cover_short.any():
+            cost = -short_shares * price
+            covered = cover_short & (cost <= cash)
+            cash[covered] -= cost[covered]
+            available_cash[covered] = cash[covered]
+            short_shares[covered] = 0
+            entry_price[covered] = 0
+            margin_used[covered] = 0
+            is_short[covered] = False
+            loop_state[covered & short_only] = 0
+            total_trades[covered] += 1
+
+        # Entries only succeed from a flat portfolio (a failed cover leaves the short open)
+        flat = ~is_long & ~is_short
+        enter_long = (buy | flip_long) & flat
+        enter_short = (open_short | flip_short) & flat
+        if enter_long.any() or enter_short.any():
+            trade_amount = available_cash * size_fraction
+            new_shares = trade_amount / price
+            cost = new_shares * price
+            affordable = cost <= available_cash
+            enter_long &= affordable
+            enter_short &= affordable
+
+            cash[enter_long] -= cost[enter_long]
+            available_cash[enter_long] -= cost[enter_long]
+            long_shares[enter_long] = new_shares[enter_long]
+            short_shares[enter_long] = 0
+            legacy = enter_long & long_only
+            shares[legacy] += new_shares[legacy]
+            margin_used[enter_long & reversal] = 0
+            is_long[enter_long] = True
+
+            available_cash[enter_short] -= cost[enter_short]
+            short_shares[enter_short] = -new_shares[enter_short]
+            long_shares[enter_short] = 0
+            margin_used[enter_short] = cost[enter_short]
+            is_short[enter_short] = True
+
+            opened = enter_long | enter_short
+            entry_price[opened] = price
+            loop_state[enter_long] = 1
+            loop_state[enter_short] = -1
+            total_trades[opened] += 1
+
+        # Mark to market and update drawdown / exposure statistics
+        portfolio_value = np.where(is_long, cash + long_shares * price,
+                                   np.where(is_short, cash + (margin_used + short_shares * price), cash))
+        np.maximum(peak_value, portfolio_value, out=peak_value)
+        np.minimum(max_drawdown, (portfolio_value - peak_value) / peak_value, out=max_drawdown)
+        bars_in_market += is_long | is_short
+
+    return {
+        'current_value': portfolio_value,
+        'cash': cash,
+        'total_trades': total_trades,
+        'max_drawdown': max_drawdown * 100,
+        'exposure_pct': bars_in_market / max(n_bars, 1) * 100,
+        'position': np.where(is_long, 'LONG', np.where(is_short, 'SHORT', 'OUT'))
+    }
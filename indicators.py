@@ -1,5 +1,10 @@
 
 from ta_strategies_TVLibrary import *
+from kernels import weighted_window_sums
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
 
 class IndicatorRegistry:
     """Registry for all available indicators - easily extensible"""
@@ -853,8 +858,24 @@ def momentum_breakout_bands(data, period=20, upper_threshold=2, lower_threshold=
 
 
 
-def calculate_indicator(data, indicator_name, params):
-    """Generic function to calculate any indicator"""
+def complete_params(indicator_name, params):
+    """params with the omitted trailing ones filled from the indicator function's defaults, e.g. RSI (14,) -> (14, 70, 30)"""
+    indicator_func = indicator_registry.get(indicator_name)
+    if indicator_func is None or isinstance(params, dict):
+        return params
+    # compute_indicator passes params positionally after data, in the function's parameter order
+    positional = [parameter for parameter in inspect.signature(indicator_func).parameters.values()
+                  if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)][1:]
+    filled = list(params)
+    for parameter in positional[len(filled):]:
+        if parameter.default is inspect.Parameter.empty:
+            break
+        filled.append(parameter.default)
+    return tuple(filled)
+
+
+def compute_indicator(data, indicator_name, params):
+    """Generic function to calculate any indicator (uncached)"""
     indicator_func = indicator_registry.get(indicator_name)
     if indicator_func is None:
         raise ValueError(f"Unknown indicator: {indicator_name}")
@@ -1010,5 +1031,260 @@ def calculate_indicator(data, indicator_name, params):
         else:
             return indicator_func(data, params[0])  # Only period
 
+
+# =============================================================================
+# INDICATOR CACHE
+# =============================================================================
+
+"""THE SAME INDICATOR IS OFTEN ASKED FOR SEVERAL TIMES PER RUN (ENTRY AND EXIT COLUMNS, EVERY
+MULTI-CONDITION ROW), SO calculate_indicator GOES THROUGH A MEMO CACHE. THE KEY IS A FINGERPRINT
+OF THE INPUT FRAME (LENGTH, INDEX AND TIMESTAMP BOUNDS, A HASH OF THE OHLCV BUFFERS) PLUS THE
+INDICATOR NAME AND NORMALIZED PARAMS, SO AN EDITED OR DIFFERENT FRAME NEVER HITS A STALE ENTRY.
+ENTRIES ARE EVICTED LEAST-RECENTLY-USED ONCE THE STORED RESULTS EXCEED max_bytes"""
+
+FINGERPRINT_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+def normalize_params(params):
+    """Turn indicator params into a hashable, order-stable key"""
+    if isinstance(params, dict):
+        return tuple(sorted((key, normalize_params(value)) for key, value in params.items()))
+    if isinstance(params, (list, tuple)):
+        return tuple(normalize_params(value) for value in params)
+    if isinstance(params, np.generic):
+        return params.item()
+    return params
+
+
+def data_fingerprint(data):
+    """Cheap content fingerprint of an OHLCV frame"""
+    digest = hashlib.blake2b(digest_size=16)
+    for column in FINGERPRINT_COLUMNS:
+        if column in data.columns:
+            digest.update(column.encode())
+            digest.update(np.ascontiguousarray(data[column].to_numpy(dtype=float)).tobytes())
+    bounds = []
+    if len(data) > 0:
+        bounds.append((data.index[0], data.index[-1]))
+        for column in ('Datetime', 'Date'):
+            if column in data.columns:
+                bounds.append((data[column].iloc[0], data[column].iloc[-1]))
+    return (len(data), type(data.index).__name__, repr(bounds), digest.hexdigest())
+
+
+def result_nbytes(result):
+    """Approximate memory held by an indicator result"""
+    if isinstance(result, (pd.Series, pd.DataFrame)):
+        return int(np.sum(result.memory_usage(index=True)))
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(result, tuple):
+        return sum(result_nbytes(item) for item in result)
+    if isinstance(result, dict):
+        return sum(result_nbytes(item) for item in result.values())
+    return 64
+
+
+def copy_result(result):
+    """Copy array-like results so callers cannot mutate cached entries"""
+    if isinstance(result, (pd.Series, pd.DataFrame, np.ndarray)):
+        return result.copy()
+    if isinstance(result, tuple):
+        return tuple(copy_result(item) for item in result)
+    if isinstance(result, dict):
+        return {key: copy_result(item) for key, item in result.items()}
+    return result
+
+
+class IndicatorCache:
+    """LRU memo cache for calculate_indicator, bounded by bytes"""
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, enabled=True):
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.entries = OrderedDict()  # {key: (result, nbytes)}
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def make_key(self, data, indicator_name, params, fingerprint=None):
+        """Cache key for an indicator call (pass fingerprint to reuse one already taken of data)"""
+        if fingerprint is None:
+            fingerprint = data_fingerprint(data)
+        return (fingerprint, indicator_name, normalize_params(params))
+
+    def get(self, key):
+        """Return a copy of the cached result, or None on a miss"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return copy_result(entry[0])
+
+    def put(self, key, result):
+        """Store a result and evict least-recently-used entries over the byte budget"""
+        nbytes = result_nbytes(result)
+        if nbytes > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self.current_bytes -= self.entries.pop(key)[1]
+            self.entries[key] = (copy_result(result), nbytes)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self.entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every cached result and reset the counters"""
+        with self.lock:
+            self.entries.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def enable(self):
+        """Turn caching on"""
+        self.enabled = True
+
+    def disable(self):
+        """Turn caching off and release the cached results"""
+        self.enabled = False
+        self.clear()
+
+    def stats(self):
+        """Hit/miss counters and memory use"""
+        lookups = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'entries': len(self.entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups * 100 if lookups else 0.0
+        }
+
+
+def calculate_indicator(data, indicator_name, params, fingerprint=None):
+    """Generic function to calculate any indicator, memoized through indicator_cache
+
+    Pass the data_fingerprint of data when calling it for many indicators of the same frame"""
+    if not indicator_cache.enabled:
+        return compute_indicator(data, indicator_name, params)
+    key = indicator_cache.make_key(data, indicator_name, params, fingerprint)
+    result = indicator_cache.get(key)
+    if result is None:
+        result = compute_indicator(data, indicator_name, params)
+        indicator_cache.put(key, result)
+    return result
+
+
+
+# =============================================================================
+# BATCH INDICATORS
+# =============================================================================
+
+"""A PARAMETER SWEEP CALLS calculate_indicator ONCE PER PERIOD. calculate_indicator_batch TAKES THE WHOLE LIST
+OF PERIODS, FINGERPRINTS THE FRAME ONCE, SKIPS THE PERIODS ALREADY CACHED AND PUTS EVERY NEW COLUMN IN
+indicator_cache UNDER THE KEY calculate_indicator USES FOR (period, *params), SO THE PER-PERIOD CALLS THAT FOLLOW
+ARE HITS. A CACHED VALUE MUST NOT DEPEND ON WHICH CALL FILLED IT, SO EACH COLUMN IS COMPUTED WITH EXACTLY THE
+PER-PERIOD ARITHMETIC (THE SAME pandas rolling / ewm CALLS, THE SAME WMA WINDOW SUMS) AND IS BIT FOR BIT WHAT
+compute_indicator RETURNS; WHAT THE PERIODS SHARE IS DONE ONCE (THE Close SERIES, RSI'S diff AND GAIN / LOSS SPLIT).
+THE MULTI-PERIOD BANKS IN kernels ARE FASTER BUT ONLY MATCH TO FLOATING-POINT TOLERANCE, SO THEY ARE NOT USED HERE"""
+
+
+def sma_batch(data, periods):
+    """Simple moving averages of Close for several periods, (bars x periods), each as sma computes it"""
+    close = data['Close']
+    result = np.empty((len(periods), len(data)))
+    for row, period in enumerate(periods):
+        result[row] = close.rolling(window=period).mean().to_numpy()
+    return result.T
+
+
+def ema_batch(data, periods):
+    """Exponential moving averages of Close for several periods, (bars x periods), each as ema computes it"""
+    close = data['Close']
+    result = np.empty((len(periods), len(data)))
+    for row, period in enumerate(periods):
+        result[row] = close.ewm(span=period).mean().to_numpy()
+    return result.T
+
+
+def rsi_batch(data, periods):
+    """Relative Strength Index for several periods, (bars x periods), each as rsi computes it"""
+    delta = data['Close'].diff()
+    gains = delta.where(delta > 0, 0)
+    losses = -delta.where(delta < 0, 0)
+    result = np.empty((len(periods), len(data)))
+    for row, period in enumerate(periods):
+        rs = gains.rolling(window=period).mean() / losses.rolling(window=period).mean()
+        result[row] = (100 - (100 / (1 + rs))).to_numpy()
+    return result.T
+
+
+def weighted_moving_average_batch(data, periods):
+    """Weighted moving averages of Close with the library's warm-up, for several periods, (bars x periods)"""
+    prices = data['Close'].to_numpy(dtype=float)
+    result = np.empty((len(periods), len(prices)))
+    for row, period in enumerate(periods):
+        w = list(range(1, period + 1))
+        warmup = min(period - 1, len(prices))
+        result[row, :warmup] = np.cumsum(prices[:warmup] * w[:warmup]) / sum(w)
+        result[row, warmup:] = weighted_window_sums(prices, w) / sum(w)
+    return result.T
+
+
+# Batch function and the params calculate_indicator takes after the period
+BATCH_INDICATORS = {
+    "SMA": (sma_batch, ()),
+    "EMA": (ema_batch, ()),
+    "RSI": (rsi_batch, (70, 30)),
+    "WMA": (weighted_moving_average_batch, (0.01,))
+}
+
+
+def calculate_indicator_batch(data, indicator_name, periods, params=None, fingerprint=None):
+    """One indicator over several periods, (bars x periods); every column is cached for calculate_indicator
+
+    Pass the data_fingerprint of data when it was already taken"""
+    if indicator_name not in BATCH_INDICATORS:
+        raise ValueError(f"No batch version of indicator: {indicator_name}. Use one of {tuple(BATCH_INDICATORS)}")
+    batch_func, default_params = BATCH_INDICATORS[indicator_name]
+    periods = [int(period) for period in periods]
+    if not periods or any(period < 1 for period in periods):
+        raise ValueError(f"Periods must be a non-empty list of positive integers, got {periods}")
+    params = tuple(default_params if params is None else params)
+    if not indicator_cache.enabled:
+        return batch_func(data, periods)
+
+    if fingerprint is None:
+        fingerprint = data_fingerprint(data)
+    keys = [indicator_cache.make_key(data, indicator_name, (period,) + params, fingerprint) for period in periods]
+    values = np.empty((len(periods), len(data))).T
+    missing = []
+    for column, key in enumerate(keys):
+        cached = indicator_cache.get(key)
+        if cached is None:
+            missing.append(column)
+        else:
+            values[:, column] = cached
+    if missing:
+        computed = batch_func(data, [periods[column] for column in missing])
+        for position, column in enumerate(missing):
+            values[:, column] = computed[:, position]
+            indicator_cache.put(keys[column], pd.Series(computed[:, position], index=data.index, name='Close'))
+    return values
+
 # Global registry instance - created after all functions are defined
 indicator_registry = IndicatorRegistry()
+indicator_cache = IndicatorCache()
@@ -4,7 +4,11 @@ from display import *
 from metrics import *
 from comparision_types import ComparisonType
 import yfinance as yf
-from new12 import entry_multi_detector, exit_multi_detector
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from market_data import *
+from new12 import entry_multi_detector, exit_multi_detector, signal_detector
+from signal_expressions import ExpressionEvaluator
 
 
 
@@ -132,6 +136,25 @@ def get_strategy_inputs():
             entry_strategy, exit_strategy, entry_comp1_candles_ago, entry_comp2_candles_ago,
             exit_comp1_candles_ago, exit_comp2_candles_ago)
 
+"""get_strategy_inputs RETURNS A TUPLE, THE MULTI-TICKER MENUS RETURN A strategy_config DICT
+WITH THE SAME FIELDS. strategy_inputs_to_config TURNS THE TUPLE INTO THAT DICT SO BOTH CAN BE
+FED TO run_batch_backtest"""
+
+STRATEGY_INPUT_KEYS = ['ticker', 'period', 'interval',
+                       'entry_comp1_type', 'entry_comp1_name', 'entry_comp1_params',
+                       'entry_comp2_type', 'entry_comp2_name', 'entry_comp2_params',
+                       'exit_comp1_type', 'exit_comp1_name', 'exit_comp1_params',
+                       'exit_comp2_type', 'exit_comp2_name', 'exit_comp2_params',
+                       'entry_strategy', 'exit_strategy',
+                       'entry_comp1_candles_ago', 'entry_comp2_candles_ago',
+                       'exit_comp1_candles_ago', 'exit_comp2_candles_ago']
+
+def strategy_inputs_to_config(inputs):
+    """Convert the get_strategy_inputs tuple into a strategy_config dict"""
+    if len(inputs) != len(STRATEGY_INPUT_KEYS):
+        raise ValueError(f"Expected {len(STRATEGY_INPUT_KEYS)} strategy inputs, got {len(inputs)}")
+    return dict(zip(STRATEGY_INPUT_KEYS, inputs))
+
 def get_strategy_direction():
     """Get strategy direction selection"""
     print("\n--- STRATEGY DIRECTION ---")
@@ -621,9 +644,10 @@ def download_and_prepare_data(ticker, period="5y", interval="4h"):
     print(f"Downloading {period} of {interval} data for {ticker}...")
     
     try:
-        data = yf.Ticker(ticker).history(period=period, interval=interval)
+        # Served from the on-disk cache when possible, only the missing tail is downloaded
+        data = market_data_cache.get_history(ticker, period, interval)
         
-        if data.empty:
+        if data is None or data.empty:
             print(f"❌ No data available for {ticker} with {period} period and {interval} interval")
             print("💡 Try shorter periods for intraday data (e.g., 1y for 1h, 60d for 15m)")
             return None
@@ -652,6 +676,42 @@ def download_and_prepare_data(ticker, period="5y", interval="4h"):
         print("   - 15-minute data: up to 60 days")
         return None
 
+"""MULTI-TICKER RUNS USED TO DOWNLOAD ONE TICKER AFTER ANOTHER, SO TEN TICKERS MEANT TEN ROUND TRIPS
+OF NETWORK LATENCY IN A ROW. download_tickers RUNS THE LOADER FOR EVERY TICKER ON A BOUNDED THREAD
+POOL, TIMES EACH ONE AND RECORDS FAILURES WITHOUT CANCELLING THE OTHERS"""
+
+def download_tickers(tickers, period, interval, max_workers=8, loader=None):
+    """Download several tickers concurrently - returns ({ticker: data}, {ticker: report})"""
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    loader = loader or download_and_prepare_data
+
+    def load(ticker):
+        start = time.perf_counter()
+        try:
+            data = loader(ticker, period, interval)
+            error = None if data is not None else 'no data returned'
+        except Exception as e:
+            data, error = None, str(e)
+        return ticker, data, time.perf_counter() - start, error
+
+    ticker_data = {}
+    report = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, max(len(tickers), 1))) as executor:
+        futures = [executor.submit(load, ticker) for ticker in tickers]
+        for future in as_completed(futures):
+            ticker, data, seconds, error = future.result()
+            report[ticker] = {
+                'seconds': seconds,
+                'rows': 0 if data is None else len(data),
+                'error': error
+            }
+            if data is not None:
+                ticker_data[ticker] = data
+    # Keep the caller's ticker order
+    return ({ticker: ticker_data[ticker] for ticker in tickers if ticker in ticker_data},
+            {ticker: report[ticker] for ticker in tickers})
+
 def get_number_of_conditions(condition_type):
     """Get number of conditions from user"""
     print(f"\n--- {condition_type.upper()} CONDITIONS ---")
@@ -760,13 +820,16 @@ def detect_multi_strategy_signals(data, entry_conditions, exit_conditions,
             condition.get('comp1_candles_ago', 0), condition.get('comp2_candles_ago', 0)
         )
     
-    # Detect entry signals
-    data, entry_condition_columns = entry_multi_detector.detect_all_conditions(data)
-    data['Entry_Signal'] = data['Combined_Signal']
+    # Entry and exit rules share one evaluator, so an operand or condition used by both is computed once
+    evaluator = ExpressionEvaluator(data, signal_detector.strategies)
+    
+    # Detect entry and exit signals (packed bitsets, unpacked once into the columns the engines read)
+    entry_signal, entry_condition_columns = entry_multi_detector.detect_packed_conditions(data, evaluator)
+    exit_signal, exit_condition_columns = exit_multi_detector.detect_packed_conditions(data, evaluator)
     
-    # Detect exit signals
-    data, exit_condition_columns = exit_multi_detector.detect_all_conditions(data)
-    data['Exit_Signal'] = data['Combined_Signal']
+    # A side without conditions never fires
+    for column, signal in (('Entry_Signal', entry_signal), ('Exit_Signal', exit_signal)):
+        data[column] = signal.unpack() if signal is not None else False
     
     return data, entry_condition_columns, exit_condition_columns
 
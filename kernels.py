@@ -0,0 +1,822 @@
+"""
+Kernels Module
+Shared numeric kernels for the indicator library: recursive (IIR) filters, fixed-weight window sums,
+rolling-window statistics and rolling volume profiles
+"""
+
+import os
+import warnings
+import importlib.util
+
+import numpy as np
+
+
+"""EMA, WILDER/RMA, THE 2-POLE SUPER SMOOTHER AND SIMILAR INDICATORS ARE RECURSIONS: EACH OUTPUT DEPENDS ON
+THE PREVIOUS ONE, SO THEY CANNOT BE WRITTEN AS A PLAIN VECTORIZED NUMPY EXPRESSION. THE KERNELS BELOW ARE
+WRITTEN ONCE AS SIMPLE INDEX LOOPS WITH THE SAME ARITHMETIC AS THE LIBRARY CLASSES USED, AND RUN ON THE
+FASTEST BACKEND AVAILABLE:
+  numba  - THE LOOPS ARE JIT COMPILED (BIT-FOR-BIT WITH THE ORIGINAL PYTHON LOOPS)
+  scipy  - LINEAR FILTERS GO THROUGH scipy.signal.lfilter (MATCHES TO FLOATING-POINT TOLERANCE)
+  numpy  - THE SAME LOOPS OVER PLAIN FLOAT LISTS, NO iloc OR PER-ELEMENT SERIES ASSIGNMENT
+SET THE FILTER_BACKEND ENVIRONMENT VARIABLE TO FORCE ONE"""
+
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
+HAS_SCIPY = importlib.util.find_spec('scipy') is not None
+
+if HAS_NUMBA:
+    from numba import njit
+if HAS_SCIPY:
+    from scipy.signal import lfilter, lfiltic
+
+FILTER_BACKENDS = ('numba', 'scipy', 'numpy')
+
+
+def default_filter_backend():
+    """numba when installed, then scipy, then the pure-Python loops"""
+    if HAS_NUMBA:
+        return 'numba'
+    if HAS_SCIPY:
+        return 'scipy'
+    return 'numpy'
+
+
+FILTER_BACKEND = os.environ.get('FILTER_BACKEND', default_filter_backend())
+
+
+def resolve_backend(backend=None):
+    """Validate a backend name, falling back to the module default"""
+    backend = backend or FILTER_BACKEND
+    if backend not in FILTER_BACKENDS:
+        raise ValueError(f"Unknown filter backend '{backend}'. Use one of {FILTER_BACKENDS}")
+    if backend == 'numba' and not HAS_NUMBA:
+        raise ValueError("Filter backend 'numba' requested but numba is not installed")
+    if backend == 'scipy' and not HAS_SCIPY:
+        raise ValueError("Filter backend 'scipy' requested but scipy is not installed")
+    return backend
+
+
+def as_float_array(values):
+    """Contiguous float64 array from a Series / list / array (no copy when it already is one)"""
+    return np.ascontiguousarray(np.asarray(values, dtype=float))
+
+
+# =============================================================================
+# LOOP KERNELS (compiled with numba when available)
+# =============================================================================
+
+"""EVERY LOOP WRITES INTO A CALLER-PROVIDED y: AN ndarray UNDER NUMBA, A PLAIN FLOAT LIST OTHERWISE, SINCE
+READING AND WRITING NUMPY ELEMENTS ONE AT A TIME FROM PYTHON COSTS MORE THAN THE ARITHMETIC ITSELF"""
+
+def run_loop(loop, jitted, backend, size, *arrays_and_args):
+    """Run a loop kernel compiled (numba) or over float lists, returning a float64 array"""
+    if backend == 'numba':
+        return jitted(*arrays_and_args, np.empty(size))
+    args = [arg.tolist() if isinstance(arg, np.ndarray) else arg for arg in arrays_and_args]
+    return np.array(loop(*args, [0.0] * size), dtype=float)
+
+
+def _exponential_loop(x, gain, decay, initial, seed_first, y):
+    """y[i] = gain * x[i] + decay * y[i-1]; y[0] = x[0] when seed_first, else y[-1] = initial"""
+    n = len(x)
+    if n == 0:
+        return y
+    if seed_first:
+        prev = x[0]
+        y[0] = prev
+        start = 1
+    else:
+        prev = initial
+        start = 0
+    for i in range(start, n):
+        prev = gain * x[i] + decay * prev
+        y[i] = prev
+    return y
+
+
+def _wilder_loop(x, period, seed, y):
+    """y[i - period] = (prev * (period - 1) + x[i]) / period from index period on, prev starts at seed"""
+    n = len(x)
+    prev = seed
+    for i in range(period, n):
+        prev = (prev * (period - 1) + x[i]) / period
+        y[i - period] = prev
+    return y
+
+
+def _super_smoother_loop(x, c1, c2, c3, y):
+    """Ehlers 2-pole super smoother, first two outputs pass the input through"""
+    n = len(x)
+    if n > 0:
+        y[0] = x[0]
+    if n > 1:
+        y[1] = x[1]
+    for i in range(2, n):
+        y[i] = c1 * (x[i] + x[i - 1]) / 2 + c2 * y[i - 1] + c3 * y[i - 2]
+    return y
+
+
+def _iir_loop(b, a, x, x_history, y_history, y):
+    """Direct-form difference equation a[0]*y[n] = sum b[k]*x[n-k] - sum a[k]*y[n-k]; histories are newest first"""
+    n = len(x)
+    nb = len(b)
+    na = len(a)
+    for i in range(n):
+        acc = 0.0
+        for k in range(nb):
+            if i - k >= 0:
+                acc += b[k] * x[i - k]
+            elif k - i - 1 < len(x_history):
+                acc += b[k] * x_history[k - i - 1]
+        for k in range(1, na):
+            if i - k >= 0:
+                acc -= a[k] * y[i - k]
+            elif k - i - 1 < len(y_history):
+                acc -= a[k] * y_history[k - i - 1]
+        y[i] = acc / a[0]
+    return y
+
+
+def _rolling_max_loop(x, period, queue, y):
+    """Trailing max over up to period bars with a monotonic deque of indices (NaN bars are skipped)"""
+    head = 0
+    tail = 0
+    for i in range(len(x)):
+        value = x[i]
+        if value == value:
+            while tail > head and x[queue[tail - 1]] <= value:
+                tail -= 1
+            queue[tail] = i
+            tail += 1
+        while tail > head and queue[head] <= i - period:
+            head += 1
+        y[i] = x[queue[head]] if tail > head else np.nan
+    return y
+
+
+def _rolling_poc_loop(ids, volume, period, totals, counts, y):
+    """Sliding volume-per-bin accumulator; y[i] is the dense bin id of the window POC (-1 during warm-up)"""
+    poc = -1
+    for i in range(len(ids)):
+        bin_in = ids[i]
+        if bin_in >= 0:
+            totals[bin_in] += volume[i]
+            counts[bin_in] += 1
+        rescan = poc < 0
+        if i >= period:
+            bin_out = ids[i - period]
+            if bin_out >= 0:
+                totals[bin_out] -= volume[i - period]
+                counts[bin_out] -= 1
+                if counts[bin_out] == 0:
+                    # An emptied bin restarts from an exact zero instead of carrying add/subtract rounding
+                    totals[bin_out] = 0.0
+                if bin_out == poc:
+                    rescan = True
+        if rescan:
+            # Only when the POC bin lost volume: scan the bins present in the window
+            poc = -1
+            for j in range(max(0, i - period + 1), i + 1):
+                candidate = ids[j]
+                if candidate >= 0 and (poc < 0 or totals[candidate] > totals[poc]
+                                       or (totals[candidate] == totals[poc] and candidate < poc)):
+                    poc = candidate
+        elif bin_in >= 0 and (totals[bin_in] > totals[poc] or (totals[bin_in] == totals[poc] and bin_in < poc)):
+            poc = bin_in
+        y[i] = poc if i >= period - 1 else -1
+    return y
+
+
+def _rolling_value_area_loop(ids, volume, poc_ids, period, percentage, totals, counts, below, above, y):
+    """Value area around each window POC; y[i] / y[n + i] are the dense ids of its low / high bin (-1 without a POC)
+
+    The bins present in the window form a linked list in price order (below / above), so each bar walks only
+    those bins: O(k) per bar for k distinct bins in the window (k <= period), plus an O(period) scan to link a
+    bin that enters the window empty"""
+    n = len(ids)
+    for i in range(n):
+        bin_in = ids[i]
+        if bin_in >= 0:
+            if counts[bin_in] == 0:
+                # Neighbours of a new bin: the closest bins present in the rest of the window
+                lower = -1
+                upper = -1
+                for j in range(max(0, i - period), i):
+                    other = ids[j]
+                    if 0 <= other < bin_in and other > lower:
+                        lower = other
+                    elif other > bin_in and (upper < 0 or other < upper):
+                        upper = other
+                below[bin_in] = lower
+                above[bin_in] = upper
+                if lower >= 0:
+                    above[lower] = bin_in
+                if upper >= 0:
+                    below[upper] = bin_in
+            totals[bin_in] += volume[i]
+            counts[bin_in] += 1
+        if i >= period and ids[i - period] >= 0:
+            bin_out = ids[i - period]
+            totals[bin_out] -= volume[i - period]
+            counts[bin_out] -= 1
+            if counts[bin_out] == 0:
+                totals[bin_out] = 0.0
+                lower = below[bin_out]
+                upper = above[bin_out]
+                if lower >= 0:
+                    above[lower] = upper
+                if upper >= 0:
+                    below[upper] = lower
+                below[bin_out] = -1
+                above[bin_out] = -1
+        poc = poc_ids[i]
+        if poc < 0:
+            y[i] = -1
+            y[n + i] = -1
+            continue
+        # Target share of the window volume, summed in price order
+        lowest = poc
+        while below[lowest] >= 0:
+            lowest = below[lowest]
+        window_volume = 0.0
+        bin_id = lowest
+        while bin_id >= 0:
+            window_volume += totals[bin_id]
+            bin_id = above[bin_id]
+        target_volume = window_volume * percentage
+        # Expand from the POC towards the larger neighbouring bin until the target is covered
+        left = poc
+        right = poc
+        area_volume = totals[poc]
+        while area_volume < target_volume:
+            lower = below[left]
+            upper = above[right]
+            if lower < 0 and upper < 0:
+                break
+            if lower >= 0 and (upper < 0 or totals[lower] >= totals[upper]):
+                left = lower
+                area_volume += totals[left]
+            else:
+                right = upper
+                area_volume += totals[right]
+        y[i] = left
+        y[n + i] = right
+    return y
+
+
+def _gann_activator_loop(close, high, low, y):
+    """Gann HiLo activator: trail the low while price is above, the high while price is below"""
+    n = len(close)
+    if n == 0:
+        return y
+    prev = close[0]
+    y[0] = prev
+    for i in range(1, n):
+        if close[i] > prev:
+            prev = min(low[i], prev)
+        elif close[i] < prev:
+            prev = max(high[i], prev)
+        y[i] = prev
+    return y
+
+
+
+def _parabolic_sar_loop(high, low, close, initial_af, max_af, y):
+    """Parabolic SAR: seeded from the first two bars, then the SAR / extreme point / acceleration recursion"""
+    n = len(close)
+    if close[1] > close[0]:
+        trend = 1
+        y[0] = low[0]
+        psar = low[0]
+        ep = max(high[0], high[1])
+    else:
+        trend = -1
+        y[0] = high[0]
+        psar = high[0]
+        ep = min(low[0], low[1])
+    y[1] = psar
+    af = initial_af
+    for i in range(2, n):
+        prev_psar = psar
+        if trend == 1:
+            psar = min(prev_psar + af * (ep - prev_psar), low[i - 1], low[i - 2])
+            if high[i] > ep:
+                ep = high[i]
+                af = min(af + initial_af, max_af)
+            if low[i] < psar:
+                trend = -1
+                psar = ep
+                ep = low[i]
+                af = initial_af
+        else:
+            psar = max(prev_psar - af * (prev_psar - ep), high[i - 1], high[i - 2])
+            if low[i] < ep:
+                ep = low[i]
+                af = min(af + initial_af, max_af)
+            if high[i] > psar:
+                trend = 1
+                psar = ep
+                ep = high[i]
+                af = initial_af
+        y[i] = psar
+    return y
+
+
+def _stop_and_reverse_loop(high, low, close, initial_af, max_af, y):
+    """Stop-and-reverse SAR: the extreme point only advances while the trend holds"""
+    n = len(close)
+    if close[1] > close[0]:
+        trend = 1
+        y[0] = low[0]
+        ep = high[0]
+    else:
+        trend = -1
+        y[0] = high[0]
+        ep = low[0]
+    af = initial_af
+    for i in range(1, n):
+        previous_sar = y[i - 1]
+        if trend == 1:
+            sar = previous_sar + af * (ep - previous_sar)
+            sar = min(sar, low[i - 1], low[i - 2]) if i >= 2 else min(sar, low[i - 1])
+            if low[i] < sar:
+                trend = -1
+                sar = ep
+                af = initial_af
+                ep = low[i]
+            elif high[i] > ep:
+                ep = high[i]
+                af = min(af + initial_af, max_af)
+        else:
+            sar = previous_sar - af * (previous_sar - ep)
+            sar = max(sar, high[i - 1], high[i - 2]) if i >= 2 else max(sar, high[i - 1])
+            if high[i] > sar:
+                trend = 1
+                sar = ep
+                af = initial_af
+                ep = high[i]
+            elif low[i] < ep:
+                ep = low[i]
+                af = min(af + initial_af, max_af)
+        y[i] = sar
+    return y
+
+
+def _supertrend_loop(close, basic_upper, basic_lower, y):
+    """Final bands ratchet toward price; y[:n] is the Supertrend line (NaN on bar 0), y[n:] the trend (+1 / -1)"""
+    n = len(close)
+    if n == 0:
+        return y
+    final_upper = basic_upper[0]
+    final_lower = basic_lower[0]
+    y[0] = np.nan
+    y[n] = 1
+    for i in range(1, n):
+        if basic_upper[i] < final_upper or close[i - 1] > final_upper:
+            final_upper = basic_upper[i]
+        if basic_lower[i] > final_lower or close[i - 1] < final_lower:
+            final_lower = basic_lower[i]
+        if close[i] <= final_upper:
+            y[i] = final_upper
+            y[n + i] = -1
+        elif close[i] >= final_lower:
+            y[i] = final_lower
+            y[n + i] = 1
+        else:
+            y[i] = y[i - 1]
+            y[n + i] = y[n + i - 1]
+    return y
+
+if HAS_NUMBA:
+    _exponential_jit = njit(cache=True)(_exponential_loop)
+    _wilder_jit = njit(cache=True)(_wilder_loop)
+    _super_smoother_jit = njit(cache=True)(_super_smoother_loop)
+    _iir_jit = njit(cache=True)(_iir_loop)
+    _gann_activator_jit = njit(cache=True)(_gann_activator_loop)
+    _rolling_max_jit = njit(cache=True)(_rolling_max_loop)
+    _rolling_poc_jit = njit(cache=True)(_rolling_poc_loop)
+    _rolling_value_area_jit = njit(cache=True)(_rolling_value_area_loop)
+    _parabolic_sar_jit = njit(cache=True)(_parabolic_sar_loop)
+    _stop_and_reverse_jit = njit(cache=True)(_stop_and_reverse_loop)
+    _supertrend_jit = njit(cache=True)(_supertrend_loop)
+else:
+    _exponential_jit = _wilder_jit = _super_smoother_jit = _iir_jit = _gann_activator_jit = None
+    _rolling_max_jit = _rolling_poc_jit = _rolling_value_area_jit = None
+    _parabolic_sar_jit = _stop_and_reverse_jit = _supertrend_jit = None
+
+
+# =============================================================================
+# RECURSIVE FILTERS
+# =============================================================================
+
+def exponential_filter(values, gain, decay, initial=None, backend=None):
+    """First-order recursion y[i] = gain * x[i] + decay * y[i-1] (EMA with gain=alpha, decay=1-alpha)"""
+    backend = resolve_backend(backend)
+    x = as_float_array(values)
+    seed_first = initial is None
+    if backend == 'scipy':
+        if len(x) == 0:
+            return np.empty(0)
+        if seed_first:
+            head = x[:1]
+            tail = lfilter([gain], [1.0, -decay], x[1:], zi=[decay * x[0]])[0]
+            return np.concatenate((head, tail))
+        return lfilter([gain], [1.0, -decay], x, zi=[decay * initial])[0]
+    return run_loop(_exponential_loop, _exponential_jit, backend, len(x),
+                    x, float(gain), float(decay), 0.0 if seed_first else float(initial), seed_first)
+
+
+def ema_filter(values, period, backend=None):
+    """EMA seeded with the first value, alpha = 2 / (period + 1)"""
+    alpha = 2 / (period + 1)
+    return exponential_filter(values, alpha, 1 - alpha, backend=backend)
+
+
+def wilder_filter(values, period, backend=None):
+    """Wilder / RMA smoothing: expanding mean for the first period bars, then (prev * (period - 1) + x) / period"""
+    backend = resolve_backend(backend)
+    x = as_float_array(values)
+    warmup = min(period, len(x))
+    head = np.empty(warmup)
+    with warnings.catch_warnings():
+        # An all-NaN warm-up window is NaN, exactly like the pandas mean it replaces
+        warnings.simplefilter('ignore', RuntimeWarning)
+        for i in range(warmup):
+            head[i] = np.nanmean(x[:i + 1])
+    if len(x) <= period:
+        return head
+    seed = head[-1]
+    if backend == 'scipy':
+        tail = lfilter([1 / period], [1.0, -(period - 1) / period], x[period:], zi=[(period - 1) / period * seed])[0]
+    else:
+        tail = run_loop(_wilder_loop, _wilder_jit, backend, len(x) - period, x, period, float(seed))
+    return np.concatenate((head, tail))
+
+
+def super_smoother_filter(values, period, backend=None):
+    """Ehlers 2-pole super smoother with the library's 1.414 * pi / period coefficients"""
+    backend = resolve_backend(backend)
+    x = as_float_array(values)
+    a = np.exp(-1.414 * np.pi / period)
+    b = 2 * a * np.cos(1.414 * np.pi / period)
+    c2 = b
+    c3 = -a * a
+    c1 = 1 - c2 - c3
+    if backend == 'scipy':
+        if len(x) <= 2:
+            return x.copy()
+        b_coeffs, a_coeffs = [c1 / 2, c1 / 2], [1.0, -c2, -c3]
+        zi = lfiltic(b_coeffs, a_coeffs, y=[x[1], x[0]], x=[x[1]])
+        return np.concatenate((x[:2], lfilter(b_coeffs, a_coeffs, x[2:], zi=zi)[0]))
+    return run_loop(_super_smoother_loop, _super_smoother_jit, backend, len(x), x, float(c1), float(c2), float(c3))
+
+
+def iir_filter(b, a, values, x_history=(), y_history=(), backend=None):
+    """Generic IIR filter with optional input / output history (newest first) before the first sample"""
+    backend = resolve_backend(backend)
+    b = as_float_array(b)
+    a = as_float_array(a)
+    x = as_float_array(values)
+    if len(a) == 0 or a[0] == 0:
+        raise ValueError("IIR denominator must start with a non-zero coefficient")
+    if backend == 'scipy':
+        if len(x_history) or len(y_history):
+            zi = lfiltic(b, a, y=list(y_history), x=list(x_history))
+            return lfilter(b, a, x, zi=zi)[0]
+        return lfilter(b, a, x)
+    return run_loop(_iir_loop, _iir_jit, backend, len(x), b, a, x, as_float_array(x_history), as_float_array(y_history))
+
+
+def gann_activator(close, high, low, backend=None):
+    """Gann HiLo activator path (non-linear recursion, so scipy falls back to the loop)"""
+    backend = resolve_backend(backend)
+    close, high, low = as_float_array(close), as_float_array(high), as_float_array(low)
+    return run_loop(_gann_activator_loop, _gann_activator_jit, backend, len(close), close, high, low)
+
+
+
+# =============================================================================
+# PATH-DEPENDENT STATE MACHINES
+# =============================================================================
+
+"""SAR AND SUPERTREND CARRY A TREND FLAG, AN EXTREME POINT OR A RATCHETING BAND FROM BAR TO BAR; THEY RUN AS
+THE LOOP KERNELS ABOVE ON PLAIN float64 ARRAYS (NO .iloc PER ELEMENT), WITH THE ORIGINAL ARITHMETIC AND THE
+SAME Python min / max ARGUMENT ORDER, SO EVERY BACKEND IS BIT FOR BIT. scipy HAS NOTHING FOR THEM AND FALLS
+BACK TO THE LOOP. RUN LENGTHS (TD SEQUENTIAL COUNTS) NEED NO LOOP AT ALL: A CUMULATIVE SUM OF THE CONDITION
+MINUS ITS VALUE AT THE LAST RESET"""
+
+def parabolic_sar(high, low, close, initial_af=0.02, max_af=0.2, backend=None):
+    """Parabolic SAR path (needs at least two bars)"""
+    backend = resolve_backend(backend)
+    high, low, close = as_float_array(high), as_float_array(low), as_float_array(close)
+    return run_loop(_parabolic_sar_loop, _parabolic_sar_jit, backend, len(close),
+                    high, low, close, float(initial_af), float(max_af))
+
+
+def stop_and_reverse(high, low, close, initial_af=0.02, max_af=0.2, backend=None):
+    """Stop-and-reverse SAR path (needs at least two bars)"""
+    backend = resolve_backend(backend)
+    high, low, close = as_float_array(high), as_float_array(low), as_float_array(close)
+    return run_loop(_stop_and_reverse_loop, _stop_and_reverse_jit, backend, len(close),
+                    high, low, close, float(initial_af), float(max_af))
+
+
+def supertrend_path(close, basic_upper, basic_lower, backend=None):
+    """(Supertrend line, trend as int64) from the basic bands"""
+    backend = resolve_backend(backend)
+    close = as_float_array(close)
+    n = len(close)
+    packed = run_loop(_supertrend_loop, _supertrend_jit, backend, 2 * n,
+                      close, as_float_array(basic_upper), as_float_array(basic_lower))
+    return packed[:n], packed[n:].astype(np.int64)
+
+
+def run_lengths(condition):
+    """Number of consecutive True values ending at each position (0 where False)"""
+    condition = np.asarray(condition, dtype=bool)
+    totals = np.cumsum(condition)
+    return totals - np.maximum.accumulate(np.where(condition, 0, totals))
+
+# =============================================================================
+# WINDOW SUMS
+# =============================================================================
+
+def weighted_window_sums(values, weights):
+    """Sum of weights[j] * values[i - len(weights) + 1 + j] over every full window, added in j order like the scalar loops"""
+    values = np.asarray(values, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    count = len(values) - len(weights) + 1
+    if count <= 0:
+        return np.empty(0)
+    totals = np.zeros(count)
+    for offset, weight in enumerate(weights):
+        totals += weight * values[offset:offset + count]
+    return totals
+
+
+# =============================================================================
+# ROLLING WINDOWS
+# =============================================================================
+
+"""TRAILING WINDOWS OF `period` BARS; WITH min_periods BELOW period THE FIRST BARS USE THE PARTIAL WINDOW
+FROM THE START OF THE SERIES, LIKE pandas rolling(min_periods=...). MIN / MAX ARE O(n): A MONOTONIC DEQUE
+UNDER NUMBA, OTHERWISE THE VAN HERK / GIL-WERMAN BLOCK PREFIX / SUFFIX MAXIMA, WHICH IS THE SAME O(n) IN
+VECTORIZED NUMPY. STD AND LEAST SQUARES WORK FROM WINDOW SUMS BUILT WITH `period` SHIFTED-SLICE ADDS -
+NO CUMULATIVE SUM, SO NO DRIFT OVER LONG SERIES AND A NaN ONLY AFFECTS THE WINDOWS THAT CONTAIN IT"""
+
+def rolling_max(values, period, backend=None):
+    """Trailing max over up to period bars, ignoring NaN (NaN when the window has no value)"""
+    backend = resolve_backend(backend)
+    x = as_float_array(values)
+    n = len(x)
+    if n == 0:
+        return np.empty(0)
+    if backend == 'numba':
+        return _rolling_max_jit(x, period, np.empty(n, dtype=np.int64), np.empty(n))
+    pad = (-n) % period
+    blocks = np.concatenate((x, np.full(pad, np.nan))).reshape(-1, period)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        prefix = np.fmax.accumulate(blocks, axis=1).ravel()[:n]
+        suffix = np.fmax.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()[:n]
+    if n < period:
+        # Every window is partial and sits inside the first block, so they are its running max
+        return prefix
+    result = np.empty(n)
+    # Partial windows all sit inside the first block, so they are its running max
+    result[:period - 1] = prefix[:period - 1]
+    result[period - 1:] = np.fmax(suffix[:n - period + 1], prefix[period - 1:])
+    return result
+
+
+def rolling_min(values, period, backend=None):
+    """Trailing min over up to period bars, ignoring NaN (NaN when the window has no value)"""
+    return -rolling_max(-as_float_array(values), period, backend=backend)
+
+
+def rolling_std(values, period, min_periods=1):
+    """Population standard deviation of each trailing window (window mean first, then squared deviations)"""
+    x = as_float_array(values)
+    n = len(x)
+    result = np.full(n, np.nan)
+    for end in range(max(min_periods, 1) - 1, min(period - 1, n)):
+        window = x[:end + 1]
+        mean = weighted_window_sums(window, np.ones(end + 1))[0] / (end + 1)
+        result[end] = np.sqrt(weighted_window_sums((window - mean) ** 2, np.ones(end + 1))[0] / (end + 1))
+    count = n - period + 1
+    if count > 0:
+        mean = weighted_window_sums(x, np.ones(period)) / period
+        squares = np.zeros(count)
+        for offset in range(period):
+            squares += (x[offset:offset + count] - mean) ** 2
+        # np.sqrt is correctly rounded; the old scalar `** 0.5` (C pow) is occasionally 1 ulp off from it
+        result[period - 1:] = np.sqrt(squares / period)
+    return result
+
+
+def _least_squares(sum_y, sum_xy, size):
+    """Slope and intercept against x = 0..size-1 from the window sums of y and x*y"""
+    sum_x = size * (size - 1) // 2
+    sum_x2 = (size - 1) * size * (2 * size - 1) // 6
+    denom = size * sum_x2 - sum_x ** 2
+    if denom == 0:
+        # A single point has no slope; the old per-window code returned 0 unless the point was missing
+        slope = np.where(np.isnan(sum_y), np.nan, 0.0)
+    else:
+        slope = (size * sum_xy - sum_x * sum_y) / denom
+    intercept = (sum_y - slope * sum_x) / size
+    return slope, intercept
+
+
+def rolling_linear_regression(values, period, min_periods=None):
+    """Closed-form least-squares (slope, intercept) of each trailing window against x = 0..n-1"""
+    x = as_float_array(values)
+    n = len(x)
+    min_periods = period if min_periods is None else min_periods
+    slope = np.full(n, np.nan)
+    intercept = np.full(n, np.nan)
+    for end in range(max(min_periods, 1) - 1, min(period - 1, n)):
+        window = x[:end + 1]
+        size = end + 1
+        window_slope, window_intercept = _least_squares(
+            weighted_window_sums(window, np.ones(size)), weighted_window_sums(window, np.arange(size)), size)
+        slope[end], intercept[end] = window_slope[0], window_intercept[0]
+    if n >= period:
+        slope[period - 1:], intercept[period - 1:] = _least_squares(
+            weighted_window_sums(x, np.ones(period)), weighted_window_sums(x, np.arange(period)), period)
+    return slope, intercept
+
+
+# =============================================================================
+# ROLLING VOLUME PROFILE
+# =============================================================================
+
+"""A VOLUME PROFILE IS THE VOLUME TRADED PER PRICE BIN (floor(Close / bin_size) * bin_size). CLOSE IS BINNED
+ONCE INTO SORTED INTEGER BIN IDS, AND A PER-BIN VOLUME ACCUMULATOR SLIDES WITH THE WINDOW: THE NEW BAR IS
+ADDED, THE BAR LEAVING THE WINDOW IS SUBTRACTED. THE POINT OF CONTROL (POC, THE HIGHEST-VOLUME BIN, LOWEST
+PRICE ON TIES) ONLY NEEDS A RESCAN OF THE WINDOW WHEN THE POC BIN ITSELF LOST VOLUME, OTHERWISE IT IS ONE
+COMPARISON AGAINST THE BIN THAT JUST GAINED VOLUME. THE VALUE AREA IS NOT AMORTIZED O(1): ITS GREEDY WALK OUT
+OF THE POC DEPENDS ON EVERY BIN IT PASSES, SO IT IS REDONE EACH BAR OVER THE k <= period BINS PRESENT IN THE
+WINDOW, WHICH ARE KEPT LINKED IN PRICE ORDER INSTEAD OF BEING RE-SORTED. SUMS ARE EXACT FOR WHOLE-NUMBER VOLUMES; FRACTIONAL
+VOLUMES CAN DIFFER FROM A FRESH GROUPBY IN THE LAST BIT, WHICH ONLY MATTERS FOR EXACT TIES"""
+
+def price_bin_ids(close, bin_size):
+    """(dense bin id per bar, -1 for missing prices; sorted bin prices) for floor(close / bin_size) * bin_size"""
+    bins = np.floor(as_float_array(close) / bin_size) * bin_size
+    valid = ~np.isnan(bins)
+    ids = np.full(len(bins), -1, dtype=np.int64)
+    bin_prices, ids[valid] = np.unique(bins[valid], return_inverse=True)
+    return ids, bin_prices
+
+
+def rolling_volume_profile(close, volume, period, bin_size=1, value_area_percentage=None, backend=None):
+    """Rolling POC price per bar (NaN until the first full window), plus value-area low/high when a percentage is given
+
+    The POC is amortized O(1) per bar; the value area is O(k) per bar for the k <= period price bins in the window"""
+    backend = resolve_backend(backend)
+    ids, bin_prices = price_bin_ids(close, bin_size)
+    volume = np.nan_to_num(as_float_array(volume), nan=0.0)
+    n = len(ids)
+    poc_ids = run_loop(_rolling_poc_loop, _rolling_poc_jit, backend, n, ids, volume, period,
+                       np.zeros(len(bin_prices)), np.zeros(len(bin_prices), dtype=np.int64)).astype(np.int64)
+    found = poc_ids >= 0
+    poc = np.full(n, np.nan)
+    poc[found] = bin_prices[poc_ids[found]]
+    result = {'poc': poc}
+    if value_area_percentage is None:
+        return result
+
+    bins = len(bin_prices)
+    area = run_loop(_rolling_value_area_loop, _rolling_value_area_jit, backend, 2 * n, ids, volume, poc_ids, period,
+                    float(value_area_percentage), np.zeros(bins), np.zeros(bins, dtype=np.int64),
+                    np.full(bins, -1, dtype=np.int64), np.full(bins, -1, dtype=np.int64)).astype(np.int64)
+    value_area_low = np.full(n, np.nan)
+    value_area_high = np.full(n, np.nan)
+    value_area_low[found] = bin_prices[area[:n][found]]
+    value_area_high[found] = bin_prices[area[n:][found]]
+    result['value_area_low'] = value_area_low
+    result['value_area_high'] = value_area_high
+    return result
+
+
+# =============================================================================
+# MULTI-PERIOD BANKS
+# =============================================================================
+
+"""PARAMETER SWEEPS ASK FOR THE SAME INDICATOR OVER MANY PERIODS. THE BANKS BELOW RETURN ONE (bars x periods)
+ARRAY FROM A SINGLE PASS OVER THE INPUT:
+  rolling_sums          - ONE PREFIX SUM, SPLIT INTO A FIXED-POINT int64 PART (EXACT, SO NO DRIFT OVER LONG
+                          SERIES) AND THE FLOAT REMAINDER BELOW ITS RESOLUTION; EVERY WINDOW IS A DIFFERENCE
+  linear_weighted_sums  - WINDOWS WEIGHTED 1..p, GROWN ONE LAG AT A TIME UP TO THE LONGEST PERIOD
+  geometric_sums        - s[t] = x[t] + decay * s[t-1] FOR A VECTOR OF DECAYS, IN BLOCKS: INSIDE A BLOCK THE
+                          RECURSION IS A MATRIX PRODUCT WITH THE DECAY POWERS, THE CARRY BETWEEN BLOCKS IS THE
+                          SAME RECURSION OVER THE BLOCK ENDS
+RESULTS MATCH THE PER-PERIOD PANDAS / LIBRARY CODE TO FLOATING-POINT TOLERANCE, NOT BIT FOR BIT"""
+
+def rolling_sums(values, periods):
+    """Trailing sums of full windows for each period, (n, len(periods)); NaN before the window fills or while it holds a NaN
+
+    A window holding an infinity is that infinity (NaN with both signs), as a float sum would be"""
+    x = as_float_array(values)
+    n = len(x)
+    missing = np.isnan(x)
+    infinite = np.isinf(x)
+    # Infinities are summed apart (a window holding +inf and -inf is NaN, like a float sum)
+    filled = np.where(missing | infinite, 0.0, x)
+    with np.errstate(over='ignore'):
+        total = np.abs(filled).sum()
+    if not np.isfinite(total):
+        # Finite values too large for the fixed-point split: plain float prefix sums
+        return _float_rolling_sums(x, periods)
+    # Multiples of 2**-shift are summed exactly as integers; the total stays below 2**60
+    shift = 60 - int(np.ceil(np.log2(total + 1)))
+    scale = np.ldexp(1.0, shift)
+    whole = np.rint(filled * scale)
+    remainder = filled - whole / scale
+    prefix_whole = np.concatenate(([0], np.cumsum(whole.astype(np.int64))))
+    prefix_remainder = np.concatenate(([0.0], np.cumsum(remainder)))
+    prefix_missing = np.concatenate(([0], np.cumsum(missing))) if missing.any() else None
+    prefix_positive = prefix_negative = None
+    if infinite.any():
+        prefix_positive = np.concatenate(([0], np.cumsum(x == np.inf)))
+        prefix_negative = np.concatenate(([0], np.cumsum(x == -np.inf)))
+    # (periods, n) so every period writes one contiguous row; returned transposed as (n, periods)
+    result = np.full((len(periods), n), np.nan)
+    for row, period in enumerate(periods):
+        if period > n:
+            continue
+        sums = result[row, period - 1:]
+        np.subtract(prefix_whole[period:], prefix_whole[:n + 1 - period], out=sums, casting='unsafe')
+        sums /= scale
+        sums += prefix_remainder[period:]
+        sums -= prefix_remainder[:n + 1 - period]
+        if prefix_positive is not None:
+            positive = prefix_positive[period:] - prefix_positive[:n + 1 - period] > 0
+            negative = prefix_negative[period:] - prefix_negative[:n + 1 - period] > 0
+            sums[positive] = np.inf
+            sums[negative] = -np.inf
+            sums[positive & negative] = np.nan
+        if prefix_missing is not None:
+            sums[prefix_missing[period:] - prefix_missing[:n + 1 - period] > 0] = np.nan
+    return result.T
+
+
+def _float_rolling_sums(x, periods):
+    """rolling_sums by shifted-slice adds of each window, for inputs whose total overflows a float"""
+    n = len(x)
+    filled = np.where(np.isnan(x), 0.0, x)
+    prefix_missing = np.concatenate(([0], np.cumsum(np.isnan(x))))
+    result = np.full((len(periods), n), np.nan)
+    for row, period in enumerate(periods):
+        if period > n:
+            continue
+        with np.errstate(invalid='ignore', over='ignore'):
+            sums = weighted_window_sums(filled, np.ones(period))
+        sums[prefix_missing[period:] - prefix_missing[:n + 1 - period] > 0] = np.nan
+        result[row, period - 1:] = sums
+    return result.T
+
+
+def linear_weighted_sums(values, periods):
+    """Sum of j * values[t - p + j] for j = 1..p over every full window, (n, len(periods)); NaN before the window fills"""
+    x = as_float_array(values)
+    n = len(x)
+    result = np.full((len(periods), n), np.nan)
+    rows = {}
+    for row, period in enumerate(periods):
+        rows.setdefault(period, []).append(row)
+    window = np.zeros(n)
+    weighted = np.zeros(n)
+    # window holds the last m bars, weighted = sum of the last 1..m bar windows = weights m..1 from the newest bar back
+    for m in range(1, min(max(periods, default=0), n) + 1):
+        window[m - 1:] += x[:n - m + 1]
+        weighted += window
+        for row in rows.get(m, ()):
+            result[row, m - 1:] = weighted[m - 1:]
+    return result.T
+
+
+def geometric_sums(values, decays, block=64):
+    """s[t] = values[t] + decay * s[t-1] with s[-1] = 0 for each decay, (n, len(decays)); values is (n,) or (n, len(decays))"""
+    decays = as_float_array(decays)
+    x = as_float_array(values)
+    x = x[:, None] if x.ndim == 1 else x
+    n = len(x)
+    if n <= block:
+        result = np.empty((n, len(decays)))
+        total = np.zeros(len(decays))
+        for i in range(n):
+            total = x[i] + decays * total
+            result[i] = total
+        return result
+    blocks = -(-n // block)
+    padded = np.concatenate((x, np.zeros((blocks * block - n, x.shape[1]))))
+    # (columns, blocks, block) so one batched matmul runs every decay over every block
+    chunks = padded.reshape(blocks, block, -1).transpose(2, 0, 1)
+    lags = np.arange(block)
+    lag = lags[:, None] - lags[None, :]
+    powers = np.where(lag >= 0, decays[:, None, None] ** np.maximum(lag, 0), 0.0)
+    local = chunks @ powers.transpose(0, 2, 1)
+    ends = geometric_sums(local[:, :, -1].T, decays ** block, block)
+    carry = np.concatenate((np.zeros((1, len(decays))), ends[:-1])).T
+    local += carry[:, :, None] * decays[:, None, None] ** (lags + 1)
+    return local.reshape(len(decays), -1)[:, :n].T
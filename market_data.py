@@ -0,0 +1,307 @@
+"""
+Market Data Module
+Persistent on-disk cache for OHLCV history with pluggable data providers
+"""
+
+import os
+import json
+import time
+import threading
+import importlib.util
+
+import pandas as pd
+import yfinance as yf
+
+
+"""EVERY download_and_prepare_data CALL USED TO HIT yf.Ticker(...).history AGAIN. THE CACHE KEEPS
+ONE COLUMNAR FILE PER TICKER + INTERVAL AND A JSON INDEX OF WHAT EACH FILE COVERS. A REQUEST WHOSE
+RANGE IS ALREADY ON DISK IS SERVED LOCALLY, A REQUEST PAST THE CACHED END ONLY FETCHES THE MISSING
+TAIL AND APPENDS IT. THE PROVIDER IS ANY OBJECT WITH fetch(ticker, interval, period=None, start=None)
+RETURNING A DATETIME-INDEXED OHLCV FRAME, SO A LOCAL FILE STAND-IN CAN REPLACE YFINANCE"""
+
+MARKET_DATA_CACHE_DIR = os.environ.get('MARKET_DATA_CACHE_DIR', '.market_data_cache')
+
+PERIOD_OFFSETS = {
+    'd': lambda n: pd.DateOffset(days=n),
+    'wk': lambda n: pd.DateOffset(weeks=n),
+    'mo': lambda n: pd.DateOffset(months=n),
+    'y': lambda n: pd.DateOffset(years=n)
+}
+
+INTERVAL_DELTAS = {
+    'm': lambda n: pd.Timedelta(minutes=n),
+    'h': lambda n: pd.Timedelta(hours=n),
+    'd': lambda n: pd.Timedelta(days=n),
+    'wk': lambda n: pd.Timedelta(weeks=n),
+    'mo': lambda n: pd.Timedelta(days=30 * n)
+}
+
+
+def split_unit(text):
+    """Split '60d' / '1wk' / '4h' into (60, 'd') / (1, 'wk') / (4, 'h')"""
+    digits = ''.join(ch for ch in text if ch.isdigit())
+    unit = text[len(digits):]
+    if not digits or not unit:
+        raise ValueError(f"Cannot parse '{text}'")
+    return int(digits), unit
+
+
+def period_start(period, now):
+    """First timestamp a yfinance-style period covers (None for 'max')"""
+    if period == 'max':
+        return None
+    if period == 'ytd':
+        return now.normalize().replace(month=1, day=1)
+    count, unit = split_unit(period)
+    if unit not in PERIOD_OFFSETS:
+        raise ValueError(f"Unknown period unit in '{period}'")
+    return now - PERIOD_OFFSETS[unit](count)
+
+
+def align_timestamp(timestamp, index):
+    """Convert a UTC timestamp to the timezone (or naivety) of a DatetimeIndex"""
+    if index.tz is None:
+        return timestamp.tz_convert('UTC').tz_localize(None)
+    return timestamp.tz_convert(index.tz)
+
+
+def utc_now():
+    """Current time in UTC"""
+    return pd.Timestamp.now(tz='UTC')
+
+
+def interval_delta(interval):
+    """Length of one bar for a yfinance-style interval"""
+    count, unit = split_unit(interval)
+    if unit not in INTERVAL_DELTAS:
+        raise ValueError(f"Unknown interval unit in '{interval}'")
+    return INTERVAL_DELTAS[unit](count)
+
+
+# =============================================================================
+# PROVIDERS
+# =============================================================================
+
+class YFinanceProvider:
+    """Fetch history from Yahoo Finance"""
+
+    def fetch(self, ticker, interval, period=None, start=None):
+        """Return a Datetime-indexed OHLCV frame"""
+        if start is not None:
+            return yf.Ticker(ticker).history(start=start, interval=interval)
+        return yf.Ticker(ticker).history(period=period, interval=interval)
+
+
+class LocalFileProvider:
+    """Serve history from <directory>/<TICKER>_<interval>.csv (or <TICKER>.csv) - offline stand-in for yfinance"""
+
+    def __init__(self, directory, clock=utc_now, latency=0.0):
+        self.directory = directory
+        self.clock = clock
+        self.latency = latency  # seconds slept per fetch to mimic a network round trip
+        self.fetch_count = 0
+
+    def fetch(self, ticker, interval, period=None, start=None):
+        """Return a Datetime-indexed OHLCV frame filtered like a yfinance request"""
+        self.fetch_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+        path = os.path.join(self.directory, f"{ticker}_{interval}.csv")
+        if not os.path.exists(path):
+            path = os.path.join(self.directory, f"{ticker}.csv")
+        if not os.path.exists(path):
+            return pd.DataFrame()
+        data = pd.read_csv(path, index_col=0)
+        data.index = pd.to_datetime(data.index, utc=True)
+        data.index.name = 'Datetime' if interval_delta(interval) < pd.Timedelta(days=1) else 'Date'
+        data = data[data.index <= self.clock()]
+        if start is not None:
+            return data[data.index >= pd.Timestamp(start)]
+        first = period_start(period, self.clock())
+        return data if first is None else data[data.index >= first]
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+def default_file_format():
+    """Parquet when a parquet engine is installed, otherwise pickle"""
+    if importlib.util.find_spec('pyarrow') or importlib.util.find_spec('fastparquet'):
+        return 'parquet'
+    return 'pickle'
+
+
+class MarketDataCache:
+    """One columnar file per ticker + interval plus a JSON metadata index"""
+
+    FILE_EXTENSIONS = {'parquet': '.parquet', 'feather': '.feather', 'pickle': '.pkl'}
+
+    def __init__(self, cache_dir=MARKET_DATA_CACHE_DIR, provider=None, file_format=None, enabled=True, clock=utc_now):
+        self.cache_dir = cache_dir
+        self.clock = clock
+        self.provider = provider or YFinanceProvider()
+        self.file_format = file_format or default_file_format()
+        if self.file_format not in self.FILE_EXTENSIONS:
+            raise ValueError(f"Unknown cache file format: {self.file_format}")
+        self.enabled = enabled
+        self.hits = 0
+        self.tail_fetches = 0
+        self.full_fetches = 0
+        self.failed_refreshes = 0
+        # Tickers are downloaded on several threads; the shared index is updated under this lock
+        self.lock = threading.Lock()
+
+    # ----- file layout -----
+
+    def index_path(self):
+        """Path of the JSON metadata index"""
+        return os.path.join(self.cache_dir, 'index.json')
+
+    def file_path(self, ticker, interval):
+        """Path of the data file for one ticker + interval"""
+        safe_ticker = ticker.replace('/', '_').replace('^', '_')
+        return os.path.join(self.cache_dir, f"{safe_ticker}_{interval}{self.FILE_EXTENSIONS[self.file_format]}")
+
+    def load_index(self):
+        """Read the metadata index ({'TICKER|interval': {...}})"""
+        if not os.path.exists(self.index_path()):
+            return {}
+        with open(self.index_path()) as handle:
+            return json.load(handle)
+
+    def save_index(self, index):
+        """Write the metadata index atomically"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = f"{self.index_path()}.{os.getpid()}.tmp"
+        with open(temp_path, 'w') as handle:
+            json.dump(index, handle, indent=2)
+        os.replace(temp_path, self.index_path())
+
+    def read_frame(self, path):
+        """Load a cached frame in the configured file format"""
+        if self.file_format == 'parquet':
+            return pd.read_parquet(path)
+        if self.file_format == 'feather':
+            data = pd.read_feather(path)
+            return data.set_index(data.columns[0])
+        return pd.read_pickle(path)
+
+    def write_frame(self, data, path):
+        """Write a cached frame atomically in the configured file format"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        if self.file_format == 'parquet':
+            data.to_parquet(temp_path)
+        elif self.file_format == 'feather':
+            data.reset_index().to_feather(temp_path)
+        else:
+            data.to_pickle(temp_path)
+        os.replace(temp_path, path)
+
+    # ----- public API -----
+
+    def get_history(self, ticker, period, interval):
+        """Return Datetime-indexed history for ticker/period/interval, fetching only what is missing"""
+        if not self.enabled:
+            return self.provider.fetch(ticker, interval, period=period)
+
+        key = f"{ticker}|{interval}"
+        with self.lock:
+            meta = self.load_index().get(key)
+        path = self.file_path(ticker, interval)
+        cached = self.read_frame(path) if meta is not None and os.path.exists(path) else None
+
+        now = self.clock()
+        wanted_start = period_start(period, now)
+
+        covered = cached is not None and not cached.empty and (
+            meta['covers_max'] or (wanted_start is not None and pd.Timestamp(meta['covered_from']) <= wanted_start))
+
+        refreshed = refresh_failed = False
+        if not covered:
+            fresh = self.provider.fetch(ticker, interval, period=period)
+            if fresh is None or fresh.empty:
+                return fresh
+            data = fresh.sort_index()
+            covered_from = wanted_start if wanted_start is not None else data.index[0]
+            covers_max = wanted_start is None
+        else:
+            data = cached
+            covered_from = pd.Timestamp(meta['covered_from'])
+            covers_max = meta['covers_max']
+            cached_end = data.index[-1]
+            fetched_at = pd.Timestamp(meta['fetched_at'])
+            if now - fetched_at >= interval_delta(interval):
+                # The last cached bar may have been partial, so the tail starts at it and replaces it
+                try:
+                    tail = self.provider.fetch(ticker, interval, start=cached_end)
+                    refreshed = True
+                except Exception as e:
+                    # fetched_at is left as it was, so the next call tries again
+                    print(f"⚠️ Could not refresh {ticker} ({e}), serving cached data from {meta['fetched_at']}")
+                    tail = None
+                    refresh_failed = True
+                if tail is not None and not tail.empty:
+                    data = pd.concat([data[data.index < tail.index[0]], tail.sort_index()])
+                    data = data[~data.index.duplicated(keep='last')]
+
+        if data is not cached:
+            self.write_frame(data, path)
+        entry = {
+            'ticker': ticker,
+            'interval': interval,
+            'file': os.path.basename(path),
+            'format': self.file_format,
+            'rows': len(data),
+            'start': str(data.index[0]),
+            'end': str(data.index[-1]),
+            'covered_from': str(covered_from),
+            'covers_max': covers_max,
+            # Any successful fetch, even one returning no new bars, restarts the refresh interval
+            'fetched_at': str(now) if not covered or refreshed else meta['fetched_at']
+        }
+        with self.lock:
+            if not covered:
+                self.full_fetches += 1
+            elif refreshed:
+                self.tail_fetches += 1
+            else:
+                self.hits += 1
+            if refresh_failed:
+                self.failed_refreshes += 1
+            if entry != meta:
+                index = self.load_index()
+                index[key] = entry
+                self.save_index(index)
+
+        if wanted_start is None:
+            return data
+        return data[data.index >= align_timestamp(wanted_start, data.index)]
+
+    def clear(self, ticker=None, interval=None):
+        """Remove cached files (all, one ticker, or one ticker + interval)"""
+        with self.lock:
+            index = self.load_index()
+            for key, meta in list(index.items()):
+                if (ticker is None or meta['ticker'] == ticker) and (interval is None or meta['interval'] == interval):
+                    path = os.path.join(self.cache_dir, meta['file'])
+                    if os.path.exists(path):
+                        os.remove(path)
+                    del index[key]
+            self.save_index(index)
+
+    def stats(self):
+        """Disk hits, tail fetches, full fetches, failed tail fetches and cached entries"""
+        return {
+            'enabled': self.enabled,
+            'entries': len(self.load_index()),
+            'hits': self.hits,
+            'tail_fetches': self.tail_fetches,
+            'full_fetches': self.full_fetches,
+            'failed_refreshes': self.failed_refreshes
+        }
+
+
+# Global cache instance used by download_and_prepare_data
+market_data_cache = MarketDataCache()
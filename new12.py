@@ -1,3 +1,5 @@
+import threading
+import weakref
 import yfinance as yf
 import pandas as pd
 from ta_strategies_TVLibrary import *
@@ -7,12 +9,17 @@ from display import *
 from comparisons import *
 from portfolios import *
 from inputs import *
+from engine import *
 # =============================================================================
 
 
 
 
 from comparision_types import ComparisonType
+from signal_expressions import (
+    ExpressionEvaluator, Operand, Comparison, compile_conditions, parse_expression, expression_comparisons,
+    operand_key, operand_label, constant_value, price_column
+)
 
 
 
@@ -34,66 +41,127 @@ AND THE PARAMETERS"""
 """THIS FUNCTION FIRST CHECK IF ITS INDICATOR OR CONSTANT, IF ITS INDICATOR IT CALCULATES THE VALUE
 AND STORES IT IN A NEW COLUMN, IF ITS CONSTANT IT STORES THE VALUE IN A NEW COLUMN"""
 
-def create_comparison_column(data, comp_type, comp_name, comp_params, candles_ago=0):
-    """Create a column for comparison - handles any type with candles ago logic"""
-    
+"""THE FRAME IS A KEYED STORE OF COMPARISON COLUMNS. EVERY (TYPE, NAME, FULL PARAMETERS, candles_ago) HAS ONE
+CANONICAL COLUMN NAME (operand_label OF operand_key), SO KAMA [10, 2, 30] AND KAMA [10, 5, 60] GET KAMA_10_2_30 AND
+KAMA_10_5_60 INSTEAD OF BOTH WRITING KAMA_10. A COLUMN IS REUSED ONLY IF THE STORE ADDED IT AND THE PRICES ARE
+UNCHANGED, SO A USER COLUMN OF THE SAME NAME OR ONE LEFT FROM BEFORE AN EDIT OF THE PRICES IS RECOMPUTED.
+THE RECORD OF A FRAME SITS IN A SIDE TABLE KEYED BY THE FRAME (NOT IN attrs, WHICH pandas COPIES INTO EVERY Series)
+AND HOLDS THE FRAME'S INDEX AND OHLCV Series. UNDER COPY-ON-WRITE ANY WRITE TO THOSE PRICES (loc, iloc, *=,
+REASSIGNING A COLUMN) THEN PUTS THEM IN NEW BUFFERS, SO "SAME INDEX, SAME BUFFERS" IS AN EXACT O(1) CHECK - NO
+HASH OF THE PRICES PER CALL. comparison_columns.stats() COUNTS REUSED vs COMPUTED COLUMNS"""
+
+
+def buffer_address(series):
+    """Address of the buffer holding a column's values"""
+    return series.to_numpy().__array_interface__['data'][0]
+
+
+class ComparisonColumnRecord:
+    """Comparison columns added to a frame and the index / price columns they were computed from"""
+
+    def __init__(self, data):
+        self.index = data.index
+        # Holding the Series makes a later write to the prices copy them (copy-on-write) into new buffers
+        self.prices = {column: data[column] for column in FINGERPRINT_COLUMNS if column in data.columns}
+        self.names = set()
+
+    def matches(self, data):
+        """True while data has the same index and its prices are still the recorded buffers"""
+        if data.index is not self.index:
+            return False
+        if [column for column in FINGERPRINT_COLUMNS if column in data.columns] != list(self.prices):
+            return False
+        return all(buffer_address(data[column]) == buffer_address(prices) for column, prices in self.prices.items())
+
+
+class ComparisonColumnStore:
+    """Comparison columns keyed by canonical operand name, reused while the frame's prices are unchanged"""
+
+    def __init__(self):
+        self.computed = 0
+        self.reused = 0
+        self.records = {}  # {id(frame): (weakref to frame, ComparisonColumnRecord)}
+        self.lock = threading.Lock()
+
+    def record(self, data):
+        """Record of the columns the store added to data, started afresh when its prices changed"""
+        frame_id = id(data)
+        with self.lock:
+            entry = self.records.get(frame_id)
+        if entry is not None and entry[0]() is data and entry[1].matches(data):
+            return entry[1]
+        record = ComparisonColumnRecord(data)
+        # The entry goes when the frame is garbage collected
+        reference = weakref.ref(data, lambda _, frame_id=frame_id: self.records.pop(frame_id, None))
+        with self.lock:
+            self.records[frame_id] = (reference, record)
+        return record
+
+    def forget(self, data):
+        """Stop reusing the columns the store added to data"""
+        with self.lock:
+            self.records.pop(id(data), None)
+
+    def column(self, data, key, compute, fingerprint=None):
+        """Name of the column holding key on data, adding compute(fingerprint) under it when missing or stale"""
+        name = operand_label(key)
+        record = self.record(data)
+        if name in record.names and name in data.columns:
+            with self.lock:
+                self.reused += 1
+            return name
+        data[name] = compute(fingerprint)
+        record.names.add(name)
+        with self.lock:
+            self.computed += 1
+        return name
+
+    def reset(self):
+        """Zero the counters"""
+        with self.lock:
+            self.computed = 0
+            self.reused = 0
+
+    def stats(self):
+        """Reused/computed column counters"""
+        requests = self.computed + self.reused
+        return {
+            'computed': self.computed,
+            'reused': self.reused,
+            'reuse_rate': self.reused / requests * 100 if requests else 0.0
+        }
+
+
+comparison_columns = ComparisonColumnStore()
+
+
+def create_comparison_column(data, comp_type, comp_name, comp_params, candles_ago=0, fingerprint=None):
+    """Create a column for comparison - handles any type with candles ago logic
+
+    Pass the data_fingerprint of data when creating several columns of the same frame; it is only
+    taken (by calculate_indicator) when an indicator column has to be computed"""
+    key = operand_key(comp_type, comp_name, comp_params, candles_ago)  # raises on an unknown type
+
     if comp_type == ComparisonType.INDICATOR:
-        # Calculate indicator
-        # Handle both list and dict formats for comp_params
-        if isinstance(comp_params, dict):
-            period = comp_params.get('period', 20)  # Default to 20 if not specified
-        else:
-            period = comp_params[0]
-        indicator_values = calculate_indicator(data, comp_name, comp_params)
-        
-        if candles_ago == 0:
-            # Current candle
-            data[f'{comp_name}_{period}'] = indicator_values
-            return data, f'{comp_name}_{period}'
-        else:
-            # Previous candle(s)
-            data[f'{comp_name}_{period}_{candles_ago}_ago'] = indicator_values.shift(candles_ago)
-            return data, f'{comp_name}_{period}_{candles_ago}_ago'
-    
+        # Previous candle(s) are the indicator shifted forward
+        def compute(fingerprint):
+            indicator_values = calculate_indicator(data, comp_name, comp_params, fingerprint)
+            return indicator_values.shift(candles_ago) if candles_ago else indicator_values
+
     elif comp_type == ComparisonType.CONSTANT:
-        # Create constant value column
-        # Handle both list and dict formats for comp_params
-        if isinstance(comp_params, dict):
-            constant_value = comp_params.get('value', comp_params.get('period', 50))  # Default to 50
-        elif len(comp_params) > 0:
-            constant_value = comp_params[0]
-        else:
-            constant_value = 50  # Default constant value if no params provided
-        if candles_ago == 0:
-            data[f'Constant_{constant_value}'] = constant_value
-            return data, f'Constant_{constant_value}'
-        else:
-            data[f'Constant_{constant_value}_{candles_ago}_ago'] = constant_value
-            return data, f'Constant_{constant_value}_{candles_ago}_ago'
-    
-    elif comp_type == ComparisonType.PRICE:
-        # Use price column directly
-        if isinstance(comp_params, dict):
-            price_column = comp_params.get('column', 'Close')  # Default to Close if not specified
-        elif len(comp_params) > 0:
-            price_column = comp_params[0]  # e.g., 'Close', 'Open', 'High', 'Low'
-        else:
-            price_column = 'Close'  # Default to Close if no params provided
-        
-        if price_column not in data.columns:
-            raise ValueError(f"Price column '{price_column}' not found in data. Available: {list(data.columns)}")
-        
-        if candles_ago == 0:
-            # Current candle
-            data[f'Price_{price_column}'] = data[price_column]
-            return data, f'Price_{price_column}'
-        else:
-            # Previous candle(s)
-            data[f'Price_{price_column}_{candles_ago}_ago'] = data[price_column].shift(candles_ago)
-            return data, f'Price_{price_column}_{candles_ago}_ago'
-    
+        # Same value on every candle, candles_ago does not change it
+        def compute(fingerprint):
+            return constant_value(comp_params)
+
     else:
-        raise ValueError(f"Unknown comparison type: {comp_type}")
+        column = price_column(comp_params)  # e.g., 'Close', 'Open', 'High', 'Low' (default Close)
+        if column not in data.columns:
+            raise ValueError(f"Price column '{column}' not found in data. Available: {list(data.columns)}")
+
+        def compute(fingerprint):
+            return data[column].shift(candles_ago) if candles_ago else data[column]
+
+    return data, comparison_columns.column(data, key, compute, fingerprint)
 
 # =============================================================================
 # SIGNAL DETECTION
@@ -117,19 +185,7 @@ class SignalDetector:
     """Generic signal detector - easily extensible"""
     
     def __init__(self):
-        self.strategies = {
-            "CROSSED UP": crossed_up,
-            "CROSSED DOWN": crossed_down,
-            "CROSSED": crossed,
-            "EQUAL": equal_comparison,
-            "GREATER THAN": greater_than,
-            "GREATER OR EQUAL": greater_or_equal,
-            "LESS THAN": less_than,
-            "LESS OR EQUAL": less_or_equal,
-            "WITHIN RANGE": within_range,
-            "INCREASED": increased,
-            "DECREASED": decreased
-        }
+        self.strategies = dict(COMPARISON_STRATEGIES)
 
     """THIS CLASS BASICALLY CREATE SIGNAL DETECTION FUNCTIONS AND STORE THEM IN A DICTIONARY
     FOR EXAMPLE IF YOU TYPE self.strategies["CROSSED UP"] YOU WILL GET THE CROSSED UP FUNCTION
@@ -145,14 +201,16 @@ class SignalDetector:
 
     def detect_signals(self, data, comp1_type, comp1_name, comp1_params, 
                       comp2_type, comp2_name, comp2_params, strategy,
-                      comp1_candles_ago=0, comp2_candles_ago=0):
-        """Detect signals based on any comparison with candles ago logic"""
+                      comp1_candles_ago=0, comp2_candles_ago=0, fingerprint=None):
+        """Detect signals based on any comparison with candles ago logic
+
+        A sweep over one frame can pass its data_fingerprint once for the indicator columns it computes"""
         
         
         # Create both comparison columns with candles ago support
         """THIS WAS RETURNING TWO THINGS DATA AND THE INDICATOR OR CONTANT COL"""
-        data, col1 = create_comparison_column(data, comp1_type, comp1_name, comp1_params, comp1_candles_ago)
-        data, col2 = create_comparison_column(data, comp2_type, comp2_name, comp2_params, comp2_candles_ago)
+        data, col1 = create_comparison_column(data, comp1_type, comp1_name, comp1_params, comp1_candles_ago, fingerprint)
+        data, col2 = create_comparison_column(data, comp2_type, comp2_name, comp2_params, comp2_candles_ago, fingerprint)
         
         # Get strategy function
         """THIS GETS THE STRATEGY FUNCTION FROM THE DICTIONARY"""
@@ -168,6 +226,21 @@ class SignalDetector:
         
         return data, col1, col2
 
+    def comparison_signal(self, data, comp1_type, comp1_name, comp1_params,
+                          comp2_type, comp2_name, comp2_params, strategy,
+                          comp1_candles_ago=0, comp2_candles_ago=0, evaluator=None):
+        """Signal of one comparison as a bool array and its two operands - data is not modified
+
+        candles_ago is read through offset views of the unshifted values, no lagged column is built"""
+        if strategy not in self.strategies:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        operand1 = Operand(comp1_type, comp1_name, comp1_params, comp1_candles_ago)
+        operand2 = Operand(comp2_type, comp2_name, comp2_params, comp2_candles_ago)
+        if evaluator is None:
+            evaluator = ExpressionEvaluator(data, self.strategies)
+        signal = evaluator.evaluate(Comparison(strategy, operand1, operand2))
+        return signal.unpack(), operand1, operand2
+
 # Global signal detector instance
 signal_detector = SignalDetector()
 
@@ -208,38 +281,33 @@ def detect_strategy_signals(data, entry_comp1_type, entry_comp1_name, entry_comp
                            exit_comp1_type, exit_comp1_name, exit_comp1_params,
                            exit_comp2_type, exit_comp2_name, exit_comp2_params,
                            entry_strategy, exit_strategy, entry_comp1_candles_ago=0, 
-                           entry_comp2_candles_ago=0, exit_comp1_candles_ago=0, exit_comp2_candles_ago=0):
-    """Detect entry and exit signals using generic comparison system with candles ago logic"""
-    
-    # Entry signals
-    data, entry_col1, entry_col2 = signal_detector.detect_signals(
-        data, entry_comp1_type, entry_comp1_name, entry_comp1_params,
-        entry_comp2_type, entry_comp2_name, entry_comp2_params, entry_strategy,
-        comp1_candles_ago=entry_comp1_candles_ago, comp2_candles_ago=entry_comp2_candles_ago
-    )
-    data['Entry_Signal'] = data['Signal']
-    
-    # Rename entry columns to avoid conflicts
-    entry_col1_renamed = f"Entry_{entry_col1}"
-    entry_col2_renamed = f"Entry_{entry_col2}"
-    data[entry_col1_renamed] = data[entry_col1]
-    data[entry_col2_renamed] = data[entry_col2]
-    
-    # Exit signals
-    data, exit_col1, exit_col2 = signal_detector.detect_signals(
-        data, exit_comp1_type, exit_comp1_name, exit_comp1_params,
-        exit_comp2_type, exit_comp2_name, exit_comp2_params, exit_strategy,
-        comp1_candles_ago=exit_comp1_candles_ago, comp2_candles_ago=exit_comp2_candles_ago
+                           entry_comp2_candles_ago=0, exit_comp1_candles_ago=0, exit_comp2_candles_ago=0,
+                           diagnostics=False):
+    """Detect entry and exit signals using generic comparison system with candles ago logic
+
+    Only Entry_Signal and Exit_Signal are written; with diagnostics=True the four operand columns
+    (Entry_<col1>, Entry_<col2>, Exit_<col1>, Exit_<col2>) are materialized as well"""
+    # Entry and exit share one evaluator, so an operand used by both is computed once
+    evaluator = ExpressionEvaluator(data, signal_detector.strategies)
+    sides = (
+        ('Entry', entry_comp1_type, entry_comp1_name, entry_comp1_params, entry_comp2_type, entry_comp2_name,
+         entry_comp2_params, entry_strategy, entry_comp1_candles_ago, entry_comp2_candles_ago),
+        ('Exit', exit_comp1_type, exit_comp1_name, exit_comp1_params, exit_comp2_type, exit_comp2_name,
+         exit_comp2_params, exit_strategy, exit_comp1_candles_ago, exit_comp2_candles_ago)
     )
-    data['Exit_Signal'] = data['Signal']
-    
-    # Rename exit columns to avoid conflicts
-    exit_col1_renamed = f"Exit_{exit_col1}"
-    exit_col2_renamed = f"Exit_{exit_col2}"
-    data[exit_col1_renamed] = data[exit_col1]
-    data[exit_col2_renamed] = data[exit_col2]
+    columns = []
+    for prefix, *comparison in sides:
+        signal, operand1, operand2 = signal_detector.comparison_signal(data, *comparison, evaluator=evaluator)
+        data[f'{prefix}_Signal'] = signal
+        
+        # Columns named like the ones detect_signals creates, prefixed to avoid conflicts
+        for operand in (operand1, operand2):
+            column = f"{prefix}_{operand.label}"
+            if diagnostics:
+                data[column] = operand.column(evaluator)
+            columns.append(column)
     
-    return data, entry_col1_renamed, entry_col2_renamed, exit_col1_renamed, exit_col2_renamed
+    return (data, *columns)
 
 # =============================================================================
 # DATA PROCESSING
@@ -470,12 +538,35 @@ def execute_trading_strategy_original(data, portfolio, strategy_direction):
     return data
 
 
+"""THE LOOP ENGINES ABOVE ARE KEPT AS THE REFERENCE IMPLEMENTATION, THE ARRAY ENGINE IN engine.py
+GIVES THE SAME RESULTS WITHOUT THE PER-ROW data.loc WRITES"""
+
+def select_execution_engine(engine="auto"):
+    """Return (reversal_executor, directional_executor) for the chosen engine: 'auto', 'array' or 'loop'
+
+    'auto' takes the vectorized fast path for Long Only / Short Only without risk orders and the
+    array bar loop otherwise; the path taken is reported in data.attrs['execution_path']"""
+    if engine == "auto":
+        return execute_trading_strategy_auto, execute_trading_strategy_auto
+    elif engine == "array":
+        return execute_trading_strategy_arrays, execute_trading_strategy_arrays
+    elif engine == "loop":
+        return execute_trading_strategy, execute_trading_strategy_original
+    else:
+        raise ValueError(f"Unknown execution engine: {engine}")
+
+
+"""THE CONDITIONS (OR A TEXT / TREE RULE SET WITH set_expression) ARE COMPILED INTO A signal_expressions TREE AND
+EVALUATED ON ARRAYS: SHARED SUBEXPRESSIONS ARE COMPUTED ONCE, AND / OR STOP EARLY ON ALL-False / ALL-True MASKS
+AND COMBINE BIT-PACKED MASKS. THE RESULT STAYS PACKED UNTIL IT IS WRITTEN AS A SIGNAL COLUMN"""
+
 class MultiConditionDetector:
     """Detects signals based on multiple conditions with AND or OR logic"""
     
     def __init__(self):
         self.conditions = []
         self.logic_type = 'AND'  # 'AND' or 'OR'
+        self.expression = None
     
     def add_condition(self, comp1_type, comp1_name, comp1_params, 
                      comp2_type, comp2_name, comp2_params, strategy,
@@ -493,70 +584,57 @@ class MultiConditionDetector:
             raise ValueError("Logic type must be 'AND' or 'OR'")
         self.logic_type = logic_type
     
-    def detect_all_conditions(self, data):
-        """Check conditions with AND or OR logic"""
+    def set_expression(self, expression):
+        """Use a rule with nested AND/OR/NOT (text or expression tree) instead of the flat conditions"""
+        if isinstance(expression, str):
+            expression = parse_expression(expression, signal_detector.strategies)
+        self.expression = expression
+    
+    def compile(self):
+        """Expression tree of the rule, or None when there is nothing to detect"""
+        if self.expression is not None:
+            return self.expression
         if not self.conditions:
-            return data, []
-        
-        all_signals = []
-        condition_columns = []
-        
-        for i, condition in enumerate(self.conditions):
-            try:
-                # Use existing detect_signals function with candles ago support
-                data, col1, col2 = signal_detector.detect_signals(
-                    data, 
-                    condition['comp1_type'], condition['comp1_name'], condition['comp1_params'],
-                    condition['comp2_type'], condition['comp2_name'], condition['comp2_params'], 
-                    condition['strategy'],
-                    condition.get('comp1_candles_ago', 0), condition.get('comp2_candles_ago', 0)
-                )
-                
-                # Check if Signal column exists
-                if 'Signal' not in data.columns:
-                    raise ValueError(f"Signal column not created for condition {i+1}")
-                
-                # Rename columns to avoid conflicts
-                condition_col1 = f"Condition_{i+1}_{col1}"
-                condition_col2 = f"Condition_{i+1}_{col2}"
-                data[condition_col1] = data[col1]
-                data[condition_col2] = data[col2]
-                
-                all_signals.append(data['Signal'])
-                condition_columns.append((condition_col1, condition_col2))
-                
-            except Exception as e:
-                raise ValueError(f"Error processing condition {i+1}: {str(e)}")
-        
-        # Apply logic (AND or OR)
-        if len(all_signals) == 1:
-            data['Combined_Signal'] = all_signals[0]
-        else:
-            if self.logic_type == 'AND':
-                # All conditions must be true
-                combined_signal = all_signals[0]
-                for signal in all_signals[1:]:
-                    combined_signal = combined_signal & signal
-            else:  # OR logic
-                # Any condition can be true
-                combined_signal = all_signals[0]
-                for signal in all_signals[1:]:
-                    combined_signal = combined_signal | signal
-            
-            data['Combined_Signal'] = combined_signal
-        
+            return None
+        return compile_conditions(self.conditions, self.logic_type)
+    
+    def detect_packed_conditions(self, data, evaluator=None):
+        """Combined signal of the conditions as a PackedSignal (None without conditions) and the operand
+        labels of each comparison; pass an ExpressionEvaluator of data to share subexpressions with another rule"""
+        expression = self.compile()
+        if expression is None:
+            return None, []
+        if evaluator is None:
+            evaluator = ExpressionEvaluator(data, signal_detector.strategies)
+        try:
+            signal = evaluator.evaluate(expression)
+        except Exception as e:
+            raise ValueError(f"Error processing conditions: {str(e)}")
+        condition_columns = [tuple(operand.label for operand in comparison.operands)
+                             for comparison in expression_comparisons(expression)]
+        return signal, condition_columns
+    
+    def detect_all_conditions(self, data, evaluator=None):
+        """Check conditions with AND or OR logic
+
+        Returns data with Combined_Signal and the operand labels of each comparison (these are not
+        written to data)"""
+        signal, condition_columns = self.detect_packed_conditions(data, evaluator)
+        if signal is not None:
+            data['Combined_Signal'] = signal.unpack()
         return data, condition_columns
     
     def clear_conditions(self):
         """Clear all conditions"""
         self.conditions = []
+        self.expression = None
 
 # Global multi-condition detectors
 entry_multi_detector = MultiConditionDetector()
 exit_multi_detector = MultiConditionDetector()
 
 
-def run_multi_condition_strategy(ticker, period, interval, entry_conditions, exit_conditions, entry_logic='AND', exit_logic='AND', strategy_direction="Long Only"):
+def run_multi_condition_strategy(ticker, period, interval, entry_conditions, exit_conditions, entry_logic='AND', exit_logic='AND', strategy_direction="Long Only", engine="auto"):
     """Run a multi-condition trading strategy"""
     # Download and prepare data
     data = download_and_prepare_data(ticker, period, interval)
@@ -598,11 +676,14 @@ def run_multi_condition_strategy(ticker, period, interval, entry_conditions, exi
         print("Trailing stop disabled - using regular risk management only")
     
     # Execute trading strategy based on direction
+    reversal_executor, directional_executor = select_execution_engine(engine)
     if strategy_direction == "Long/Short Reversal":
-        data = execute_trading_strategy(data, portfolio)
+        data = reversal_executor(data, portfolio)
     else:
         # For Long Only and Short Only, use the original logic
-        data = execute_trading_strategy_original(data, portfolio, strategy_direction)
+        data = directional_executor(data, portfolio, strategy_direction)
+    if 'execution_path' in data.attrs:
+        print(f"⚙️ Execution path: {data.attrs['execution_path']}")
     
     # Display results
     display_multi_condition_results(ticker, data, portfolio, entry_conditions, exit_conditions, entry_logic, exit_logic)
@@ -682,7 +763,8 @@ def run_trading_strategy(ticker, period, interval, entry_comp1_type, entry_comp1
                         exit_comp1_type, exit_comp1_name, exit_comp1_params,
                         exit_comp2_type, exit_comp2_name, exit_comp2_params,
                         entry_strategy, exit_strategy, entry_comp1_candles_ago=0, 
-                        entry_comp2_candles_ago=0, exit_comp1_candles_ago=0, exit_comp2_candles_ago=0, strategy_direction="Long Only"):
+                        entry_comp2_candles_ago=0, exit_comp1_candles_ago=0, exit_comp2_candles_ago=0, strategy_direction="Long Only",
+                        engine="auto"):
     """Run a complete trading strategy with candles ago logic"""
     # Download and prepare data
     data = download_and_prepare_data(ticker, period, interval)
@@ -694,24 +776,121 @@ def run_trading_strategy(ticker, period, interval, entry_comp1_type, entry_comp1
         exit_comp1_type, exit_comp1_name, exit_comp1_params,
         exit_comp2_type, exit_comp2_name, exit_comp2_params,
         entry_strategy, exit_strategy, entry_comp1_candles_ago, entry_comp2_candles_ago,
-        exit_comp1_candles_ago, exit_comp2_candles_ago
+        exit_comp1_candles_ago, exit_comp2_candles_ago, diagnostics=True
     )
     
     # Initialize portfolio
     portfolio = Portfolio(10000)  # Start with $10,000
     
     # Execute trading strategy based on direction
+    reversal_executor, directional_executor = select_execution_engine(engine)
     if strategy_direction == "Long/Short Reversal":
-        data = execute_trading_strategy(data, portfolio)
+        data = reversal_executor(data, portfolio)
     else:
         # For Long Only and Short Only, use the original logic
-        data = execute_trading_strategy_original(data, portfolio, strategy_direction)
+        data = directional_executor(data, portfolio, strategy_direction)
+    if 'execution_path' in data.attrs:
+        print(f"⚙️ Execution path: {data.attrs['execution_path']}")
     
     # Display results
     display_results(ticker, data, portfolio, entry_comp1_name, entry_comp2_name,
                    exit_comp1_name, exit_comp2_name, entry_strategy, exit_strategy,
                    entry_col1, entry_col2, exit_col1, exit_col2)
 
+# =============================================================================
+# BATCHED PARAMETER STUDIES
+# =============================================================================
+
+"""A PARAMETER STUDY CALLS run_trading_strategy ONCE PER CONFIG, WHICH DOWNLOADS, REBUILDS EVERY
+COLUMN AND WALKS THE BAR LOOP AGAIN EACH TIME. run_batch_backtest TAKES ONE PREPARED FRAME AND
+N strategy_config DICTS, COMPUTES EACH DISTINCT OPERAND AND SIGNAL ONCE (ONE ExpressionEvaluator), STACKS THE
+SIGNALS INTO (N x bars) MATRICES AND RUNS ALL N PORTFOLIOS TOGETHER WITH execute_batch_arrays"""
+
+def config_comparison(config, side):
+    """Comparison node for the entry or exit side of a strategy_config dict"""
+    operands = [Operand(config[f'{side}_{slot}_type'], config[f'{side}_{slot}_name'], config[f'{side}_{slot}_params'],
+                        config.get(f'{side}_{slot}_candles_ago', 0))
+                for slot in ('comp1', 'comp2')]
+    strategy = config[f'{side}_strategy']
+    if strategy not in signal_detector.strategies:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    return Comparison(strategy, *operands)
+
+def batch_indicator_operands(data, comparisons, fingerprint=None):
+    """Fill indicator_cache with one calculate_indicator_batch per indicator and params for the operands of comparisons"""
+    groups = {}
+    for comparison in comparisons:
+        for operand in comparison.operands:
+            operand = operand.current
+            if operand.comp_type != ComparisonType.INDICATOR or operand.comp_name not in BATCH_INDICATORS:
+                continue
+            params = normalize_params(operand.comp_params)
+            # Only the (period, *params) form calculate_indicator accepts, so errors still come from it
+            if (not isinstance(params, tuple) or len(params) != 1 + len(BATCH_INDICATORS[operand.comp_name][1])
+                    or not isinstance(params[0], (int, float)) or params[0] != int(params[0]) or params[0] < 1):
+                continue
+            groups.setdefault((operand.comp_name, params[1:]), set()).add(int(params[0]))
+    for (name, params), periods in groups.items():
+        if len(periods) > 1:
+            calculate_indicator_batch(data, name, sorted(periods), params, fingerprint)
+
+
+def build_signal_matrices(data, configs):
+    """Build (N x bars) entry and exit signal matrices for a list of strategy_config dicts
+
+    Also returns how many distinct operand arrays and distinct signals were computed"""
+    evaluator = ExpressionEvaluator(data, signal_detector.strategies)
+    operands = set()
+    signals = set()
+    entry_matrix = np.empty((len(configs), len(data)), dtype=bool)
+    exit_matrix = np.empty((len(configs), len(data)), dtype=bool)
+    comparisons = [[config_comparison(config, side) for side in ('entry', 'exit')] for config in configs]
+    if indicator_cache.enabled:
+        # Indicators swept over many periods are computed together and read back per operand from the cache
+        batch_indicator_operands(data, [comparison for pair in comparisons for comparison in pair], evaluator.fingerprint())
+    for row, pair in enumerate(comparisons):
+        for comparison, matrix in zip(pair, (entry_matrix, exit_matrix)):
+            matrix[row] = evaluator.evaluate(comparison).unpack()
+            operands.update(operand.current.key for operand in comparison.operands)
+            signals.add(comparison.key)
+    return entry_matrix, exit_matrix, len(operands), len(signals)
+
+def describe_strategy_config(config):
+    """Short one-line label for a strategy_config dict"""
+    def side(prefix):
+        comp1 = f"{config[f'{prefix}_comp1_name']}{tuple(config[f'{prefix}_comp1_params'])}"
+        comp2 = f"{config[f'{prefix}_comp2_name']}{tuple(config[f'{prefix}_comp2_params'])}"
+        return f"{comp1} {config[f'{prefix}_strategy']} {comp2}"
+    return f"{side('entry')} | {side('exit')}"
+
+def run_batch_backtest(data, configs, initial_cash=10000, trade_size_percentage=100, strategy_direction="Long Only"):
+    """Backtest N strategy configs over one prepared OHLCV frame and return a summary table
+
+    configs are strategy_config dicts (see strategy_inputs_to_config); a config may override
+    'strategy_direction' and 'trade_size_percentage'. Stop-loss / take-profit are not applied."""
+    if not configs:
+        raise ValueError("At least one strategy config is required")
+    entry_matrix, exit_matrix, n_operands, n_signals = build_signal_matrices(data, configs)
+    directions = [config.get('strategy_direction', strategy_direction) for config in configs]
+    trade_sizes = [config.get('trade_size_percentage', trade_size_percentage) for config in configs]
+    print(f"⚙️ Batch backtest: {len(configs)} configs, {n_operands} distinct operands, {n_signals} distinct signals")
+
+    results = execute_batch_arrays(data['Close'].to_numpy(), entry_matrix, exit_matrix,
+                                   directions, initial_cash, trade_sizes)
+    summary = pd.DataFrame({
+        'strategy': [describe_strategy_config(config) for config in configs],
+        'strategy_direction': directions,
+        'trade_size_percentage': trade_sizes,
+        'current_value': results['current_value'],
+        'total_return': results['current_value'] - initial_cash,
+        'return_pct': (results['current_value'] - initial_cash) / initial_cash * 100,
+        'total_trades': results['total_trades'],
+        'max_drawdown': results['max_drawdown'],
+        'exposure_pct': results['exposure_pct'],
+        'position': results['position']
+    })
+    return summary
+
 def run_multi_ticker_strategy(config):
     """Run multi-ticker portfolio strategy"""
     print(f"\n🚀 Running Multi-Ticker Portfolio Strategy...")
@@ -724,23 +903,35 @@ def run_multi_ticker_strategy(config):
     # Initialize multi-ticker portfolio
     portfolio = MultiTickerPortfolio(config['total_capital'], config['allocations'], config['trade_sizes'])
     
-    # Download data for all tickers
+    # Download data for all tickers concurrently
     print(f"\n📊 Downloading data for all tickers...")
-    for ticker in config['tickers']:
-        print(f"  Downloading {ticker}...")
-        data = portfolio.get_ticker_data(ticker, config['period'], config['interval'])
-        if data is None:
-            print(f"  ❌ Failed to download {ticker}")
-            return
+    report = portfolio.load_ticker_data(config['tickers'], config['period'], config['interval'],
+                                        max_workers=config.get('download_workers', 8))
+    failed = [ticker for ticker, entry in report.items() if entry['error'] is not None]
+    if failed:
+        print(f"  ❌ Failed to download {', '.join(failed)}")
+        return
     
-    # Run strategy on each ticker
-    print(f"\n📈 Running strategy on all tickers...")
-    for ticker in config['tickers']:
-        print(f"  Processing {ticker}...")
-        data = portfolio.run_strategy_on_ticker(ticker, config['period'], config['interval'], config, detect_strategy_signals, execute_trading_strategy, execute_trading_strategy_original)
-        if data is None:
-            print(f"  ❌ Failed to process {ticker}")
+    # Run strategy on each ticker - in a process pool when config['backtest_workers'] > 1
+    reversal_executor, directional_executor = select_execution_engine(config.get('engine', 'auto'))
+    backtest_workers = config.get('backtest_workers', 1)
+    if backtest_workers > 1:
+        print(f"\n📈 Running strategy on all tickers ({backtest_workers} worker processes)...")
+        results = portfolio.run_strategies_parallel(config['tickers'], config['period'], config['interval'], config,
+                                                    detect_strategy_signals, reversal_executor, directional_executor,
+                                                    max_workers=backtest_workers)
+        failed = [ticker for ticker, data in results.items() if data is None]
+        if failed:
+            print(f"  ❌ Failed to process {', '.join(failed)}")
             return
+    else:
+        print(f"\n📈 Running strategy on all tickers...")
+        for ticker in config['tickers']:
+            print(f"  Processing {ticker}...")
+            data = portfolio.run_strategy_on_ticker(ticker, config['period'], config['interval'], config, detect_strategy_signals, reversal_executor, directional_executor)
+            if data is None:
+                print(f"  ❌ Failed to process {ticker}")
+                return
     
     # Display results
     portfolio.display_combined_results(config)
@@ -767,11 +958,17 @@ def run_multi_ticker_multi_strategy(config):
         config['ticker_strategies']
     )
     
+    # Download data for all tickers concurrently; failed tickers are retried and reported per ticker below
+    print(f"\n📊 Downloading data for all tickers...")
+    portfolio.load_ticker_data(config['tickers'], config['period'], config['interval'],
+                               max_workers=config.get('download_workers', 8))
+    
     # Run strategy on each ticker with individual strategies
+    reversal_executor, directional_executor = select_execution_engine(config.get('engine', 'auto'))
     print(f"\n📈 Running individual strategies on all tickers...")
     for ticker in config['tickers']:
         print(f"  Processing {ticker} with its unique strategy...")
-        data = portfolio.run_strategy_on_ticker(ticker, config['period'], config['interval'], detect_strategy_signals, execute_trading_strategy, execute_trading_strategy_original)
+        data = portfolio.run_strategy_on_ticker(ticker, config['period'], config['interval'], detect_strategy_signals, reversal_executor, directional_executor)
         if data is None:
             print(f"  ❌ Failed to process {ticker}")
             return
@@ -0,0 +1,91 @@
+"""
+Packed Signals Module
+Boolean signals stored as bitsets (one bit per bar) and combined word by word
+"""
+
+import numpy as np
+
+
+"""A CONDITION MASK IS ONE BIT OF INFORMATION PER BAR BUT A bool ARRAY SPENDS A BYTE ON IT. A PackedSignal KEEPS
+THE BITS (np.packbits, LITTLE BIT ORDER) IN uint64 WORDS, SO A MULTI-MILLION-BAR MASK IS 8x SMALLER AND AND / OR /
+NOT RUN 64 BARS PER OPERATION. BITS PAST THE LAST BAR ARE ALWAYS ZERO, SO any() / all() / count() READ THE WORDS
+DIRECTLY. unpack() GIVES THE bool ARRAY BACK WHEN A CONSUMER (THE ENGINE, A DataFrame COLUMN) NEEDS ONE"""
+
+
+def clear_padding(words, length):
+    """Zero the bits of words past length (in place)"""
+    octets = words.view(np.uint8)
+    full, remainder = divmod(length, 8)
+    if remainder:
+        octets[full] &= (1 << remainder) - 1
+        full += 1
+    octets[full:] = 0
+    return words
+
+
+class PackedSignal:
+    """Boolean signal of length bars, 64 bars per uint64 word"""
+
+    def __init__(self, words, length):
+        self.words = words
+        self.length = length
+
+    @classmethod
+    def pack(cls, mask):
+        """Packed copy of a boolean mask"""
+        mask = np.asarray(mask, dtype=bool)
+        octets = np.zeros(-(-len(mask) // 64) * 8, dtype=np.uint8)
+        octets[:-(-len(mask) // 8)] = np.packbits(mask, bitorder='little')
+        return cls(octets.view(np.uint64), len(mask))
+
+    @classmethod
+    def filled(cls, length, value):
+        """Signal that is value on every bar"""
+        words = np.full(-(-length // 64), np.uint64(0xFFFFFFFFFFFFFFFF) if value else 0, dtype=np.uint64)
+        return cls(clear_padding(words, length), length)
+
+    def unpack(self):
+        """bool array of the signal"""
+        return np.unpackbits(self.words.view(np.uint8), count=self.length, bitorder='little').view(bool)
+
+    def check_length(self, other):
+        if other.length != self.length:
+            raise ValueError(f"Cannot combine signals of {self.length} and {other.length} bars")
+
+    def __and__(self, other):
+        self.check_length(other)
+        return PackedSignal(self.words & other.words, self.length)
+
+    def __or__(self, other):
+        self.check_length(other)
+        return PackedSignal(self.words | other.words, self.length)
+
+    def __xor__(self, other):
+        self.check_length(other)
+        return PackedSignal(self.words ^ other.words, self.length)
+
+    def __invert__(self):
+        return PackedSignal(clear_padding(~self.words, self.length), self.length)
+
+    def __len__(self):
+        return self.length
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.unpack()
+        return values if dtype is None else values.astype(dtype)
+
+    def any(self):
+        """True on at least one bar"""
+        return bool(self.words.any())
+
+    def all(self):
+        """True on every bar"""
+        return not (~self).any()
+
+    def count(self):
+        """Number of bars where the signal is True"""
+        return int(np.unpackbits(self.words.view(np.uint8)).sum(dtype=np.int64))
+
+    @property
+    def nbytes(self):
+        return self.words.nbytes
@@ -3,6 +3,8 @@ from metrics import *
 from display import *
 from comparisons import *
 from inputs import *
+import time
+from concurrent.futures import ProcessPoolExecutor
 # Removed circular import - functions will be passed as parameters
 
 
@@ -595,6 +597,40 @@ class Portfolio:
                 return True
         return False
 
+"""EACH TICKER IN A MultiTickerPortfolio HAS ITS OWN Portfolio AND ITS OWN DATA, SO THE PER-TICKER
+BACKTESTS ARE INDEPENDENT. backtest_ticker IS THE BODY SHARED BY THE SERIAL AND THE PROCESS-POOL
+PATHS: THE POOL SENDS (data, strategy_config, capital) TO A WORKER AND GETS THE FINISHED Portfolio
+(TRADE LEDGER INCLUDED) AND THE TRACKED DATA BACK, SO BOTH PATHS PRODUCE THE SAME RESULTS"""
+
+def backtest_ticker(data, strategy_config, portfolio, detect_strategy_signals, execute_trading_strategy, execute_trading_strategy_original):
+    """Detect signals and execute one ticker's strategy on its portfolio"""
+    data, entry_col1, entry_col2, exit_col1, exit_col2 = detect_strategy_signals(
+        data,
+        strategy_config['entry_comp1_type'], strategy_config['entry_comp1_name'], strategy_config['entry_comp1_params'],  # entry_comp1
+        strategy_config['entry_comp2_type'], strategy_config['entry_comp2_name'], strategy_config['entry_comp2_params'],  # entry_comp2
+        strategy_config['exit_comp1_type'], strategy_config['exit_comp1_name'], strategy_config['exit_comp1_params'],  # exit_comp1
+        strategy_config['exit_comp2_type'], strategy_config['exit_comp2_name'], strategy_config['exit_comp2_params'],  # exit_comp2
+        strategy_config['entry_strategy'], strategy_config['exit_strategy'],  # strategies
+        strategy_config['entry_comp1_candles_ago'], strategy_config['entry_comp2_candles_ago'], 
+        strategy_config['exit_comp1_candles_ago'], strategy_config['exit_comp2_candles_ago']  # candles_ago
+    )
+    
+    # Execute trading strategy based on direction
+    strategy_direction = strategy_config.get('strategy_direction', 'Long Only')
+    if strategy_direction == "Long/Short Reversal":
+        data = execute_trading_strategy(data, portfolio)
+    else:
+        # For Long Only and Short Only, use the original logic
+        data = execute_trading_strategy_original(data, portfolio, strategy_direction)
+    return data
+
+def run_ticker_backtest_task(task):
+    """Process-pool worker - build the ticker's Portfolio and run backtest_ticker on it"""
+    ticker, data, strategy_config, portfolio_settings, executors = task
+    portfolio = Portfolio(**portfolio_settings)
+    data = backtest_ticker(data, strategy_config, portfolio, *executors)
+    return ticker, data, portfolio
+
 """MultiTickerPortfolio class is used to manage the portfolio and the trades for multiple tickers"""
 """it just sets the trade_size_percentage"""
 """it just sets the trade_size_dollars"""
@@ -624,6 +660,7 @@ class MultiTickerPortfolio:
         self.ticker_capital = {}  # {ticker: allocated_capital}
         self.portfolios = {}  # {ticker: Portfolio}
         self.ticker_data = {}  # {ticker: data}
+        self.download_report = {}  # {ticker: {'seconds', 'rows', 'error'}}
         self.ticker_performance = {}  # {ticker: performance}
         
         # Calculate allocated capital for each ticker
@@ -691,49 +728,71 @@ class MultiTickerPortfolio:
         if data is not None:
             self.ticker_data[ticker] = data
         return data
+
+    def load_ticker_data(self, tickers, period, interval, max_workers=8, loader=None):
+        """Download all tickers concurrently into ticker_data - returns the per-ticker report"""
+        start = time.perf_counter()
+        ticker_data, report = download_tickers(tickers, period, interval, max_workers=max_workers, loader=loader)
+        self.ticker_data.update(ticker_data)
+        self.download_report = report
+        display_download_report(report, time.perf_counter() - start)
+        return report
     
     def run_strategy_on_ticker(self, ticker, period, interval, strategy_config, detect_strategy_signals, execute_trading_strategy, execute_trading_strategy_original):
         """Run strategy on a specific ticker"""
-        data = self.get_ticker_data(ticker, period, interval)
-        if data is None:
-            return None
-        
-        # Create portfolio for this ticker
-        allocated_capital = self.ticker_capital[ticker]
-        trade_size = self.trade_size_percentages.get(ticker, 100)
-        
-        portfolio = Portfolio(
-            initial_cash=allocated_capital,
-            trade_size_percentage=trade_size,
-            trade_type=self.trade_type
-        )
-        
-        # Run the trading strategy
-        data, entry_col1, entry_col2, exit_col1, exit_col2 = detect_strategy_signals(
-            data,
-            strategy_config['entry_comp1_type'], strategy_config['entry_comp1_name'], strategy_config['entry_comp1_params'],  # entry_comp1
-            strategy_config['entry_comp2_type'], strategy_config['entry_comp2_name'], strategy_config['entry_comp2_params'],  # entry_comp2
-            strategy_config['exit_comp1_type'], strategy_config['exit_comp1_name'], strategy_config['exit_comp1_params'],  # exit_comp1
-            strategy_config['exit_comp2_type'], strategy_config['exit_comp2_name'], strategy_config['exit_comp2_params'],  # exit_comp2
-            strategy_config['entry_strategy'], strategy_config['exit_strategy'],  # strategies
-            strategy_config['entry_comp1_candles_ago'], strategy_config['entry_comp2_candles_ago'], 
-            strategy_config['exit_comp1_candles_ago'], strategy_config['exit_comp2_candles_ago']  # candles_ago
-        )
-        
-        # Execute trading strategy based on direction
-        strategy_direction = strategy_config.get('strategy_direction', 'Long Only')
-        if strategy_direction == "Long/Short Reversal":
-            data = execute_trading_strategy(data, portfolio)
+        # Reuse data already fetched by load_ticker_data / get_ticker_data
+        if ticker in self.ticker_data:
+            data = self.ticker_data[ticker]
         else:
-            # For Long Only and Short Only, use the original logic
-            data = execute_trading_strategy_original(data, portfolio, strategy_direction)
+            data = self.get_ticker_data(ticker, period, interval)
+            if data is None:
+                return None
+        
+        # Create portfolio for this ticker and run the trading strategy
+        portfolio = Portfolio(**self.ticker_portfolio_settings(ticker))
+        data = backtest_ticker(data, strategy_config, portfolio, detect_strategy_signals,
+                               execute_trading_strategy, execute_trading_strategy_original)
         
-        # Store portfolio and performance
+        self.store_ticker_result(ticker, data, portfolio)
+        return data
+    
+    def ticker_portfolio_settings(self, ticker):
+        """Portfolio constructor arguments for a ticker's allocated capital"""
+        return {
+            'initial_cash': self.ticker_capital[ticker],
+            'trade_size_percentage': self.trade_size_percentages.get(ticker, 100),
+            'trade_type': self.trade_type
+        }
+    
+    def store_ticker_result(self, ticker, data, portfolio):
+        """Store portfolio and performance for a finished ticker"""
         self.portfolios[ticker] = portfolio
         current_price = data['Close'].iloc[-1] if not data.empty else 0
         self.ticker_performance[ticker] = portfolio.get_performance(current_price)
-        
-        return data
+    
+    def run_strategies_parallel(self, tickers, period, interval, strategy_config, detect_strategy_signals, execute_trading_strategy, execute_trading_strategy_original, max_workers=None):
+        """Run every ticker's backtest in a process pool - same results as calling run_strategy_on_ticker per ticker
+        
+        Returns {ticker: data}; tickers whose data cannot be loaded map to None."""
+        results = {}
+        tasks = []
+        executors = (detect_strategy_signals, execute_trading_strategy, execute_trading_strategy_original)
+        for ticker in tickers:
+            data = self.ticker_data.get(ticker)
+            if data is None:
+                data = self.get_ticker_data(ticker, period, interval)
+            if data is None:
+                results[ticker] = None
+                continue
+            tasks.append((ticker, data, strategy_config, self.ticker_portfolio_settings(ticker), executors))
+        
+        # map keeps submission order, so portfolios / performance are filled in ticker order like the serial run
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for ticker, data, portfolio in executor.map(run_ticker_backtest_task, tasks):
+                self.ticker_data[ticker] = data
+                self.store_ticker_result(ticker, data, portfolio)
+                results[ticker] = data
+        return {ticker: results[ticker] for ticker in tickers}
     
     def get_combined_performance(self):
         """Calculate combined portfolio performance"""
@@ -804,6 +863,7 @@ class MultiTickerMultiStrategyPortfolio:
         self.ticker_capital = {}  # {ticker: allocated_capital}
         self.portfolios = {}  # {ticker: Portfolio}
         self.ticker_data = {}  # {ticker: data}
+        self.download_report = {}  # {ticker: {'seconds', 'rows', 'error'}}
         self.ticker_performance = {}  # {ticker: performance}
         
         # Risk management settings for each ticker
@@ -879,6 +939,15 @@ class MultiTickerMultiStrategyPortfolio:
         if data is not None:
             self.ticker_data[ticker] = data
         return data
+
+    def load_ticker_data(self, tickers, period, interval, max_workers=8, loader=None):
+        """Download all tickers concurrently into ticker_data - returns the per-ticker report"""
+        start = time.perf_counter()
+        ticker_data, report = download_tickers(tickers, period, interval, max_workers=max_workers, loader=loader)
+        self.ticker_data.update(ticker_data)
+        self.download_report = report
+        display_download_report(report, time.perf_counter() - start)
+        return report
     
     def run_strategy_on_ticker(self, ticker, period, interval, detect_strategy_signals, execute_trading_strategy, execute_trading_strategy_original):
         """Run individual strategy on a specific ticker"""
@@ -0,0 +1,162 @@
+"""
+Primitives Module
+Shared intermediate series (true range, ATR, EMA, rolling std, typical price, directional movement)
+computed once per frame and reused by every strategy class that needs them
+"""
+
+import threading
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+
+"""DOZENS OF LIBRARY CLASSES REBUILT THE SAME BUILDING BLOCKS FROM df ON THEIR OWN: TRUE RANGE AND ITS ROLLING
+MEAN, EMAs OF Close, ROLLING STD OF Close, TYPICAL PRICE AND DIRECTIONAL MOVEMENT. A CLASS NOW DECLARES THE
+PRIMITIVES IT READS IN required_primitives() AND FETCHES THEM IN compute_values THROUGH frame_primitives(self, df).
+A PRIMITIVE IS A TUPLE KEY (KIND, *PARAMS), E.G. ('EMA', 'Close', 12) OR ('ATR', 14, 1, True). THE STRATEGY
+RUNNERS PLAN THE UNION OF THE DECLARED KEYS (DEPENDENCIES FIRST), COMPUTE EACH ONE ONCE PER FRAME IN A SHARED
+PrimitiveStore AND BIND THAT STORE TO EVERY WORKING COPY; A CLASS USED ON ITS OWN GETS A PRIVATE STORE AND
+COMPUTES EXACTLY WHAT IT USED TO. EVERY PRIMITIVE REPEATS THE PANDAS OPERATIONS THE CLASSES USED, SO THE
+SHARED VALUES ARE BIT-FOR-BIT THE ONES EACH CLASS COMPUTED BEFORE"""
+
+
+def true_range(store, skipna=True):
+    """max(High - Low, |High - prev Close|, |Low - prev Close|); skipna=False keeps the NaN of the first bar"""
+    df = store.df
+    prev_close = df['Close'].shift(1)
+    high_low = (df['High'] - df['Low']).to_numpy()
+    high_close = (df['High'] - prev_close).abs().to_numpy()
+    low_close = (df['Low'] - prev_close).abs().to_numpy()
+    # fmax skips NaN like DataFrame.max(axis=1); maximum propagates it like np.maximum on the Series
+    combine = np.fmax if skipna else np.maximum
+    return pd.Series(combine(combine(high_low, high_close), low_close), index=df.index)
+
+
+def average_true_range(store, period, min_periods=1, skipna=True):
+    """Simple rolling mean of the true range"""
+    return store.compute(('TR', skipna)).rolling(window=period, min_periods=min_periods).mean()
+
+
+def exponential_moving_average(store, column, span):
+    """Recursive (adjust=False) EMA of one column"""
+    return store.df[column].ewm(span=span, adjust=False).mean()
+
+
+def rolling_standard_deviation(store, column, period, min_periods=1):
+    """Sample rolling standard deviation of one column"""
+    return store.df[column].rolling(window=period, min_periods=min_periods).std()
+
+
+def typical_price(store):
+    """(High + Low + Close) / 3"""
+    df = store.df
+    return (df['High'] + df['Low'] + df['Close']) / 3
+
+
+def directional_movement(store):
+    """(+DM, -DM): the up or down move when it is positive and larger than the opposite move, else 0"""
+    df = store.df
+    up_move = df['High'] - df['High'].shift(1)
+    down_move = df['Low'].shift(1) - df['Low']
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
+    return pd.Series(plus_dm, index=df.index), pd.Series(minus_dm, index=df.index)
+
+
+# Registry of primitive kinds: key[0] -> function(store, *key[1:])
+PRIMITIVES = {
+    'TR': true_range,                           # ('TR', skipna)
+    'ATR': average_true_range,                  # ('ATR', period, min_periods, skipna)
+    'EMA': exponential_moving_average,          # ('EMA', column, span)
+    'STD': rolling_standard_deviation,          # ('STD', column, period, min_periods)
+    'TYPICAL_PRICE': typical_price,             # ('TYPICAL_PRICE',)
+    'DM': directional_movement                  # ('DM',) -> (+DM, -DM)
+}
+
+# Primitives a kind reads from the store, as a function of its parameters
+PRIMITIVE_DEPENDENCIES = {
+    'ATR': lambda period, min_periods=1, skipna=True: [('TR', skipna)]
+}
+
+
+def primitive_dependencies(key):
+    """Primitive keys that must be computed before key"""
+    if key[0] not in PRIMITIVES:
+        raise ValueError(f"Unknown primitive '{key[0]}'. Use one of {tuple(PRIMITIVES)}")
+    dependencies = PRIMITIVE_DEPENDENCIES.get(key[0])
+    return dependencies(*key[1:]) if dependencies else []
+
+
+def plan_primitives(strategies):
+    """Primitives declared by strategies, dependencies first, and how many strategies declared each one"""
+    demand = Counter()
+    for strategy in strategies:
+        declare = getattr(strategy, 'required_primitives', None)
+        if declare is not None:
+            demand.update(set(declare()))
+    order, seen = [], set()
+
+    def visit(key):
+        if key in seen:
+            return
+        seen.add(key)
+        for dependency in primitive_dependencies(key):
+            visit(dependency)
+        order.append(key)
+
+    for key in demand:
+        visit(key)
+    return order, demand
+
+
+def share_result(value):
+    """Shallow copy handed to a strategy, so in-place edits copy-on-write instead of touching the store"""
+    if isinstance(value, tuple):
+        return tuple(share_result(item) for item in value)
+    return value.copy(deep=False)
+
+
+class PrimitiveStore:
+    """Primitive series of one frame, each computed at most once"""
+
+    def __init__(self, df):
+        self.df = df
+        self.values = {}
+        self.requests = Counter()
+        # Re-entrant: a primitive computes its dependencies through compute() while holding the lock
+        self.lock = threading.RLock()
+
+    def compute(self, key):
+        """Value of a primitive, computing it (and its dependencies) on first use"""
+        with self.lock:
+            if key not in self.values:
+                if key[0] not in PRIMITIVES:
+                    raise ValueError(f"Unknown primitive '{key[0]}'. Use one of {tuple(PRIMITIVES)}")
+                self.values[key] = PRIMITIVES[key[0]](self, *key[1:])
+            return self.values[key]
+
+    def get(self, key):
+        """Primitive requested by a strategy (counted for stats)"""
+        with self.lock:
+            self.requests[key] += 1
+            return share_result(self.compute(key))
+
+    def prepare(self, plan):
+        """Compute a planned list of primitives up front"""
+        for key in plan:
+            self.compute(key)
+
+    def stats(self):
+        """Primitives computed and strategy requests served"""
+        return {
+            'computed': len(self.values),
+            'requests': sum(self.requests.values()),
+            'requests_per_primitive': dict(self.requests)
+        }
+
+
+def frame_primitives(strategy, df):
+    """Store bound to a strategy's working copy by the runners, else a private store for df"""
+    store = getattr(strategy, 'primitive_store', None)
+    return store if store is not None else PrimitiveStore(df)
@@ -0,0 +1,509 @@
+"""
+Signal Expressions Module
+Entry/exit rules compiled into a boolean expression tree (AND / OR / NOT over comparisons of indicators,
+constants and price columns) and evaluated on NumPy arrays
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from comparision_types import ComparisonType
+from comparisons import (
+    COMPARISON_STRATEGIES, crossed_up, crossed_down, crossed, equal_comparison, greater_than, greater_or_equal,
+    less_than, less_or_equal, within_range, increased, decreased
+)
+from indicators import calculate_indicator, complete_params, data_fingerprint, indicator_cache, normalize_params
+from packed_signals import PackedSignal
+
+
+"""MultiConditionDetector USED TO RUN EVERY CONDITION THROUGH detect_signals, WRITING TWO OPERAND COLUMNS AND THE
+SHARED Signal COLUMN INTO THE DataFrame, COPYING THEM TO Condition_i_* COLUMNS AND FOLDING THE Signal SERIES
+WITH & OR |. A RULE IS NOW A TREE: Operand LEAVES (INDICATOR / CONSTANT / PRICE, candles_ago BARS BACK),
+Comparison NODES (ANY SIGNAL DETECTOR STRATEGY) AND And / Or / Not ABOVE THEM, NESTED FREELY. EVERY NODE HAS A
+STRUCTURAL key, SO AN ExpressionEvaluator COMPUTES EACH DISTINCT SUBEXPRESSION ONCE PER FRAME (EMA(12) IN AN
+ENTRY AND AN EXIT RULE, EMA(12) AND EMA(12)[1], THE SAME COMPARISON TWICE). And / Or EVALUATE THEIR CHEAPEST
+CHILDREN FIRST AND STOP AS SOON AS THE MASK IS ALL False / ALL True. NOTHING IS WRITTEN TO THE DataFrame; THE
+BUILT-IN STRATEGIES RUN AS NumPy COMPARISONS WITH THE SAME NaN BEHAVIOUR AS comparisons.py, A CUSTOM REGISTERED
+STRATEGY GETS A TWO-COLUMN FRAME. CONDITION MASKS ARE KEPT AND COMBINED AS PackedSignal BITSETS. RULES COME FROM THE FLAT CONDITION DICTS (compile_conditions) OR FROM TEXT
+(parse_expression), E.G. crossed_up(EMA(12), EMA(26)) AND RSI(14) < 70 OR NOT Close[1] > SMA(200), WHERE OMITTED
+TRAILING INDICATOR PARAMETERS TAKE THE INDICATOR FUNCTION'S DEFAULTS (RSI(14) IS RSI(14, 70, 30)). A candles_ago
+OPERAND IS NEVER SHIFTED INTO A NEW ARRAY: THE COMPARISON READS values[start - k:n - k] AGAINST THE OTHER SIDE'S
+VIEW (compare_lagged)"""
+
+
+# =============================================================================
+# ARRAY COMPARISONS
+# =============================================================================
+
+def lagged(values, periods=1):
+    """values shifted forward by periods bars, NaN where nothing precedes (Series.shift on a float array)"""
+    result = np.full(len(values), np.nan)
+    if periods < len(values):
+        result[periods:] = values[:len(values) - periods]
+    return result
+
+
+def lagged_window(values, lag, start, stop):
+    """View of values lag bars back for bars [start, stop); a constant (0-d) operand is returned as is"""
+    if np.ndim(values) == 0:
+        return values
+    return values[start - lag:stop - lag]
+
+
+# comparisons.py function -> (reads operand 2, reads the previous bar, test on (value1, value2, previous1, previous2))
+ARRAY_COMPARISONS = {
+    crossed_up: (True, True, lambda value1, value2, previous1, previous2: (previous1 < previous2) & (value1 > value2)),
+    crossed_down: (True, True, lambda value1, value2, previous1, previous2: (previous1 > previous2) & (value1 < value2)),
+    crossed: (True, True, lambda value1, value2, previous1, previous2: (((previous1 < previous2) & (value1 > value2))
+                                                                        | ((previous1 > previous2) & (value1 < value2)))),
+    equal_comparison: (True, False, lambda value1, value2, previous1, previous2: np.abs(value1 - value2) < 0.01),
+    greater_than: (True, False, lambda value1, value2, previous1, previous2: value1 > value2),
+    greater_or_equal: (True, False, lambda value1, value2, previous1, previous2: value1 >= value2),
+    less_than: (True, False, lambda value1, value2, previous1, previous2: value1 < value2),
+    less_or_equal: (True, False, lambda value1, value2, previous1, previous2: value1 <= value2),
+    within_range: (True, False, lambda value1, value2, previous1, previous2: np.abs(value1 - value2) <= 0.01),
+    increased: (False, True, lambda value1, value2, previous1, previous2: value1 > previous1),
+    decreased: (False, True, lambda value1, value2, previous1, previous2: value1 < previous1)
+}
+
+
+def compare_lagged(strategy_func, n_bars, values1, lag1, values2, lag2):
+    """Mask of a built-in comparison of values1 lag1 bars back against values2 lag2 bars back
+
+    Reads offset views of the unshifted arrays. Bars before the first one where every value read exists
+    are False, which is what the comparison gives on the NaN a shifted column holds there"""
+    reads_second, reads_previous, test = ARRAY_COMPARISONS[strategy_func]
+    start = max(lag1, lag2 if reads_second else 0) + (1 if reads_previous else 0)
+    mask = np.zeros(n_bars, dtype=bool)
+    if start >= n_bars:
+        return mask
+    value1 = lagged_window(values1, lag1, start, n_bars)
+    value2 = lagged_window(values2, lag2, start, n_bars) if reads_second else None
+    previous1 = previous2 = None
+    if reads_previous:
+        previous1 = lagged_window(values1, lag1 + 1, start, n_bars)
+        previous2 = lagged_window(values2, lag2 + 1, start, n_bars) if reads_second else None
+    mask[start:] = test(value1, value2, previous1, previous2)
+    return mask
+
+
+# =============================================================================
+# OPERAND PARAMETERS
+# =============================================================================
+
+def constant_value(comp_params):
+    """Value of a constant operand"""
+    if isinstance(comp_params, dict):
+        return comp_params.get('value', comp_params.get('period', 50))
+    return comp_params[0] if len(comp_params) > 0 else 50
+
+
+def price_column(comp_params):
+    """Column read by a price operand"""
+    if isinstance(comp_params, dict):
+        return comp_params.get('column', 'Close')
+    return comp_params[0] if len(comp_params) > 0 else 'Close'
+
+
+def operand_key(comp_type, comp_name, comp_params, candles_ago=0):
+    """Canonical identity of an operand: every parameter counts, candles_ago too except for a constant"""
+    if comp_type == ComparisonType.INDICATOR:
+        params = normalize_params(comp_params)
+        return (comp_type, comp_name, params if isinstance(params, tuple) else (params,), candles_ago)
+    if comp_type == ComparisonType.CONSTANT:
+        return (comp_type, normalize_params(constant_value(comp_params)))
+    if comp_type == ComparisonType.PRICE:
+        return (comp_type, price_column(comp_params), candles_ago)
+    raise ValueError(f"Unknown comparison type: {comp_type}")
+
+
+def param_label(value):
+    """Text of one normalized parameter in a column name (dict items as name=value, strings quoted)"""
+    if isinstance(value, tuple) and len(value) == 2 and isinstance(value[0], str) and not isinstance(value[1], tuple):
+        return f'{value[0]}={param_label(value[1])}'
+    if isinstance(value, str):
+        return repr(value)
+    return str(value)
+
+
+def operand_label(key):
+    """Column name of an operand key, one name per key: EMA_12, RSI_14_70_30, Price_Close_2_ago, Constant_70"""
+    comp_type = key[0]
+    if comp_type == ComparisonType.CONSTANT:
+        return f'Constant_{key[1]}'
+    if comp_type == ComparisonType.INDICATOR:
+        _, comp_name, params, candles_ago = key
+        label = '_'.join([str(comp_name)] + [param_label(value) for value in params])
+    else:
+        _, column, candles_ago = key
+        label = f'Price_{column}'
+    return f'{label}_{candles_ago}_ago' if candles_ago else label
+
+
+# =============================================================================
+# EXPRESSION NODES
+# =============================================================================
+
+# Relative evaluation cost of an operand, used to order And / Or children
+OPERAND_COSTS = {ComparisonType.INDICATOR: 10, ComparisonType.PRICE: 1, ComparisonType.CONSTANT: 0}
+
+
+class Operand:
+    """Indicator, constant or price column value, candles_ago bars back"""
+
+    def __init__(self, comp_type, comp_name, comp_params, candles_ago=0):
+        if comp_type not in OPERAND_COSTS:
+            raise ValueError(f"Unknown comparison type: {comp_type}")
+        self.comp_type = comp_type
+        self.comp_name = comp_name
+        self.comp_params = comp_params
+        self.candles_ago = candles_ago
+        self.cost = OPERAND_COSTS[comp_type]
+        self.key = ('OPERAND',) + operand_key(comp_type, comp_name, comp_params, candles_ago)
+        self.label = operand_label(self.key[1:])
+        # Lagged operands share the values of the current one and are read through offset views
+        self.lag = 0 if comp_type == ComparisonType.CONSTANT else candles_ago
+        self.current = self if not self.lag else Operand(comp_type, comp_name, comp_params)
+
+    def compute(self, evaluator):
+        """Unshifted values: a float array, or a 0-d float for a constant"""
+        if self is not self.current:
+            return evaluator.evaluate(self.current)
+        data = evaluator.data
+        if self.comp_type == ComparisonType.CONSTANT:
+            return np.float64(constant_value(self.comp_params))
+        if self.comp_type == ComparisonType.INDICATOR:
+            values = calculate_indicator(data, self.comp_name, self.comp_params, evaluator.fingerprint())
+        else:
+            column = price_column(self.comp_params)
+            if column not in data.columns:
+                raise ValueError(f"Price column '{column}' not found in data. Available: {list(data.columns)}")
+            values = data[column]
+        if isinstance(values, pd.Series):
+            return values.to_numpy(dtype=float)
+        return np.asarray(values, dtype=float)
+
+    def column(self, evaluator):
+        """Materialized values, candles_ago bars back (for diagnostics and custom strategies)"""
+        values = evaluator.evaluate(self.current)
+        if np.ndim(values) == 0:
+            return np.full(len(evaluator.data), values)
+        return lagged(values, self.lag) if self.lag else values
+
+
+class Comparison:
+    """Signal detector strategy applied to two operands (PackedSignal)"""
+
+    def __init__(self, strategy, operand1, operand2):
+        self.strategy = strategy
+        self.operands = (operand1, operand2)
+        self.cost = operand1.cost + operand2.cost
+        self.key = ('COMPARE', strategy, operand1.key, operand2.key)
+        self.label = f'{strategy}({operand1.label}, {operand2.label})'
+
+    def compute(self, evaluator):
+        strategy_func = evaluator.strategies.get(self.strategy)
+        if strategy_func is None:
+            raise ValueError(f"Unknown strategy: {self.strategy}")
+        operand1, operand2 = self.operands
+        if strategy_func in ARRAY_COMPARISONS:
+            return PackedSignal.pack(compare_lagged(strategy_func, len(evaluator.data),
+                                                    evaluator.evaluate(operand1.current), operand1.lag,
+                                                    evaluator.evaluate(operand2.current), operand2.lag))
+        # Custom registered strategy: it reads two columns of a frame
+        frame = pd.DataFrame({'comp1': operand1.column(evaluator), 'comp2': operand2.column(evaluator)},
+                             index=evaluator.data.index)
+        if self.strategy == "WITHIN RANGE":
+            signal = strategy_func(frame, 'comp1', 'comp2', tolerance=0.01)
+        else:
+            signal = strategy_func(frame, 'comp1', 'comp2')
+        return PackedSignal.pack(np.asarray(signal, dtype=bool))
+
+
+class Not:
+    """Negation of one expression"""
+
+    def __init__(self, child):
+        self.child = child
+        self.cost = child.cost
+        self.key = ('NOT', child.key)
+        self.label = f'NOT {child.label}'
+
+    def compute(self, evaluator):
+        return ~evaluator.evaluate(self.child)
+
+
+class And:
+    """Every child is True; stops once the mask is all False"""
+
+    operator = 'AND'
+
+    def __init__(self, children):
+        self.children = children
+        self.cost = sum(child.cost for child in children)
+        self.key = (self.operator,) + tuple(child.key for child in children)
+        self.label = '(' + f' {self.operator} '.join(child.label for child in children) + ')'
+
+    def settled(self, mask):
+        return not mask.any()
+
+    def combine(self, mask, other):
+        return mask & other
+
+    def compute(self, evaluator):
+        mask = evaluator.evaluate(self.children[0])
+        for child in self.children[1:]:
+            if self.settled(mask):
+                evaluator.short_circuits += 1
+                break
+            mask = self.combine(mask, evaluator.evaluate(child))
+        return mask
+
+
+class Or(And):
+    """Any child is True; stops once the mask is all True"""
+
+    operator = 'OR'
+
+    def settled(self, mask):
+        return mask.all()
+
+    def combine(self, mask, other):
+        return mask | other
+
+
+def combine_expressions(node_type, children):
+    """And / Or of children: nested nodes of the same type flattened, duplicates dropped, cheapest first"""
+    flat = []
+    for child in children:
+        flat.extend(child.children if type(child) is node_type else [child])
+    unique = list({child.key: child for child in flat}.values())
+    if not unique:
+        raise ValueError(f"{node_type.operator} needs at least one condition")
+    if len(unique) == 1:
+        return unique[0]
+    return node_type(sorted(unique, key=lambda child: child.cost))
+
+
+def all_of(*children):
+    """Expression true where every child is true"""
+    return combine_expressions(And, children)
+
+
+def any_of(*children):
+    """Expression true where any child is true"""
+    return combine_expressions(Or, children)
+
+
+def expression_comparisons(node):
+    """Comparison nodes of an expression, left to right"""
+    if isinstance(node, Comparison):
+        return [node]
+    children = [node.child] if isinstance(node, Not) else node.children
+    return [comparison for child in children for comparison in expression_comparisons(child)]
+
+
+def compile_conditions(conditions, logic_type='AND'):
+    """Expression for MultiConditionDetector condition dicts joined with 'AND' or 'OR' logic"""
+    if logic_type not in ['AND', 'OR']:
+        raise ValueError("Logic type must be 'AND' or 'OR'")
+    comparisons = [
+        Comparison(condition['strategy'],
+                   Operand(condition['comp1_type'], condition['comp1_name'], condition['comp1_params'],
+                           condition.get('comp1_candles_ago', 0)),
+                   Operand(condition['comp2_type'], condition['comp2_name'], condition['comp2_params'],
+                           condition.get('comp2_candles_ago', 0)))
+        for condition in conditions
+    ]
+    return all_of(*comparisons) if logic_type == 'AND' else any_of(*comparisons)
+
+
+# =============================================================================
+# EVALUATION
+# =============================================================================
+
+class ExpressionEvaluator:
+    """Evaluates expressions on one frame, computing each distinct subexpression once"""
+
+    def __init__(self, data, strategies=None):
+        self.data = data
+        self.strategies = COMPARISON_STRATEGIES if strategies is None else strategies
+        self.values = {}
+        self.hits = 0
+        self.short_circuits = 0
+        self.data_fingerprint = None
+
+    def fingerprint(self):
+        """indicator_cache fingerprint of the frame, taken once for all indicator operands"""
+        if self.data_fingerprint is None and indicator_cache.enabled:
+            self.data_fingerprint = data_fingerprint(self.data)
+        return self.data_fingerprint
+
+    def evaluate(self, node):
+        """Value of a node (unshifted values for operands, PackedSignal for conditions)"""
+        values = self.values.get(node.key)
+        if values is not None:
+            self.hits += 1
+            return values
+        values = node.compute(self)
+        self.values[node.key] = values
+        return values
+
+    def stats(self):
+        """Subexpressions computed, reuses and short-circuited And / Or nodes"""
+        return {'computed': len(self.values), 'reused': self.hits, 'short_circuits': self.short_circuits}
+
+
+# =============================================================================
+# TEXT RULES
+# =============================================================================
+
+"""GRAMMAR (KEYWORDS AND PRICE COLUMNS ARE CASE-INSENSITIVE, NOT BINDS TIGHTER THAN AND, AND THAN OR):
+    expression := term (OR term)*            term := factor (AND factor)*
+    factor     := NOT factor | ( expression ) | strategy(operand[, operand]) | operand op operand
+    operand    := NAME(number, ...)[n] | Open/High/Low/Close/Volume[n] | number
+    op         := > | >= | < | <= | ==
+WHERE strategy IS A DETECTOR STRATEGY WRITTEN WITH UNDERSCORES (crossed_up, increased, ...), [n] IS candles_ago
+AND == IS THE EQUAL STRATEGY (WITHIN 0.01)"""
+
+TOKEN_PATTERN = re.compile(r"\s*(?:(?P<number>-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)|(?P<name>[A-Za-z_]\w*)"
+                           r"|(?P<symbol>>=|<=|==|[<>(),\[\]]))")
+
+OPERATOR_STRATEGIES = {
+    '>': "GREATER THAN", '>=': "GREATER OR EQUAL", '<': "LESS THAN", '<=': "LESS OR EQUAL", '==': "EQUAL"
+}
+
+PRICE_COLUMNS = {'OPEN': 'Open', 'HIGH': 'High', 'LOW': 'Low', 'CLOSE': 'Close', 'VOLUME': 'Volume'}
+
+
+def tokenize(text):
+    """(kind, text) tokens of a rule"""
+    tokens, position = [], 0
+    text = text.rstrip()
+    while position < len(text):
+        match = TOKEN_PATTERN.match(text, position)
+        if match is None:
+            raise ValueError(f"Unexpected character in rule at position {position}: {text[position:position + 10]!r}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return tokens
+
+
+class ExpressionParser:
+    """Recursive-descent parser for text rules"""
+
+    def __init__(self, text, strategies=None):
+        self.tokens = tokenize(text)
+        self.position = 0
+        self.strategies = COMPARISON_STRATEGIES if strategies is None else strategies
+
+    def peek(self, offset=0):
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def take(self, expected=None):
+        kind, text = self.peek()
+        if kind is None or (expected is not None and text != expected):
+            raise ValueError(f"Expected {expected or 'a token'} in rule, found {text!r}")
+        self.position += 1
+        return kind, text
+
+    def keyword(self, word):
+        kind, text = self.peek()
+        if kind == 'name' and text.upper() == word:
+            self.position += 1
+            return True
+        return False
+
+    def parse(self):
+        expression = self.expression()
+        if self.peek()[0] is not None:
+            raise ValueError(f"Unexpected {self.peek()[1]!r} in rule")
+        return expression
+
+    def expression(self):
+        terms = [self.term()]
+        while self.keyword('OR'):
+            terms.append(self.term())
+        return any_of(*terms)
+
+    def term(self):
+        factors = [self.factor()]
+        while self.keyword('AND'):
+            factors.append(self.factor())
+        return all_of(*factors)
+
+    def factor(self):
+        if self.keyword('NOT'):
+            return Not(self.factor())
+        kind, text = self.peek()
+        if text == '(':
+            self.take('(')
+            expression = self.expression()
+            self.take(')')
+            return expression
+        strategy = text.upper().replace('_', ' ') if kind == 'name' else None
+        if strategy in self.strategies and self.peek(1)[1] == '(':
+            self.take()
+            self.take('(')
+            operand1 = self.operand()
+            # INCREASED / DECREASED read only the first operand
+            operand2 = operand1
+            if self.peek()[1] == ',':
+                self.take(',')
+                operand2 = self.operand()
+            self.take(')')
+            return Comparison(strategy, operand1, operand2)
+        operand1 = self.operand()
+        _, symbol = self.take()
+        if symbol not in OPERATOR_STRATEGIES:
+            raise ValueError(f"Expected a comparison operator in rule, found {symbol!r}")
+        return Comparison(OPERATOR_STRATEGIES[symbol], operand1, self.operand())
+
+    def number(self):
+        _, text = self.take()
+        try:
+            return int(text) if re.fullmatch(r'-?\d+', text) else float(text)
+        except ValueError:
+            raise ValueError(f"Expected a number in rule, found {text!r}") from None
+
+    def candles_ago(self):
+        if self.peek()[1] != '[':
+            return 0
+        self.take('[')
+        candles_ago = self.number()
+        self.take(']')
+        if not isinstance(candles_ago, int) or candles_ago < 0:
+            raise ValueError(f"candles ago must be a non-negative integer, got {candles_ago}")
+        return candles_ago
+
+    def operand(self):
+        kind, text = self.peek()
+        if kind == 'number':
+            return Operand(ComparisonType.CONSTANT, 'CONSTANT', (self.number(),))
+        if kind != 'name':
+            raise ValueError(f"Expected an indicator, price column or number in rule, found {text!r}")
+        self.take()
+        if self.peek()[1] == '(':
+            self.take('(')
+            params = []
+            while self.peek()[1] != ')':
+                params.append(self.number())
+                if self.peek()[1] == ',':
+                    self.take(',')
+            self.take(')')
+            return Operand(ComparisonType.INDICATOR, text, complete_params(text, params), self.candles_ago())
+        if text.upper() in PRICE_COLUMNS:
+            return Operand(ComparisonType.PRICE, PRICE_COLUMNS[text.upper()], (PRICE_COLUMNS[text.upper()],),
+                           self.candles_ago())
+        raise ValueError(f"Unknown operand {text!r}: use NAME(params), a price column or a number")
+
+
+def parse_expression(text, strategies=None):
+    """Expression for a text rule such as 'crossed_up(EMA(12), EMA(26)) AND RSI(14) < 70'
+
+    Omitted trailing indicator parameters take the indicator's defaults: RSI(14) is RSI(14, 70, 30)"""
+    return ExpressionParser(text, strategies).parse()
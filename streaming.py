@@ -0,0 +1,730 @@
+"""
+Streaming Module
+Incremental indicators: update(bar) -> value in O(1) per bar, with a serializable state,
+reproducing the batch compute_values output of the library classes bar by bar,
+and a bar-by-bar strategy runner built on them
+"""
+
+import abc
+import math
+from collections import deque
+
+import numpy as np
+
+from comparision_types import ComparisonType
+from engine import POSITION_LABELS, ACTION_LABELS, TRACKING_COLUMNS, ReasonCodes, step_bar
+
+
+"""THE LIBRARY CLASSES ONLY WORK ON A WHOLE FRAME, SO ONE MORE BAR MEANS RECOMPUTING THE WHOLE HISTORY. A
+STREAMING INDICATOR KEEPS JUST WHAT THE NEXT BAR NEEDS (THE LAST VALUE OF A RECURSION, A RING BUFFER OF THE
+WINDOW AND ITS RUNNING SUMS) AND update(bar) RETURNS THE VALUE FOR THAT BAR. A BAR IS ANY MAPPING WITH
+Open / High / Low / Close / Volume KEYS (A dict, A DataFrame ROW). RUNNING SUMS ARE RECOMPUTED FROM THE
+BUFFER ONCE EVERY `period` BARS, WHICH KEEPS THE UPDATE AMORTIZED O(1) AND STOPS ROUNDING FROM ACCUMULATING
+OVER A LONG STREAM. indicator.state IS A TREE OF PLAIN dicts / lists / NUMBERS (json.dumps ROUND-TRIPS IT)
+AND restore_indicator(state) CONTINUES THE STREAM FROM IT. EACH CLASS MIRRORS THE ARITHMETIC OF ITS
+LIBRARY CLASS, SO THE STREAM MATCHES compute_values TO FLOATING-POINT TOLERANCE (RECURSIONS BIT FOR BIT)"""
+
+# Stateful classes by name, for restore_indicator
+STATE_CLASSES = {}
+
+
+def encode_state(value):
+    """Plain-data form of a state field"""
+    if isinstance(value, Stateful):
+        return value.state
+    if isinstance(value, deque):
+        return {'deque': [encode_state(item) for item in value], 'maxlen': value.maxlen}
+    if isinstance(value, (list, tuple)):
+        return [encode_state(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def decode_state(value):
+    """Inverse of encode_state"""
+    if isinstance(value, dict):
+        if 'type' in value:
+            return restore_indicator(value)
+        return deque((decode_state(item) for item in value['deque']), maxlen=value['maxlen'])
+    if isinstance(value, list):
+        return [decode_state(item) for item in value]
+    return value
+
+
+def restore_indicator(state):
+    """Rebuild a streaming indicator (or helper) from its state"""
+    cls = STATE_CLASSES.get(state.get('type'))
+    if cls is None:
+        raise ValueError(f"Unknown streaming state type: {state.get('type')}")
+    instance = cls.__new__(cls)
+    instance.__dict__.update({name: decode_state(value) for name, value in state['fields'].items()})
+    return instance
+
+
+class Stateful:
+    """Base class whose instance fields make up a serializable state"""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        STATE_CLASSES[cls.__name__] = cls
+
+    @property
+    def state(self):
+        """Plain-data snapshot of every field"""
+        return {'type': type(self).__name__, 'fields': {name: encode_state(value) for name, value in vars(self).items()}}
+
+
+# =============================================================================
+# ROLLING WINDOW HELPERS
+# =============================================================================
+
+class RollingWindow(Stateful):
+    """Trailing window with a NaN-skipping running sum, like pandas rolling(period, min_periods)"""
+
+    def __init__(self, period, min_periods=None):
+        self.period = period
+        self.min_periods = period if min_periods is None else min_periods
+        self.values = deque(maxlen=period)
+        self.total = 0.0
+        self.count = 0
+        self.since_anchor = 0
+
+    def push(self, value):
+        """Add the newest value, dropping the oldest once the window is full"""
+        if len(self.values) == self.period:
+            oldest = self.values[0]
+            if not math.isnan(oldest):
+                self.total -= oldest
+                self.count -= 1
+        self.values.append(value)
+        if not math.isnan(value):
+            self.total += value
+            self.count += 1
+        self.since_anchor += 1
+        if self.since_anchor >= self.period:
+            self.total = math.fsum(item for item in self.values if not math.isnan(item))
+            self.since_anchor = 0
+
+    def sum(self):
+        """Sum of the non-NaN values, NaN below min_periods"""
+        return self.total if self.count >= max(self.min_periods, 1) else math.nan
+
+    def mean(self):
+        """Mean of the non-NaN values, NaN below min_periods"""
+        return self.total / self.count if self.count >= max(self.min_periods, 1) else math.nan
+
+
+class RollingVariance(RollingWindow):
+    """Trailing window with a running Welford mean / M2 for the sample standard deviation"""
+
+    def __init__(self, period, min_periods=None):
+        super().__init__(period, min_periods)
+        self.average = 0.0
+        self.m2 = 0.0
+
+    def push(self, value):
+        """Add the newest value, dropping the oldest once the window is full"""
+        if len(self.values) == self.period:
+            oldest = self.values[0]
+            if not math.isnan(oldest):
+                self.count -= 1
+                if self.count == 0:
+                    self.average, self.m2 = 0.0, 0.0
+                else:
+                    delta = oldest - self.average
+                    self.average -= delta / self.count
+                    self.m2 -= delta * (oldest - self.average)
+        self.values.append(value)
+        if not math.isnan(value):
+            self.count += 1
+            delta = value - self.average
+            self.average += delta / self.count
+            self.m2 += delta * (value - self.average)
+        self.since_anchor += 1
+        if self.since_anchor >= self.period:
+            present = [item for item in self.values if not math.isnan(item)]
+            self.average = math.fsum(present) / len(present) if present else 0.0
+            self.m2 = math.fsum((item - self.average) ** 2 for item in present)
+            self.since_anchor = 0
+
+    def mean(self):
+        """Mean of the non-NaN values, NaN below min_periods"""
+        return self.average if self.count >= max(self.min_periods, 1) else math.nan
+
+    def std(self):
+        """Sample standard deviation (ddof=1), NaN below min_periods or with a single value"""
+        if self.count < max(self.min_periods, 2):
+            return math.nan
+        return math.sqrt(max(self.m2, 0.0) / (self.count - 1))
+
+
+class RollingExtreme(Stateful):
+    """Trailing max (or min) over up to period bars with a monotonic deque, ignoring NaN"""
+
+    def __init__(self, period, highest=True):
+        self.period = period
+        self.highest = highest
+        self.position = -1
+        self.candidates = deque()  # [position, value], values decreasing (increasing for a min)
+
+    def push(self, value):
+        """Add the newest value and return the extreme of the window"""
+        self.position += 1
+        while self.candidates and self.candidates[0][0] <= self.position - self.period:
+            self.candidates.popleft()
+        if not math.isnan(value):
+            while self.candidates and (self.candidates[-1][1] <= value if self.highest else self.candidates[-1][1] >= value):
+                self.candidates.pop()
+            self.candidates.append([self.position, value])
+        return self.candidates[0][1] if self.candidates else math.nan
+
+
+def divide(numerator, denominator):
+    """numerator / denominator like pandas: +-inf for x / 0, NaN for 0 / 0"""
+    if denominator == 0:
+        if numerator == 0 or math.isnan(numerator):
+            return math.nan
+        return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+    return numerator / denominator
+
+
+def true_range(high, low, prev_close, skipna=True):
+    """max(High - Low, |High - prev Close|, |Low - prev Close|); skipna=False is NaN when prev Close is"""
+    high_low = high - low
+    high_close = abs(high - prev_close)
+    low_close = abs(low - prev_close)
+    if skipna:
+        return max((item for item in (high_low, high_close, low_close) if not math.isnan(item)), default=math.nan)
+    if math.isnan(prev_close) or math.isnan(high_low):
+        return math.nan
+    return max(high_low, high_close, low_close)
+
+
+# =============================================================================
+# STREAMING INDICATORS
+# =============================================================================
+
+class StreamingIndicator(Stateful, abc.ABC):
+    """Base class: update(bar) returns the indicator value for that bar"""
+
+    @abc.abstractmethod
+    def update(self, bar):
+        """Add one bar and return the indicator value for it"""
+
+    def run(self, df):
+        """Feed every row of df in order and return the values"""
+        return [self.update(bar) for bar in df.to_dict('records')]
+
+
+class StreamingSMA(StreamingIndicator):
+    """Simple moving average of Close (indicators.sma)"""
+
+    def __init__(self, period=20):
+        self.window = RollingWindow(period)
+
+    def update(self, bar):
+        self.window.push(bar['Close'])
+        return self.window.mean()
+
+
+class StreamingEMA(StreamingIndicator):
+    """EMA seeded with the first Close (ExponentialMovingAverageStrategies)"""
+
+    def __init__(self, period=20):
+        self.multiplier = 2 / (period + 1)
+        self.ema = None
+
+    def update(self, bar):
+        close = bar['Close']
+        self.ema = close if self.ema is None else close * self.multiplier + self.ema * (1 - self.multiplier)
+        return self.ema
+
+
+class StreamingEWMA(StreamingIndicator):
+    """pandas ewm(span=period).mean() of Close, the EMA behind calculate_indicator("EMA")"""
+
+    def __init__(self, period=20):
+        self.decay = 1 - 2 / (period + 1)
+        self.weighted = math.nan
+        self.old_weight = 1.0
+        self.started = False
+
+    def update(self, bar):
+        close = bar['Close']
+        # Same steps as the pandas adjust=True recursion (ignore_na=False), so the values are bit for bit
+        if not self.started:
+            self.weighted, self.started = close, True
+        elif not math.isnan(self.weighted):
+            self.old_weight *= self.decay
+            if not math.isnan(close):
+                if self.weighted != close:
+                    self.weighted = (self.old_weight * self.weighted + close) / (self.old_weight + 1.0)
+                self.old_weight += 1.0
+        elif not math.isnan(close):
+            self.weighted = close
+        return self.weighted
+
+
+class StreamingRSI(StreamingIndicator):
+    """RSI from simple-average gains / losses (RelativeStrengthIndexStrategies)"""
+
+    def __init__(self, period=14):
+        self.gains = RollingWindow(period, 1)
+        self.losses = RollingWindow(period, 1)
+        self.prev_close = math.nan
+
+    def update(self, bar):
+        delta = bar['Close'] - self.prev_close
+        self.prev_close = bar['Close']
+        self.gains.push(max(delta, 0.0) if not math.isnan(delta) else math.nan)
+        self.losses.push(-min(delta, 0.0) if not math.isnan(delta) else math.nan)
+        avg_loss = self.losses.mean()
+        rs = self.gains.mean() / (1e-10 if avg_loss == 0 else avg_loss)
+        return 100 - (100 / (1 + rs))
+
+
+class StreamingSimpleRSI(StreamingIndicator):
+    """RSI over full windows of simple-average gains / losses, the RSI behind calculate_indicator("RSI")"""
+
+    def __init__(self, period=14):
+        self.gains = RollingWindow(period)
+        self.losses = RollingWindow(period)
+        self.prev_close = math.nan
+
+    def update(self, bar):
+        delta = bar['Close'] - self.prev_close
+        self.prev_close = bar['Close']
+        # where(delta > 0, 0) also turns the first (NaN) delta into 0
+        self.gains.push(delta if delta > 0 else 0.0)
+        self.losses.push(-delta if delta < 0 else 0.0)
+        return 100 - (100 / (1 + divide(self.gains.mean(), self.losses.mean())))
+
+
+class StreamingWMA(StreamingIndicator):
+    """Linearly weighted moving average with the library warm-up (WeightedMovingAverageStrategies)"""
+
+    def __init__(self, period=14):
+        self.period = period
+        self.weight_sum = period * (period + 1) / 2
+        self.values = deque(maxlen=period)
+        self.window_sum = 0.0
+        self.weighted_sum = 0.0
+        self.missing = 0
+        self.since_anchor = 0
+
+    def update(self, bar):
+        close = bar['Close']
+        value = 0.0 if math.isnan(close) else close
+        if len(self.values) == self.period:
+            # Every weight drops by one (the oldest to zero), the newest bar enters with weight period
+            oldest = self.values[0]
+            self.weighted_sum += self.period * value - self.window_sum
+            self.window_sum -= 0.0 if math.isnan(oldest) else oldest
+            self.missing -= math.isnan(oldest)
+        else:
+            self.weighted_sum += (len(self.values) + 1) * value
+        self.values.append(close)
+        self.window_sum += value
+        self.missing += math.isnan(close)
+        self.since_anchor += 1
+        if self.since_anchor >= self.period:
+            present = [0.0 if math.isnan(item) else item for item in self.values]
+            self.window_sum = math.fsum(present)
+            self.weighted_sum = math.fsum(weight * item for weight, item in enumerate(present, 1))
+            self.since_anchor = 0
+        # During the warm-up the window is every bar so far, like the batch cumulative sum
+        if self.missing:
+            return math.nan
+        return self.weighted_sum / self.weight_sum
+
+
+class StreamingOBV(StreamingIndicator):
+    """On-balance volume starting at 0 (OnBalanceVolumeStrategies)"""
+
+    def __init__(self):
+        self.obv = 0
+        self.prev_close = None
+
+    def update(self, bar):
+        close = bar['Close']
+        if self.prev_close is not None:
+            if close > self.prev_close:
+                self.obv += bar['Volume']
+            elif close < self.prev_close:
+                self.obv -= bar['Volume']
+        self.prev_close = close
+        return self.obv
+
+
+class StreamingVWAP(StreamingIndicator):
+    """Cumulative typical-price VWAP (VolumeWeightedAveragePriceStrategies)"""
+
+    def __init__(self):
+        self.price_volume = 0.0
+        self.volume = 0.0
+
+    def update(self, bar):
+        price_volume = (bar['High'] + bar['Low'] + bar['Close']) / 3 * bar['Volume']
+        if not math.isnan(price_volume):
+            self.price_volume += price_volume
+        if not math.isnan(bar['Volume']):
+            self.volume += bar['Volume']
+        if math.isnan(price_volume) or math.isnan(bar['Volume']):
+            return math.nan
+        return self.price_volume / (1 if self.volume == 0 else self.volume)
+
+
+class StreamingATR(StreamingIndicator):
+    """Simple-average true range over full windows (AverageTrueRangeStrategies)"""
+
+    def __init__(self, period=14):
+        self.window = RollingWindow(period)
+        self.prev_close = math.nan
+
+    def update(self, bar):
+        self.window.push(true_range(bar['High'], bar['Low'], self.prev_close, skipna=False))
+        self.prev_close = bar['Close']
+        return self.window.mean()
+
+
+class StreamingBollingerBands(StreamingIndicator):
+    """Bollinger middle / upper / lower bands and %B (BollingerBandsStrategies)"""
+
+    def __init__(self, period=20, multiplier=2):
+        self.multiplier = multiplier
+        self.window = RollingVariance(period)
+
+    def update(self, bar):
+        close = bar['Close']
+        self.window.push(close)
+        middle, std = self.window.mean(), self.window.std()
+        upper = middle + self.multiplier * std
+        lower = middle - self.multiplier * std
+        return {'Middle': middle, 'Upper': upper, 'Lower': lower, 'PercentB': divide(close - lower, upper - lower)}
+
+
+class StreamingMACD(StreamingIndicator):
+    """MACD line, signal and histogram from first-value-seeded EMAs (MACDStrategies)"""
+
+    def __init__(self, short_period=12, long_period=26, signal_period=9):
+        self.multipliers = [2 / (short_period + 1), 2 / (long_period + 1), 2 / (signal_period + 1)]
+        self.short_ema = None
+        self.long_ema = None
+        self.signal = None
+
+    def update(self, bar):
+        close = bar['Close']
+        short_multiplier, long_multiplier, signal_multiplier = self.multipliers
+        if self.short_ema is None:
+            self.short_ema, self.long_ema = close, close
+        else:
+            self.short_ema = (close - self.short_ema) * short_multiplier + self.short_ema
+            self.long_ema = (close - self.long_ema) * long_multiplier + self.long_ema
+        macd = self.short_ema - self.long_ema
+        self.signal = macd if self.signal is None else (macd - self.signal) * signal_multiplier + self.signal
+        return {'MACD': macd, 'Signal': self.signal, 'Histogram': macd - self.signal}
+
+
+class StreamingStochastic(StreamingIndicator):
+    """Stochastic %K over up to period bars, 0 for a flat range (StochasticStrategies)"""
+
+    def __init__(self, period=14):
+        self.lowest = RollingExtreme(period, highest=False)
+        self.highest = RollingExtreme(period, highest=True)
+
+    def update(self, bar):
+        lowest_low = self.lowest.push(bar['Low'])
+        highest_high = self.highest.push(bar['High'])
+        price_range = highest_high - lowest_low
+        if price_range == 0 or math.isnan(price_range):
+            return 0.0
+        stoch = 100 * (bar['Close'] - lowest_low) / price_range
+        return 0.0 if math.isnan(stoch) else stoch
+
+
+class StreamingADX(StreamingIndicator):
+    """ADX with +DI / -DI from rolling sums over up to period bars (AverageDirectionalIndexStrategies)"""
+
+    def __init__(self, period=14):
+        self.true_ranges = RollingWindow(period, 1)
+        self.plus_moves = RollingWindow(period, 1)
+        self.minus_moves = RollingWindow(period, 1)
+        self.directional_index = RollingWindow(period, 1)
+        self.prev_bar = None
+
+    def update(self, bar):
+        high, low = bar['High'], bar['Low']
+        prev_high, prev_low, prev_close = self.prev_bar if self.prev_bar is not None else (math.nan,) * 3
+        self.prev_bar = [high, low, bar['Close']]
+        plus_move = high - prev_high
+        minus_move = prev_low - low
+        plus_move = plus_move if plus_move > minus_move and plus_move > 0 else 0.0
+        # Compared against the already-filtered +DM, exactly like the batch code
+        minus_move = minus_move if minus_move > plus_move and minus_move > 0 else 0.0
+        self.true_ranges.push(true_range(high, low, prev_close))
+        self.plus_moves.push(plus_move)
+        self.minus_moves.push(minus_move)
+        tr_sum = self.true_ranges.sum()
+        di_plus = divide(100 * self.plus_moves.sum(), tr_sum)
+        di_minus = divide(100 * self.minus_moves.sum(), tr_sum)
+        di_total = di_plus + di_minus
+        dx = 100 * (abs(di_plus - di_minus) / di_total) if di_total != 0 else math.nan
+        self.directional_index.push(0.0 if math.isnan(dx) else dx)
+        return {'ADX': self.directional_index.mean(), 'DI+': di_plus, 'DI-': di_minus}
+
+
+class StreamingSupertrend(StreamingIndicator):
+    """Supertrend line and trend direction (SupertrendStrategies)"""
+
+    def __init__(self, period=10, multiplier=3.0):
+        self.multiplier = multiplier
+        self.true_ranges = RollingWindow(period, 1)
+        self.prev_close = math.nan
+        self.final_upper = None
+        self.final_lower = None
+        self.supertrend = None
+        self.trend = 1
+
+    def update(self, bar):
+        high, low, close = bar['High'], bar['Low'], bar['Close']
+        self.true_ranges.push(true_range(high, low, self.prev_close))
+        atr = self.true_ranges.mean()
+        median = (high + low) / 2
+        basic_upper = median + self.multiplier * atr
+        basic_lower = median - self.multiplier * atr
+        if self.final_upper is None:
+            self.final_upper, self.final_lower = basic_upper, basic_lower
+        else:
+            if basic_upper < self.final_upper or self.prev_close > self.final_upper:
+                self.final_upper = basic_upper
+            if basic_lower > self.final_lower or self.prev_close < self.final_lower:
+                self.final_lower = basic_lower
+            if close <= self.final_upper:
+                self.supertrend, self.trend = self.final_upper, -1
+            elif close >= self.final_lower:
+                self.supertrend, self.trend = self.final_lower, 1
+        self.prev_close = close
+        return {'Supertrend': math.nan if self.supertrend is None else self.supertrend, 'Trend': self.trend}
+
+
+class StreamingParabolicSAR(StreamingIndicator):
+    """Parabolic SAR (ParabolicStopAndReverseStrategies); NaN on the first bar, whose batch value looks one bar ahead"""
+
+    def __init__(self, initial_af=0.02, max_af=0.2):
+        self.initial_af = initial_af
+        self.max_af = max_af
+        self.history = []  # [High, Low, Close] of the last two bars
+        self.trend = None
+        self.psar = None
+        self.ep = None
+        self.af = initial_af
+
+    def update(self, bar):
+        high, low, close = bar['High'], bar['Low'], bar['Close']
+        if len(self.history) == 0:
+            self.history.append([high, low, close])
+            return math.nan
+        if self.trend is None:
+            first_high, first_low, first_close = self.history[0]
+            self.trend = 'up' if close > first_close else 'down'
+            if self.trend == 'up':
+                self.psar, self.ep = first_low, max(first_high, high)
+            else:
+                self.psar, self.ep = first_high, min(first_low, low)
+            self.history.append([high, low, close])
+            return self.psar
+        (high_2, low_2, _), (high_1, low_1, _) = self.history
+        prev_psar = self.psar
+        if self.trend == 'up':
+            self.psar = min(prev_psar + self.af * (self.ep - prev_psar), low_1, low_2)
+            if high > self.ep:
+                self.ep = high
+                self.af = min(self.af + self.initial_af, self.max_af)
+            if low < self.psar:
+                self.trend, self.psar, self.ep, self.af = 'down', self.ep, low, self.initial_af
+        else:
+            self.psar = max(prev_psar - self.af * (prev_psar - self.ep), high_1, high_2)
+            if low < self.ep:
+                self.ep = low
+                self.af = min(self.af + self.initial_af, self.max_af)
+            if high > self.psar:
+                self.trend, self.psar, self.ep, self.af = 'up', self.ep, high, self.initial_af
+        self.history = [self.history[1], [high, low, close]]
+        return self.psar
+
+
+# Streaming indicators by the indicator registry names
+STREAMING_INDICATORS = {
+    "SMA": StreamingSMA,
+    "EMA": StreamingEMA,
+    "RSI": StreamingRSI,
+    "WMA": StreamingWMA,
+    "OBV": StreamingOBV,
+    "VWAP": StreamingVWAP,
+    "ATR": StreamingATR,
+    "BOLLINGER": StreamingBollingerBands,
+    "MACD": StreamingMACD,
+    "STOCHASTIC": StreamingStochastic,
+    "ADX": StreamingADX,
+    "SUPERTREND": StreamingSupertrend,
+    "PSAR": StreamingParabolicSAR
+}
+
+
+def create_streaming_indicator(name, **params):
+    """Streaming indicator by name"""
+    if name not in STREAMING_INDICATORS:
+        raise ValueError(f"Unknown streaming indicator: {name}. Use one of {tuple(STREAMING_INDICATORS)}")
+    return STREAMING_INDICATORS[name](**params)
+
+
+# =============================================================================
+# STREAMING STRATEGY RUNNER
+# =============================================================================
+
+"""run_trading_strategy BUILDS EVERY COMPARISON COLUMN OVER THE WHOLE HISTORY AND THEN LOOPS, SO A NEW BAR MEANS
+STARTING AGAIN FROM BAR 0. StreamingStrategyRunner TAKES THE SAME strategy_config KEYS (entry_comp1_type ...
+exit_strategy) AND KEEPS, BETWEEN BARS: ONE STREAMING INDICATOR PER COMPARISON OPERAND (WITH THE
+calculate_indicator SEMANTICS OF THE BATCH COLUMNS), A candles_ago DELAY LINE PER OPERAND, THE PREVIOUS BAR'S
+OPERAND VALUES (CROSSED UP / DOWN, INCREASED / DECREASED LOOK ONE BAR BACK) AND THE Portfolio WITH ITS POSITION.
+EACH BAR RUNS engine.step_bar, THE SAME STATE MACHINE AS THE ARRAY ENGINE, SO REPLAYING HISTORY GIVES THE
+BATCH ENGINE'S ROWS AND TRADES. BARS COME FROM ANY ITERATOR OF (date, bar) PAIRS (E.G. df.iterrows()) OR AN
+asyncio.Queue ENDED BY None"""
+
+
+def indicator_period(params):
+    """Period of an indicator operand, read like create_comparison_column"""
+    if isinstance(params, dict):
+        return params.get('period', 20)
+    return params[0]
+
+
+# calculate_indicator name -> (streaming indicator from the operand params, output key for dict values)
+STREAMING_CALCULATIONS = {
+    "SMA": (lambda params: StreamingSMA(indicator_period(params)), None),
+    "EMA": (lambda params: StreamingEWMA(indicator_period(params)), None),
+    "RSI": (lambda params: StreamingSimpleRSI(indicator_period(params)), None),
+    "WMA": (lambda params: StreamingWMA(indicator_period(params)), None),
+    "OBV": (lambda params: StreamingOBV(), None),
+    "VWAP": (lambda params: StreamingVWAP(), None),
+    "ADX": (lambda params: StreamingADX(indicator_period(params)), 'ADX')
+}
+
+# Signal detector strategy -> test on (previous value 1, previous value 2, value 1, value 2)
+STREAMING_COMPARISONS = {
+    "CROSSED UP": lambda prev1, prev2, value1, value2: prev1 < prev2 and value1 > value2,
+    "CROSSED DOWN": lambda prev1, prev2, value1, value2: prev1 > prev2 and value1 < value2,
+    "CROSSED": lambda prev1, prev2, value1, value2: ((prev1 < prev2 and value1 > value2)
+                                                     or (prev1 > prev2 and value1 < value2)),
+    "EQUAL": lambda prev1, prev2, value1, value2: abs(value1 - value2) < 0.01,
+    "GREATER THAN": lambda prev1, prev2, value1, value2: value1 > value2,
+    "GREATER OR EQUAL": lambda prev1, prev2, value1, value2: value1 >= value2,
+    "LESS THAN": lambda prev1, prev2, value1, value2: value1 < value2,
+    "LESS OR EQUAL": lambda prev1, prev2, value1, value2: value1 <= value2,
+    "WITHIN RANGE": lambda prev1, prev2, value1, value2: abs(value1 - value2) <= 0.01,
+    "INCREASED": lambda prev1, prev2, value1, value2: value1 > prev1,
+    "DECREASED": lambda prev1, prev2, value1, value2: value1 < prev1
+}
+
+
+class StreamingOperand:
+    """One side of a comparison (indicator, constant or price column), candles_ago bars back"""
+
+    def __init__(self, comp_type, comp_name, comp_params, candles_ago=0):
+        self.indicator = None
+        self.output = None
+        self.constant = None
+        self.column = None
+        if comp_type == ComparisonType.INDICATOR:
+            if comp_name not in STREAMING_CALCULATIONS:
+                raise ValueError(f"No streaming version of indicator: {comp_name}. "
+                                 f"Use one of {tuple(STREAMING_CALCULATIONS)}")
+            factory, self.output = STREAMING_CALCULATIONS[comp_name]
+            self.indicator = factory(comp_params)
+        elif comp_type == ComparisonType.CONSTANT:
+            if isinstance(comp_params, dict):
+                self.constant = comp_params.get('value', comp_params.get('period', 50))
+            else:
+                self.constant = comp_params[0] if len(comp_params) > 0 else 50
+        elif comp_type == ComparisonType.PRICE:
+            if isinstance(comp_params, dict):
+                self.column = comp_params.get('column', 'Close')
+            else:
+                self.column = comp_params[0] if len(comp_params) > 0 else 'Close'
+        else:
+            raise ValueError(f"Unknown comparison type: {comp_type}")
+        # A constant is never shifted; other operands read the value from candles_ago bars back
+        self.delay = deque(maxlen=candles_ago + 1) if candles_ago and self.constant is None else None
+
+    def update(self, bar):
+        """Operand value for this bar"""
+        if self.constant is not None:
+            return self.constant
+        if self.indicator is not None:
+            value = self.indicator.update(bar)
+            if self.output is not None:
+                value = value[self.output]
+        else:
+            value = bar[self.column]
+        if self.delay is None:
+            return value
+        self.delay.append(value)
+        return self.delay[0] if len(self.delay) == self.delay.maxlen else math.nan
+
+
+class StreamingSignal:
+    """Entry or exit signal of a strategy_config, one bar at a time"""
+
+    def __init__(self, config, side):
+        self.operands = [StreamingOperand(config[f'{side}_{slot}_type'], config[f'{side}_{slot}_name'],
+                                          config[f'{side}_{slot}_params'], config.get(f'{side}_{slot}_candles_ago', 0))
+                         for slot in ('comp1', 'comp2')]
+        strategy = config[f'{side}_strategy']
+        if strategy not in STREAMING_COMPARISONS:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        self.compare = STREAMING_COMPARISONS[strategy]
+        self.previous = (math.nan, math.nan)
+
+    def update(self, bar):
+        """Whether the signal fires on this bar"""
+        value1, value2 = (operand.update(bar) for operand in self.operands)
+        fired = bool(self.compare(*self.previous, value1, value2))
+        self.previous = (value1, value2)
+        return fired
+
+
+class StreamingStrategyRunner:
+    """Bar-by-bar strategy execution keeping indicator, comparison and Portfolio state between bars"""
+
+    def __init__(self, config, portfolio, strategy_direction="Long Only"):
+        self.entry = StreamingSignal(config, 'entry')
+        self.exit = StreamingSignal(config, 'exit')
+        self.portfolio = portfolio
+        self.strategy_direction = strategy_direction
+        self.current_position = 'OUT'
+        self.reasons = ReasonCodes()
+
+    def on_bar(self, date, bar):
+        """Process one new bar and return its tracking row (Entry/Exit signal, Action, Position, values)"""
+        entry = self.entry.update(bar)
+        exit_ = self.exit.update(bar)
+        self.current_position, row = step_bar(self.portfolio, self.current_position, bar['Close'], date,
+                                              entry, exit_, self.strategy_direction, self.reasons)
+        position, action, reason, *values, position_type = row
+        return dict(zip(['Date', 'Entry_Signal', 'Exit_Signal'] + TRACKING_COLUMNS,
+                        [date, entry, exit_, POSITION_LABELS[position], ACTION_LABELS[action], *values,
+                         POSITION_LABELS[position_type], self.reasons.labels[reason]]))
+
+    def run(self, bars):
+        """Process (date, bar) pairs from any iterator, yielding one row per bar"""
+        for date, bar in bars:
+            yield self.on_bar(date, bar)
+
+    async def run_async(self, queue):
+        """Process (date, bar) pairs from an asyncio.Queue until a None item, yielding one row per bar"""
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            yield self.on_bar(*item)
@@ -1,6 +1,130 @@
 import pandas as pd
 import numpy as np
 import math
+import functools
+import threading
+import weakref
+
+from kernels import (
+    ema_filter, exponential_filter, gann_activator, super_smoother_filter, wilder_filter,
+    weighted_window_sums, rolling_max, rolling_min, rolling_std, rolling_linear_regression, rolling_volume_profile,
+    parabolic_sar, stop_and_reverse, supertrend_path, run_lengths
+)
+from primitives import frame_primitives
+
+
+"""SCORES ARE int8 (-1 / 0 / 1). THE _Value / _Explanation COLUMNS ARE ONLY BUILT WHEN signal_value OR
+signal_explanation IS REQUESTED, AND THEN AS A CATEGORICAL OVER THE FIXED THREE-ENTRY MAPPING: ONE int8
+CODE PER BAR PLUS THREE STRINGS PER COLUMN INSTEAD OF ONE PYTHON STRING OBJECT PER BAR"""
+
+
+def signal_labels(scores, mapping):
+    """Categorical labels for a score series from a fixed {score: text} mapping (unmapped scores -> NaN)"""
+    categories = list(dict.fromkeys(mapping.values()))
+    values = np.asarray(scores)
+    codes = np.full(len(values), -1, dtype=np.int8)
+    for score, text in mapping.items():
+        codes[values == score] = categories.index(text)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=categories), index=scores.index)
+
+
+"""THE CLASSES MEMOIZE THEIR INDICATORS ON self (if self.aberration is None: ...), SO ONE INSTANCE RUN ON A SECOND
+FRAME USED TO SERVE THE FIRST FRAME'S VALUES. EVERY run_all_strategies / compute_values / calculate_* METHOD NOW
+CHECKS THE FRAME FIRST: THE INSTANCE'S StrategyMemo HOLDS THE INDEX AND PRICE COLUMNS ITS MEMOS WERE COMPUTED FROM
+(HOLDING THE Series KEEPS THEIR BUFFERS ALIVE, AND UNDER COPY-ON-WRITE AN IN-PLACE EDIT OF THE FRAME MOVES THEM),
+AND ON ANY OTHER FRAME EVERY ATTRIBUTE THAT WAS NOT A SETTING IS DROPPED BEFORE THE METHOD RUNS. A REENTRANT LOCK
+PER INSTANCE SERIALIZES THREADS SHARING IT AND PICKLED OR COPIED INSTANCES CARRY ONLY THEIR SETTINGS, SO A SHARED
+INSTANCE GIVES THE SAME SIGNALS AS A FRESH ONE ON EVERY TICKER, THREAD AND PROCESS"""
+
+PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+
+def buffer_address(series):
+    """Address of the first element of a Series' values"""
+    return series.to_numpy().__array_interface__['data'][0]
+
+
+class StrategyMemo:
+    """Settings of one strategy instance and the frame its memoized attributes were computed from"""
+
+    def __init__(self, state):
+        self.settings = {name for name, value in state.items() if value is not None}
+        self.empty = {name for name, value in state.items() if value is None}
+        self.lock = threading.RLock()
+        self.depth = 0
+        self.df = None
+        self.index = None
+        self.prices = {}
+
+    def matches(self, df):
+        """True if df has the same index object and price buffers as the remembered frame"""
+        if df.index is not self.index or [c for c in PRICE_COLUMNS if c in df.columns] != list(self.prices):
+            return False
+        return all(buffer_address(df[c]) == buffer_address(series) for c, series in self.prices.items())
+
+    def remember(self, df):
+        self.index = df.index
+        self.prices = {c: df[c] for c in PRICE_COLUMNS if c in df.columns}
+
+    def settings_state(self, state):
+        """state without the memoized attributes (None where the constructor set None)"""
+        return {name: (value if name in self.settings else None) for name, value in state.items()
+                if name in self.settings or name in self.empty}
+
+
+# Memo record per strategy instance, created on its first method call
+STRATEGY_MEMOS = weakref.WeakKeyDictionary()
+STRATEGY_MEMOS_LOCK = threading.Lock()
+
+
+def strategy_memo(instance):
+    """StrategyMemo of an instance, taking its current attributes as the settings on first use"""
+    memo = STRATEGY_MEMOS.get(instance)
+    if memo is None:
+        with STRATEGY_MEMOS_LOCK:
+            memo = STRATEGY_MEMOS.get(instance)
+            if memo is None:
+                memo = STRATEGY_MEMOS[instance] = StrategyMemo(vars(instance))
+    return memo
+
+
+def memo_free_state(instance):
+    """Attributes of a strategy instance without its memoized values (what it was constructed with)"""
+    memo = STRATEGY_MEMOS.get(instance)
+    return dict(vars(instance)) if memo is None else memo.settings_state(vars(instance))
+
+
+def frame_bound(method):
+    """Run a strategy method with the instance's memos dropped first when df is not the frame they belong to"""
+    @functools.wraps(method)
+    def bound(self, df, *args, **kwargs):
+        memo = strategy_memo(self)
+        with memo.lock:
+            if not (memo.depth and df is memo.df) and not memo.matches(df):
+                state = vars(self)
+                kept = memo.settings_state(state)
+                state.clear()
+                state.update(kept)
+                memo.remember(df)
+            outer = memo.df
+            memo.depth += 1
+            memo.df = df
+            try:
+                return method(self, df, *args, **kwargs)
+            finally:
+                memo.depth -= 1
+                memo.df = outer
+    return bound
+
+
+def bind_to_frames(cls):
+    """Wrap the frame-reading methods of a strategy class with frame_bound; pickles and copies drop the memos"""
+    for name, method in list(vars(cls).items()):
+        if callable(method) and (name in ('run_all_strategies', 'compute_values') or name.startswith('calculate_')):
+            setattr(cls, name, frame_bound(method))
+    cls.__getstate__ = memo_free_state
+    return cls
+
 
 class AberrationStrategies:
     def __init__(self, period=20, baseline=0, upper_threshold=2, lower_threshold=-2):
@@ -22,7 +146,7 @@ class AberrationStrategies:
         cond_bull = (aberration_prev <= self.baseline) & (self.aberration > self.baseline)
         cond_bear = (aberration_prev >= self.baseline) & (self.aberration < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Aberration_Above_Baseline', -1: 'Aberration_Below_Baseline', 0: 'Aberration_Neutral'}
@@ -31,11 +155,11 @@ class AberrationStrategies:
             -1: f'Aberration crossed below the baseline of {self.baseline}, indicating bearish momentum.',
             0: f'Aberration remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Aberration_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -63,7 +187,7 @@ class AberrationStrategies:
         cond_bull = self.aberration < self.lower_threshold
         cond_bear = self.aberration > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Aberration_Oversold', -1: 'Aberration_Overbought', 0: 'Aberration_Neutral'}
@@ -72,11 +196,11 @@ class AberrationStrategies:
             -1: f'Aberration is above the upper threshold of {self.upper_threshold}, indicating overbought conditions and a potential bearish reversal.',
             0: 'Aberration is within normal limits, suggesting balanced market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Aberration_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -103,7 +227,7 @@ class AberrationStrategies:
             self.aberration = self.compute_values(df)
         diff = self.aberration.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Aberration_Rising', -1: 'Aberration_Falling', 0: 'Aberration_Unchanged'}
@@ -112,11 +236,11 @@ class AberrationStrategies:
             -1: 'Aberration is falling, suggesting strengthening bearish momentum.',
             0: 'Aberration remains unchanged, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Aberration_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -156,9 +280,13 @@ class AbsolutePriceOscillatorStrategies:
         self.lower_threshold = lower_threshold
         self.apo = None
 
+    def required_primitives(self):
+        return [('EMA', 'Close', self.short_period), ('EMA', 'Close', self.long_period)]
+
     def compute_values(self, df):
-        ema_short = df['Close'].ewm(span=self.short_period, adjust=False).mean()
-        ema_long = df['Close'].ewm(span=self.long_period, adjust=False).mean()
+        primitives = frame_primitives(self, df)
+        ema_short = primitives.get(('EMA', 'Close', self.short_period))
+        ema_long = primitives.get(('EMA', 'Close', self.long_period))
         apo = ema_short - ema_long
         return pd.Series(apo, index=df.index)
 
@@ -169,7 +297,7 @@ class AbsolutePriceOscillatorStrategies:
         cond_bull = (apo_prev <= self.baseline) & (self.apo > self.baseline)
         cond_bear = (apo_prev >= self.baseline) & (self.apo < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'APO_Above_Baseline', -1: 'APO_Below_Baseline', 0: 'APO_Neutral'}
@@ -178,11 +306,11 @@ class AbsolutePriceOscillatorStrategies:
             -1: f'APO crossed below the baseline of {self.baseline}, indicating bearish momentum.',
             0: f'APO remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'APO_SP:{self.short_period}_LP:{self.long_period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -210,7 +338,7 @@ class AbsolutePriceOscillatorStrategies:
         cond_bull = self.apo < self.lower_threshold
         cond_bear = self.apo > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'APO_Oversold', -1: 'APO_Overbought', 0: 'APO_Neutral'}
@@ -219,11 +347,11 @@ class AbsolutePriceOscillatorStrategies:
             -1: f'APO is above the upper threshold of {self.upper_threshold}, suggesting potential overvaluation and bearish reversal.',
             0: 'APO is within normal range, indicating balanced market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'APO_SP:{self.short_period}_LP:{self.long_period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -250,7 +378,7 @@ class AbsolutePriceOscillatorStrategies:
             self.apo = self.compute_values(df)
         diff = self.apo.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'APO_Rising', -1: 'APO_Falling', 0: 'APO_Unchanged'}
@@ -259,11 +387,11 @@ class AbsolutePriceOscillatorStrategies:
             -1: 'APO is falling, indicating increasing bearish momentum.',
             0: 'APO remains unchanged, suggesting neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'APO_SP:{self.short_period}_LP:{self.long_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -318,7 +446,7 @@ class AccelerationBandsStrategies:
         cond_bull = (close_prev <= midline_prev) & (close > self.midline)
         cond_bear = (close_prev >= midline_prev) & (close < self.midline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Above_Midline', -1: 'Price_Below_Midline', 0: 'Price_Neutral'}
@@ -327,11 +455,11 @@ class AccelerationBandsStrategies:
             -1: 'The closing price crossed below the midline, indicating bearish momentum.',
             0: 'The closing price remains around the midline, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ABANDS_Period:{self.period}_Multiplier:{self.multiplier}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -360,7 +488,7 @@ class AccelerationBandsStrategies:
         cond_bull = close > self.upper_band
         cond_bear = close < self.lower_band
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Breakout_Above_UpperBand', -1: 'Breakdown_Below_LowerBand', 0: 'Within_Bands'}
@@ -369,11 +497,11 @@ class AccelerationBandsStrategies:
             -1: 'The closing price fell below the lower band, indicating a bearish breakdown.',
             0: 'The closing price remains within the bands, indicating balanced market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ABANDS_Period:{self.period}_Multiplier:{self.multiplier}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -402,7 +530,7 @@ class AccelerationBandsStrategies:
             self.compute_values(df)
         diff = self.midline.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Midline_Rising', -1: 'Midline_Falling', 0: 'Midline_Unchanged'}
@@ -411,11 +539,11 @@ class AccelerationBandsStrategies:
             -1: 'The midline is falling, indicating downward momentum.',
             0: 'The midline remains unchanged, indicating a neutral trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ABANDS_Period:{self.period}_Multiplier:{self.multiplier}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -466,7 +594,7 @@ class AccumulationDistributionLineStrategies:
         cond_bull = (adl_prev <= self.baseline) & (self.adl > self.baseline)
         cond_bear = (adl_prev >= self.baseline) & (self.adl < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'ADL_Above_Baseline', -1: 'ADL_Below_Baseline', 0: 'ADL_Neutral'}
@@ -475,11 +603,11 @@ class AccumulationDistributionLineStrategies:
             -1: f'ADL crossed below the baseline of {self.baseline}, indicating bearish distribution.',
             0: f'ADL remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ADL_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -507,7 +635,7 @@ class AccumulationDistributionLineStrategies:
         cond_bull = self.adl > self.upper_threshold
         cond_bear = self.adl < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'ADL_OverAccumulated', -1: 'ADL_OverDistributed', 0: 'ADL_Neutral'}
@@ -516,11 +644,11 @@ class AccumulationDistributionLineStrategies:
             -1: f'ADL is below the lower threshold of {self.lower_threshold}, indicating strong distribution.',
             0: f'ADL is within the thresholds, indicating balanced accumulation/distribution.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ADL_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -547,7 +675,7 @@ class AccumulationDistributionLineStrategies:
             self.adl = self.compute_values(df)
         diff = self.adl.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'ADL_Rising', -1: 'ADL_Falling', 0: 'ADL_Unchanged'}
@@ -556,11 +684,11 @@ class AccumulationDistributionLineStrategies:
             -1: 'ADL is falling, indicating increasing selling pressure.',
             0: 'ADL remains unchanged, indicating neutral accumulation/distribution.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ADL_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -611,7 +739,7 @@ class AccumulationDistributionIndexStrategies:
         cond_bull = (adi_prev <= self.baseline) & (self.adi > self.baseline)
         cond_bear = (adi_prev >= self.baseline) & (self.adi < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'ADI_Above_Baseline', -1: 'ADI_Below_Baseline', 0: 'ADI_Neutral'}
@@ -620,11 +748,11 @@ class AccumulationDistributionIndexStrategies:
             -1: f'ADI crossed below the baseline of {self.baseline}, indicating bearish distribution.',
             0: f'ADI remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ADI_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -652,7 +780,7 @@ class AccumulationDistributionIndexStrategies:
         cond_bull = self.adi > self.upper_threshold
         cond_bear = self.adi < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'ADI_OverAccumulated', -1: 'ADI_OverDistributed', 0: 'ADI_Neutral'}
@@ -661,11 +789,11 @@ class AccumulationDistributionIndexStrategies:
             -1: f'ADI is below the lower threshold of {self.lower_threshold}, indicating strong distribution.',
             0: f'ADI is within the set thresholds, indicating balanced accumulation/distribution.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ADI_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -692,7 +820,7 @@ class AccumulationDistributionIndexStrategies:
             self.adi = self.compute_values(df)
         diff = self.adi.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'ADI_Rising', -1: 'ADI_Falling', 0: 'ADI_Unchanged'}
@@ -701,11 +829,11 @@ class AccumulationDistributionIndexStrategies:
             -1: 'ADI is falling, suggesting increasing selling pressure.',
             0: 'ADI remains unchanged, indicating neutral accumulation/distribution.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'ADI_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -762,7 +890,7 @@ class AccumulationDistributionOscillatorStrategies:
         cond_bull = (adosc_prev <= self.baseline) & (self.adosc > self.baseline)
         cond_bear = (adosc_prev >= self.baseline) & (self.adosc < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'ADOSC_Above_Baseline', -1: 'ADOSC_Below_Baseline', 0: 'ADOSC_Neutral'}
@@ -771,11 +899,11 @@ class AccumulationDistributionOscillatorStrategies:
             -1: f'ADOSC crossed below the baseline of {self.baseline}, indicating bearish distribution.',
             0: f'ADOSC remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ADOSC_FP:{self.fast_period}_SP:{self.slow_period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -803,7 +931,7 @@ class AccumulationDistributionOscillatorStrategies:
         cond_bull = self.adosc > self.upper_threshold
         cond_bear = self.adosc < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'ADOSC_OverAccumulated', -1: 'ADOSC_OverDistributed', 0: 'ADOSC_Neutral'}
@@ -812,11 +940,11 @@ class AccumulationDistributionOscillatorStrategies:
             -1: f'ADOSC is below the lower threshold of {self.lower_threshold}, suggesting strong distribution.',
             0: f'ADOSC is within thresholds, indicating balanced accumulation/distribution.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ADOSC_FP:{self.fast_period}_SP:{self.slow_period}_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -843,7 +971,7 @@ class AccumulationDistributionOscillatorStrategies:
             self.adosc = self.compute_values(df)
         diff = self.adosc.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'ADOSC_Rising', -1: 'ADOSC_Falling', 0: 'ADOSC_Unchanged'}
@@ -852,11 +980,11 @@ class AccumulationDistributionOscillatorStrategies:
             -1: 'ADOSC is falling, indicating increasing selling pressure and distribution momentum.',
             0: 'ADOSC remains unchanged, suggesting neutral accumulation/distribution.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ADOSC_FP:{self.fast_period}_SP:{self.slow_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -896,15 +1024,12 @@ class AdaptivePriceZoneStrategies:
         self.upper_zone = None
         self.lower_zone = None
 
+    def required_primitives(self):
+        return [('ATR', self.period, 1, True)]
+
     def compute_values(self, df):
         self.center = df['Close'].rolling(window=self.period, min_periods=1).mean()
-        prev_close = df['Close'].shift(1)
-        tr = pd.DataFrame()
-        tr['hl'] = df['High'] - df['Low']
-        tr['hc'] = (df['High'] - prev_close).abs()
-        tr['lc'] = (df['Low'] - prev_close).abs()
-        true_range = tr.max(axis=1)
-        atr = true_range.rolling(window=self.period, min_periods=1).mean()
+        atr = frame_primitives(self, df).get(('ATR', self.period, 1, True))
         self.upper_zone = self.center + self.multiplier * atr
         self.lower_zone = self.center - self.multiplier * atr
         return self.center, self.upper_zone, self.lower_zone
@@ -917,7 +1042,7 @@ class AdaptivePriceZoneStrategies:
         cond_bull = (diff_prev <= self.baseline) & (diff > self.baseline)
         cond_bear = (diff_prev >= self.baseline) & (diff < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Above_Center', -1: 'Price_Below_Center', 0: 'Price_Neutral'}
@@ -926,11 +1051,11 @@ class AdaptivePriceZoneStrategies:
             -1: 'The closing price crossed below the adaptive center, indicating bearish momentum.',
             0: 'The closing price remains around the adaptive center, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'APZ_Period:{self.period}_Multiplier:{self.multiplier}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -958,7 +1083,7 @@ class AdaptivePriceZoneStrategies:
         cond_bull = df['Close'] < self.lower_zone
         cond_bear = df['Close'] > self.upper_zone
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Below_LowerZone', -1: 'Price_Above_UpperZone', 0: 'Within_AdaptiveZone'}
@@ -967,11 +1092,11 @@ class AdaptivePriceZoneStrategies:
             -1: f'The closing price is above the upper adaptive zone, suggesting overbought conditions and potential bearish reversal.',
             0: 'The closing price is within the adaptive price zone, indicating balanced market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'APZ_Period:{self.period}_Multiplier:{self.multiplier}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -1000,7 +1125,7 @@ class AdaptivePriceZoneStrategies:
             self.compute_values(df)
         diff = self.center.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Center_Rising', -1: 'Center_Falling', 0: 'Center_Unchanged'}
@@ -1009,11 +1134,11 @@ class AdaptivePriceZoneStrategies:
             -1: 'The adaptive center is falling, indicating downward momentum.',
             0: 'The adaptive center is unchanged, indicating a neutral trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'APZ_Period:{self.period}_Multiplier:{self.multiplier}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -1068,7 +1193,7 @@ class AllMovingAverageStrategies:
         cond_bull = (price_prev <= allma_prev) & (price > self.allma)
         cond_bear = (price_prev >= allma_prev) & (price < self.allma)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Crossed_Above_AllMA', -1: 'Price_Crossed_Below_AllMA', 0: 'Price_No_Cross'}
@@ -1077,11 +1202,11 @@ class AllMovingAverageStrategies:
             -1: 'The closing price crossed below the aggregated moving average, indicating bearish momentum.',
             0: 'No significant crossing occurred between the price and the aggregated moving average.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'AllMA_SP:{self.short_period}_MP:{self.medium_period}_LP:{self.long_period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -1110,7 +1235,7 @@ class AllMovingAverageStrategies:
         cond_bull = diff_percent < -self.threshold_percent
         cond_bear = diff_percent > self.threshold_percent
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Significantly_Below_AllMA', -1: 'Price_Significantly_Above_AllMA', 0: 'Price_Near_AllMA'}
@@ -1119,11 +1244,11 @@ class AllMovingAverageStrategies:
             -1: f'The closing price is more than {self.threshold_percent*100:.1f}% above the aggregated moving average, indicating potential bearish reversal.',
             0: 'The price is within a normal range relative to the aggregated moving average.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'AllMA_SP:{self.short_period}_MP:{self.medium_period}_LP:{self.long_period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -1150,7 +1275,7 @@ class AllMovingAverageStrategies:
             self.compute_values(df)
         diff = self.allma.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'AllMA_Rising', -1: 'AllMA_Falling', 0: 'AllMA_Unchanged'}
@@ -1159,11 +1284,11 @@ class AllMovingAverageStrategies:
             -1: 'The aggregated moving average is falling, indicating downward trend momentum.',
             0: 'The aggregated moving average is unchanged, indicating a neutral trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'AllMA_SP:{self.short_period}_MP:{self.medium_period}_LP:{self.long_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -1218,7 +1343,7 @@ class ArcherMovingAveragesTrendsStrategies:
         cond_bull = (amt_prev <= self.baseline) & (self.amt > self.baseline)
         cond_bear = (amt_prev >= self.baseline) & (self.amt < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'AMT_Crossed_Above_Baseline', -1: 'AMT_Crossed_Below_Baseline', 0: 'AMT_Neutral'}
@@ -1227,11 +1352,11 @@ class ArcherMovingAveragesTrendsStrategies:
             -1: f'The ArcherMovingAveragesTrends indicator crossed below the baseline of {self.baseline}, suggesting bearish trend conditions.',
             0: f'The ArcherMovingAveragesTrends indicator remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'AMT_SP:{self.short_period}_MP:{self.medium_period}_LP:{self.long_period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -1259,7 +1384,7 @@ class ArcherMovingAveragesTrendsStrategies:
         cond_bull = self.amt > self.upper_threshold
         cond_bear = self.amt < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'AMT_Over_Bullish', -1: 'AMT_Over_Bearish', 0: 'AMT_Neutral'}
@@ -1268,11 +1393,11 @@ class ArcherMovingAveragesTrendsStrategies:
             -1: f'The ArcherMovingAveragesTrends indicator falls below the lower threshold of {self.lower_threshold}, indicating strong bearish trends.',
             0: f'The indicator is within the defined thresholds, indicating balanced trend conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'AMT_SP:{self.short_period}_MP:{self.medium_period}_LP:{self.long_period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -1299,7 +1424,7 @@ class ArcherMovingAveragesTrendsStrategies:
             self.amt = self.compute_values(df)
         diff = self.amt.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'AMT_Rising', -1: 'AMT_Falling', 0: 'AMT_Unchanged'}
@@ -1308,11 +1433,11 @@ class ArcherMovingAveragesTrendsStrategies:
             -1: 'The ArcherMovingAveragesTrends indicator is falling, indicating strengthening bearish momentum.',
             0: 'The ArcherMovingAveragesTrends indicator remains unchanged, indicating neutral trend conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'AMT_SP:{self.short_period}_MP:{self.medium_period}_LP:{self.long_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -1363,7 +1488,7 @@ class ArcherOnBalanceVolumeStrategies:
         cond_bull = (obv_prev <= self.baseline) & (self.obv > self.baseline)
         cond_bear = (obv_prev >= self.baseline) & (self.obv < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'OBV_Above_Baseline', -1: 'OBV_Below_Baseline', 0: 'OBV_Neutral'}
@@ -1372,11 +1497,11 @@ class ArcherOnBalanceVolumeStrategies:
             -1: f'OBV crossed below the baseline of {self.baseline}, indicating bearish distribution.',
             0: f'OBV remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'OBV_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -1404,7 +1529,7 @@ class ArcherOnBalanceVolumeStrategies:
         cond_bull = self.obv > self.upper_threshold
         cond_bear = self.obv < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'OBV_OverAccumulated', -1: 'OBV_OverDistributed', 0: 'OBV_Neutral'}
@@ -1413,11 +1538,11 @@ class ArcherOnBalanceVolumeStrategies:
             -1: f'OBV is below the lower threshold of {self.lower_threshold}, suggesting strong distribution.',
             0: 'OBV is within the set thresholds, indicating balanced volume pressure.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'OBV_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -1444,7 +1569,7 @@ class ArcherOnBalanceVolumeStrategies:
             self.obv = self.compute_values(df)
         diff = self.obv.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'OBV_Rising', -1: 'OBV_Falling', 0: 'OBV_Unchanged'}
@@ -1453,11 +1578,11 @@ class ArcherOnBalanceVolumeStrategies:
             -1: 'OBV is falling, indicating increasing selling pressure.',
             0: 'OBV remains unchanged, indicating neutral volume activity.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'OBV_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -1514,7 +1639,7 @@ class ArnaudLegouxMovingAverageStrategies:
         cond_bull = (diff_prev <= self.baseline) & (diff > self.baseline)
         cond_bear = (diff_prev >= self.baseline) & (diff < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Above_ALMA', -1: 'Price_Below_ALMA', 0: 'Price_Near_ALMA'}
@@ -1523,11 +1648,11 @@ class ArnaudLegouxMovingAverageStrategies:
             -1: f'Price crossed below ALMA, suggesting bearish conditions.',
             0: f'Price remains near ALMA, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ALMA_Period:{self.period}_Offset:{self.offset}_Sigma:{self.sigma}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -1556,7 +1681,7 @@ class ArnaudLegouxMovingAverageStrategies:
         cond_bull = diff > self.upper_threshold
         cond_bear = diff < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Much_Above_ALMA', -1: 'Price_Much_Below_ALMA', 0: 'Price_Close_to_ALMA'}
@@ -1565,11 +1690,11 @@ class ArnaudLegouxMovingAverageStrategies:
             -1: f'Price is significantly below ALMA, indicating strong bearish momentum.',
             0: f'Price is close to ALMA, suggesting balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ALMA_Period:{self.period}_Offset:{self.offset}_Sigma:{self.sigma}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -1596,7 +1721,7 @@ class ArnaudLegouxMovingAverageStrategies:
             self.alma = self.compute_values(df)
         slope = self.alma.diff()
         signals = np.where(slope > 0, 1, np.where(slope < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'ALMA_Rising', -1: 'ALMA_Falling', 0: 'ALMA_Unchanged'}
@@ -1605,11 +1730,11 @@ class ArnaudLegouxMovingAverageStrategies:
             -1: 'ALMA is falling, indicating a downtrend.',
             0: 'ALMA remains unchanged, indicating neutral trend conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ALMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -1667,7 +1792,7 @@ class AroonStrategies:
         cond_bull = (osc_prev <= self.baseline) & (self.aroon_osc > self.baseline)
         cond_bear = (osc_prev >= self.baseline) & (self.aroon_osc < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'AroonOsc_Above_Baseline', -1: 'AroonOsc_Below_Baseline', 0: 'AroonOsc_Neutral'}
@@ -1676,11 +1801,11 @@ class AroonStrategies:
             -1: f'Aroon Oscillator crossed below the baseline of {self.baseline}, indicating bearish momentum.',
             0: f'Aroon Oscillator remains neutral around the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Aroon_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -1708,7 +1833,7 @@ class AroonStrategies:
         cond_bull = self.aroon_osc > self.upper_threshold
         cond_bear = self.aroon_osc < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'AroonOsc_Overbullish', -1: 'AroonOsc_Overbearish', 0: 'AroonOsc_Neutral'}
@@ -1717,11 +1842,11 @@ class AroonStrategies:
             -1: f'Aroon Oscillator is below the lower threshold of {self.lower_threshold}, indicating strong bearish momentum.',
             0: 'Aroon Oscillator is within normal range, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Aroon_Period:{self.period}_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -1748,7 +1873,7 @@ class AroonStrategies:
             self.compute_values(df)
         diff = self.aroon_osc.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'AroonOsc_Rising', -1: 'AroonOsc_Falling', 0: 'AroonOsc_Unchanged'}
@@ -1757,11 +1882,11 @@ class AroonStrategies:
             -1: 'Aroon Oscillator is falling, indicating increasing bearish momentum.',
             0: 'Aroon Oscillator remains unchanged, indicating a neutral trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Aroon_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -1818,7 +1943,7 @@ class AroonOscillatorStrategies:
         cond_bull = (osc_prev <= self.baseline) & (self.aroon_osc > self.baseline)
         cond_bear = (osc_prev >= self.baseline) & (self.aroon_osc < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'AroonOsc_Above_Baseline', -1: 'AroonOsc_Below_Baseline', 0: 'AroonOsc_Neutral'}
@@ -1827,11 +1952,11 @@ class AroonOscillatorStrategies:
             -1: f'Aroon Oscillator crossed below the baseline of {self.baseline}, suggesting bearish momentum.',
             0: f'Aroon Oscillator remains neutral around the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'AroonOsc_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -1859,7 +1984,7 @@ class AroonOscillatorStrategies:
         cond_bull = self.aroon_osc > self.upper_threshold
         cond_bear = self.aroon_osc < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'AroonOsc_Overbullish', -1: 'AroonOsc_Overbearish', 0: 'AroonOsc_Neutral'}
@@ -1868,11 +1993,11 @@ class AroonOscillatorStrategies:
             -1: f'Aroon Oscillator is below the lower threshold of {self.lower_threshold}, indicating strong bearish momentum.',
             0: 'Aroon Oscillator is within normal limits, indicating balanced market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'AroonOsc_Period:{self.period}_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -1899,7 +2024,7 @@ class AroonOscillatorStrategies:
             self.compute_values(df)
         diff = self.aroon_osc.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'AroonOsc_Rising', -1: 'AroonOsc_Falling', 0: 'AroonOsc_Unchanged'}
@@ -1908,11 +2033,11 @@ class AroonOscillatorStrategies:
             -1: 'Aroon Oscillator is falling, indicating increasing bearish momentum.',
             0: 'Aroon Oscillator remains unchanged, indicating a neutral trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'AroonOsc_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -1951,14 +2076,15 @@ class AverageDirectionalIndexStrategies:
         self.di_plus = None
         self.di_minus = None
 
+    def required_primitives(self):
+        return [('TR', True)]
+
     def compute_values(self, df):
         high = df['High']
         low = df['Low']
-        close = df['Close']
-        prev_close = close.shift(1)
         prev_high = high.shift(1)
         prev_low = low.shift(1)
-        tr = pd.concat([high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1).max(axis=1)
+        tr = frame_primitives(self, df).get(('TR', True))
         dm_plus = high - prev_high
         dm_minus = prev_low - low
         dm_plus = dm_plus.where((dm_plus > dm_minus) & (dm_plus > 0), 0)
@@ -1982,7 +2108,7 @@ class AverageDirectionalIndexStrategies:
         condition_strong = self.adx > self.adx_threshold
         score = pd.Series(0, index=df.index)
         score = score.where(~condition_strong, np.where(self.di_plus > self.di_minus, 1, np.where(self.di_minus > self.di_plus, -1, 0)))
-        return score
+        return score.astype(np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Strong_Trend_Bullish', -1: 'Strong_Trend_Bearish', 0: 'Weak_or_Indeterminate_Trend'}
@@ -1991,11 +2117,11 @@ class AverageDirectionalIndexStrategies:
             -1: f'ADX is above {self.adx_threshold} and DI- is greater than DI+, indicating a strong bearish trend.',
             0: f'ADX is below {self.adx_threshold} or DI values are equal, indicating a weak or indeterminate trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ADX_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -2025,7 +2151,7 @@ class AverageDirectionalIndexStrategies:
         cond_bull = (di_plus_prev <= di_minus_prev) & (self.di_plus > self.di_minus)
         cond_bear = (di_plus_prev >= di_minus_prev) & (self.di_plus < self.di_minus)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def crossover_map(self, series):
         mapping_value = {1: 'DI+_Cross_Above_DI-', -1: 'DI+_Cross_Below_DI-', 0: 'No_Crossover'}
@@ -2034,11 +2160,11 @@ class AverageDirectionalIndexStrategies:
             -1: 'DI+ has crossed below DI-, suggesting a bearish shift in trend direction.',
             0: 'No significant DI crossover detected, indicating neutral trend direction.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_crossover_strategy(df)
-        value, explanation = self.crossover_map(score)
+        value, explanation = self.crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ADX_Period:{self.period}_DI_Crossover_Signal'
         if append:
             if ta_indicator_value:
@@ -2067,7 +2193,7 @@ class AverageDirectionalIndexStrategies:
         score = pd.Series(0, index=df.index)
         condition = self.adx > self.adx_threshold
         score = score.where(~condition, np.where(adx_diff > 0, 1, np.where(adx_diff < 0, -1, 0)))
-        return score
+        return score.astype(np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'ADX_Rising', -1: 'ADX_Falling', 0: 'ADX_Stable_or_Weak'}
@@ -2076,11 +2202,11 @@ class AverageDirectionalIndexStrategies:
             -1: f'ADX is above {self.adx_threshold} and falling, indicating weakening trend conditions.',
             0: f'ADX is either below {self.adx_threshold} or stable, indicating neutral trend strength.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ADX_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -2135,7 +2261,7 @@ class AveragePriceStrategies:
         cond_bull = (diff_prev <= 0) & (diff > 0)
         cond_bear = (diff_prev >= 0) & (diff < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Above_AvgPrice', -1: 'Price_Below_AvgPrice', 0: 'Price_Neutral'}
@@ -2144,11 +2270,11 @@ class AveragePriceStrategies:
             -1: 'The closing price has crossed below the average price, suggesting bearish momentum.',
             0: 'No significant crossover between the closing price and the average price detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'AvgPrice_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -2177,7 +2303,7 @@ class AveragePriceStrategies:
         cond_bull = diff_pct > self.threshold
         cond_bear = diff_pct < -self.threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Above_Threshold', -1: 'Price_Below_Threshold', 0: 'Within_Threshold'}
@@ -2186,11 +2312,11 @@ class AveragePriceStrategies:
             -1: f'The closing price is more than {self.threshold}% below the average price, indicating bearish conditions.',
             0: f'The closing price is within {self.threshold}% of the average price, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'AvgPrice_Threshold_{self.threshold}_Signal'
         if append:
             if ta_indicator_value:
@@ -2217,7 +2343,7 @@ class AveragePriceStrategies:
             self.compute_values(df)
         slope = self.average_price.diff()
         signals = np.where(slope > 0, 1, np.where(slope < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'AvgPrice_Rising', -1: 'AvgPrice_Falling', 0: 'AvgPrice_Unchanged'}
@@ -2226,11 +2352,11 @@ class AveragePriceStrategies:
             -1: 'The average price is falling, indicating bearish momentum.',
             0: 'The average price is unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'AvgPrice_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -2266,13 +2392,11 @@ class AverageTrueRangeStrategies:
         self.threshold = threshold
         self.atr = None
 
+    def required_primitives(self):
+        return [('ATR', self.period, self.period, False)]
+
     def compute_values(self, df):
-        prev_close = df['Close'].shift(1)
-        tr1 = df['High'] - df['Low']
-        tr2 = abs(df['High'] - prev_close)
-        tr3 = abs(df['Low'] - prev_close)
-        true_range = np.maximum(np.maximum(tr1, tr2), tr3)
-        atr = pd.Series(true_range).rolling(window=self.period, min_periods=self.period).mean()
+        atr = frame_primitives(self, df).get(('ATR', self.period, self.period, False))
         self.atr = pd.Series(atr, index=df.index)
         return self.atr
 
@@ -2283,7 +2407,7 @@ class AverageTrueRangeStrategies:
         cond_bull = diff > self.atr
         cond_bear = diff < -self.atr
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Up_Breakout', -1: 'Price_Down_Breakout', 0: 'No_Breakout'}
@@ -2292,11 +2416,11 @@ class AverageTrueRangeStrategies:
             -1: 'The price decrease exceeds the ATR, suggesting a bearish breakdown.',
             0: 'Price movement does not exceed the ATR, indicating no breakout.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ATR_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -2325,7 +2449,7 @@ class AverageTrueRangeStrategies:
         cond_bull = self.atr > atr_ma * (1 + self.threshold)
         cond_bear = self.atr < atr_ma * (1 - self.threshold)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'High_Volatility', -1: 'Low_Volatility', 0: 'Normal_Volatility'}
@@ -2334,11 +2458,11 @@ class AverageTrueRangeStrategies:
             -1: f'The ATR is more than {100 * self.threshold}% below its moving average, indicating low volatility and a consolidating market.',
             0: 'The ATR is near its moving average, indicating normal volatility conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ATR_Period:{self.period}_Threshold:{self.threshold}_Signal'
         if append:
             if ta_indicator_value:
@@ -2365,7 +2489,7 @@ class AverageTrueRangeStrategies:
             self.compute_values(df)
         diff = self.atr.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'ATR_Rising', -1: 'ATR_Falling', 0: 'ATR_Unchanged'}
@@ -2374,11 +2498,11 @@ class AverageTrueRangeStrategies:
             -1: 'The ATR is falling, indicating decreasing volatility.',
             0: 'The ATR remains unchanged, indicating stable volatility.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ATR_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -2429,7 +2553,7 @@ class AwesomeOscillatorStrategies:
         cond_bull = (ao_prev <= 0) & (self.ao > 0)
         cond_bear = (ao_prev >= 0) & (self.ao < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'AO_Above_Zero', -1: 'AO_Below_Zero', 0: 'AO_Neutral'}
@@ -2438,11 +2562,11 @@ class AwesomeOscillatorStrategies:
             -1: 'Awesome Oscillator crossed below zero, indicating bearish momentum.',
             0: 'No zero cross detected in Awesome Oscillator, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'AO_Short:{self.short_period}_Long:{self.long_period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -2470,7 +2594,7 @@ class AwesomeOscillatorStrategies:
         cond_bull = self.ao > self.threshold
         cond_bear = self.ao < -self.threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'AO_Above_Threshold', -1: 'AO_Below_Threshold', 0: 'AO_Within_Threshold'}
@@ -2479,11 +2603,11 @@ class AwesomeOscillatorStrategies:
             -1: f'Awesome Oscillator is below the negative threshold of {-self.threshold}, indicating strong bearish momentum.',
             0: f'Awesome Oscillator is within the threshold range, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'AO_Short:{self.short_period}_Long:{self.long_period}_Threshold:{self.threshold}_Signal'
         if append:
             if ta_indicator_value:
@@ -2510,7 +2634,7 @@ class AwesomeOscillatorStrategies:
             self.compute_values(df)
         diff = self.ao.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'AO_Rising', -1: 'AO_Falling', 0: 'AO_Unchanged'}
@@ -2519,11 +2643,11 @@ class AwesomeOscillatorStrategies:
             -1: 'Awesome Oscillator is falling, indicating increasing bearish momentum.',
             0: 'Awesome Oscillator is unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'AO_Short:{self.short_period}_Long:{self.long_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -2571,7 +2695,7 @@ class BalanceOfPowerStrategies:
         cond_bull = (bop_prev <= 0) & (self.bop > 0)
         cond_bear = (bop_prev >= 0) & (self.bop < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'BOP_Cross_Up', -1: 'BOP_Cross_Down', 0: 'BOP_Neutral'}
@@ -2580,11 +2704,11 @@ class BalanceOfPowerStrategies:
             -1: 'Balance of Power crossed below zero, indicating a shift towards bearish control.',
             0: 'Balance of Power remains neutral with no clear crossover signal.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'BOP_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -2612,7 +2736,7 @@ class BalanceOfPowerStrategies:
         cond_bull = self.bop > self.threshold
         cond_bear = self.bop < -self.threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'BOP_Above_Threshold', -1: 'BOP_Below_Threshold', 0: 'BOP_Within_Threshold'}
@@ -2621,11 +2745,11 @@ class BalanceOfPowerStrategies:
             -1: f'Balance of Power is below -{self.threshold}, indicating strong bearish control.',
             0: f'Balance of Power is within ±{self.threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'BOP_Threshold_{self.threshold}_Signal'
         if append:
             if ta_indicator_value:
@@ -2652,7 +2776,7 @@ class BalanceOfPowerStrategies:
             self.compute_values(df)
         diff = self.bop.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'BOP_Rising', -1: 'BOP_Falling', 0: 'BOP_Unchanged'}
@@ -2661,11 +2785,11 @@ class BalanceOfPowerStrategies:
             -1: 'Balance of Power is falling, indicating increasing bearish pressure.',
             0: 'Balance of Power remains unchanged, indicating no significant shift in power.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'BOP_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -2720,7 +2844,7 @@ class BetaStrategies:
         cond_bull = (beta_prev <= self.baseline) & (self.beta > self.baseline)
         cond_bear = (beta_prev >= self.baseline) & (self.beta < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Beta_Above_Baseline', -1: 'Beta_Below_Baseline', 0: 'Beta_Neutral'}
@@ -2729,11 +2853,11 @@ class BetaStrategies:
             -1: f'Beta crossed below the baseline of {self.baseline}, indicating decreasing market sensitivity.',
             0: f'Beta remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Beta_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -2761,7 +2885,7 @@ class BetaStrategies:
         cond_bull = self.beta < self.lower_threshold
         cond_bear = self.beta > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Beta_Low', -1: 'Beta_High', 0: 'Beta_Normal'}
@@ -2770,11 +2894,11 @@ class BetaStrategies:
             -1: f'Beta is above the upper threshold of {self.upper_threshold}, indicating higher volatility and market sensitivity.',
             0: f'Beta is within the normal range between {self.lower_threshold} and {self.upper_threshold}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Beta_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -2801,7 +2925,7 @@ class BetaStrategies:
             self.compute_values(df)
         diff = self.beta.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Beta_Rising', -1: 'Beta_Falling', 0: 'Beta_Unchanged'}
@@ -2810,11 +2934,11 @@ class BetaStrategies:
             -1: 'Beta is falling, indicating decreasing market sensitivity and potentially lower risk/reward.',
             0: 'Beta remains unchanged, indicating stable market sensitivity.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Beta_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -2863,7 +2987,7 @@ class BiasStrategies:
         cond_bull = (bias_prev <= 0) & (self.bias > 0)
         cond_bear = (bias_prev >= 0) & (self.bias < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Bias_Above_Zero', -1: 'Bias_Below_Zero', 0: 'Bias_Neutral'}
@@ -2872,11 +2996,11 @@ class BiasStrategies:
             -1: 'Bias crossed below zero, indicating price below its moving average and bearish momentum.',
             0: 'No significant zero cross detected in Bias indicator.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Bias_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -2904,7 +3028,7 @@ class BiasStrategies:
         cond_bull = self.bias > self.threshold
         cond_bear = self.bias < -self.threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Bias_Above_Threshold', -1: 'Bias_Below_Threshold', 0: 'Bias_Within_Threshold'}
@@ -2913,11 +3037,11 @@ class BiasStrategies:
             -1: f'Bias is below -{self.threshold}%, indicating strong bearish momentum.',
             0: f'Bias is within ±{self.threshold}%, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Bias_Period:{self.period}_Threshold:{self.threshold}_Signal'
         if append:
             if ta_indicator_value:
@@ -2944,7 +3068,7 @@ class BiasStrategies:
             self.compute_values(df)
         diff = self.bias.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Bias_Rising', -1: 'Bias_Falling', 0: 'Bias_Unchanged'}
@@ -2953,11 +3077,11 @@ class BiasStrategies:
             -1: 'Bias is falling, indicating increasing bearish momentum.',
             0: 'Bias remains unchanged, indicating stable market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Bias_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -3013,7 +3137,7 @@ class BRARStrategies:
         cond_bull = (brar_prev <= self.baseline) & (self.brar > self.baseline)
         cond_bear = (brar_prev >= self.baseline) & (self.brar < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'BRAR_Cross_Up', -1: 'BRAR_Cross_Down', 0: 'BRAR_Neutral'}
@@ -3022,11 +3146,11 @@ class BRARStrategies:
             -1: f'BRAR crossed below the baseline of {self.baseline}, indicating bearish momentum.',
             0: f'BRAR remains around the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'BRAR_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -3054,7 +3178,7 @@ class BRARStrategies:
         cond_bull = self.brar > self.threshold
         cond_bear = self.brar < -self.threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'BRAR_Above_Threshold', -1: 'BRAR_Below_Threshold', 0: 'BRAR_Within_Threshold'}
@@ -3063,11 +3187,11 @@ class BRARStrategies:
             -1: f'BRAR is below -{self.threshold}, indicating strong bearish momentum.',
             0: f'BRAR is within ±{self.threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'BRAR_Period:{self.period}_Threshold:{self.threshold}_Signal'
         if append:
             if ta_indicator_value:
@@ -3094,7 +3218,7 @@ class BRARStrategies:
             self.compute_values(df)
         diff = self.brar.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'BRAR_Rising', -1: 'BRAR_Falling', 0: 'BRAR_Unchanged'}
@@ -3103,11 +3227,11 @@ class BRARStrategies:
             -1: 'BRAR is falling, indicating increasing bearish momentum.',
             0: 'BRAR remains unchanged, indicating stable market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'BRAR_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -3146,9 +3270,12 @@ class BollingerBandsStrategies:
         self.upper_threshold = upper_threshold
         self.percent_b = None
 
+    def required_primitives(self):
+        return [('STD', 'Close', self.period, self.period)]
+
     def compute_values(self, df):
         ma = pd.Series(df['Close']).rolling(window=self.period, min_periods=self.period).mean()
-        std = pd.Series(df['Close']).rolling(window=self.period, min_periods=self.period).std()
+        std = frame_primitives(self, df).get(('STD', 'Close', self.period, self.period))
         upper_band = ma + self.multiplier * std
         lower_band = ma - self.multiplier * std
         percent_b = (df['Close'] - lower_band) / (upper_band - lower_band)
@@ -3162,7 +3289,7 @@ class BollingerBandsStrategies:
         cond_bull = (percent_b_prev <= self.baseline) & (self.percent_b > self.baseline)
         cond_bear = (percent_b_prev >= self.baseline) & (self.percent_b < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Above_Middle_Band', -1: 'Price_Below_Middle_Band', 0: 'Price_Neutral'}
@@ -3171,11 +3298,11 @@ class BollingerBandsStrategies:
            -1: f'%B crossed below the baseline of {self.baseline}, indicating price moving into the lower half of the bands, potentially bearish.',
             0: f'%B remains around the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'BB_Period:{self.period}_Multiplier:{self.multiplier}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -3203,7 +3330,7 @@ class BollingerBandsStrategies:
         cond_bull = self.percent_b < self.lower_threshold
         cond_bear = self.percent_b > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Oversold', -1: 'Overbought', 0: 'Within_Range'}
@@ -3212,11 +3339,11 @@ class BollingerBandsStrategies:
            -1: f'%B is above {self.upper_threshold}, indicating price is near or above the upper band (potential overbought condition, bearish reversal).',
             0: f'%B is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'BB_Period:{self.period}_Multiplier:{self.multiplier}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -3243,7 +3370,7 @@ class BollingerBandsStrategies:
             self.compute_values(df)
         diff = self.percent_b.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PercentB_Rising', -1: 'PercentB_Falling', 0: 'PercentB_Unchanged'}
@@ -3252,11 +3379,11 @@ class BollingerBandsStrategies:
            -1: 'The %B indicator is falling, indicating increasing momentum towards the lower band (bearish).',
             0: 'The %B indicator is unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'BB_Period:{self.period}_Multiplier:{self.multiplier}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -3295,9 +3422,12 @@ class BollingerBandsWidthStrategies:
         self.upper_threshold = upper_threshold
         self.bb_width = None
 
+    def required_primitives(self):
+        return [('STD', 'Close', self.period, self.period)]
+
     def compute_values(self, df):
         ma = pd.Series(df['Close']).rolling(window=self.period, min_periods=self.period).mean()
-        std = pd.Series(df['Close']).rolling(window=self.period, min_periods=self.period).std()
+        std = frame_primitives(self, df).get(('STD', 'Close', self.period, self.period))
         upper_band = ma + self.multiplier * std
         lower_band = ma - self.multiplier * std
         bb_width = (upper_band - lower_band) / ma
@@ -3311,7 +3441,7 @@ class BollingerBandsWidthStrategies:
         cond_bull = (bb_width_prev <= self.baseline) & (self.bb_width > self.baseline)
         cond_bear = (bb_width_prev >= self.baseline) & (self.bb_width < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'BBWidth_Expanding', -1: 'BBWidth_Contracting', 0: 'BBWidth_Neutral'}
@@ -3320,11 +3450,11 @@ class BollingerBandsWidthStrategies:
            -1: f'Bollinger Bands Width has crossed below the baseline of {self.baseline}, indicating a contraction in volatility and a period of consolidation (bearish signal).',
             0: f'Bollinger Bands Width remains around the baseline of {self.baseline}, indicating stable volatility conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'BBWidth_Period:{self.period}_Multiplier:{self.multiplier}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -3352,7 +3482,7 @@ class BollingerBandsWidthStrategies:
         cond_bull = self.bb_width < self.lower_threshold
         cond_bear = self.bb_width > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'BBWidth_Squeeze', -1: 'BBWidth_Expansion', 0: 'BBWidth_Normal'}
@@ -3361,11 +3491,11 @@ class BollingerBandsWidthStrategies:
            -1: f'Bollinger Bands Width is above {self.upper_threshold}, indicating high volatility and overextended market conditions, which can signal a potential reversal (bearish signal).',
             0: f'Bollinger Bands Width is between {self.lower_threshold} and {self.upper_threshold}, indicating normal volatility conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'BBWidth_Period:{self.period}_Multiplier:{self.multiplier}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -3392,7 +3522,7 @@ class BollingerBandsWidthStrategies:
             self.compute_values(df)
         diff = self.bb_width.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'BBWidth_Rising', -1: 'BBWidth_Falling', 0: 'BBWidth_Unchanged'}
@@ -3401,11 +3531,11 @@ class BollingerBandsWidthStrategies:
            -1: 'Bollinger Bands Width is falling, indicating decreasing volatility and a potential return to consolidation (bearish signal).',
             0: 'Bollinger Bands Width remains unchanged, indicating stable volatility conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'BBWidth_Period:{self.period}_Multiplier:{self.multiplier}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -3442,8 +3572,11 @@ class BullBearPowerStrategies:
         self.upper_threshold = upper_threshold
         self.bbp = None
 
+    def required_primitives(self):
+        return [('EMA', 'Close', self.period)]
+
     def compute_values(self, df):
-        ema = pd.Series(df['Close']).ewm(span=self.period, adjust=False).mean()
+        ema = frame_primitives(self, df).get(('EMA', 'Close', self.period))
         bull_power = df['High'] - ema
         bear_power = df['Low'] - ema
         self.bbp = pd.Series(bull_power + bear_power, index=df.index)
@@ -3456,7 +3589,7 @@ class BullBearPowerStrategies:
         cond_bull = (bbp_prev <= 0) & (self.bbp > 0)
         cond_bear = (bbp_prev >= 0) & (self.bbp < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'BBP_Above_Zero', -1: 'BBP_Below_Zero', 0: 'BBP_Neutral'}
@@ -3465,11 +3598,11 @@ class BullBearPowerStrategies:
            -1: 'BullBearPower crossed below zero, indicating that bearish pressure dominates bullish strength.',
             0: 'BullBearPower remains neutral around zero, indicating balanced market forces.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'BBP_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -3497,7 +3630,7 @@ class BullBearPowerStrategies:
         cond_bull = self.bbp > self.upper_threshold
         cond_bear = self.bbp < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'BBP_High', -1: 'BBP_Low', 0: 'BBP_Normal'}
@@ -3506,11 +3639,11 @@ class BullBearPowerStrategies:
            -1: f'BullBearPower is below {self.lower_threshold}, indicating strong bearish dominance.',
             0: f'BullBearPower is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'BBP_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -3537,7 +3670,7 @@ class BullBearPowerStrategies:
             self.compute_values(df)
         diff = self.bbp.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'BBP_Rising', -1: 'BBP_Falling', 0: 'BBP_Unchanged'}
@@ -3546,11 +3679,11 @@ class BullBearPowerStrategies:
            -1: 'BullBearPower is falling, indicating increasing bearish momentum.',
             0: 'BullBearPower remains unchanged, indicating stable market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'BBP_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -3602,7 +3735,7 @@ class BuyAndSellPressureStrategies:
         cond_bull = (bsp_prev <= self.baseline) & (self.bsp > self.baseline)
         cond_bear = (bsp_prev >= self.baseline) & (self.bsp < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'BSP_Above_Baseline', -1: 'BSP_Below_Baseline', 0: 'BSP_Neutral'}
@@ -3611,11 +3744,11 @@ class BuyAndSellPressureStrategies:
             -1: f'BSP crossed below the baseline of {self.baseline}, indicating bearish pressure.',
             0: f'BSP remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'BSP_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -3643,7 +3776,7 @@ class BuyAndSellPressureStrategies:
         cond_bull = self.bsp < self.lower_threshold
         cond_bear = self.bsp > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'BSP_Oversold', -1: 'BSP_Overbought', 0: 'BSP_Neutral'}
@@ -3652,11 +3785,11 @@ class BuyAndSellPressureStrategies:
             -1: f'BSP is above the upper threshold of {self.upper_threshold}, indicating overbought conditions and potential bearish reversal.',
             0: 'BSP is within normal range, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'BSP_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -3683,7 +3816,7 @@ class BuyAndSellPressureStrategies:
             self.bsp = self.compute_values(df)
         diff = self.bsp.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'BSP_Rising', -1: 'BSP_Falling', 0: 'BSP_Unchanged'}
@@ -3692,11 +3825,11 @@ class BuyAndSellPressureStrategies:
             -1: 'BSP is falling, indicating increasing bearish pressure.',
             0: 'BSP remains unchanged, indicating neutral pressure.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'BSP_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -3748,7 +3881,7 @@ class CenterOfGravityStrategies:
         cond_bull = (diff_prev <= self.baseline) & (diff > self.baseline)
         cond_bear = (diff_prev >= self.baseline) & (diff < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Above_COG', -1: 'Price_Below_COG', 0: 'Price_Near_COG'}
@@ -3757,11 +3890,11 @@ class CenterOfGravityStrategies:
             -1: f'Price crossed below the Center of Gravity, suggesting bearish conditions.',
             0: f'Price remains near the Center of Gravity, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'COG_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -3790,7 +3923,7 @@ class CenterOfGravityStrategies:
         cond_bull = diff > self.upper_threshold
         cond_bear = diff < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Significantly_Above_COG', -1: 'Significantly_Below_COG', 0: 'Near_COG'}
@@ -3799,11 +3932,11 @@ class CenterOfGravityStrategies:
             -1: f'Price is significantly below the Center of Gravity, indicating strong bearish momentum.',
             0: f'Price is close to the Center of Gravity, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'COG_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -3830,7 +3963,7 @@ class CenterOfGravityStrategies:
             self.cog = self.compute_values(df)
         slope = self.cog.diff()
         signals = np.where(slope > 0, 1, np.where(slope < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'COG_Rising', -1: 'COG_Falling', 0: 'COG_Unchanged'}
@@ -3839,11 +3972,11 @@ class CenterOfGravityStrategies:
             -1: 'The Center of Gravity is falling, indicating potential bearish momentum.',
             0: 'The Center of Gravity is unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'COG_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -3910,7 +4043,7 @@ class ChandeForecastOscillatorStrategies:
         cond_bull = (cfo_prev <= 0) & (self.cfo > 0)
         cond_bear = (cfo_prev >= 0) & (self.cfo < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'CFO_Above_Baseline', -1: 'CFO_Below_Baseline', 0: 'CFO_Neutral'}
@@ -3919,11 +4052,11 @@ class ChandeForecastOscillatorStrategies:
             -1: 'CFO crossed below zero, indicating bearish conditions.',
             0: 'CFO remains neutral around zero.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CFO_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -3951,7 +4084,7 @@ class ChandeForecastOscillatorStrategies:
         cond_bull = self.cfo < self.lower_threshold
         cond_bear = self.cfo > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'CFO_Oversold', -1: 'CFO_Overbought', 0: 'CFO_Neutral'}
@@ -3960,11 +4093,11 @@ class ChandeForecastOscillatorStrategies:
             -1: f'CFO is above the upper threshold of {self.upper_threshold}, indicating overbought conditions and potential bearish reversal.',
             0: 'CFO is within the normal range, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CFO_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -3991,7 +4124,7 @@ class ChandeForecastOscillatorStrategies:
             self.cfo = self.compute_values(df)
         diff = self.cfo.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'CFO_Rising', -1: 'CFO_Falling', 0: 'CFO_Unchanged'}
@@ -4000,11 +4133,11 @@ class ChandeForecastOscillatorStrategies:
             -1: 'CFO is falling, indicating increasing bearish momentum.',
             0: 'CFO remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CFO_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -4042,10 +4175,11 @@ class ChandeKrollStopStrategies:
         self.lower_threshold = lower_threshold
         self.cks = None
 
+    def required_primitives(self):
+        return [('ATR', self.period, 1, True)]
+
     def compute_values(self, df):
-        prev_close = df['Close'].shift(1)
-        tr = pd.concat([df['High'] - df['Low'], (df['High'] - prev_close).abs(), (df['Low'] - prev_close).abs()], axis=1).max(axis=1)
-        atr = tr.rolling(window=self.period, min_periods=1).mean()
+        atr = frame_primitives(self, df).get(('ATR', self.period, 1, True))
         long_candidate = df['High'].rolling(window=self.period, min_periods=1).max() - self.multiplier * atr
         short_candidate = df['Low'].rolling(window=self.period, min_periods=1).min() + self.multiplier * atr
         cks_values = np.zeros(len(df))
@@ -4070,7 +4204,7 @@ class ChandeKrollStopStrategies:
         cond_bull = (prev_close <= prev_cks) & (df['Close'] > self.cks)
         cond_bear = (prev_close >= prev_cks) & (df['Close'] < self.cks)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'CKS_Bullish_Cross', -1: 'CKS_Bearish_Cross', 0: 'CKS_Neutral'}
@@ -4079,11 +4213,11 @@ class ChandeKrollStopStrategies:
             -1: 'Price crossed below the Chande Kroll Stop, indicating a bearish reversal.',
             0: 'No significant cross between price and the Chande Kroll Stop.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CKS_Period:{self.period}_Multiplier:{self.multiplier}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -4110,7 +4244,7 @@ class ChandeKrollStopStrategies:
             self.cks = self.compute_values(df)
         diff = df['Close'] - self.cks
         signals = np.where(diff > self.upper_threshold, 1, np.where(diff < self.lower_threshold, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'CKS_Strong_Bullish', -1: 'CKS_Strong_Bearish', 0: 'CKS_Neutral'}
@@ -4119,11 +4253,11 @@ class ChandeKrollStopStrategies:
             -1: f'Price is significantly below the Chande Kroll Stop by more than {abs(self.lower_threshold)}, indicating strong bearish momentum.',
             0: 'Price is close to the Chande Kroll Stop, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CKS_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -4150,7 +4284,7 @@ class ChandeKrollStopStrategies:
             self.cks = self.compute_values(df)
         diff = self.cks.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'CKS_Rising', -1: 'CKS_Falling', 0: 'CKS_Unchanged'}
@@ -4159,11 +4293,11 @@ class ChandeKrollStopStrategies:
             -1: 'Chande Kroll Stop is falling, indicating a potential bearish trend.',
             0: 'Chande Kroll Stop remains unchanged, indicating a neutral trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CKS_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -4216,7 +4350,7 @@ class ChandeMomentumOscillatorStrategies:
         cond_bull = (cmo_prev <= 0) & (self.cmo > 0)
         cond_bear = (cmo_prev >= 0) & (self.cmo < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'CMO_Above_Zero', -1: 'CMO_Below_Zero', 0: 'CMO_Neutral'}
@@ -4225,11 +4359,11 @@ class ChandeMomentumOscillatorStrategies:
             -1: 'CMO crossed below zero, indicating bearish momentum.',
             0: 'CMO remains neutral around zero.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CMO_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -4257,7 +4391,7 @@ class ChandeMomentumOscillatorStrategies:
         cond_bull = self.cmo < self.lower_threshold
         cond_bear = self.cmo > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'CMO_Oversold', -1: 'CMO_Overbought', 0: 'CMO_Neutral'}
@@ -4266,11 +4400,11 @@ class ChandeMomentumOscillatorStrategies:
             -1: f'CMO is above {self.upper_threshold}, indicating overbought conditions and potential bearish reversal.',
             0: 'CMO is within normal range, indicating balanced momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CMO_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -4297,7 +4431,7 @@ class ChandeMomentumOscillatorStrategies:
             self.cmo = self.compute_values(df)
         diff = self.cmo.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'CMO_Rising', -1: 'CMO_Falling', 0: 'CMO_Unchanged'}
@@ -4306,11 +4440,11 @@ class ChandeMomentumOscillatorStrategies:
             -1: 'CMO is falling, indicating increasing bearish momentum.',
             0: 'CMO remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CMO_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -4348,10 +4482,11 @@ class ChandelierExitStrategies:
         self.lower_threshold = lower_threshold
         self.ce = None
 
+    def required_primitives(self):
+        return [('ATR', self.period, 1, True)]
+
     def compute_values(self, df):
-        prev_close = df['Close'].shift(1)
-        tr = pd.concat([df['High'] - df['Low'], (df['High'] - prev_close).abs(), (df['Low'] - prev_close).abs()], axis=1).max(axis=1)
-        atr = tr.rolling(window=self.period, min_periods=1).mean()
+        atr = frame_primitives(self, df).get(('ATR', self.period, 1, True))
         highest_high = df['High'].rolling(window=self.period, min_periods=1).max()
         ce = highest_high - self.multiplier * atr
         return pd.Series(ce, index=df.index)
@@ -4364,7 +4499,7 @@ class ChandelierExitStrategies:
         cond_bull = (prev_close <= prev_ce) & (df['Close'] > self.ce)
         cond_bear = (prev_close >= prev_ce) & (df['Close'] < self.ce)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'ChandelierExit_Bullish_Cross', -1: 'ChandelierExit_Bearish_Cross', 0: 'ChandelierExit_Neutral'}
@@ -4373,11 +4508,11 @@ class ChandelierExitStrategies:
             -1: 'Price crossed below the Chandelier Exit level, indicating a potential bearish reversal or exit signal.',
             0: 'No significant cross between price and the Chandelier Exit level.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ChandelierExit_Period:{self.period}_Multiplier:{self.multiplier}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -4406,7 +4541,7 @@ class ChandelierExitStrategies:
         cond_bull = diff > self.upper_threshold
         cond_bear = diff < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'ChandelierExit_Strong_Bullish', -1: 'ChandelierExit_Strong_Bearish', 0: 'ChandelierExit_Neutral'}
@@ -4415,11 +4550,11 @@ class ChandelierExitStrategies:
             -1: f'Price is close to or below the Chandelier Exit by more than {self.lower_threshold}, indicating a potential bearish reversal or exit signal.',
             0: 'Price is within a moderate range of the Chandelier Exit, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ChandelierExit_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -4446,7 +4581,7 @@ class ChandelierExitStrategies:
             self.ce = self.compute_values(df)
         diff = self.ce.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'ChandelierExit_Rising', -1: 'ChandelierExit_Falling', 0: 'ChandelierExit_Unchanged'}
@@ -4455,11 +4590,11 @@ class ChandelierExitStrategies:
             -1: 'The Chandelier Exit is falling, indicating that the trailing stop is moving downward, which could be a warning sign in an uptrend.',
             0: 'The Chandelier Exit remains unchanged, indicating stable conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ChandelierExit_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -4507,7 +4642,7 @@ class ChaikinADLineStrategies:
         cond_bull = (ad_prev <= 0) & (self.ad > 0)
         cond_bear = (ad_prev >= 0) & (self.ad < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'ChaikinAD_Accumulation', -1: 'ChaikinAD_Distribution', 0: 'ChaikinAD_Neutral'}
@@ -4516,11 +4651,11 @@ class ChaikinADLineStrategies:
             -1: 'Chaikin A/D line crossed below zero, indicating net distribution and bearish conditions.',
             0: 'Chaikin A/D line remains around zero, indicating neutral money flow.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'ChaikinAD_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -4546,7 +4681,7 @@ class ChaikinADLineStrategies:
         if not hasattr(self, 'ad') or self.ad is None:
             self.ad = self.compute_values(df)
         signals = np.select([self.ad > self.upper_threshold, self.ad < self.lower_threshold], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'ChaikinAD_Strong_Accumulation', -1: 'ChaikinAD_Strong_Distribution', 0: 'ChaikinAD_Neutral'}
@@ -4555,11 +4690,11 @@ class ChaikinADLineStrategies:
             -1: f'Chaikin A/D line is below {self.lower_threshold}, indicating strong distribution and bearish sentiment.',
             0: f'Chaikin A/D line is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced money flow.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ChaikinAD_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -4586,7 +4721,7 @@ class ChaikinADLineStrategies:
             self.ad = self.compute_values(df)
         diff = self.ad.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'ChaikinAD_Rising', -1: 'ChaikinAD_Falling', 0: 'ChaikinAD_Unchanged'}
@@ -4595,11 +4730,11 @@ class ChaikinADLineStrategies:
             -1: 'Chaikin A/D line is falling, indicating increasing distribution and bearish momentum.',
             0: 'Chaikin A/D line remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'ChaikinAD_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -4652,7 +4787,7 @@ class ChaikinADOscillatorStrategies:
         cond_bull = (cao_prev <= 0) & (self.cao > 0)
         cond_bear = (cao_prev >= 0) & (self.cao < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'CAO_Above_Zero', -1: 'CAO_Below_Zero', 0: 'CAO_Neutral'}
@@ -4661,11 +4796,11 @@ class ChaikinADOscillatorStrategies:
             -1: 'Chaikin A/D Oscillator crossed below zero, indicating bearish momentum.',
             0: 'Chaikin A/D Oscillator remains neutral around zero.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CAO_Short:{self.short_period}_Long:{self.long_period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -4693,7 +4828,7 @@ class ChaikinADOscillatorStrategies:
         cond_bull = self.cao > self.upper_threshold
         cond_bear = self.cao < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'CAO_Strong_Bullish', -1: 'CAO_Strong_Bearish', 0: 'CAO_Neutral'}
@@ -4702,11 +4837,11 @@ class ChaikinADOscillatorStrategies:
             -1: f'Chaikin A/D Oscillator is below {self.lower_threshold}, indicating strong bearish momentum.',
             0: 'Chaikin A/D Oscillator is within the neutral range, indicating balanced market pressure.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CAO_Short:{self.short_period}_Long:{self.long_period}_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -4733,7 +4868,7 @@ class ChaikinADOscillatorStrategies:
             self.cao = self.compute_values(df)
         diff = self.cao.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'CAO_Rising', -1: 'CAO_Falling', 0: 'CAO_Unchanged'}
@@ -4742,11 +4877,11 @@ class ChaikinADOscillatorStrategies:
             -1: 'Chaikin A/D Oscillator is falling, indicating increasing bearish momentum.',
             0: 'Chaikin A/D Oscillator remains unchanged, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CAO_Short:{self.short_period}_Long:{self.long_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -4795,7 +4930,7 @@ class ChaikinMoneyFlowStrategies:
         cond_bull = (cmf_prev <= 0) & (self.cmf > 0)
         cond_bear = (cmf_prev >= 0) & (self.cmf < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'CMF_Above_Zero', -1: 'CMF_Below_Zero', 0: 'CMF_Neutral'}
@@ -4804,11 +4939,11 @@ class ChaikinMoneyFlowStrategies:
             -1: 'CMF crossed below zero, indicating net selling pressure and bearish conditions.',
             0: 'CMF remains neutral around zero, indicating balanced money flow.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CMF_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -4836,7 +4971,7 @@ class ChaikinMoneyFlowStrategies:
         cond_bull = self.cmf > self.upper_threshold
         cond_bear = self.cmf < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'CMF_Strong_Bullish', -1: 'CMF_Strong_Bearish', 0: 'CMF_Neutral'}
@@ -4845,11 +4980,11 @@ class ChaikinMoneyFlowStrategies:
             -1: f'CMF is below {self.lower_threshold}, indicating strong selling pressure.',
             0: f'CMF is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced money flow.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CMF_Period:{self.period}_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -4876,7 +5011,7 @@ class ChaikinMoneyFlowStrategies:
             self.cmf = self.compute_values(df)
         diff = self.cmf.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'CMF_Rising', -1: 'CMF_Falling', 0: 'CMF_Unchanged'}
@@ -4885,11 +5020,11 @@ class ChaikinMoneyFlowStrategies:
             -1: 'CMF is falling, indicating increasing selling pressure.',
             0: 'CMF remains unchanged, indicating neutral money flow.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CMF_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -4942,7 +5077,7 @@ class ChaikinOscillatorStrategies:
         cond_bull = (co_prev <= 0) & (self.co > 0)
         cond_bear = (co_prev >= 0) & (self.co < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'CO_Above_Zero', -1: 'CO_Below_Zero', 0: 'CO_Neutral'}
@@ -4951,11 +5086,11 @@ class ChaikinOscillatorStrategies:
             -1: 'Chaikin Oscillator crossed below zero, indicating increasing selling pressure.',
             0: 'Chaikin Oscillator remains neutral around zero.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CO_Short:{self.short_period}_Long:{self.long_period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -4983,7 +5118,7 @@ class ChaikinOscillatorStrategies:
         cond_bull = self.co > self.upper_threshold
         cond_bear = self.co < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'CO_Strong_Bullish', -1: 'CO_Strong_Bearish', 0: 'CO_Neutral'}
@@ -4992,11 +5127,11 @@ class ChaikinOscillatorStrategies:
             -1: f'Chaikin Oscillator is below {self.lower_threshold}, indicating strong bearish momentum.',
             0: f'Chaikin Oscillator is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CO_Short:{self.short_period}_Long:{self.long_period}_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -5023,7 +5158,7 @@ class ChaikinOscillatorStrategies:
             self.co = self.compute_values(df)
         diff = self.co.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'CO_Rising', -1: 'CO_Falling', 0: 'CO_Unchanged'}
@@ -5032,11 +5167,11 @@ class ChaikinOscillatorStrategies:
             -1: 'Chaikin Oscillator is falling, indicating increasing bearish momentum.',
             0: 'Chaikin Oscillator remains unchanged, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CO_Short:{self.short_period}_Long:{self.long_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -5073,9 +5208,11 @@ class ChoppinessIndexStrategies:
         self.lower_threshold = lower_threshold
         self.chop = None
 
+    def required_primitives(self):
+        return [('TR', True)]
+
     def compute_values(self, df):
-        prev_close = df['Close'].shift(1)
-        tr = pd.concat([df['High'] - df['Low'], (df['High'] - prev_close).abs(), (df['Low'] - prev_close).abs()], axis=1).max(axis=1)
+        tr = frame_primitives(self, df).get(('TR', True))
         sum_tr = pd.Series(tr).rolling(window=self.period, min_periods=1).sum()
         highest_high = df['High'].rolling(window=self.period, min_periods=1).max()
         lowest_low = df['Low'].rolling(window=self.period, min_periods=1).min()
@@ -5092,7 +5229,7 @@ class ChoppinessIndexStrategies:
         cond_bull = (chop_prev >= self.baseline) & (self.chop < self.baseline)
         cond_bear = (chop_prev <= self.baseline) & (self.chop > self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'CHOP_Trending', -1: 'CHOP_Choppy', 0: 'CHOP_Neutral'}
@@ -5101,11 +5238,11 @@ class ChoppinessIndexStrategies:
             -1: f'Choppiness Index crossed above the baseline of {self.baseline}, indicating a transition to choppy conditions.',
             0: f'Choppiness Index remains near the baseline of {self.baseline}, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CHOP_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -5133,7 +5270,7 @@ class ChoppinessIndexStrategies:
         cond_bull = self.chop < self.lower_threshold
         cond_bear = self.chop > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'CHOP_Trending_Strong', -1: 'CHOP_Choppy_Strong', 0: 'CHOP_Neutral'}
@@ -5142,11 +5279,11 @@ class ChoppinessIndexStrategies:
             -1: f'Choppiness Index is above {self.upper_threshold}, indicating strong choppiness.',
             0: f'Choppiness Index is between {self.lower_threshold} and {self.upper_threshold}, indicating moderate conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CHOP_Period:{self.period}_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -5173,7 +5310,7 @@ class ChoppinessIndexStrategies:
             self.chop = self.compute_values(df)
         diff = self.chop.diff()
         signals = np.where(diff < 0, 1, np.where(diff > 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'CHOP_Falling', -1: 'CHOP_Rising', 0: 'CHOP_Unchanged'}
@@ -5182,11 +5319,11 @@ class ChoppinessIndexStrategies:
             -1: 'Choppiness Index is rising, indicating increasing choppiness.',
             0: 'Choppiness Index remains unchanged, indicating stable market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CHOP_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -5223,8 +5360,11 @@ class CommodityChannelIndexStrategies:
         self.baseline = baseline
         self.cci = None
 
+    def required_primitives(self):
+        return [('TYPICAL_PRICE',)]
+
     def compute_values(self, df):
-        typical_price = (df['High'] + df['Low'] + df['Close']) / 3
+        typical_price = frame_primitives(self, df).get(('TYPICAL_PRICE',))
         sma = pd.Series(typical_price).rolling(window=self.period, min_periods=1).mean()
         mean_deviation = pd.Series(np.abs(typical_price - sma)).rolling(window=self.period, min_periods=1).mean()
         cci = (typical_price - sma) / (0.015 * mean_deviation)
@@ -5238,7 +5378,7 @@ class CommodityChannelIndexStrategies:
         cond_bull = (cci_prev <= self.baseline) & (self.cci > self.baseline)
         cond_bear = (cci_prev >= self.baseline) & (self.cci < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'CCI_Above_Baseline', -1: 'CCI_Below_Baseline', 0: 'CCI_Neutral'}
@@ -5247,11 +5387,11 @@ class CommodityChannelIndexStrategies:
             -1: f'CCI crossed below the baseline of {self.baseline}, suggesting bearish momentum.',
             0: f'CCI remains neutral around the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CCI_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -5279,7 +5419,7 @@ class CommodityChannelIndexStrategies:
         cond_bull = self.cci < self.lower_threshold
         cond_bear = self.cci > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'CCI_Oversold', -1: 'CCI_Overbought', 0: 'CCI_Neutral'}
@@ -5288,11 +5428,11 @@ class CommodityChannelIndexStrategies:
             -1: f'CCI is above {self.upper_threshold}, suggesting overbought conditions and a potential bearish reversal.',
             0: f'CCI is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CCI_Period:{self.period}_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -5319,7 +5459,7 @@ class CommodityChannelIndexStrategies:
             self.cci = self.compute_values(df)
         diff = self.cci.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'CCI_Rising', -1: 'CCI_Falling', 0: 'CCI_Unchanged'}
@@ -5328,11 +5468,11 @@ class CommodityChannelIndexStrategies:
             -1: 'CCI is falling, indicating increasing bearish momentum.',
             0: 'CCI remains unchanged, suggesting a neutral market.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CCI_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -5390,7 +5530,7 @@ class CorrelationTrendIndicatorStrategies:
         cond_bull = (cti_prev <= self.baseline) & (self.cti > self.baseline)
         cond_bear = (cti_prev >= self.baseline) & (self.cti < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'CTI_Above_Baseline', -1: 'CTI_Below_Baseline', 0: 'CTI_Neutral'}
@@ -5399,11 +5539,11 @@ class CorrelationTrendIndicatorStrategies:
             -1: f'CTI crossed below the baseline of {self.baseline}, indicating emerging bearish trend.',
             0: f'CTI remains near the baseline of {self.baseline}, suggesting neutral trend conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CTI_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -5431,7 +5571,7 @@ class CorrelationTrendIndicatorStrategies:
         cond_bull = self.cti > self.upper_threshold
         cond_bear = self.cti < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'CTI_Strong_Bullish', -1: 'CTI_Strong_Bearish', 0: 'CTI_Neutral'}
@@ -5440,11 +5580,11 @@ class CorrelationTrendIndicatorStrategies:
             -1: f'CTI is below {self.lower_threshold}, indicating a strong bearish trend.',
             0: f'CTI is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral trend strength.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CTI_Period:{self.period}_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -5471,7 +5611,7 @@ class CorrelationTrendIndicatorStrategies:
             self.cti = self.compute_values(df)
         diff = self.cti.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'CTI_Rising', -1: 'CTI_Falling', 0: 'CTI_Unchanged'}
@@ -5480,11 +5620,11 @@ class CorrelationTrendIndicatorStrategies:
             -1: 'CTI is falling, suggesting a strengthening bearish trend.',
             0: 'CTI remains unchanged, indicating stable trend conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CTI_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -5538,7 +5678,7 @@ class CoppockCurveStrategies:
         cond_bull = (coppock_prev <= self.baseline) & (self.coppock > self.baseline)
         cond_bear = (coppock_prev >= self.baseline) & (self.coppock < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Coppock_Above_Baseline', -1: 'Coppock_Below_Baseline', 0: 'Coppock_Neutral'}
@@ -5547,11 +5687,11 @@ class CoppockCurveStrategies:
             -1: f'Coppock Curve crossed below the baseline of {self.baseline}, suggesting emerging bearish momentum.',
             0: f'Coppock Curve remains near the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CoppockCurve_ROC1:{self.roc_period1}_ROC2:{self.roc_period2}_WMA:{self.wma_period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -5579,7 +5719,7 @@ class CoppockCurveStrategies:
         cond_bull = self.coppock < self.lower_threshold
         cond_bear = self.coppock > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Coppock_Oversold', -1: 'Coppock_Overbought', 0: 'Coppock_Neutral'}
@@ -5588,11 +5728,11 @@ class CoppockCurveStrategies:
             -1: f'Coppock Curve is above {self.upper_threshold}, indicating overbought conditions and a potential bearish reversal.',
             0: f'Coppock Curve is between {self.lower_threshold} and {self.upper_threshold}, suggesting balanced momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CoppockCurve_ROC1:{self.roc_period1}_ROC2:{self.roc_period2}_WMA:{self.wma_period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -5619,7 +5759,7 @@ class CoppockCurveStrategies:
             self.coppock = self.compute_values(df)
         diff = self.coppock.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Coppock_Rising', -1: 'Coppock_Falling', 0: 'Coppock_Unchanged'}
@@ -5628,11 +5768,11 @@ class CoppockCurveStrategies:
             -1: 'Coppock Curve is falling, indicating weakening momentum or bearish conditions.',
             0: 'Coppock Curve remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CoppockCurve_ROC1:{self.roc_period1}_ROC2:{self.roc_period2}_WMA:{self.wma_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -5680,7 +5820,7 @@ class CumulativeForceIndexStrategies:
         cond_bull = (cfi_prev <= self.baseline) & (self.cfi > self.baseline)
         cond_bear = (cfi_prev >= self.baseline) & (self.cfi < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'CFI_Above_Baseline', -1: 'CFI_Below_Baseline', 0: 'CFI_Neutral'}
@@ -5689,11 +5829,11 @@ class CumulativeForceIndexStrategies:
             -1: f'CFI crossed below the baseline of {self.baseline}, indicating bearish momentum.',
             0: f'CFI remains near the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CFI_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -5721,7 +5861,7 @@ class CumulativeForceIndexStrategies:
         cond_bull = self.cfi > self.upper_threshold
         cond_bear = self.cfi < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'CFI_Strong_Bullish', -1: 'CFI_Strong_Bearish', 0: 'CFI_Neutral'}
@@ -5730,11 +5870,11 @@ class CumulativeForceIndexStrategies:
             -1: f'CFI is below {self.lower_threshold}, indicating strong bearish pressure.',
             0: f'CFI is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced force.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CFI_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -5761,7 +5901,7 @@ class CumulativeForceIndexStrategies:
             self.cfi = self.compute_values(df)
         diff = self.cfi.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'CFI_Rising', -1: 'CFI_Falling', 0: 'CFI_Unchanged'}
@@ -5770,11 +5910,11 @@ class CumulativeForceIndexStrategies:
             -1: 'CFI is falling, indicating increasing bearish force.',
             0: 'CFI remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'CFI_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -5826,7 +5966,7 @@ class CrossSignalsStrategies:
         cond_bull = (cross_prev <= self.baseline) & (self.cross > self.baseline)
         cond_bear = (cross_prev >= self.baseline) & (self.cross < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'CrossSignal_Bullish', -1: 'CrossSignal_Bearish', 0: 'CrossSignal_Neutral'}
@@ -5835,11 +5975,11 @@ class CrossSignalsStrategies:
             -1: 'Fast MA crossed below Slow MA, indicating bearish momentum.',
             0: 'No crossing detected, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CrossSignals_Fast:{self.fast_period}_Slow:{self.slow_period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -5867,7 +6007,7 @@ class CrossSignalsStrategies:
         cond_bull = self.cross > self.upper_threshold
         cond_bear = self.cross < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'CrossSignal_Strong_Bullish', -1: 'CrossSignal_Strong_Bearish', 0: 'CrossSignal_Neutral'}
@@ -5876,11 +6016,11 @@ class CrossSignalsStrategies:
             -1: f'CrossSignal is below {self.lower_threshold}, indicating strong bearish conditions.',
             0: f'CrossSignal is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CrossSignals_Fast:{self.fast_period}_Slow:{self.slow_period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -5907,7 +6047,7 @@ class CrossSignalsStrategies:
             self.cross = self.compute_values(df)
         diff = self.cross.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'CrossSignal_Rising', -1: 'CrossSignal_Falling', 0: 'CrossSignal_Unchanged'}
@@ -5916,11 +6056,11 @@ class CrossSignalsStrategies:
             -1: 'The CrossSignal indicator is falling, suggesting increasing bearish momentum.',
             0: 'The CrossSignal indicator remains unchanged, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'CrossSignals_Fast:{self.fast_period}_Slow:{self.slow_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -5958,8 +6098,11 @@ class DecayStrategies:
         self.lower_threshold = lower_threshold
         self.decay = None
 
+    def required_primitives(self):
+        return [('EMA', 'Close', self.period)]
+
     def compute_values(self, df):
-        decay = df['Close'] - pd.Series(df['Close']).ewm(span=self.period, adjust=False).mean()
+        decay = df['Close'] - frame_primitives(self, df).get(('EMA', 'Close', self.period))
         return pd.Series(decay, index=df.index)
 
     def calculate_scores_zero_cross_strategy(self, df):
@@ -5969,7 +6112,7 @@ class DecayStrategies:
         cond_bull = (decay_prev <= self.baseline) & (self.decay > self.baseline)
         cond_bear = (decay_prev >= self.baseline) & (self.decay < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Decay_Above_Baseline', -1: 'Decay_Below_Baseline', 0: 'Decay_Neutral'}
@@ -5978,11 +6121,11 @@ class DecayStrategies:
             -1: f'Decay crossed below the baseline of {self.baseline}, suggesting bearish conditions.',
             0: f'Decay remains near the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Decay_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -6010,7 +6153,7 @@ class DecayStrategies:
         cond_bull = self.decay > self.upper_threshold
         cond_bear = self.decay < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Decay_Strong_Bullish', -1: 'Decay_Strong_Bearish', 0: 'Decay_Neutral'}
@@ -6019,11 +6162,11 @@ class DecayStrategies:
             -1: f'Decay is below {self.lower_threshold}, indicating strong bearish momentum.',
             0: f'Decay is between {self.lower_threshold} and {self.upper_threshold}, suggesting neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Decay_Period:{self.period}_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -6050,7 +6193,7 @@ class DecayStrategies:
             self.decay = self.compute_values(df)
         diff = self.decay.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Decay_Rising', -1: 'Decay_Falling', 0: 'Decay_Unchanged'}
@@ -6059,11 +6202,11 @@ class DecayStrategies:
             -1: 'Decay is falling, indicating increasing bearish momentum.',
             0: 'Decay remains unchanged, suggesting neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Decay_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -6110,7 +6253,7 @@ class DecreasingPriceStrategies:
         cond_bear = (dp_prev <= self.baseline) & (self.decreasing_price > self.baseline)
         cond_bull = (dp_prev >= self.baseline) & (self.decreasing_price < self.baseline)
         signals = np.select([cond_bear, cond_bull], [-1, 1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'DecPrice_Below_Baseline', -1: 'DecPrice_Above_Baseline', 0: 'DecPrice_Neutral'}
@@ -6119,11 +6262,11 @@ class DecreasingPriceStrategies:
             -1: f'DecreasingPrice crossed above the baseline of {self.baseline}, indicating the onset of price decline (bearish).',
             0: f'DecreasingPrice remains near the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'DecPrice_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -6151,7 +6294,7 @@ class DecreasingPriceStrategies:
         cond_bear = self.decreasing_price > self.upper_threshold
         cond_bull = self.decreasing_price < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'DecPrice_Recovery', -1: 'DecPrice_Strong_Decrease', 0: 'DecPrice_Moderate'}
@@ -6160,11 +6303,11 @@ class DecreasingPriceStrategies:
             -1: f'DecreasingPrice is above the upper threshold of {self.upper_threshold}, indicating significant price decline (bearish).',
             0: f'DecreasingPrice is between {self.lower_threshold} and {self.upper_threshold}, indicating moderate movement.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'DecPrice_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -6191,7 +6334,7 @@ class DecreasingPriceStrategies:
             self.decreasing_price = self.compute_values(df)
         diff = self.decreasing_price.diff()
         signals = np.where(diff > 0, -1, np.where(diff < 0, 1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'DecPrice_Recovering', -1: 'DecPrice_Accelerating_Decrease', 0: 'DecPrice_Unchanged'}
@@ -6200,11 +6343,11 @@ class DecreasingPriceStrategies:
             -1: 'A positive slope indicates that the rate of price decline is accelerating (bearish).',
             0: 'No change in the slope indicates stable price movement.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'DecPrice_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -6259,7 +6402,7 @@ class DetrendedPriceOscillatorStrategies:
         cond_bull = (dpo_prev <= self.baseline) & (self.dpo > self.baseline)
         cond_bear = (dpo_prev >= self.baseline) & (self.dpo < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'DPO_Above_Baseline', -1: 'DPO_Below_Baseline', 0: 'DPO_Neutral'}
@@ -6268,11 +6411,11 @@ class DetrendedPriceOscillatorStrategies:
             -1: f'DPO crossed below the baseline of {self.baseline}, indicating bearish conditions.',
             0: f'DPO remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'DPO_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -6300,7 +6443,7 @@ class DetrendedPriceOscillatorStrategies:
         cond_bull = self.dpo < self.lower_threshold
         cond_bear = self.dpo > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'DPO_Oversold', -1: 'DPO_Overbought', 0: 'DPO_Neutral'}
@@ -6309,11 +6452,11 @@ class DetrendedPriceOscillatorStrategies:
             -1: f'DPO is above the upper threshold of {self.upper_threshold}, indicating overbought conditions and potential bearish reversal.',
             0: f'DPO is within the normal range between {self.lower_threshold} and {self.upper_threshold}, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'DPO_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -6340,7 +6483,7 @@ class DetrendedPriceOscillatorStrategies:
             self.dpo = self.compute_values(df)
         diff = self.dpo.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'DPO_Rising', -1: 'DPO_Falling', 0: 'DPO_Unchanged'}
@@ -6349,11 +6492,11 @@ class DetrendedPriceOscillatorStrategies:
             -1: 'DPO is falling, indicating increasing bearish momentum.',
             0: 'DPO remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'DPO_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -6390,11 +6533,11 @@ class DirectionalMovementStrategies:
         self.lower_threshold = lower_threshold
         self.dm = None
 
+    def required_primitives(self):
+        return [('DM',)]
+
     def compute_values(self, df):
-        up_move = df['High'] - df['High'].shift(1)
-        down_move = df['Low'].shift(1) - df['Low']
-        dm_plus = np.where((up_move > down_move) & (up_move > 0), up_move, 0)
-        dm_minus = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
+        dm_plus, dm_minus = frame_primitives(self, df).get(('DM',))
         dm = dm_plus - dm_minus
         return pd.Series(dm, index=df.index)
 
@@ -6405,7 +6548,7 @@ class DirectionalMovementStrategies:
         cond_bull = (dm_prev <= self.baseline) & (self.dm > self.baseline)
         cond_bear = (dm_prev >= self.baseline) & (self.dm < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'DM_Above_Baseline', -1: 'DM_Below_Baseline', 0: 'DM_Neutral'}
@@ -6414,11 +6557,11 @@ class DirectionalMovementStrategies:
             -1: f'DM crossed below the baseline of {self.baseline}, indicating bearish directional movement.',
             0: f'DM remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'DM_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -6446,7 +6589,7 @@ class DirectionalMovementStrategies:
         cond_bull = self.dm > self.upper_threshold
         cond_bear = self.dm < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'DM_Strong_Bullish', -1: 'DM_Strong_Bearish', 0: 'DM_Neutral'}
@@ -6455,11 +6598,11 @@ class DirectionalMovementStrategies:
             -1: f'DM is below the lower threshold of {self.lower_threshold}, indicating strong bearish directional movement.',
             0: f'DM is within the normal range between {self.lower_threshold} and {self.upper_threshold}, indicating balanced directional movement.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'DM_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -6486,7 +6629,7 @@ class DirectionalMovementStrategies:
             self.dm = self.compute_values(df)
         diff = self.dm.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'DM_Rising', -1: 'DM_Falling', 0: 'DM_Unchanged'}
@@ -6495,11 +6638,11 @@ class DirectionalMovementStrategies:
             -1: 'DM is falling, indicating increasing bearish directional momentum.',
             0: 'DM remains unchanged, indicating neutral directional movement.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'DM_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -6550,7 +6693,7 @@ class DonchianChannelStrategies:
         prev_lower = self.lower.shift(1)
         cond_bull = df['Close'] > prev_upper
         cond_bear = df['Close'] < prev_lower
-        signals = pd.Series(np.select([cond_bull, cond_bear], [1, -1], default=0), index=df.index)
+        signals = pd.Series(np.select([cond_bull, cond_bear], [1, -1], default=0), index=df.index, dtype=np.int8)
         return signals
 
     def breakout_map(self, series):
@@ -6560,11 +6703,11 @@ class DonchianChannelStrategies:
             -1: 'Price has broken below the previous lower channel, indicating a strong bearish breakdown.',
             0: 'Price remains within the channel, indicating no breakout.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_breakout_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_breakout_strategy(df)
-        value, explanation = self.breakout_map(score)
+        value, explanation = self.breakout_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Donchian_Period:{self.period}_Breakout_Signal'
         if append:
             if ta_indicator_value:
@@ -6596,7 +6739,7 @@ class DonchianChannelStrategies:
             self.compute_values(df)
         cond_bull = ((df['Close'] - self.lower) / self.lower) <= self.tolerance
         cond_bear = ((self.upper - df['Close']) / self.upper) <= self.tolerance
-        signals = pd.Series(np.select([cond_bull, cond_bear], [1, -1], default=0), index=df.index)
+        signals = pd.Series(np.select([cond_bull, cond_bear], [1, -1], default=0), index=df.index, dtype=np.int8)
         return signals
 
     def bounce_map(self, series):
@@ -6606,11 +6749,11 @@ class DonchianChannelStrategies:
             -1: f'Price is near the upper channel boundary, suggesting potential bearish reversal from overbought conditions.',
             0: 'Price is not at the boundaries, indicating neutral bounce conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_bounce_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_bounce_strategy(df)
-        value, explanation = self.bounce_map(score)
+        value, explanation = self.bounce_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Donchian_Period:{self.period}_Bounce_Signal'
         if append:
             if ta_indicator_value:
@@ -6640,7 +6783,7 @@ class DonchianChannelStrategies:
     def calculate_scores_trend_strategy(self, df):
         if self.midline is None:
             self.compute_values(df)
-        signals = pd.Series(np.where(df['Close'] > self.midline, 1, np.where(df['Close'] < self.midline, -1, 0)), index=df.index)
+        signals = pd.Series(np.where(df['Close'] > self.midline, 1, np.where(df['Close'] < self.midline, -1, 0)), index=df.index, dtype=np.int8)
         return signals
 
     def trend_map(self, series):
@@ -6650,11 +6793,11 @@ class DonchianChannelStrategies:
             -1: 'Price is below the midline of the channel, indicating an overall downward trend.',
             0: 'Price is exactly at the midline, indicating a neutral trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_trend_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_trend_strategy(df)
-        value, explanation = self.trend_map(score)
+        value, explanation = self.trend_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Donchian_Period:{self.period}_Trend_Signal'
         if append:
             if ta_indicator_value:
@@ -6696,12 +6839,7 @@ class DoubleExponentialMovingAverageStrategies:
         self.dema = None
 
     def _compute_ema(self, values):
-        alpha = 2 / (self.period + 1)
-        ema = np.empty(len(values))
-        ema[0] = values[0]
-        for i in range(1, len(values)):
-            ema[i] = alpha * values[i] + (1 - alpha) * ema[i - 1]
-        return ema
+        return ema_filter(values, self.period)
 
     def compute_values(self, df):
         prices = df['Close'].values.astype(float)
@@ -6719,7 +6857,7 @@ class DoubleExponentialMovingAverageStrategies:
         dema_prev = dema_series.shift(1)
         cond_bull = (close_prev <= dema_prev) & (close > dema_series)
         cond_bear = (close_prev >= dema_prev) & (close < dema_series)
-        signals = pd.Series(np.select([cond_bull, cond_bear], [1, -1], default=0), index=df.index)
+        signals = pd.Series(np.select([cond_bull, cond_bear], [1, -1], default=0), index=df.index, dtype=np.int8)
         return signals
 
     def price_cross_map(self, series):
@@ -6729,11 +6867,11 @@ class DoubleExponentialMovingAverageStrategies:
             -1: 'Price has crossed below the DEMA, indicating a bearish trend reversal.',
             0: 'Price remains on the same side of the DEMA, indicating no significant crossover.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'DEMA_Period:{self.period}_PriceCross_Signal'
         if append:
             if ta_indicator_value:
@@ -6761,7 +6899,7 @@ class DoubleExponentialMovingAverageStrategies:
             self.compute_values(df)
         dema_series = pd.Series(self.dema, index=df.index)
         diff = dema_series.diff()
-        signals = pd.Series(np.where(diff > 0, 1, np.where(diff < 0, -1, 0)), index=df.index)
+        signals = pd.Series(np.where(diff > 0, 1, np.where(diff < 0, -1, 0)), index=df.index, dtype=np.int8)
         return signals
 
     def slope_map(self, series):
@@ -6771,11 +6909,11 @@ class DoubleExponentialMovingAverageStrategies:
             -1: 'DEMA is falling, suggesting downward momentum.',
             0: 'DEMA remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'DEMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -6806,7 +6944,7 @@ class DoubleExponentialMovingAverageStrategies:
         distance = (close - dema_series) / dema_series
         cond_bull = distance > self.distance_threshold
         cond_bear = distance < -self.distance_threshold
-        signals = pd.Series(np.select([cond_bull, cond_bear], [1, -1], default=0), index=df.index)
+        signals = pd.Series(np.select([cond_bull, cond_bear], [1, -1], default=0), index=df.index, dtype=np.int8)
         return signals
 
     def distance_map(self, series):
@@ -6816,11 +6954,11 @@ class DoubleExponentialMovingAverageStrategies:
             -1: f'Price is below the DEMA by more than {self.distance_threshold*100:.1f}%, indicating strong bearish momentum.',
             0: f'Price is within {self.distance_threshold*100:.1f}% of the DEMA, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_distance_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_distance_strategy(df)
-        value, explanation = self.distance_map(score)
+        value, explanation = self.distance_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'DEMA_Period:{self.period}_Distance_Signal'
         if append:
             if ta_indicator_value:
@@ -6858,19 +6996,7 @@ class EhlersSuperSmootherFilterStrategies:
         self.filter = None
 
     def compute_values(self, df):
-        prices = df['Close'].values.astype(float)
-        N = len(prices)
-        result = np.empty(N)
-        a = np.exp(-1.414 * np.pi / self.period)
-        b = 2 * a * np.cos(1.414 * np.pi / self.period)
-        c2 = b
-        c3 = -a * a
-        c1 = 1 - c2 - c3
-        result[0] = prices[0]
-        if N > 1:
-            result[1] = prices[1]
-        for i in range(2, N):
-            result[i] = c1 * (prices[i] + prices[i-1]) / 2 + c2 * result[i-1] + c3 * result[i-2]
+        result = super_smoother_filter(df['Close'].values, self.period)
         self.filter = result
         return pd.Series(result, index=df.index)
 
@@ -6883,7 +7009,7 @@ class EhlersSuperSmootherFilterStrategies:
         filter_prev = filter_series.shift(1)
         cond_bull = (price_prev <= filter_prev) & (price > filter_series)
         cond_bear = (price_prev >= filter_prev) & (price < filter_series)
-        signals = pd.Series(np.select([cond_bull, cond_bear], [1, -1], default=0), index=df.index)
+        signals = pd.Series(np.select([cond_bull, cond_bear], [1, -1], default=0), index=df.index, dtype=np.int8)
         return signals
 
     def price_cross_map(self, series):
@@ -6893,11 +7019,11 @@ class EhlersSuperSmootherFilterStrategies:
             -1: 'Price has crossed below the Super Smoother Filter, indicating a bearish reversal.',
             0: 'No price crossover detected relative to the Super Smoother Filter.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SSSF_Period:{self.period}_PriceCross_Signal'
         if append:
             if ta_indicator_value:
@@ -6925,7 +7051,7 @@ class EhlersSuperSmootherFilterStrategies:
             self.compute_values(df)
         filter_series = pd.Series(self.filter, index=df.index)
         diff = filter_series.diff()
-        signals = pd.Series(np.where(diff > 0, 1, np.where(diff < 0, -1, 0)), index=df.index)
+        signals = pd.Series(np.where(diff > 0, 1, np.where(diff < 0, -1, 0)), index=df.index, dtype=np.int8)
         return signals
 
     def slope_map(self, series):
@@ -6935,11 +7061,11 @@ class EhlersSuperSmootherFilterStrategies:
             -1: 'The Super Smoother Filter is falling, indicating strengthening bearish momentum.',
             0: 'The Super Smoother Filter is unchanged, indicating a neutral trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SSSF_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -6970,7 +7096,7 @@ class EhlersSuperSmootherFilterStrategies:
         distance = (price - filter_series) / filter_series
         cond_bull = distance > self.distance_threshold
         cond_bear = distance < -self.distance_threshold
-        signals = pd.Series(np.select([cond_bull, cond_bear], [1, -1], default=0), index=df.index)
+        signals = pd.Series(np.select([cond_bull, cond_bear], [1, -1], default=0), index=df.index, dtype=np.int8)
         return signals
 
     def distance_map(self, series):
@@ -6980,11 +7106,11 @@ class EhlersSuperSmootherFilterStrategies:
             -1: f'Price is more than {self.distance_threshold*100:.1f}% below the Super Smoother Filter, indicating strong bearish momentum.',
             0: f'Price is within {self.distance_threshold*100:.1f}% of the Super Smoother Filter, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_distance_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_distance_strategy(df)
-        value, explanation = self.distance_map(score)
+        value, explanation = self.distance_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SSSF_Period:{self.period}_Distance_Signal'
         if append:
             if ta_indicator_value:
@@ -7045,7 +7171,7 @@ class ElderRayIndexStrategies:
         ema_prev = ema_series.shift(1)
         cond_bull = (price_prev <= ema_prev) & (price > ema_series)
         cond_bear = (price_prev >= ema_prev) & (price < ema_series)
-        signals = pd.Series(np.select([cond_bull, cond_bear], [1, -1], default=0), index=df.index)
+        signals = pd.Series(np.select([cond_bull, cond_bear], [1, -1], default=0), index=df.index, dtype=np.int8)
         return signals
 
     def price_cross_map(self, series):
@@ -7055,11 +7181,11 @@ class ElderRayIndexStrategies:
             -1: 'Price has crossed below the EMA, indicating a bearish trend reversal.',
             0: 'Price remains on the same side of the EMA, indicating no significant crossover.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ElderRay_Period:{self.period}_PriceCross_Signal'
         if append:
             if ta_indicator_value:
@@ -7086,7 +7212,7 @@ class ElderRayIndexStrategies:
         if self.bull_power is None or self.bear_power is None:
             self.compute_values(df)
         diff = self.bull_power + self.bear_power
-        signals = pd.Series(np.where(diff > 0, 1, np.where(diff < 0, -1, 0)), index=df.index)
+        signals = pd.Series(np.where(diff > 0, 1, np.where(diff < 0, -1, 0)), index=df.index, dtype=np.int8)
         return signals
 
     def differential_map(self, series):
@@ -7096,11 +7222,11 @@ class ElderRayIndexStrategies:
             -1: 'The average of the high and low is below the EMA, indicating that selling pressure dominates.',
             0: 'Buying and selling pressures are balanced.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_differential_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_differential_strategy(df)
-        value, explanation = self.differential_map(score)
+        value, explanation = self.differential_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ElderRay_Period:{self.period}_Differential_Signal'
         if append:
             if ta_indicator_value:
@@ -7131,7 +7257,7 @@ class ElderRayIndexStrategies:
         if self.ema is None:
             self.compute_values(df)
         diff = self.ema.diff()
-        signals = pd.Series(np.where(diff > 0, 1, np.where(diff < 0, -1, 0)), index=df.index)
+        signals = pd.Series(np.where(diff > 0, 1, np.where(diff < 0, -1, 0)), index=df.index, dtype=np.int8)
         return signals
 
     def ema_slope_map(self, series):
@@ -7141,11 +7267,11 @@ class ElderRayIndexStrategies:
             -1: 'The EMA is falling, indicating an overall bearish trend.',
             0: 'The EMA remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_ema_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_ema_slope_strategy(df)
-        value, explanation = self.ema_slope_map(score)
+        value, explanation = self.ema_slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ElderRay_Period:{self.period}_EMASlope_Signal'
         if append:
             if ta_indicator_value:
@@ -7199,7 +7325,7 @@ class EldersForceIndexStrategies:
         cond_bull = (efi_prev <= self.baseline) & (self.efi > self.baseline)
         cond_bear = (efi_prev >= self.baseline) & (self.efi < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'EFI_Above_Zero', -1: 'EFI_Below_Zero', 0: 'EFI_Neutral'}
@@ -7208,11 +7334,11 @@ class EldersForceIndexStrategies:
             -1: f'EFI crossed below zero, indicating bearish momentum.',
             0: 'EFI remains around zero, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'EFI_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -7240,7 +7366,7 @@ class EldersForceIndexStrategies:
         cond_bull = self.efi < self.lower_threshold
         cond_bear = self.efi > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'EFI_Undersold', -1: 'EFI_Overextended', 0: 'EFI_Neutral'}
@@ -7249,11 +7375,11 @@ class EldersForceIndexStrategies:
             -1: f'EFI is above the upper threshold of {self.upper_threshold}, suggesting overextended bullish conditions and a potential bearish reversal.',
             0: 'EFI is within the threshold range, indicating balanced market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'EFI_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -7280,7 +7406,7 @@ class EldersForceIndexStrategies:
             self.efi = self.compute_values(df)
         diff = self.efi.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'EFI_Rising', -1: 'EFI_Falling', 0: 'EFI_Unchanged'}
@@ -7289,11 +7415,11 @@ class EldersForceIndexStrategies:
             -1: 'EFI is falling, indicating increasing bearish momentum.',
             0: 'EFI remains unchanged, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'EFI_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -7355,7 +7481,7 @@ class EldersThermometerStrategies:
         cond_bull = (thermo_prev <= self.baseline) & (self.thermo > self.baseline)
         cond_bear = (thermo_prev >= self.baseline) & (self.thermo < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Thermo_Cross_Above', -1: 'Thermo_Cross_Below', 0: 'Thermo_Neutral'}
@@ -7364,11 +7490,11 @@ class EldersThermometerStrategies:
             -1: f'Thermometer crossed below the baseline of {self.baseline}, indicating a bearish shift.',
             0: f'Thermometer remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Thermo_SP:{self.short_period}_LP:{self.long_period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -7396,7 +7522,7 @@ class EldersThermometerStrategies:
         cond_bull = self.thermo < self.lower_threshold
         cond_bear = self.thermo > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Thermo_Oversold', -1: 'Thermo_Overheated', 0: 'Thermo_Neutral'}
@@ -7405,11 +7531,11 @@ class EldersThermometerStrategies:
             -1: f'Thermometer is above the upper threshold of {self.upper_threshold}, suggesting overheated conditions and a potential bearish reversal.',
             0: f'Thermometer is within the thresholds, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Thermo_SP:{self.short_period}_LP:{self.long_period}_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -7436,7 +7562,7 @@ class EldersThermometerStrategies:
             self.compute_values(df)
         diff = self.thermo.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Thermo_Rising', -1: 'Thermo_Falling', 0: 'Thermo_Unchanged'}
@@ -7445,11 +7571,11 @@ class EldersThermometerStrategies:
             -1: 'Thermometer is falling, indicating strengthening bearish momentum.',
             0: 'Thermometer remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Thermo_SP:{self.short_period}_LP:{self.long_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -7510,7 +7636,7 @@ class ElasticVolumeMovingAverageStrategies:
         cond_bull = (close_prev <= evma_prev) & (df['Close'] > self.evma)
         cond_bear = (close_prev >= evma_prev) & (df['Close'] < self.evma)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'Price_Above_EVMA', -1: 'Price_Below_EVMA', 0: 'Price_Neutral'}
@@ -7519,11 +7645,11 @@ class ElasticVolumeMovingAverageStrategies:
             -1: 'The closing price has crossed below the Elastic Volume Moving Average, indicating bearish momentum.',
             0: 'No significant price crossover with the Elastic Volume Moving Average detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'EVMA_Period:{self.period}_PriceCross_Signal'
         if append:
             if ta_indicator_value:
@@ -7552,7 +7678,7 @@ class ElasticVolumeMovingAverageStrategies:
         cond_bull = divergence < self.lower_threshold
         cond_bear = divergence > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Undersold', -1: 'Price_Overextended', 0: 'Price_Normal'}
@@ -7561,11 +7687,11 @@ class ElasticVolumeMovingAverageStrategies:
             -1: f'The closing price is significantly above the Elastic Volume Moving Average (by more than {self.upper_threshold*100:.1f}%), suggesting a potential bearish reversal.',
             0: 'The closing price is within a normal range relative to the Elastic Volume Moving Average.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'EVMA_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -7592,7 +7718,7 @@ class ElasticVolumeMovingAverageStrategies:
             self.compute_values(df)
         diff = self.evma.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'EVMA_Rising', -1: 'EVMA_Falling', 0: 'EVMA_Unchanged'}
@@ -7601,11 +7727,11 @@ class ElasticVolumeMovingAverageStrategies:
             -1: 'The Elastic Volume Moving Average is falling, indicating increasing bearish momentum.',
             0: 'The Elastic Volume Moving Average is unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'EVMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -7684,7 +7810,7 @@ class ElasticVolumeMACDStrategies:
         cond_bull = (macd_prev <= signal_prev) & (self.macd_line > self.signal_line)
         cond_bear = (macd_prev >= signal_prev) & (self.macd_line < self.signal_line)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'MACD_Cross_Above', -1: 'MACD_Cross_Below', 0: 'MACD_Cross_Neutral'}
@@ -7693,11 +7819,11 @@ class ElasticVolumeMACDStrategies:
             -1: 'MACD line crossed below the signal line, indicating a bearish momentum shift.',
             0: 'No significant crossover between MACD and signal line.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'EVMACD_F:{self.fast_period}_S:{self.slow_period}_Sig:{self.signal_period}_PriceCross'
         if append:
             if ta_indicator_value:
@@ -7730,7 +7856,7 @@ class ElasticVolumeMACDStrategies:
         cond_bull = self.histogram > self.histogram_upper
         cond_bear = self.histogram < self.histogram_lower
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Histogram_High', -1: 'Histogram_Low', 0: 'Histogram_Normal'}
@@ -7739,11 +7865,11 @@ class ElasticVolumeMACDStrategies:
             -1: f'MACD histogram is below {self.histogram_lower}, indicating strong bearish momentum.',
             0: 'MACD histogram is within normal range, indicating balanced momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'EVMACD_F:{self.fast_period}_S:{self.slow_period}_HistThreshold'
         if append:
             if ta_indicator_value:
@@ -7771,7 +7897,7 @@ class ElasticVolumeMACDStrategies:
             self.compute_values(df)
         diff = self.macd_line.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'MACD_Rising', -1: 'MACD_Falling', 0: 'MACD_Unchanged'}
@@ -7780,11 +7906,11 @@ class ElasticVolumeMACDStrategies:
             -1: 'MACD line is falling, indicating increasing bearish momentum.',
             0: 'MACD line remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'EVMACD_F:{self.fast_period}_S:{self.slow_period}_Slope'
         if append:
             if ta_indicator_value:
@@ -7838,7 +7964,7 @@ class ExponentialMovingAverageStrategies:
         cond_bull = (close_prev <= ema_prev) & (df['Close'] > self.ema)
         cond_bear = (close_prev >= ema_prev) & (df['Close'] < self.ema)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'Price_Above_EMA', -1: 'Price_Below_EMA', 0: 'Price_Neutral'}
@@ -7847,11 +7973,11 @@ class ExponentialMovingAverageStrategies:
             -1: 'The price has crossed below the EMA, suggesting a bearish trend.',
             0: 'No price crossover detected relative to the EMA.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'EMA_Period:{self.period}_PriceCross'
         if append:
             if ta_indicator_value:
@@ -7880,7 +8006,7 @@ class ExponentialMovingAverageStrategies:
         cond_bull = divergence < self.lower_threshold
         cond_bear = divergence > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Undersold', -1: 'Price_Overextended', 0: 'Price_Normal'}
@@ -7889,11 +8015,11 @@ class ExponentialMovingAverageStrategies:
             -1: f'The price is significantly above the EMA (by more than {self.upper_threshold*100:.1f}%), indicating potential overextension and a bearish reversal.',
             0: 'The price is close to the EMA, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'EMA_Period:{self.period}_Threshold'
         if append:
             if ta_indicator_value:
@@ -7920,7 +8046,7 @@ class ExponentialMovingAverageStrategies:
             self.compute_values(df)
         diff = self.ema.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'EMA_Rising', -1: 'EMA_Falling', 0: 'EMA_Unchanged'}
@@ -7929,11 +8055,11 @@ class ExponentialMovingAverageStrategies:
             -1: 'The EMA is falling, indicating downward momentum.',
             0: 'The EMA is stable, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'EMA_Period:{self.period}_Slope'
         if append:
             if ta_indicator_value:
@@ -7988,7 +8114,7 @@ class FibonacciPivotPointsStrategies:
         cond_bull = (close_prev <= pivot) & (close_curr > pivot)
         cond_bear = (close_prev >= pivot) & (close_curr < pivot)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def pivot_cross_map(self, series):
         mapping_value = {1: 'Price_Above_Pivot', -1: 'Price_Below_Pivot', 0: 'Pivot_Neutral'}
@@ -7997,11 +8123,11 @@ class FibonacciPivotPointsStrategies:
             -1: 'Price crossed below the pivot point, indicating bearish momentum.',
             0: 'Price remains around the pivot, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_pivot_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_pivot_cross_strategy(df)
-        value, explanation = self.pivot_cross_map(score)
+        value, explanation = self.pivot_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'FibPivot_PivotCross'
         if append:
             if ta_indicator_value:
@@ -8034,7 +8160,7 @@ class FibonacciPivotPointsStrategies:
         cond_bull = (close_prev < S1) & (close_curr > S1)
         cond_bear = (close_prev > R1) & (close_curr < R1)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def fib_bounce_map(self, series):
         mapping_value = {1: 'Bounce_From_Support', -1: 'Rejection_From_Resistance', 0: 'Bounce_Neutral'}
@@ -8043,11 +8169,11 @@ class FibonacciPivotPointsStrategies:
             -1: 'Price was rejected at the resistance level (R1), indicating a potential bearish reversal.',
             0: 'No significant bounce observed at key Fibonacci levels.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_fib_bounce_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_fib_bounce_strategy(df)
-        value, explanation = self.fib_bounce_map(score)
+        value, explanation = self.fib_bounce_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'FibPivot_FibBounce'
         if append:
             if ta_indicator_value:
@@ -8081,7 +8207,7 @@ class FibonacciPivotPointsStrategies:
         cond_bear = close > R2
         cond_bull = close < S2
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def fib_zone_map(self, series):
         mapping_value = {1: 'Oversold_Zone', -1: 'Overbought_Zone', 0: 'Zone_Neutral'}
@@ -8090,11 +8216,11 @@ class FibonacciPivotPointsStrategies:
             -1: 'Price is in the upper zone above R2, indicating overbought conditions and a potential bearish reversal.',
             0: 'Price is within a neutral zone between key Fibonacci levels.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_fib_zone_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_fib_zone_strategy(df)
-        value, explanation = self.fib_zone_map(score)
+        value, explanation = self.fib_zone_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'FibPivot_FibZone'
         if append:
             if ta_indicator_value:
@@ -8144,12 +8270,9 @@ class FibonacciWeightedMovingAverageStrategies:
             else:
                 fib_sequence.append(fib_sequence[-1] + fib_sequence[-2])
         total_weight = sum(fib_sequence)
-        fwma_list = [np.nan] * (self.period - 1)
-        for i in range(self.period - 1, len(prices)):
-            window = prices.iloc[i - self.period + 1:i + 1].tolist()
-            weighted_sum = sum(fib_sequence[j] * window[j] for j in range(self.period))
-            fwma_list.append(weighted_sum / total_weight)
-        self.fwma = pd.Series(fwma_list, index=df.index)
+        fwma = np.full(len(prices), np.nan)
+        fwma[self.period - 1:] = weighted_window_sums(prices.to_numpy(), fib_sequence) / total_weight
+        self.fwma = pd.Series(fwma, index=df.index)
         return self.fwma
 
     def calculate_scores_price_cross_strategy(self, df):
@@ -8160,7 +8283,7 @@ class FibonacciWeightedMovingAverageStrategies:
         cond_bull = (close_prev <= fwma_prev) & (df['Close'] > self.fwma)
         cond_bear = (close_prev >= fwma_prev) & (df['Close'] < self.fwma)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'Price_Above_FWMA', -1: 'Price_Below_FWMA', 0: 'Price_Neutral'}
@@ -8169,11 +8292,11 @@ class FibonacciWeightedMovingAverageStrategies:
             -1: 'The closing price crossed below the Fibonacci Weighted Moving Average, indicating bearish momentum.',
             0: 'No significant price crossover relative to the Fibonacci Weighted Moving Average.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'FWMA_Period:{self.period}_PriceCross'
         if append:
             if ta_indicator_value:
@@ -8203,7 +8326,7 @@ class FibonacciWeightedMovingAverageStrategies:
         cond_bull = divergence < self.lower_threshold
         cond_bear = divergence > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Undersold', -1: 'Price_Overextended', 0: 'Price_Normal'}
@@ -8212,11 +8335,11 @@ class FibonacciWeightedMovingAverageStrategies:
             -1: f'The closing price is significantly above the Fibonacci Weighted Moving Average (by more than {self.upper_threshold*100:.1f}%), suggesting bearish reversal.',
             0: 'The closing price is close to the Fibonacci Weighted Moving Average, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'FWMA_Period:{self.period}_Threshold'
         if append:
             if ta_indicator_value:
@@ -8244,7 +8367,7 @@ class FibonacciWeightedMovingAverageStrategies:
             self.compute_values(df)
         diff = self.fwma.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'FWMA_Rising', -1: 'FWMA_Falling', 0: 'FWMA_Unchanged'}
@@ -8253,11 +8376,11 @@ class FibonacciWeightedMovingAverageStrategies:
             -1: 'The Fibonacci Weighted Moving Average is falling, indicating bearish momentum.',
             0: 'The Fibonacci Weighted Moving Average remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'FWMA_Period:{self.period}_Slope'
         if append:
             if ta_indicator_value:
@@ -8308,7 +8431,7 @@ class FiniteVolumeElementStrategies:
         cond_bull = (fve_prev <= 0) & (self.fve > 0)
         cond_bear = (fve_prev >= 0) & (self.fve < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'FVE_Cross_Above_Zero', -1: 'FVE_Cross_Below_Zero', 0: 'FVE_Zero_Neutral'}
@@ -8317,11 +8440,11 @@ class FiniteVolumeElementStrategies:
             -1: 'The Finite Volume Element has crossed below zero, indicating a shift to bearish momentum.',
             0: 'No significant zero crossing detected in the Finite Volume Element.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'FVE_Period:{self.period}_ZeroCross'
         if append:
             if ta_indicator_value:
@@ -8349,7 +8472,7 @@ class FiniteVolumeElementStrategies:
         cond_bull = self.fve > self.upper_threshold
         cond_bear = self.fve < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'FVE_Above_Threshold', -1: 'FVE_Below_Threshold', 0: 'FVE_Within_Threshold'}
@@ -8358,11 +8481,11 @@ class FiniteVolumeElementStrategies:
             -1: f'The Finite Volume Element is below {self.lower_threshold}, indicating strong bearish momentum.',
             0: 'The Finite Volume Element is within the defined thresholds, suggesting neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'FVE_Period:{self.period}_Threshold'
         if append:
             if ta_indicator_value:
@@ -8389,7 +8512,7 @@ class FiniteVolumeElementStrategies:
             self.compute_values(df)
         diff = self.fve.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'FVE_Rising', -1: 'FVE_Falling', 0: 'FVE_Unchanged'}
@@ -8398,11 +8521,11 @@ class FiniteVolumeElementStrategies:
             -1: 'The Finite Volume Element is falling, indicating increasing bearish momentum.',
             0: 'The Finite Volume Element remains unchanged, suggesting neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'FVE_Period:{self.period}_Slope'
         if append:
             if ta_indicator_value:
@@ -8457,7 +8580,7 @@ class FisherTransformStrategies:
         cond_bull = (fisher_prev <= 0) & (self.fisher > 0)
         cond_bear = (fisher_prev >= 0) & (self.fisher < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def fisher_cross_map(self, series):
         mapping_value = {1: 'Fisher_Cross_Above_Zero', -1: 'Fisher_Cross_Below_Zero', 0: 'Fisher_Neutral'}
@@ -8466,11 +8589,11 @@ class FisherTransformStrategies:
             -1: 'Fisher Transform crossed below zero, indicating potential bearish reversal.',
             0: 'No significant zero crossing in the Fisher Transform.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.fisher_cross_map(score)
+        value, explanation = self.fisher_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Fisher_Period:{self.period}_ZeroCross'
         if append:
             if ta_indicator_value:
@@ -8499,7 +8622,7 @@ class FisherTransformStrategies:
         cond_bull = self.fisher < self.lower_threshold
         cond_bear = self.fisher > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Fisher_Oversold', -1: 'Fisher_Overbought', 0: 'Fisher_Normal'}
@@ -8508,11 +8631,11 @@ class FisherTransformStrategies:
             -1: f'Fisher Transform is above {self.upper_threshold}, indicating overbought conditions and a potential bearish reversal.',
             0: 'Fisher Transform is within normal range, suggesting balanced market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Fisher_Period:{self.period}_Threshold'
         if append:
             if ta_indicator_value:
@@ -8540,7 +8663,7 @@ class FisherTransformStrategies:
             self.compute_values(df)
         diff = self.fisher.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Fisher_Rising', -1: 'Fisher_Falling', 0: 'Fisher_Unchanged'}
@@ -8549,11 +8672,11 @@ class FisherTransformStrategies:
             -1: 'Fisher Transform is falling, indicating strengthening bearish momentum.',
             0: 'Fisher Transform remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Fisher_Period:{self.period}_Slope'
         if append:
             if ta_indicator_value:
@@ -8602,7 +8725,7 @@ class ForceIndexStrategies:
         cond_bull = (force_prev <= 0) & (self.force_index > 0)
         cond_bear = (force_prev >= 0) & (self.force_index < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'ForceIndex_Cross_Above_Zero', -1: 'ForceIndex_Cross_Below_Zero', 0: 'ForceIndex_Zero_Neutral'}
@@ -8611,11 +8734,11 @@ class ForceIndexStrategies:
             -1: 'The Force Index crossed below zero, indicating a shift to bearish momentum.',
             0: 'No significant zero crossing in the Force Index, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ForceIndex_ZeroCross'
         if append:
             if ta_indicator_value:
@@ -8644,7 +8767,7 @@ class ForceIndexStrategies:
         cond_bull = self.force_index > self.upper_threshold
         cond_bear = self.force_index < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'ForceIndex_Above_Threshold', -1: 'ForceIndex_Below_Threshold', 0: 'ForceIndex_Within_Threshold'}
@@ -8653,11 +8776,11 @@ class ForceIndexStrategies:
             -1: f'The Force Index is below {self.lower_threshold}, indicating strong bearish force.',
             0: 'The Force Index is within the defined thresholds, indicating neutral force.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ForceIndex_Threshold'
         if append:
             if ta_indicator_value:
@@ -8685,7 +8808,7 @@ class ForceIndexStrategies:
             self.compute_values(df)
         diff = self.force_index.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'ForceIndex_Rising', -1: 'ForceIndex_Falling', 0: 'ForceIndex_Unchanged'}
@@ -8694,11 +8817,11 @@ class ForceIndexStrategies:
             -1: 'The Force Index is falling, indicating increasing bearish momentum.',
             0: 'The Force Index remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ForceIndex_Slope'
         if append:
             if ta_indicator_value:
@@ -8775,7 +8898,7 @@ class FractalAdaptiveMovingAverageStrategies:
         cond_bull = (close_prev <= frama_prev) & (df['Close'] > self.frama)
         cond_bear = (close_prev >= frama_prev) & (df['Close'] < self.frama)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'Price_Above_FRAMA', -1: 'Price_Below_FRAMA', 0: 'Price_Neutral'}
@@ -8784,11 +8907,11 @@ class FractalAdaptiveMovingAverageStrategies:
             -1: 'Price crossed below the Fractal Adaptive Moving Average, indicating a bearish shift.',
             0: 'No significant price crossover relative to the FRAMA.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'FRAMA_Period:{self.period}_PriceCross'
         if append:
             if ta_indicator_value:
@@ -8818,7 +8941,7 @@ class FractalAdaptiveMovingAverageStrategies:
         cond_bull = divergence < self.divergence_lower_threshold
         cond_bear = divergence > self.divergence_upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Undersold', -1: 'Price_Overextended', 0: 'Price_Normal'}
@@ -8827,11 +8950,11 @@ class FractalAdaptiveMovingAverageStrategies:
             -1: 'Price is significantly above the FRAMA, suggesting overvalued conditions and a potential bearish reversal.',
             0: 'Price is close to the FRAMA, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'FRAMA_Period:{self.period}_Threshold'
         if append:
             if ta_indicator_value:
@@ -8859,7 +8982,7 @@ class FractalAdaptiveMovingAverageStrategies:
             self.compute_values(df)
         diff = self.frama.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'FRAMA_Rising', -1: 'FRAMA_Falling', 0: 'FRAMA_Unchanged'}
@@ -8868,11 +8991,11 @@ class FractalAdaptiveMovingAverageStrategies:
             -1: 'FRAMA is falling, indicating increasing bearish momentum.',
             0: 'FRAMA remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'FRAMA_Period:{self.period}_Slope'
         if append:
             if ta_indicator_value:
@@ -8912,18 +9035,7 @@ class GannHighLowActivatorStrategies:
         self.activator = None
 
     def compute_values(self, df):
-        activator = []
-        for i in range(len(df)):
-            if i == 0:
-                activator.append(df['Close'].iloc[i])
-            else:
-                if df['Close'].iloc[i] > activator[i - 1]:
-                    new_val = min(df['Low'].iloc[i], activator[i - 1])
-                elif df['Close'].iloc[i] < activator[i - 1]:
-                    new_val = max(df['High'].iloc[i], activator[i - 1])
-                else:
-                    new_val = activator[i - 1]
-                activator.append(new_val)
+        activator = gann_activator(df['Close'].values, df['High'].values, df['Low'].values)
         self.activator = pd.Series(activator, index=df.index)
         return self.activator
 
@@ -8935,7 +9047,7 @@ class GannHighLowActivatorStrategies:
         cond_bull = (close_prev <= activator_prev) & (df['Close'] > self.activator)
         cond_bear = (close_prev >= activator_prev) & (df['Close'] < self.activator)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Above_Activator', -1: 'Price_Below_Activator', 0: 'Activator_Neutral'}
@@ -8944,11 +9056,11 @@ class GannHighLowActivatorStrategies:
             -1: 'Price crossed below the Gann High Low Activator, indicating bearish momentum.',
             0: 'No significant crossover relative to the activator.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'GannHLActivator_ZeroCross'
         if append:
             if ta_indicator_value:
@@ -8978,7 +9090,7 @@ class GannHighLowActivatorStrategies:
         cond_bull = divergence > self.divergence_upper_threshold
         cond_bear = divergence < self.divergence_lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Significantly_Above', -1: 'Price_Significantly_Below', 0: 'Price_Near_Activator'}
@@ -8987,11 +9099,11 @@ class GannHighLowActivatorStrategies:
             -1: f'Price is significantly below the activator (by more than {abs(self.divergence_lower_threshold) * 100:.1f}%), indicating strong bearish conditions.',
             0: 'Price is close to the activator, suggesting neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'GannHLActivator_Threshold'
         if append:
             if ta_indicator_value:
@@ -9019,7 +9131,7 @@ class GannHighLowActivatorStrategies:
             self.compute_values(df)
         diff = self.activator.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Activator_Rising', -1: 'Activator_Falling', 0: 'Activator_Unchanged'}
@@ -9028,11 +9140,11 @@ class GannHighLowActivatorStrategies:
             -1: 'The activator is falling, suggesting a weakening trend or potential reversal.',
             0: 'The activator remains unchanged, indicating neutral trend conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'GannHLActivator_Slope'
         if append:
             if ta_indicator_value:
@@ -9082,7 +9194,7 @@ class HighLowAverageStrategies:
         cond_bull = (close_prev <= hla_prev) & (df['Close'] > self.hla)
         cond_bear = (close_prev >= hla_prev) & (df['Close'] < self.hla)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'Price_Above_HLA', -1: 'Price_Below_HLA', 0: 'HLA_Neutral'}
@@ -9091,11 +9203,11 @@ class HighLowAverageStrategies:
             -1: 'Price crossed below the HighLowAverage, indicating bearish momentum.',
             0: 'No significant price crossover relative to the HighLowAverage.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HLA_PriceCross'
         if append:
             if ta_indicator_value:
@@ -9125,7 +9237,7 @@ class HighLowAverageStrategies:
         cond_bull = divergence < self.lower_threshold
         cond_bear = divergence > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Undersold', -1: 'Price_Overextended', 0: 'Price_Normal'}
@@ -9134,11 +9246,11 @@ class HighLowAverageStrategies:
             -1: 'Price is significantly above the HighLowAverage, indicating potential bearish reversal.',
             0: 'Price is close to the HighLowAverage, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HLA_Threshold'
         if append:
             if ta_indicator_value:
@@ -9166,7 +9278,7 @@ class HighLowAverageStrategies:
             self.compute_values(df)
         diff = self.hla.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'HLA_Rising', -1: 'HLA_Falling', 0: 'HLA_Unchanged'}
@@ -9175,11 +9287,11 @@ class HighLowAverageStrategies:
             -1: 'The HighLowAverage is falling, indicating bearish momentum.',
             0: 'The HighLowAverage remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HLA_Slope'
         if append:
             if ta_indicator_value:
@@ -9218,8 +9330,11 @@ class HilbertTransformDominantCyclePeriodStrategies:
         self.upper_threshold = upper_threshold
         self.htdcp = None
 
+    def required_primitives(self):
+        return [('STD', 'Close', self.period, 1)]
+
     def compute_values(self, df):
-        self.htdcp = df['Close'].rolling(window=self.period, min_periods=1).std() * 10 + 10
+        self.htdcp = frame_primitives(self, df).get(('STD', 'Close', self.period, 1)) * 10 + 10
         return self.htdcp
 
     def calculate_scores_baseline_strategy(self, df):
@@ -9229,7 +9344,7 @@ class HilbertTransformDominantCyclePeriodStrategies:
         cond_bull = (htdcp_prev >= self.baseline) & (self.htdcp < self.baseline)
         cond_bear = (htdcp_prev <= self.baseline) & (self.htdcp > self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def baseline_map(self, series):
         mapping_value = {1: 'HTDCP_Below_Baseline', -1: 'HTDCP_Above_Baseline', 0: 'HTDCP_Neutral'}
@@ -9238,11 +9353,11 @@ class HilbertTransformDominantCyclePeriodStrategies:
             -1: f'HTDCP has crossed above the baseline of {self.baseline}, indicating an expansion of cycle periods and potential bearish conditions.',
             0: f'HTDCP remains near the baseline of {self.baseline}, suggesting neutral cycle conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_baseline_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_baseline_strategy(df)
-        value, explanation = self.baseline_map(score)
+        value, explanation = self.baseline_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'HTDCP_Period:{self.period}_Baseline'
         if append:
             if ta_indicator_value:
@@ -9271,7 +9386,7 @@ class HilbertTransformDominantCyclePeriodStrategies:
         cond_bull = self.htdcp < self.lower_threshold
         cond_bear = self.htdcp > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'HTDCP_Fast_Cycle', -1: 'HTDCP_Slow_Cycle', 0: 'HTDCP_Normal'}
@@ -9280,11 +9395,11 @@ class HilbertTransformDominantCyclePeriodStrategies:
             -1: f'HTDCP is above {self.upper_threshold}, indicating a slow cycle and potential bearish conditions.',
             0: 'HTDCP is within the defined thresholds, suggesting normal cycle conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'HTDCP_Period:{self.period}_Threshold'
         if append:
             if ta_indicator_value:
@@ -9312,7 +9427,7 @@ class HilbertTransformDominantCyclePeriodStrategies:
             self.compute_values(df)
         diff = self.htdcp.diff()
         signals = np.where(diff < 0, 1, np.where(diff > 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'HTDCP_Contracting', -1: 'HTDCP_Expanding', 0: 'HTDCP_Unchanged'}
@@ -9321,11 +9436,11 @@ class HilbertTransformDominantCyclePeriodStrategies:
             -1: 'HTDCP is expanding, suggesting longer cycles and potential bearish conditions.',
             0: 'HTDCP remains unchanged, indicating stable cycle conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'HTDCP_Period:{self.period}_Slope'
         if append:
             if ta_indicator_value:
@@ -9381,7 +9496,7 @@ class HilbertTransformDominantCyclePhaseStrategies:
         cond_bull = (phase_prev <= self.baseline) & (self.phase > self.baseline)
         cond_bear = (phase_prev >= self.baseline) & (self.phase < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def baseline_map(self, series):
         mapping_value = {1: 'Phase_Above_Baseline', -1: 'Phase_Below_Baseline', 0: 'Phase_Neutral'}
@@ -9390,11 +9505,11 @@ class HilbertTransformDominantCyclePhaseStrategies:
             -1: f'The dominant cycle phase has crossed below the baseline of {self.baseline}, suggesting bearish cyclic momentum.',
             0: f'The dominant cycle phase remains around the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_baseline_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_baseline_strategy(df)
-        value, explanation = self.baseline_map(score)
+        value, explanation = self.baseline_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'HTDCP_Phase_Period:{self.period}_Baseline'
         if append:
             if ta_indicator_value:
@@ -9423,7 +9538,7 @@ class HilbertTransformDominantCyclePhaseStrategies:
         cond_bull = self.phase < self.lower_threshold
         cond_bear = self.phase > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Phase_Low', -1: 'Phase_High', 0: 'Phase_Normal'}
@@ -9432,11 +9547,11 @@ class HilbertTransformDominantCyclePhaseStrategies:
             -1: f'The dominant cycle phase is above {self.upper_threshold}, indicating an overbought cyclic condition and potential bearish reversal.',
             0: 'The dominant cycle phase is within normal range, suggesting balanced cycle conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'HTDCP_Phase_Period:{self.period}_Threshold'
         if append:
             if ta_indicator_value:
@@ -9464,7 +9579,7 @@ class HilbertTransformDominantCyclePhaseStrategies:
             self.compute_values(df)
         diff = self.phase.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Phase_Rising', -1: 'Phase_Falling', 0: 'Phase_Unchanged'}
@@ -9473,11 +9588,11 @@ class HilbertTransformDominantCyclePhaseStrategies:
             -1: 'The dominant cycle phase is falling, indicating strengthening bearish cyclic momentum.',
             0: 'The dominant cycle phase remains unchanged, suggesting neutral cyclic conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'HTDCP_Phase_Period:{self.period}_Slope'
         if append:
             if ta_indicator_value:
@@ -9527,7 +9642,7 @@ class HilbertTransformInstantaneousTrendlineStrategies:
         cond_bull = (close_prev <= trend_prev) & (close_current > trend_current)
         cond_bear = (close_prev >= trend_prev) & (close_current < trend_current)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def crossover_map(self, series):
         mapping_value = {1: 'Price_Above_Trendline', -1: 'Price_Below_Trendline', 0: 'No_Crossover'}
@@ -9536,11 +9651,11 @@ class HilbertTransformInstantaneousTrendlineStrategies:
             -1: 'Price crossed below the Hilbert Transform Instantaneous Trendline, indicating a bearish signal.',
             0: 'No significant price crossover detected relative to the trendline.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_crossover_strategy(df)
-        value, explanation = self.crossover_map(score)
+        value, explanation = self.crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HTIT_Crossover_Signal'
         if append:
             if ta_indicator_value:
@@ -9567,7 +9682,7 @@ class HilbertTransformInstantaneousTrendlineStrategies:
             self.compute_values(df)
         slope = self.htit.diff()
         signals = np.where(slope > 0, 1, np.where(slope < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Trend_Rising', -1: 'Trend_Falling', 0: 'Trend_Flat'}
@@ -9576,11 +9691,11 @@ class HilbertTransformInstantaneousTrendlineStrategies:
             -1: 'The instantaneous trendline is falling, indicating bearish momentum.',
             0: 'The instantaneous trendline is flat, indicating no clear momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HTIT_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -9609,7 +9724,7 @@ class HilbertTransformInstantaneousTrendlineStrategies:
         cond_bull = deviation < -self.deviation_threshold
         cond_bear = deviation > self.deviation_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def deviation_map(self, series):
         mapping_value = {1: 'Price_Under_Trendline', -1: 'Price_Over_Trendline', 0: 'Price_Near_Trendline'}
@@ -9618,11 +9733,11 @@ class HilbertTransformInstantaneousTrendlineStrategies:
             -1: f'Price is significantly above the Hilbert Transform Instantaneous Trendline by more than {self.deviation_threshold}%, indicating potential bearish reversal.',
             0: 'Price is within the acceptable range of the trendline, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_deviation_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_deviation_strategy(df)
-        value, explanation = self.deviation_map(score)
+        value, explanation = self.deviation_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HTIT_Deviation_Signal'
         if append:
             if ta_indicator_value:
@@ -9672,7 +9787,7 @@ class HilbertTransformPhasorComponentsStrategies:
         cond_bull = (phase_prev <= self.phase_threshold) & (phase > self.phase_threshold)
         cond_bear = (phase_prev >= self.phase_threshold) & (phase < self.phase_threshold)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def phase_crossover_map(self, series):
         mapping_value = {1: 'Phase_Above_Threshold', -1: 'Phase_Below_Threshold', 0: 'No_Phase_Crossover'}
@@ -9681,11 +9796,11 @@ class HilbertTransformPhasorComponentsStrategies:
             -1: f'Phase angle crossed below the threshold of {self.phase_threshold}°, indicating bearish cyclic momentum.',
             0: f'No phase crossover relative to the threshold of {self.phase_threshold}° detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_phase_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_phase_crossover_strategy(df)
-        value, explanation = self.phase_crossover_map(score)
+        value, explanation = self.phase_crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HTPC_PhaseCrossover_Signal'
         if append:
             if ta_indicator_value:
@@ -9715,7 +9830,7 @@ class HilbertTransformPhasorComponentsStrategies:
         magnitude = np.sqrt(self.I**2 + self.Q**2)
         slope = magnitude.diff()
         signals = np.where(slope > 0, 1, np.where(slope < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def magnitude_slope_map(self, series):
         mapping_value = {1: 'Magnitude_Increasing', -1: 'Magnitude_Decreasing', 0: 'Magnitude_Unchanged'}
@@ -9724,11 +9839,11 @@ class HilbertTransformPhasorComponentsStrategies:
             -1: 'The phasor magnitude is falling, suggesting decreasing cyclic momentum and a bearish signal.',
             0: 'The phasor magnitude remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_magnitude_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_magnitude_slope_strategy(df)
-        value, explanation = self.magnitude_slope_map(score)
+        value, explanation = self.magnitude_slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HTPC_MagnitudeSlope_Signal'
         if append:
             magnitude = np.sqrt(self.I**2 + self.Q**2)
@@ -9781,7 +9896,7 @@ class HilbertTransformSineWaveStrategies:
         cond_bull = (sine_prev <= leadsine_prev) & (self.sine > self.leadsine)
         cond_bear = (sine_prev >= leadsine_prev) & (self.sine < self.leadsine)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def crossover_map(self, series):
         mapping_value = {1: 'Sine_Above_LeadSine', -1: 'Sine_Below_LeadSine', 0: 'No_Crossover'}
@@ -9790,11 +9905,11 @@ class HilbertTransformSineWaveStrategies:
             -1: 'Sine crossed below LeadSine, indicating a bearish shift in the market cycle.',
             0: 'No crossover detected between Sine and LeadSine, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_crossover_strategy(df)
-        value, explanation = self.crossover_map(score)
+        value, explanation = self.crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HTSW_Crossover_Signal'
         if append:
             if ta_indicator_value:
@@ -9823,7 +9938,7 @@ class HilbertTransformSineWaveStrategies:
             self.compute_values(df)
         slope = self.sine.diff()
         signals = np.where(slope > 0, 1, np.where(slope < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Sine_Rising', -1: 'Sine_Falling', 0: 'Sine_Flat'}
@@ -9832,11 +9947,11 @@ class HilbertTransformSineWaveStrategies:
             -1: 'The Sine is falling, indicating increasing bearish cyclic momentum.',
             0: 'The Sine is flat, indicating neutral cyclic momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HTSW_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -9884,7 +9999,7 @@ class HilbertTransformTrendCycleStrategies:
         cond_bull = (price_prev <= cycle_prev) & (price_current > cycle_current)
         cond_bear = (price_prev >= cycle_prev) & (price_current < cycle_current)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def crossover_map(self, series):
         mapping_value = {1: 'Price_Above_TrendCycle', -1: 'Price_Below_TrendCycle', 0: 'No_Crossover'}
@@ -9893,11 +10008,11 @@ class HilbertTransformTrendCycleStrategies:
             -1: 'Price crossed below the Hilbert Transform Trend Cycle, suggesting bearish momentum.',
             0: 'No significant price crossover relative to the Trend Cycle was detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_crossover_strategy(df)
-        value, explanation = self.crossover_map(score)
+        value, explanation = self.crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HTTC_Crossover_Signal'
         if append:
             if ta_indicator_value:
@@ -9924,7 +10039,7 @@ class HilbertTransformTrendCycleStrategies:
             self.compute_values(df)
         slope = pd.Series(self.httc, index=df.index).diff()
         signals = np.where(slope > 0, 1, np.where(slope < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'TrendCycle_Rising', -1: 'TrendCycle_Falling', 0: 'TrendCycle_Flat'}
@@ -9933,11 +10048,11 @@ class HilbertTransformTrendCycleStrategies:
             -1: 'The Trend Cycle is falling, indicating increasing bearish momentum.',
             0: 'The Trend Cycle is flat, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HTTC_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -9966,7 +10081,7 @@ class HilbertTransformTrendCycleStrategies:
         cond_bull = deviation < -self.deviation_threshold
         cond_bear = deviation > self.deviation_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def deviation_map(self, series):
         mapping_value = {1: 'Price_Under_TrendCycle', -1: 'Price_Over_TrendCycle', 0: 'Price_Near_TrendCycle'}
@@ -9975,11 +10090,11 @@ class HilbertTransformTrendCycleStrategies:
             -1: f'Price is significantly above the Trend Cycle by more than {self.deviation_threshold}%, suggesting a potential bearish reversal.',
             0: 'Price is close to the Trend Cycle, indicating balanced market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_deviation_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_deviation_strategy(df)
-        value, explanation = self.deviation_map(score)
+        value, explanation = self.deviation_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HTTC_Deviation_Signal'
         if append:
             if ta_indicator_value:
@@ -10053,7 +10168,7 @@ class HoltWinterChannelStrategies:
         cond_bull = (price_prev < upper_prev) & (price_current >= self.upper_channel)
         cond_bear = (price_prev > lower_prev) & (price_current <= self.lower_channel)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def crossover_map(self, series):
         mapping_value = {1: 'Price_Breakout_Upper', -1: 'Price_Breakout_Lower', 0: 'Price_Within_Channel'}
@@ -10062,11 +10177,11 @@ class HoltWinterChannelStrategies:
             -1: 'Price crossed below the lower Holt-Winters channel, suggesting strong bearish momentum.',
             0: 'Price remains within the channel boundaries, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_crossover_strategy(df)
-        value, explanation = self.crossover_map(score)
+        value, explanation = self.crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HWC_Crossover_Signal'
         if append:
             if ta_indicator_value:
@@ -10098,7 +10213,7 @@ class HoltWinterChannelStrategies:
             self.compute_values(df)
         slope = self.center.diff()
         signals = np.where(slope > 0, 1, np.where(slope < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Channel_Rising', -1: 'Channel_Falling', 0: 'Channel_Flat'}
@@ -10107,11 +10222,11 @@ class HoltWinterChannelStrategies:
             -1: 'The center line of the Holt-Winters channel is falling, indicating a downtrend.',
             0: 'The center line of the Holt-Winters channel is flat, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HWC_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -10141,7 +10256,7 @@ class HoltWinterChannelStrategies:
         cond_bull = deviation < -self.deviation_percent_threshold
         cond_bear = deviation > self.deviation_percent_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def deviation_map(self, series):
         mapping_value = {1: 'Price_Undersold_Relative', -1: 'Price_Overbought_Relative', 0: 'Price_Near_Center'}
@@ -10150,11 +10265,11 @@ class HoltWinterChannelStrategies:
             -1: f'Price is significantly above the center channel by more than {self.deviation_percent_threshold}%, suggesting potential bearish reversal.',
             0: 'Price is near the center channel, indicating balanced market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_deviation_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_deviation_strategy(df)
-        value, explanation = self.deviation_map(score)
+        value, explanation = self.deviation_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HWC_Deviation_Signal'
         if append:
             if ta_indicator_value:
@@ -10219,7 +10334,7 @@ class HoltWinterMovingAverageStrategies:
         cond_bull = (price_prev < hwma_prev) & (price_current >= hwma_current)
         cond_bear = (price_prev > hwma_prev) & (price_current <= hwma_current)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def crossover_map(self, series):
         mapping_value = {1: 'Price_Above_HWMA', -1: 'Price_Below_HWMA', 0: 'Price_Near_HWMA'}
@@ -10228,11 +10343,11 @@ class HoltWinterMovingAverageStrategies:
             -1: 'Price crossed below the Holt-Winters Moving Average, indicating bearish momentum.',
             0: 'Price remains near the Holt-Winters Moving Average, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_crossover_strategy(df)
-        value, explanation = self.crossover_map(score)
+        value, explanation = self.crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HWMA_Crossover_Signal'
         if append:
             if ta_indicator_value:
@@ -10260,7 +10375,7 @@ class HoltWinterMovingAverageStrategies:
             self.compute_values(df)
         slope = self.hwma.diff()
         signals = np.where(slope > 0, 1, np.where(slope < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'HWMA_Rising', -1: 'HWMA_Falling', 0: 'HWMA_Flat'}
@@ -10269,11 +10384,11 @@ class HoltWinterMovingAverageStrategies:
             -1: 'The Holt-Winters Moving Average is falling, suggesting increasing bearish momentum.',
             0: 'The Holt-Winters Moving Average is flat, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HWMA_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -10303,7 +10418,7 @@ class HoltWinterMovingAverageStrategies:
         cond_bull = deviation > self.deviation_percent_threshold
         cond_bear = deviation < -self.deviation_percent_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def deviation_map(self, series):
         mapping_value = {1: 'Price_Above_HWMA', -1: 'Price_Below_HWMA', 0: 'Price_Near_HWMA'}
@@ -10312,11 +10427,11 @@ class HoltWinterMovingAverageStrategies:
             -1: f'Price is significantly below the Holt-Winters Moving Average by more than {self.deviation_percent_threshold}%, indicating bearish conditions.',
             0: 'Price is within a close range of the Holt-Winters Moving Average, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_deviation_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_deviation_strategy(df)
-        value, explanation = self.deviation_map(score)
+        value, explanation = self.deviation_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HWMA_Deviation_Signal'
         if append:
             if ta_indicator_value:
@@ -10380,7 +10495,7 @@ class HullExponentialMovingAverageStrategies:
         cond_bull = (price_prev < hema_prev) & (price_current >= hema_current)
         cond_bear = (price_prev > hema_prev) & (price_current <= hema_current)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def crossover_map(self, series):
         mapping_value = {1: 'Price_Above_HEMA', -1: 'Price_Below_HEMA', 0: 'Price_Near_HEMA'}
@@ -10389,11 +10504,11 @@ class HullExponentialMovingAverageStrategies:
             -1: 'Price crossed below the Hull Exponential Moving Average, indicating bearish momentum.',
             0: 'No significant crossover detected between price and the Hull Exponential Moving Average.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_crossover_strategy(df)
-        value, explanation = self.crossover_map(score)
+        value, explanation = self.crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HEMA_Crossover_Signal'
         if append:
             if ta_indicator_value:
@@ -10421,7 +10536,7 @@ class HullExponentialMovingAverageStrategies:
             self.compute_values(df)
         slope = self.hema.diff()
         signals = np.where(slope > 0, 1, np.where(slope < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'HEMA_Rising', -1: 'HEMA_Falling', 0: 'HEMA_Flat'}
@@ -10430,11 +10545,11 @@ class HullExponentialMovingAverageStrategies:
             -1: 'The Hull Exponential Moving Average is falling, indicating increasing bearish momentum.',
             0: 'The Hull Exponential Moving Average is flat, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HEMA_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -10464,7 +10579,7 @@ class HullExponentialMovingAverageStrategies:
         cond_bull = deviation > self.deviation_percent_threshold
         cond_bear = deviation < -self.deviation_percent_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def deviation_map(self, series):
         mapping_value = {1: 'Price_Above_HEMA', -1: 'Price_Below_HEMA', 0: 'Price_Near_HEMA'}
@@ -10473,11 +10588,11 @@ class HullExponentialMovingAverageStrategies:
             -1: f'Price is significantly below the Hull Exponential Moving Average by more than {self.deviation_percent_threshold}%, indicating bearish conditions.',
             0: 'Price is close to the Hull Exponential Moving Average, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_deviation_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_deviation_strategy(df)
-        value, explanation = self.deviation_map(score)
+        value, explanation = self.deviation_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'HEMA_Deviation_Signal'
         if append:
             if ta_indicator_value:
@@ -10535,7 +10650,7 @@ class HullMovingAverageStrategies:
         cond_bull = (close_prev <= hma_prev) & (close > self.hma)
         cond_bear = (close_prev >= hma_prev) & (close < self.hma)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'Price_Above_HMA', -1: 'Price_Below_HMA', 0: 'Price_Neutral'}
@@ -10544,11 +10659,11 @@ class HullMovingAverageStrategies:
             -1: 'Closing price crossed below HMA, indicating bearish conditions.',
             0: 'No significant crossover between closing price and HMA.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'HMA_Period:{self.period}_PriceCross_Signal'
         if append:
             if ta_indicator_value:
@@ -10575,7 +10690,7 @@ class HullMovingAverageStrategies:
             self.compute_values(df)
         diff = self.hma.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'HMA_Rising', -1: 'HMA_Falling', 0: 'HMA_Unchanged'}
@@ -10584,11 +10699,11 @@ class HullMovingAverageStrategies:
             -1: 'HMA is falling, suggesting bearish momentum.',
             0: 'HMA remains unchanged, suggesting neutral trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'HMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -10615,7 +10730,7 @@ class HullMovingAverageStrategies:
             self.compute_values(df)
         diff = (df['Close'] - self.hma) / self.hma
         signals = np.where(diff > self.price_threshold, 1, np.where(diff < -self.price_threshold, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def distance_map(self, series):
         mapping_value = {1: 'Price_Much_Above_HMA', -1: 'Price_Much_Below_HMA', 0: 'Price_Close_to_HMA'}
@@ -10624,11 +10739,11 @@ class HullMovingAverageStrategies:
             -1: f'Closing price is below HMA by more than {self.price_threshold * 100}%, indicating bearish momentum.',
             0: f'Closing price is within {self.price_threshold * 100}% of HMA, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_distance_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_distance_strategy(df)
-        value, explanation = self.distance_map(score)
+        value, explanation = self.distance_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'HMA_Period:{self.period}_Distance_Signal'
         if append:
             if ta_indicator_value:
@@ -10683,7 +10798,7 @@ class IchimokuCloudStrategies:
         lower_cloud = np.minimum(senkouA, senkouB)
         close = df['Close']
         signals = np.where(close > upper_cloud, 1, np.where(close < lower_cloud, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cloud_map(self, series):
         mapping_value = {1: 'Price_Above_Cloud', -1: 'Price_Below_Cloud', 0: 'Price_Within_Cloud'}
@@ -10692,11 +10807,11 @@ class IchimokuCloudStrategies:
             -1: 'The closing price is below the cloud, indicating strong bearish conditions.',
             0: 'The closing price is within the cloud, indicating a neutral or indecisive market.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cloud_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cloud_strategy(df)
-        value, explanation = self.price_cloud_map(score)
+        value, explanation = self.price_cloud_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Ichimoku_Cloud_Conv:{self.conversion_line_period}_Base:{self.base_line_period}_PriceCloud_Signal'
         if append:
             if ta_indicator_value:
@@ -10727,7 +10842,7 @@ class IchimokuCloudStrategies:
         kijun_prev = kijun.shift(1)
         signals = np.select([ (tenkan_prev <= kijun_prev) & (tenkan > kijun),
                               (tenkan_prev >= kijun_prev) & (tenkan < kijun) ], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def tenkan_kijun_map(self, series):
         mapping_value = {1: 'Tenkan_Above_Kijun', -1: 'Tenkan_Below_Kijun', 0: 'No_Crossover'}
@@ -10736,11 +10851,11 @@ class IchimokuCloudStrategies:
             -1: 'Tenkan-Sen has crossed below Kijun-Sen, suggesting bearish momentum.',
             0: 'No significant crossover between Tenkan-Sen and Kijun-Sen detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_tenkan_kijun_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_tenkan_kijun_strategy(df)
-        value, explanation = self.tenkan_kijun_map(score)
+        value, explanation = self.tenkan_kijun_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Ichimoku_Cloud_Conv:{self.conversion_line_period}_Base:{self.base_line_period}_TenkanKijun_Signal'
         if append:
             if ta_indicator_value:
@@ -10767,7 +10882,7 @@ class IchimokuCloudStrategies:
         close = df['Close']
         past_close = close.shift(displacement)
         signals = np.where(close > past_close, 1, np.where(close < past_close, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def chikou_span_map(self, series):
         mapping_value = {1: 'Chikou_Above_Price', -1: 'Chikou_Below_Price', 0: 'Chikou_Neutral'}
@@ -10776,11 +10891,11 @@ class IchimokuCloudStrategies:
             -1: f'The current closing price is lower than the closing price {self.displacement} periods ago, confirming bearish momentum.',
             0: f'The current closing price is equal to the closing price {self.displacement} periods ago, indicating neutrality.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_chikou_span_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_chikou_span_strategy(df)
-        value, explanation = self.chikou_span_map(score)
+        value, explanation = self.chikou_span_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Ichimoku_Cloud_ChikouSpan_Signal'
         if append:
             if ta_indicator_value:
@@ -10829,7 +10944,7 @@ class IncreasingPriceStrategies:
         cond_bull = (ip_prev <= self.baseline) & (self.increasing_price > self.baseline)
         cond_bear = (ip_prev >= self.baseline) & (self.increasing_price < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'IncPrice_Above_Baseline', -1: 'IncPrice_Below_Baseline', 0: 'IncPrice_Neutral'}
@@ -10838,11 +10953,11 @@ class IncreasingPriceStrategies:
             -1: f'IncreasingPrice crossed below the baseline of {self.baseline}, indicating a bearish trend.',
             0: f'IncreasingPrice remains around the baseline of {self.baseline}, indicating neutral price movement.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'IncPrice_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -10870,7 +10985,7 @@ class IncreasingPriceStrategies:
         cond_bull = self.increasing_price > self.upper_threshold
         cond_bear = self.increasing_price < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'IncPrice_High', -1: 'IncPrice_Low', 0: 'IncPrice_Moderate'}
@@ -10879,11 +10994,11 @@ class IncreasingPriceStrategies:
             -1: f'IncreasingPrice is below the lower threshold of {self.lower_threshold}, indicating strong price depreciation.',
             0: f'IncreasingPrice is between {self.lower_threshold} and {self.upper_threshold}, indicating moderate price movement.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'IncPrice_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -10910,7 +11025,7 @@ class IncreasingPriceStrategies:
             self.increasing_price = self.compute_values(df)
         diff = self.increasing_price.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'IncPrice_Rising', -1: 'IncPrice_Falling', 0: 'IncPrice_Unchanged'}
@@ -10919,11 +11034,11 @@ class IncreasingPriceStrategies:
             -1: 'IncreasingPrice is falling, indicating accelerating price losses.',
             0: 'IncreasingPrice remains unchanged, indicating stable price trends.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'IncPrice_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -10974,7 +11089,7 @@ class InertiaStrategies:
         cond_bull = (inertia_prev <= 0) & (self.inertia > 0)
         cond_bear = (inertia_prev >= 0) & (self.inertia < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Inertia_Positive_Cross', -1: 'Inertia_Negative_Cross', 0: 'Inertia_Neutral'}
@@ -10983,11 +11098,11 @@ class InertiaStrategies:
             -1: 'Inertia has crossed from positive to negative, indicating a potential bearish reversal.',
             0: 'No significant zero-cross event detected in inertia.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Inertia_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -11015,7 +11130,7 @@ class InertiaStrategies:
         cond_bull = self.inertia > self.threshold
         cond_bear = self.inertia < -self.threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Inertia_Above_Threshold', -1: 'Inertia_Below_Threshold', 0: 'Inertia_Within_Threshold'}
@@ -11024,11 +11139,11 @@ class InertiaStrategies:
             -1: f'Inertia is below the negative threshold of {-self.threshold}, suggesting sustained bearish momentum.',
             0: f'Inertia is within the threshold range of -{self.threshold} to {self.threshold}, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Inertia_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -11055,7 +11170,7 @@ class InertiaStrategies:
             self.compute_values(df)
         acceleration = self.inertia.diff()
         signals = np.where(acceleration > self.acceleration_threshold, 1, np.where(acceleration < -self.acceleration_threshold, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def acceleration_map(self, series):
         mapping_value = {1: 'Acceleration_Positive', -1: 'Acceleration_Negative', 0: 'Acceleration_Neutral'}
@@ -11064,11 +11179,11 @@ class InertiaStrategies:
             -1: 'The inertia acceleration is negative, indicating that bearish momentum is increasing.',
             0: 'There is no significant acceleration in inertia, indicating stable momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_acceleration_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_acceleration_strategy(df)
-        value, explanation = self.acceleration_map(score)
+        value, explanation = self.acceleration_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Inertia_Period:{self.period}_Acceleration_Signal'
         if append:
             if ta_indicator_value:
@@ -11125,7 +11240,7 @@ class InverseFisherTransformRSIStrategies:
         cond_bull = (ift_prev <= 0) & (self.ift_rsi > 0)
         cond_bear = (ift_prev >= 0) & (self.ift_rsi < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'IFT_RSI_Cross_Above_Zero', -1: 'IFT_RSI_Cross_Below_Zero', 0: 'IFT_RSI_Neutral'}
@@ -11134,11 +11249,11 @@ class InverseFisherTransformRSIStrategies:
             -1: 'The Inverse Fisher Transform RSI crossed below zero, suggesting bearish momentum.',
             0: 'No zero-cross event detected in the Inverse Fisher Transform RSI.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'IFT_RSI_Period:{self.rsi_period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -11166,7 +11281,7 @@ class InverseFisherTransformRSIStrategies:
         cond_bull = self.ift_rsi > self.upper_threshold
         cond_bear = self.ift_rsi < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'IFT_RSI_Above_Upper', -1: 'IFT_RSI_Below_Lower', 0: 'IFT_RSI_Neutral'}
@@ -11175,11 +11290,11 @@ class InverseFisherTransformRSIStrategies:
             -1: f'The Inverse Fisher Transform RSI is below {self.lower_threshold}, indicating strong bearish conditions.',
             0: 'The Inverse Fisher Transform RSI is between the defined thresholds, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'IFT_RSI_Period:{self.rsi_period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -11206,7 +11321,7 @@ class InverseFisherTransformRSIStrategies:
             self.compute_values(df)
         diff = self.ift_rsi.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'IFT_RSI_Rising', -1: 'IFT_RSI_Falling', 0: 'IFT_RSI_Unchanged'}
@@ -11215,11 +11330,11 @@ class InverseFisherTransformRSIStrategies:
             -1: 'The Inverse Fisher Transform RSI is falling, indicating increasing bearish momentum.',
             0: 'The Inverse Fisher Transform RSI remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'IFT_RSI_Period:{self.rsi_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -11278,7 +11393,7 @@ class JurikMovingAverageStrategies:
         cond_bull = (price_prev <= jma_prev) & (price > self.jma)
         cond_bear = (price_prev >= jma_prev) & (price < self.jma)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'Price_Above_JMA', -1: 'Price_Below_JMA', 0: 'Price_Near_JMA'}
@@ -11287,11 +11402,11 @@ class JurikMovingAverageStrategies:
             -1: 'The closing price has crossed below the Jurik Moving Average, indicating bearish conditions.',
             0: 'The closing price is near the Jurik Moving Average, suggesting no clear trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'JMA_Period:{self.period}_PriceCross_Signal'
         if append:
             if ta_indicator_value:
@@ -11318,7 +11433,7 @@ class JurikMovingAverageStrategies:
             self.compute_values(df)
         diff = self.jma.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'JMA_Rising', -1: 'JMA_Falling', 0: 'JMA_Flat'}
@@ -11327,11 +11442,11 @@ class JurikMovingAverageStrategies:
             -1: 'The Jurik Moving Average is falling, indicating downward momentum.',
             0: 'The Jurik Moving Average is flat, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'JMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -11359,7 +11474,7 @@ class JurikMovingAverageStrategies:
         price = df['Close']
         diff = (price - self.jma) / self.jma
         signals = np.where(diff > self.distance_threshold, 1, np.where(diff < -self.distance_threshold, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def distance_map(self, series):
         mapping_value = {1: 'Price_Significantly_Above_JMA', -1: 'Price_Significantly_Below_JMA', 0: 'Price_Close_to_JMA'}
@@ -11368,11 +11483,11 @@ class JurikMovingAverageStrategies:
             -1: f'The closing price is more than {self.distance_threshold * 100}% below the Jurik Moving Average, indicating strong bearish conditions.',
             0: f'The closing price is within {self.distance_threshold * 100}% of the Jurik Moving Average, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_distance_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_distance_strategy(df)
-        value, explanation = self.distance_map(score)
+        value, explanation = self.distance_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'JMA_Period:{self.period}_Distance_Signal'
         if append:
             if ta_indicator_value:
@@ -11412,27 +11527,14 @@ class KDJIndicatorStrategies:
         self.j = None
 
     def compute_values(self, df):
-        k_values = []
-        d_values = []
-        j_values = []
-        k_prev = 50
-        d_prev = 50
-        for i in range(len(df)):
-            window_start = max(0, i - self.period + 1)
-            high_max = df['High'].iloc[window_start:i+1].max()
-            low_min = df['Low'].iloc[window_start:i+1].min()
-            if high_max == low_min:
-                rsv = 0
-            else:
-                rsv = (df['Close'].iloc[i] - low_min) / (high_max - low_min) * 100
-            k_curr = (2/3)*k_prev + (1/3)*rsv
-            d_curr = (2/3)*d_prev + (1/3)*k_curr
-            j_curr = 3*k_curr - 2*d_curr
-            k_values.append(k_curr)
-            d_values.append(d_curr)
-            j_values.append(j_curr)
-            k_prev = k_curr
-            d_prev = d_curr
+        high_max = rolling_max(df['High'].values, self.period)
+        low_min = rolling_min(df['Low'].values, self.period)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsv_values = np.where(high_max == low_min, 0.0, (df['Close'].values - low_min) / (high_max - low_min) * 100)
+        # K and D are both 1/3-gain smoothers seeded at 50
+        k_values = exponential_filter(rsv_values, 1/3, 2/3, initial=50)
+        d_values = exponential_filter(k_values, 1/3, 2/3, initial=50)
+        j_values = 3*k_values - 2*d_values
         self.k = pd.Series(k_values, index=df.index)
         self.d = pd.Series(d_values, index=df.index)
         self.j = pd.Series(j_values, index=df.index)
@@ -11446,7 +11548,7 @@ class KDJIndicatorStrategies:
         cond_bull = (k_prev <= d_prev) & (self.k > self.d)
         cond_bear = (k_prev >= d_prev) & (self.k < self.d)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def kd_crossover_map(self, series):
         mapping_value = {1: 'K_Above_D', -1: 'K_Below_D', 0: 'K_D_Neutral'}
@@ -11455,11 +11557,11 @@ class KDJIndicatorStrategies:
             -1: 'The %K line has crossed below the %D line, indicating a bearish signal.',
             0: 'No crossover between %K and %D detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_kd_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_kd_crossover_strategy(df)
-        value, explanation = self.kd_crossover_map(score)
+        value, explanation = self.kd_crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KDJ_Period:{self.period}_KDCross_Signal'
         if append:
             if ta_indicator_value:
@@ -11487,7 +11589,7 @@ class KDJIndicatorStrategies:
         cond_bull = self.j < self.lower_threshold
         cond_bear = self.j > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'J_Oversold', -1: 'J_Overbought', 0: 'J_Neutral'}
@@ -11496,11 +11598,11 @@ class KDJIndicatorStrategies:
             -1: f'The %J value is above {self.upper_threshold}, indicating overbought conditions and a potential bearish reversal.',
             0: f'The %J value is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KDJ_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -11527,7 +11629,7 @@ class KDJIndicatorStrategies:
             self.compute_values(df)
         diff = self.k.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'K_Rising', -1: 'K_Falling', 0: 'K_Flat'}
@@ -11536,11 +11638,11 @@ class KDJIndicatorStrategies:
             -1: 'The %K line is falling, suggesting increasing bearish momentum.',
             0: 'The %K line remains flat, suggesting neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KDJ_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -11606,7 +11708,7 @@ class KaufmanAdaptiveMovingAverageStrategies:
         cond_bull = (price_prev <= kama_prev) & (price > self.kama)
         cond_bear = (price_prev >= kama_prev) & (price < self.kama)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'Price_Above_KAMA', -1: 'Price_Below_KAMA', 0: 'Price_Near_KAMA'}
@@ -11615,11 +11717,11 @@ class KaufmanAdaptiveMovingAverageStrategies:
             -1: 'The closing price has crossed below the Kaufman Adaptive Moving Average, indicating bearish conditions.',
             0: 'No clear crossover between the closing price and the KAMA is detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KAMA_Period:{self.period}_PriceCross_Signal'
         if append:
             if ta_indicator_value:
@@ -11646,7 +11748,7 @@ class KaufmanAdaptiveMovingAverageStrategies:
             self.compute_values(df)
         diff = self.kama.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'KAMA_Rising', -1: 'KAMA_Falling', 0: 'KAMA_Flat'}
@@ -11655,11 +11757,11 @@ class KaufmanAdaptiveMovingAverageStrategies:
             -1: 'The Kaufman Adaptive Moving Average is falling, indicating downward momentum.',
             0: 'The Kaufman Adaptive Moving Average is flat, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KAMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -11687,7 +11789,7 @@ class KaufmanAdaptiveMovingAverageStrategies:
         price = df['Close']
         diff = (price - self.kama) / self.kama
         signals = np.where(diff > self.distance_threshold, 1, np.where(diff < -self.distance_threshold, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def distance_map(self, series):
         mapping_value = {1: 'Price_Significantly_Above_KAMA', -1: 'Price_Significantly_Below_KAMA', 0: 'Price_Close_to_KAMA'}
@@ -11696,11 +11798,11 @@ class KaufmanAdaptiveMovingAverageStrategies:
             -1: f'The closing price is more than {self.distance_threshold * 100}% below the Kaufman Adaptive Moving Average, indicating strong bearish conditions.',
             0: f'The closing price is within {self.distance_threshold * 100}% of the KAMA, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_distance_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_distance_strategy(df)
-        value, explanation = self.distance_map(score)
+        value, explanation = self.distance_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KAMA_Period:{self.period}_Distance_Signal'
         if append:
             if ta_indicator_value:
@@ -11754,7 +11856,7 @@ class KaufmanEfficiencyIndicatorStrategies:
         cond_bull = (eff_prev <= self.baseline) & (self.efficiency > self.baseline)
         cond_bear = (eff_prev >= self.baseline) & (self.efficiency < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Efficiency_Above_Baseline', -1: 'Efficiency_Below_Baseline', 0: 'Efficiency_Neutral'}
@@ -11763,11 +11865,11 @@ class KaufmanEfficiencyIndicatorStrategies:
             -1: f'Efficiency Ratio crossed below the baseline of {self.baseline}, indicating a move to a less trending or choppy market.',
             0: f'Efficiency Ratio remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KEI_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -11795,7 +11897,7 @@ class KaufmanEfficiencyIndicatorStrategies:
         cond_bull = self.efficiency > self.upper_threshold
         cond_bear = self.efficiency < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Trending_Efficient', -1: 'Choppy_Market', 0: 'Neutral_Efficiency'}
@@ -11804,11 +11906,11 @@ class KaufmanEfficiencyIndicatorStrategies:
             -1: f'Efficiency Ratio is below {self.lower_threshold}, indicating a choppy, non-trending market (potential bearish or sideways conditions).',
             0: f'Efficiency Ratio is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral market efficiency.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KEI_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -11835,7 +11937,7 @@ class KaufmanEfficiencyIndicatorStrategies:
             self.compute_values(df)
         diff = self.efficiency.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Efficiency_Rising', -1: 'Efficiency_Falling', 0: 'Efficiency_Unchanged'}
@@ -11844,11 +11946,11 @@ class KaufmanEfficiencyIndicatorStrategies:
             -1: 'Efficiency Ratio is falling, suggesting the market is becoming less trending.',
             0: 'Efficiency Ratio remains unchanged, indicating stable market efficiency.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KEI_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -11888,13 +11990,13 @@ class KeltnerChannelStrategies:
         self.upper = None
         self.lower = None
 
+    def required_primitives(self):
+        return [('EMA', 'Close', self.period), ('ATR', self.atr_period, 1, True)]
+
     def compute_values(self, df):
-        self.center = df['Close'].ewm(span=self.period, adjust=False).mean()
-        tr1 = df['High'] - df['Low']
-        tr2 = (df['High'] - df['Close'].shift()).abs()
-        tr3 = (df['Low'] - df['Close'].shift()).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(window=self.atr_period, min_periods=1).mean()
+        primitives = frame_primitives(self, df)
+        self.center = primitives.get(('EMA', 'Close', self.period))
+        atr = primitives.get(('ATR', self.atr_period, 1, True))
         self.upper = self.center + self.multiplier * atr
         self.lower = self.center - self.multiplier * atr
         return {'center': self.center, 'upper': self.upper, 'lower': self.lower, 'atr': atr}
@@ -11906,7 +12008,7 @@ class KeltnerChannelStrategies:
         cond_bull = price > self.upper
         cond_bear = price < self.lower
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def breakout_map(self, series):
         mapping_value = {1: 'Price_Above_Upper_Band', -1: 'Price_Below_Lower_Band', 0: 'Price_Within_Channel'}
@@ -11915,11 +12017,11 @@ class KeltnerChannelStrategies:
             -1: 'Closing price is below the lower band of the Keltner Channel, indicating a bearish breakout.',
             0: 'Closing price is within the channel, indicating no breakout.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_breakout_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_breakout_strategy(df)
-        value, explanation = self.breakout_map(score)
+        value, explanation = self.breakout_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KeltnerChannel_Breakout_Signal'
         if append:
             if ta_indicator_value:
@@ -11951,7 +12053,7 @@ class KeltnerChannelStrategies:
         cond_bull = (price_prev <= center_prev) & (price > self.center)
         cond_bear = (price_prev >= center_prev) & (price < self.center)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def middle_cross_map(self, series):
         mapping_value = {1: 'Price_Crossed_Above_Center', -1: 'Price_Crossed_Below_Center', 0: 'No_Cross'}
@@ -11960,11 +12062,11 @@ class KeltnerChannelStrategies:
             -1: 'Price crossed below the center line (EMA), indicating a bearish signal.',
             0: 'No crossover with the center line detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_middle_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_middle_cross_strategy(df)
-        value, explanation = self.middle_cross_map(score)
+        value, explanation = self.middle_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KeltnerChannel_MiddleCross_Signal'
         if append:
             if ta_indicator_value:
@@ -11992,7 +12094,7 @@ class KeltnerChannelStrategies:
             self.compute_values(df)
         diff = self.center.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Center_Rising', -1: 'Center_Falling', 0: 'Center_Flat'}
@@ -12001,11 +12103,11 @@ class KeltnerChannelStrategies:
             -1: 'The center line is falling, suggesting downward momentum.',
             0: 'The center line is flat, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KeltnerChannel_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -12059,7 +12161,7 @@ class KlingerVolumeOscillatorStrategies:
         cond_bull = (kvo_prev <= 0) & (self.kvo > 0)
         cond_bear = (kvo_prev >= 0) & (self.kvo < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'KVO_Crossed_Above_Zero', -1: 'KVO_Crossed_Below_Zero', 0: 'KVO_Neutral'}
@@ -12068,11 +12170,11 @@ class KlingerVolumeOscillatorStrategies:
             -1: 'KVO crossed below zero, indicating bearish momentum.',
             0: 'KVO remains near zero, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KVO_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -12100,7 +12202,7 @@ class KlingerVolumeOscillatorStrategies:
         cond_bull = self.kvo > self.distance_threshold
         cond_bear = self.kvo < -self.distance_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'KVO_Above_Threshold', -1: 'KVO_Below_Threshold', 0: 'KVO_Within_Threshold'}
@@ -12109,11 +12211,11 @@ class KlingerVolumeOscillatorStrategies:
             -1: f'KVO is below {-self.distance_threshold}, indicating strong bearish momentum.',
             0: f'KVO is within ±{self.distance_threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KVO_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -12140,7 +12242,7 @@ class KlingerVolumeOscillatorStrategies:
             self.compute_values(df)
         diff = self.kvo.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'KVO_Rising', -1: 'KVO_Falling', 0: 'KVO_Unchanged'}
@@ -12149,11 +12251,11 @@ class KlingerVolumeOscillatorStrategies:
             -1: 'KVO is falling, indicating increasing bearish momentum.',
             0: 'KVO is unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KVO_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -12220,7 +12322,7 @@ class KnowSureThingStrategies:
         cond_bull = (kst_prev <= 0) & (self.kst > 0)
         cond_bear = (kst_prev >= 0) & (self.kst < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'KST_Cross_Above_Zero', -1: 'KST_Cross_Below_Zero', 0: 'KST_Neutral'}
@@ -12229,11 +12331,11 @@ class KnowSureThingStrategies:
             -1: 'KST has crossed below zero, indicating bearish momentum.',
             0: 'KST remains neutral around zero.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KST_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -12261,7 +12363,7 @@ class KnowSureThingStrategies:
         cond_bull = self.kst > self.upper_threshold
         cond_bear = self.kst < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'KST_Above_Upper', -1: 'KST_Below_Lower', 0: 'KST_Neutral'}
@@ -12270,11 +12372,11 @@ class KnowSureThingStrategies:
             -1: f'KST is below {self.lower_threshold}, suggesting strong bearish momentum.',
             0: f'KST is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KST_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -12301,7 +12403,7 @@ class KnowSureThingStrategies:
             self.compute_values(df)
         diff = self.kst.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'KST_Rising', -1: 'KST_Falling', 0: 'KST_Flat'}
@@ -12310,11 +12412,11 @@ class KnowSureThingStrategies:
             -1: 'KST is falling, indicating increasing bearish momentum.',
             0: 'KST remains flat, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'KST_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -12349,17 +12451,10 @@ class LinearRegressionStrategies:
         self.distance_threshold = distance_threshold
         self.reg_line = None
 
-    def _linear_regression(self, y):
-        n = len(y)
-        x = np.arange(n)
-        denom = n * np.sum(x**2) - (np.sum(x))**2
-        slope = (n * np.dot(x, y) - np.sum(x) * np.sum(y)) / denom if denom != 0 else 0
-        intercept = (np.sum(y) - slope * np.sum(x)) / n
-        return intercept + slope * (n - 1)
-
     def compute_values(self, df):
-        reg = df['Close'].rolling(window=self.period, min_periods=self.period).apply(lambda y: self._linear_regression(y), raw=True)
-        self.reg_line = pd.Series(reg, index=df.index)
+        slope, intercept = rolling_linear_regression(df['Close'].values, self.period)
+        reg = intercept + slope * (self.period - 1)
+        self.reg_line = pd.Series(reg, index=df.index, name=df['Close'].name)
         return self.reg_line
 
     def calculate_scores_price_cross_strategy(self, df):
@@ -12371,7 +12466,7 @@ class LinearRegressionStrategies:
         cond_bull = (price_prev <= reg_prev) & (price > self.reg_line)
         cond_bear = (price_prev >= reg_prev) & (price < self.reg_line)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'Price_Above_Regression', -1: 'Price_Below_Regression', 0: 'Price_Near_Regression'}
@@ -12380,11 +12475,11 @@ class LinearRegressionStrategies:
             -1: 'Closing price has crossed below the regression line, indicating bearish conditions.',
             0: 'No crossover detected between the price and the regression line.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'LinearRegression_Period:{self.period}_PriceCross_Signal'
         if append:
             if ta_indicator_value:
@@ -12411,7 +12506,7 @@ class LinearRegressionStrategies:
             self.compute_values(df)
         diff = self.reg_line.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Regression_Rising', -1: 'Regression_Falling', 0: 'Regression_Flat'}
@@ -12420,11 +12515,11 @@ class LinearRegressionStrategies:
             -1: 'The regression line is falling, indicating a downtrend.',
             0: 'The regression line is flat, indicating a neutral trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'LinearRegression_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -12452,7 +12547,7 @@ class LinearRegressionStrategies:
         price = df['Close']
         diff = (price - self.reg_line) / self.reg_line
         signals = np.where(diff > self.distance_threshold, 1, np.where(diff < -self.distance_threshold, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def distance_map(self, series):
         mapping_value = {1: 'Price_Significantly_Above_Regression', -1: 'Price_Significantly_Below_Regression', 0: 'Price_Close_to_Regression'}
@@ -12461,11 +12556,11 @@ class LinearRegressionStrategies:
             -1: f'Closing price is more than {self.distance_threshold * 100}% below the regression line, indicating strong bearish momentum.',
             0: f'Closing price is within {self.distance_threshold * 100}% of the regression line, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_distance_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_distance_strategy(df)
-        value, explanation = self.distance_map(score)
+        value, explanation = self.distance_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'LinearRegression_Period:{self.period}_Distance_Signal'
         if append:
             if ta_indicator_value:
@@ -12503,17 +12598,10 @@ class LinearRegressionAngleStrategies:
         self.distance_threshold = distance_threshold
         self.lr_angle = None
 
-    def _linear_regression_angle(self, y):
-        n = len(y)
-        x = np.arange(n)
-        denom = n * np.sum(x**2) - (np.sum(x))**2
-        slope = (n * np.dot(x, y) - np.sum(x) * np.sum(y)) / denom if denom != 0 else 0
-        angle = np.degrees(np.arctan(slope))
-        return angle
-
     def compute_values(self, df):
-        angles = df['Close'].rolling(window=self.period, min_periods=self.period).apply(lambda y: self._linear_regression_angle(y), raw=True)
-        self.lr_angle = pd.Series(angles, index=df.index)
+        slope, _ = rolling_linear_regression(df['Close'].values, self.period)
+        angles = np.degrees(np.arctan(slope))
+        self.lr_angle = pd.Series(angles, index=df.index, name=df['Close'].name)
         return self.lr_angle
 
     def calculate_scores_zero_cross_strategy(self, df):
@@ -12523,7 +12611,7 @@ class LinearRegressionAngleStrategies:
         cond_bull = (angle_prev <= 0) & (self.lr_angle > 0)
         cond_bear = (angle_prev >= 0) & (self.lr_angle < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Angle_Crossed_Above_Zero', -1: 'Angle_Crossed_Below_Zero', 0: 'Angle_Neutral'}
@@ -12532,11 +12620,11 @@ class LinearRegressionAngleStrategies:
             -1: 'The linear regression angle crossed below zero, indicating a shift toward a downtrend.',
             0: 'No zero-cross event detected in the linear regression angle.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'LRAngle_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -12564,7 +12652,7 @@ class LinearRegressionAngleStrategies:
         cond_bull = self.lr_angle > self.upper_threshold
         cond_bear = self.lr_angle < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Angle_Above_Upper', -1: 'Angle_Below_Lower', 0: 'Angle_Neutral'}
@@ -12573,11 +12661,11 @@ class LinearRegressionAngleStrategies:
             -1: f'The linear regression angle is below {self.lower_threshold}°, indicating strong bearish momentum.',
             0: f'The linear regression angle is between {self.lower_threshold}° and {self.upper_threshold}°, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'LRAngle_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -12604,7 +12692,7 @@ class LinearRegressionAngleStrategies:
             self.compute_values(df)
         diff = self.lr_angle.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Angle_Rising', -1: 'Angle_Falling', 0: 'Angle_Flat'}
@@ -12613,11 +12701,11 @@ class LinearRegressionAngleStrategies:
             -1: 'The linear regression angle is falling, suggesting increasing bearish momentum.',
             0: 'The linear regression angle remains flat, indicating neutral trend conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'LRAngle_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -12652,17 +12740,9 @@ class LinearRegressionInterceptStrategies:
         self.distance_threshold = distance_threshold
         self.lr_intercept = None
 
-    def _linear_regression_intercept(self, y):
-        n = len(y)
-        x = np.arange(n)
-        denom = n * np.sum(x**2) - (np.sum(x))**2
-        slope = (n * np.dot(x, y) - np.sum(x) * np.sum(y)) / denom if denom != 0 else 0
-        intercept = (np.sum(y) - slope * np.sum(x)) / n
-        return intercept
-
     def compute_values(self, df):
-        intercepts = df['Close'].rolling(window=self.period, min_periods=self.period).apply(lambda y: self._linear_regression_intercept(y), raw=True)
-        self.lr_intercept = pd.Series(intercepts, index=df.index)
+        _, intercepts = rolling_linear_regression(df['Close'].values, self.period)
+        self.lr_intercept = pd.Series(intercepts, index=df.index, name=df['Close'].name)
         return self.lr_intercept
 
     def calculate_scores_price_cross_strategy(self, df):
@@ -12674,7 +12754,7 @@ class LinearRegressionInterceptStrategies:
         cond_bull = (price_prev <= intercept_prev) & (price > self.lr_intercept)
         cond_bear = (price_prev >= intercept_prev) & (price < self.lr_intercept)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'Price_Above_Intercept', -1: 'Price_Below_Intercept', 0: 'Price_Near_Intercept'}
@@ -12683,11 +12763,11 @@ class LinearRegressionInterceptStrategies:
             -1: 'Closing price crossed below the regression intercept, suggesting bearish conditions.',
             0: 'No significant crossover between the closing price and regression intercept detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'LRIntercept_Period:{self.period}_PriceCross_Signal'
         if append:
             if ta_indicator_value:
@@ -12714,7 +12794,7 @@ class LinearRegressionInterceptStrategies:
             self.compute_values(df)
         diff = self.lr_intercept.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Intercept_Rising', -1: 'Intercept_Falling', 0: 'Intercept_Stable'}
@@ -12723,11 +12803,11 @@ class LinearRegressionInterceptStrategies:
             -1: 'The regression intercept is falling, indicating weakening support levels and bearish sentiment.',
             0: 'The regression intercept remains stable, suggesting neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'LRIntercept_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -12755,7 +12835,7 @@ class LinearRegressionInterceptStrategies:
         price = df['Close']
         diff = (price - self.lr_intercept) / self.lr_intercept
         signals = np.where(diff > self.distance_threshold, 1, np.where(diff < -self.distance_threshold, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def distance_map(self, series):
         mapping_value = {1: 'Price_Significantly_Above_Intercept', -1: 'Price_Significantly_Below_Intercept', 0: 'Price_Near_Intercept'}
@@ -12764,11 +12844,11 @@ class LinearRegressionInterceptStrategies:
             -1: f'Closing price is more than {self.distance_threshold * 100}% below the regression intercept, indicating strong bearish conditions.',
             0: f'Closing price is within {self.distance_threshold * 100}% of the regression intercept, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_distance_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_distance_strategy(df)
-        value, explanation = self.distance_map(score)
+        value, explanation = self.distance_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'LRIntercept_Period:{self.period}_Distance_Signal'
         if append:
             if ta_indicator_value:
@@ -12804,16 +12884,9 @@ class LinearRegressionSlopeStrategies:
         self.threshold = threshold
         self.slope = None
 
-    def _linear_regression_slope(self, y):
-        n = len(y)
-        x = np.arange(n)
-        denom = n * np.sum(x**2) - (np.sum(x))**2
-        slope = (n * np.dot(x, y) - np.sum(x) * np.sum(y)) / denom if denom != 0 else 0
-        return slope
-
     def compute_values(self, df):
-        slopes = df['Close'].rolling(window=self.period, min_periods=self.period).apply(lambda y: self._linear_regression_slope(y), raw=True)
-        self.slope = pd.Series(slopes, index=df.index)
+        slopes, _ = rolling_linear_regression(df['Close'].values, self.period)
+        self.slope = pd.Series(slopes, index=df.index, name=df['Close'].name)
         return self.slope
 
     def calculate_scores_zero_cross_strategy(self, df):
@@ -12823,7 +12896,7 @@ class LinearRegressionSlopeStrategies:
         cond_bull = (slope_prev <= 0) & (self.slope > 0)
         cond_bear = (slope_prev >= 0) & (self.slope < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Slope_Crossed_Above_Zero', -1: 'Slope_Crossed_Below_Zero', 0: 'Slope_Neutral'}
@@ -12832,11 +12905,11 @@ class LinearRegressionSlopeStrategies:
             -1: 'The linear regression slope crossed below zero, indicating a potential bearish trend reversal.',
             0: 'No significant zero-cross event in the slope detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'LR_Slope_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -12864,7 +12937,7 @@ class LinearRegressionSlopeStrategies:
         cond_bull = self.slope > self.threshold
         cond_bear = self.slope < -self.threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Slope_Above_Threshold', -1: 'Slope_Below_Threshold', 0: 'Slope_Neutral'}
@@ -12873,11 +12946,11 @@ class LinearRegressionSlopeStrategies:
             -1: f'The slope is below -{self.threshold}, indicating strong bearish momentum.',
             0: f'The slope is between -{self.threshold} and {self.threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'LR_Slope_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -12904,7 +12977,7 @@ class LinearRegressionSlopeStrategies:
             self.compute_values(df)
         acceleration = self.slope.diff()
         signals = np.where(acceleration > 0, 1, np.where(acceleration < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def acceleration_map(self, series):
         mapping_value = {1: 'Slope_Accelerating', -1: 'Slope_Decelerating', 0: 'Slope_Stable'}
@@ -12913,11 +12986,11 @@ class LinearRegressionSlopeStrategies:
             -1: 'The acceleration is negative, indicating that bearish momentum is increasing.',
             0: 'No significant acceleration in slope, indicating stable conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_acceleration_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_acceleration_strategy(df)
-        value, explanation = self.acceleration_map(score)
+        value, explanation = self.acceleration_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'LR_Slope_Period:{self.period}_Acceleration_Signal'
         if append:
             if ta_indicator_value:
@@ -12966,7 +13039,7 @@ class LongRunStrategies:
         cond_bull = (lr_prev <= self.baseline) & (self.longrun > self.baseline)
         cond_bear = (lr_prev >= self.baseline) & (self.longrun < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Above_LongRun', -1: 'Price_Below_LongRun', 0: 'Neutral_LongRun'}
@@ -12975,11 +13048,11 @@ class LongRunStrategies:
             -1: 'Price has crossed below its long-run average, indicating a bearish long-term regime.',
             0: 'No significant crossover relative to the long-run average.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'LongRun_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -13007,7 +13080,7 @@ class LongRunStrategies:
         cond_bull = self.longrun > self.upper_threshold
         cond_bear = self.longrun < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'LongRun_Overbought', -1: 'LongRun_Oversold', 0: 'LongRun_Neutral'}
@@ -13016,11 +13089,11 @@ class LongRunStrategies:
             -1: f'Price is more than {abs(self.lower_threshold)*100:.1f}% below its long-run average, indicating strong bearish momentum.',
             0: 'Price is within a neutral range of its long-run average.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'LongRun_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -13047,7 +13120,7 @@ class LongRunStrategies:
             self.compute_values(df)
         diff = self.longrun.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'LongRun_Rising', -1: 'LongRun_Falling', 0: 'LongRun_Unchanged'}
@@ -13056,11 +13129,11 @@ class LongRunStrategies:
             -1: 'The LongRun indicator is falling, indicating increasing long-term bearish strength.',
             0: 'The LongRun indicator remains unchanged, suggesting a neutral long-term trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'LongRun_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -13097,9 +13170,12 @@ class MarkWhistlersWAVEPMStrategies:
         self.lower_threshold = lower_threshold
         self.mark_wavepm = None
 
+    def required_primitives(self):
+        return [('STD', 'Close', self.period, self.period)]
+
     def compute_values(self, df):
         sma = df['Close'].rolling(window=self.period, min_periods=self.period).mean()
-        std = df['Close'].rolling(window=self.period, min_periods=self.period).std()
+        std = frame_primitives(self, df).get(('STD', 'Close', self.period, self.period))
         zscore = (df['Close'] - sma) / std
         self.mark_wavepm = np.sin(zscore)
         return self.mark_wavepm
@@ -13111,7 +13187,7 @@ class MarkWhistlersWAVEPMStrategies:
         cond_bull = (mw_prev <= 0) & (self.mark_wavepm > 0)
         cond_bear = (mw_prev >= 0) & (self.mark_wavepm < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'WAVEPM_Cross_Above_Zero', -1: 'WAVEPM_Cross_Below_Zero', 0: 'WAVEPM_Neutral'}
@@ -13120,11 +13196,11 @@ class MarkWhistlersWAVEPMStrategies:
             -1: 'The MarkWhistlersWAVEPM indicator crossed below zero, indicating bearish momentum.',
             0: 'No zero-cross event detected in the MarkWhistlersWAVEPM indicator.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WAVEPM_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -13152,7 +13228,7 @@ class MarkWhistlersWAVEPMStrategies:
         cond_bull = self.mark_wavepm > self.upper_threshold
         cond_bear = self.mark_wavepm < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'WAVEPM_Above_Upper', -1: 'WAVEPM_Below_Lower', 0: 'WAVEPM_Neutral'}
@@ -13161,11 +13237,11 @@ class MarkWhistlersWAVEPMStrategies:
             -1: f'The indicator is below {self.lower_threshold}, suggesting strong bearish momentum.',
             0: f'The indicator is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WAVEPM_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -13192,7 +13268,7 @@ class MarkWhistlersWAVEPMStrategies:
             self.compute_values(df)
         diff = self.mark_wavepm.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'WAVEPM_Rising', -1: 'WAVEPM_Falling', 0: 'WAVEPM_Flat'}
@@ -13201,11 +13277,11 @@ class MarkWhistlersWAVEPMStrategies:
             -1: 'The MarkWhistlersWAVEPM indicator is falling, indicating increasing bearish momentum.',
             0: 'The indicator remains flat, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WAVEPM_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -13252,7 +13328,7 @@ class MarketMomentumStrategies:
         cond_bull = (momentum_prev <= 0) & (self.momentum > 0)
         cond_bear = (momentum_prev >= 0) & (self.momentum < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Momentum_Cross_Above_Zero', -1: 'Momentum_Cross_Below_Zero', 0: 'Momentum_Neutral'}
@@ -13261,11 +13337,11 @@ class MarketMomentumStrategies:
             -1: 'The MarketMomentum indicator crossed below zero, indicating a bearish momentum shift.',
             0: 'The MarketMomentum indicator remains neutral relative to zero.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MarketMomentum_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -13293,7 +13369,7 @@ class MarketMomentumStrategies:
         cond_bull = self.momentum > self.upper_threshold
         cond_bear = self.momentum < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Momentum_Above_Upper', -1: 'Momentum_Below_Lower', 0: 'Momentum_Neutral'}
@@ -13302,11 +13378,11 @@ class MarketMomentumStrategies:
             -1: f'The MarketMomentum indicator is below {abs(self.lower_threshold)*100:.1f}%, suggesting strong bearish momentum.',
             0: 'The MarketMomentum indicator is within neutral bounds.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MarketMomentum_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -13333,7 +13409,7 @@ class MarketMomentumStrategies:
             self.compute_values(df)
         diff = self.momentum.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Momentum_Rising', -1: 'Momentum_Falling', 0: 'Momentum_Flat'}
@@ -13342,11 +13418,11 @@ class MarketMomentumStrategies:
             -1: 'The MarketMomentum indicator is falling, indicating increasing bearish momentum.',
             0: 'The MarketMomentum indicator is flat, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MarketMomentum_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -13406,7 +13482,7 @@ class MassIndexStrategies:
         cond_bull = (mi_prev <= self.baseline) & (self.mass_index > self.baseline)
         cond_bear = (mi_prev >= self.baseline) & (self.mass_index < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'MI_Crossed_Above_Baseline', -1: 'MI_Crossed_Below_Baseline', 0: 'MI_Neutral'}
@@ -13415,11 +13491,11 @@ class MassIndexStrategies:
             -1: f'Mass Index crossed below the baseline of {self.baseline}, indicating potential bearish reversal.',
             0: f'Mass Index remains around the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MI_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -13447,7 +13523,7 @@ class MassIndexStrategies:
         cond_bull = self.mass_index < self.lower_threshold
         cond_bear = self.mass_index > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'MI_Below_Lower', -1: 'MI_Above_Upper', 0: 'MI_Neutral'}
@@ -13456,11 +13532,11 @@ class MassIndexStrategies:
             -1: f'Mass Index is above {self.upper_threshold}, suggesting a potential bearish reversal.',
             0: f'Mass Index is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MI_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -13487,7 +13563,7 @@ class MassIndexStrategies:
             self.compute_values(df)
         diff = self.mass_index.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'MI_Rising', -1: 'MI_Falling', 0: 'MI_Flat'}
@@ -13496,11 +13572,11 @@ class MassIndexStrategies:
             -1: 'Mass Index is falling, suggesting that the volatility range is contracting, potentially signaling a reversal.',
             0: 'Mass Index remains flat, indicating neutral volatility conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MI_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -13559,7 +13635,7 @@ class McGinleyDynamicStrategies:
         cond_bull = (price_prev <= mcg_prev) & (price > self.mcg_dynamic)
         cond_bear = (price_prev >= mcg_prev) & (price < self.mcg_dynamic)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'Price_Above_McGinley', -1: 'Price_Below_McGinley', 0: 'Price_Near_McGinley'}
@@ -13568,11 +13644,11 @@ class McGinleyDynamicStrategies:
             -1: 'Price crossed below the McGinley Dynamic, indicating bearish conditions.',
             0: 'No significant price crossover with the McGinley Dynamic detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'McGinleyDynamic_Period:{self.period}_PriceCross_Signal'
         if append:
             if ta_indicator_value:
@@ -13599,7 +13675,7 @@ class McGinleyDynamicStrategies:
             self.compute_values(df)
         diff = self.mcg_dynamic.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'McGinley_Rising', -1: 'McGinley_Falling', 0: 'McGinley_Flat'}
@@ -13608,11 +13684,11 @@ class McGinleyDynamicStrategies:
             -1: 'The McGinley Dynamic is falling, indicating downward momentum.',
             0: 'The McGinley Dynamic remains flat, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'McGinleyDynamic_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -13639,7 +13715,7 @@ class McGinleyDynamicStrategies:
             self.compute_values(df)
         diff_ratio = (df['Close'] - self.mcg_dynamic) / self.mcg_dynamic
         signals = np.where(diff_ratio > self.threshold, 1, np.where(diff_ratio < -self.threshold, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def distance_map(self, series):
         mapping_value = {1: 'Price_Significantly_Above_McGinley', -1: 'Price_Significantly_Below_McGinley', 0: 'Price_Close_to_McGinley'}
@@ -13648,11 +13724,11 @@ class McGinleyDynamicStrategies:
             -1: f'Price is more than {self.threshold*100:.1f}% below the McGinley Dynamic, indicating strong bearish conditions.',
             0: f'Price is within {self.threshold*100:.1f}% of the McGinley Dynamic, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_distance_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_distance_strategy(df)
-        value, explanation = self.distance_map(score)
+        value, explanation = self.distance_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'McGinleyDynamic_Period:{self.period}_Distance_Signal'
         if append:
             if ta_indicator_value:
@@ -13699,7 +13775,7 @@ class MedianPriceStrategies:
         cond_bull = (close_prev <= median_prev) & (close > self.median)
         cond_bear = (close_prev >= median_prev) & (close < self.median)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'Price_Above_Median', -1: 'Price_Below_Median', 0: 'Price_Neutral'}
@@ -13708,11 +13784,11 @@ class MedianPriceStrategies:
             -1: 'Closing price crossed below the median price, indicating bearish conditions.',
             0: 'Closing price remains near the median price, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MedianPrice_PriceCross_Signal'
         if append:
             if ta_indicator_value:
@@ -13739,7 +13815,7 @@ class MedianPriceStrategies:
             self.compute_values(df)
         diff = self.median.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Median_Rising', -1: 'Median_Falling', 0: 'Median_Flat'}
@@ -13748,11 +13824,11 @@ class MedianPriceStrategies:
             -1: 'The median price is falling, indicating a downward trend in the price range.',
             0: 'The median price is flat, indicating neutral price movement.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MedianPrice_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -13779,7 +13855,7 @@ class MedianPriceStrategies:
             self.compute_values(df)
         diff = (df['Close'] - self.median) / self.median
         signals = np.where(diff > self.threshold, 1, np.where(diff < -self.threshold, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def distance_map(self, series):
         mapping_value = {1: 'Price_Significantly_Above_Median', -1: 'Price_Significantly_Below_Median', 0: 'Price_Close_to_Median'}
@@ -13788,11 +13864,11 @@ class MedianPriceStrategies:
             -1: f'Closing price is more than {self.threshold*100:.1f}% below the median price, indicating strong bearish conditions.',
             0: f'Closing price is within {self.threshold*100:.1f}% of the median price, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_distance_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_distance_strategy(df)
-        value, explanation = self.distance_map(score)
+        value, explanation = self.distance_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MedianPrice_Distance_Signal'
         if append:
             if ta_indicator_value:
@@ -13842,7 +13918,7 @@ class MidPointOverPeriodStrategies:
         cond_bull = (close_prev <= midpoint_prev) & (close > self.midpoint)
         cond_bear = (close_prev >= midpoint_prev) & (close < self.midpoint)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'Price_Above_MidPoint', -1: 'Price_Below_MidPoint', 0: 'Price_Neutral'}
@@ -13851,11 +13927,11 @@ class MidPointOverPeriodStrategies:
             -1: 'Closing price crossed below the midpoint, indicating bearish conditions.',
             0: 'No significant crossover between the price and the midpoint detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MidPointOverPeriod_Period:{self.period}_PriceCross_Signal'
         if append:
             if ta_indicator_value:
@@ -13882,7 +13958,7 @@ class MidPointOverPeriodStrategies:
             self.compute_values(df)
         diff_ratio = (df['Close'] - self.midpoint) / self.midpoint
         signals = np.where(diff_ratio > self.threshold, 1, np.where(diff_ratio < -self.threshold, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Significantly_Above_MidPoint', -1: 'Price_Significantly_Below_MidPoint', 0: 'Price_Close_to_MidPoint'}
@@ -13891,11 +13967,11 @@ class MidPointOverPeriodStrategies:
             -1: f'Closing price is more than {self.threshold*100:.1f}% below the midpoint, indicating strong bearish conditions.',
             0: f'Closing price is within {self.threshold*100:.1f}% of the midpoint, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MidPointOverPeriod_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -13922,7 +13998,7 @@ class MidPointOverPeriodStrategies:
             self.compute_values(df)
         diff = self.midpoint.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'MidPoint_Rising', -1: 'MidPoint_Falling', 0: 'MidPoint_Flat'}
@@ -13931,11 +14007,11 @@ class MidPointOverPeriodStrategies:
             -1: 'The midpoint is falling, indicating a downward shift in the price range.',
             0: 'The midpoint remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MidPointOverPeriod_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -13991,7 +14067,7 @@ class MidpointPricePeriodStrategies:
         cond_bull = (close_prev <= midpoint_prev) & (close > self.midpoint)
         cond_bear = (close_prev >= midpoint_prev) & (close < self.midpoint)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'Price_Above_Midpoint', -1: 'Price_Below_Midpoint', 0: 'Price_Neutral'}
@@ -14000,11 +14076,11 @@ class MidpointPricePeriodStrategies:
             -1: 'Closing price crossed below the midpoint, indicating bearish conditions.',
             0: 'Closing price remains near the midpoint, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MidpointPricePeriod_Period:{self.period}_PriceCross_Signal'
         if append:
             if ta_indicator_value:
@@ -14031,7 +14107,7 @@ class MidpointPricePeriodStrategies:
             self.compute_values(df)
         diff_ratio = (df['Close'] - self.midpoint) / self.midpoint
         signals = np.where(diff_ratio > self.threshold, 1, np.where(diff_ratio < -self.threshold, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Significantly_Above_Midpoint', -1: 'Price_Significantly_Below_Midpoint', 0: 'Price_Close_to_Midpoint'}
@@ -14040,11 +14116,11 @@ class MidpointPricePeriodStrategies:
             -1: f'Closing price is more than {self.threshold*100:.1f}% below the midpoint, indicating strong bearish conditions.',
             0: f'Closing price is within {self.threshold*100:.1f}% of the midpoint, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MidpointPricePeriod_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -14071,7 +14147,7 @@ class MidpointPricePeriodStrategies:
             self.compute_values(df)
         diff = self.midpoint.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Midpoint_Rising', -1: 'Midpoint_Falling', 0: 'Midpoint_Flat'}
@@ -14080,11 +14156,11 @@ class MidpointPricePeriodStrategies:
             -1: 'The midpoint is falling, indicating a downward shift in the price range.',
             0: 'The midpoint remains flat, indicating neutral price movement.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MidpointPricePeriod_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -14127,16 +14203,13 @@ class MinusDirectionalIndicatorStrategies:
         self.upper_threshold = upper_threshold
         self.di_minus = None
 
+    def required_primitives(self):
+        return [('TR', True), ('DM',)]
+
     def compute_values(self, df):
-        high = df['High']
-        low = df['Low']
-        close = df['Close']
-        prev_close = close.shift(1)
-        prev_high = high.shift(1)
-        prev_low = low.shift(1)
-        tr = pd.concat([high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1).max(axis=1)
-        dm_minus = prev_low - low
-        dm_minus = dm_minus.where((dm_minus > (high - prev_high)) & (dm_minus > 0), 0)
+        primitives = frame_primitives(self, df)
+        tr = primitives.get(('TR', True))
+        dm_minus = primitives.get(('DM',))[1]
         tr_sum = tr.rolling(window=self.period, min_periods=1).sum()
         dm_minus_sum = dm_minus.rolling(window=self.period, min_periods=1).sum()
         di_minus = 100 * dm_minus_sum / tr_sum
@@ -14150,7 +14223,7 @@ class MinusDirectionalIndicatorStrategies:
         cond_bear = (di_minus_prev <= self.baseline) & (self.di_minus > self.baseline)
         cond_bull = (di_minus_prev >= self.baseline) & (self.di_minus < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'DI-_Below_Baseline', -1: 'DI-_Above_Baseline', 0: 'DI-_Neutral'}
@@ -14159,11 +14232,11 @@ class MinusDirectionalIndicatorStrategies:
             -1: f'DI– crossed above the baseline of {self.baseline}, indicating rising bearish momentum (bearish signal).',
             0: f'DI– remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'DI-_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -14191,7 +14264,7 @@ class MinusDirectionalIndicatorStrategies:
         cond_bull = self.di_minus < self.lower_threshold
         cond_bear = self.di_minus > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'DI-_Low', -1: 'DI-_High', 0: 'DI-_Neutral'}
@@ -14200,11 +14273,11 @@ class MinusDirectionalIndicatorStrategies:
             -1: f'DI– is above the upper threshold of {self.upper_threshold}, indicating strong bearish pressure (bearish signal).',
             0: f'DI– is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'DI-_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -14231,7 +14304,7 @@ class MinusDirectionalIndicatorStrategies:
             self.compute_values(df)
         diff = self.di_minus.diff()
         signals = np.where(diff > 0, -1, np.where(diff < 0, 1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'DI-_Falling', -1: 'DI-_Rising', 0: 'DI-_Stable'}
@@ -14240,11 +14313,11 @@ class MinusDirectionalIndicatorStrategies:
             -1: 'DI– is rising, indicating that bearish momentum is increasing (bearish signal).',
             0: 'DI– is stable, indicating no significant change in bearish momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'DI-_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -14286,12 +14359,11 @@ class MinusDirectionalMovementStrategies:
         self.lower_threshold = lower_threshold
         self.minus_dm = None
 
+    def required_primitives(self):
+        return [('DM',)]
+
     def compute_values(self, df):
-        prev_high = df['High'].shift(1)
-        prev_low = df['Low'].shift(1)
-        down_move = prev_low - df['Low']
-        up_move = df['High'] - prev_high
-        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
+        minus_dm = frame_primitives(self, df).get(('DM',))[1]
         self.minus_dm = pd.Series(minus_dm, index=df.index).rolling(window=self.period, min_periods=1).mean()
         return self.minus_dm
 
@@ -14302,7 +14374,7 @@ class MinusDirectionalMovementStrategies:
         cond_bear = (prev_val <= self.baseline) & (self.minus_dm > self.baseline)
         cond_bull = (prev_val > self.baseline) & (self.minus_dm <= self.baseline)
         signals = np.select([cond_bear, cond_bull], [-1, 1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {-1: 'MinusDM_Above_Baseline', 1: 'MinusDM_Below_Baseline', 0: 'MinusDM_Neutral'}
@@ -14311,11 +14383,11 @@ class MinusDirectionalMovementStrategies:
             1: f'MinusDirectionalMovement crossed below the baseline of {self.baseline}, indicating the cessation of bearish movement and potential bullish reversal.',
             0: f'MinusDirectionalMovement remains near the baseline of {self.baseline}, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MinusDM_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -14343,7 +14415,7 @@ class MinusDirectionalMovementStrategies:
         cond_bear = self.minus_dm > self.upper_threshold
         cond_bull = self.minus_dm < self.lower_threshold
         signals = np.select([cond_bear, cond_bull], [-1, 1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {-1: 'MinusDM_High', 1: 'MinusDM_Low', 0: 'MinusDM_Neutral'}
@@ -14352,11 +14424,11 @@ class MinusDirectionalMovementStrategies:
             1: f'MinusDirectionalMovement is below the lower threshold of {self.lower_threshold}, indicating minimal bearish movement and potential bullish conditions.',
             0: f'MinusDirectionalMovement is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MinusDM_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -14383,7 +14455,7 @@ class MinusDirectionalMovementStrategies:
             self.compute_values(df)
         diff = self.minus_dm.diff()
         signals = np.where(diff > 0, -1, np.where(diff < 0, 1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {-1: 'MinusDM_Rising', 1: 'MinusDM_Falling', 0: 'MinusDM_Unchanged'}
@@ -14392,11 +14464,11 @@ class MinusDirectionalMovementStrategies:
             1: 'MinusDirectionalMovement is falling, indicating decreasing bearish pressure and potential bullish reversal.',
             0: 'MinusDirectionalMovement remains unchanged, indicating steady market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MinusDM_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -14434,8 +14506,11 @@ class MoneyFlowIndexStrategies:
         self.lower_threshold = lower_threshold
         self.mfi = None
 
+    def required_primitives(self):
+        return [('TYPICAL_PRICE',)]
+
     def compute_values(self, df):
-        typical_price = (df['High'] + df['Low'] + df['Close']) / 3
+        typical_price = frame_primitives(self, df).get(('TYPICAL_PRICE',))
         money_flow = typical_price * df['Volume']
         change = typical_price.diff()
         pos_flow = np.where(change > 0, money_flow, 0)
@@ -14454,7 +14529,7 @@ class MoneyFlowIndexStrategies:
         cond_bull = (mfi_prev <= self.baseline) & (self.mfi > self.baseline)
         cond_bear = (mfi_prev >= self.baseline) & (self.mfi < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'MFI_Above_Baseline', -1: 'MFI_Below_Baseline', 0: 'MFI_Neutral'}
@@ -14463,11 +14538,11 @@ class MoneyFlowIndexStrategies:
             -1: f'MFI crossed below the baseline of {self.baseline}, indicating bearish conditions.',
             0: f'MFI remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MFI_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -14495,7 +14570,7 @@ class MoneyFlowIndexStrategies:
         cond_bull = self.mfi < self.lower_threshold
         cond_bear = self.mfi > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'MFI_Oversold', -1: 'MFI_Overbought', 0: 'MFI_Neutral'}
@@ -14504,11 +14579,11 @@ class MoneyFlowIndexStrategies:
             -1: f'MFI is above the upper threshold of {self.upper_threshold}, indicating overbought conditions and potential bearish reversal.',
             0: 'MFI is within the normal range, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MFI_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -14535,7 +14610,7 @@ class MoneyFlowIndexStrategies:
             self.compute_values(df)
         diff = self.mfi.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'MFI_Rising', -1: 'MFI_Falling', 0: 'MFI_Unchanged'}
@@ -14544,11 +14619,11 @@ class MoneyFlowIndexStrategies:
             -1: 'MFI is falling, indicating increasing bearish momentum.',
             0: 'MFI remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MFI_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -14598,7 +14673,7 @@ class MomentumStrategies:
         cond_bull = (prev_val <= self.baseline) & (self.momentum > self.baseline)
         cond_bear = (prev_val >= self.baseline) & (self.momentum < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Momentum_Above_Baseline', -1: 'Momentum_Below_Baseline', 0: 'Momentum_Neutral'}
@@ -14607,11 +14682,11 @@ class MomentumStrategies:
             -1: f'Momentum crossed below the baseline of {self.baseline}, indicating emerging bearish momentum.',
             0: f'Momentum remains around the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Momentum_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -14639,7 +14714,7 @@ class MomentumStrategies:
         cond_bull = self.momentum > self.upper_threshold
         cond_bear = self.momentum < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Momentum_Strong_Bullish', -1: 'Momentum_Strong_Bearish', 0: 'Momentum_Neutral'}
@@ -14648,11 +14723,11 @@ class MomentumStrategies:
             -1: f'Momentum is below the lower threshold of {self.lower_threshold}, indicating strong bearish momentum.',
             0: f'Momentum is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Momentum_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -14679,7 +14754,7 @@ class MomentumStrategies:
             self.compute_values(df)
         diff = self.momentum.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Momentum_Rising', -1: 'Momentum_Falling', 0: 'Momentum_Unchanged'}
@@ -14688,11 +14763,11 @@ class MomentumStrategies:
             -1: 'Momentum is falling, indicating increasing bearish pressure.',
             0: 'Momentum remains unchanged, indicating a stable trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Momentum_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -14756,7 +14831,7 @@ class MomentumBreakoutBandsStrategies:
         cond_bull = (prev_mom <= prev_middle) & (self.momentum > self.middle)
         cond_bear = (prev_mom >= prev_middle) & (self.momentum < self.middle)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'MomentumAboveMiddle', -1: 'MomentumBelowMiddle', 0: 'MomentumNeutral'}
@@ -14765,11 +14840,11 @@ class MomentumBreakoutBandsStrategies:
             -1: 'Momentum has crossed below the middle band, indicating a potential bearish breakout.',
             0: 'Momentum remains near the middle band, indicating no clear breakout.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MBB_Period:{self.period}_Multiplier:{self.multiplier}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -14799,7 +14874,7 @@ class MomentumBreakoutBandsStrategies:
         cond_bull = self.momentum > upper_threshold
         cond_bear = self.momentum < lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'MomentumAboveUpperBand', -1: 'MomentumBelowLowerBand', 0: 'MomentumWithinBands'}
@@ -14808,11 +14883,11 @@ class MomentumBreakoutBandsStrategies:
             -1: 'Momentum is below the lower band, indicating a strong bearish breakout.',
             0: 'Momentum is within the breakout bands, indicating a lack of significant breakout.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MBB_Period:{self.period}_Multiplier:{self.multiplier}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -14839,7 +14914,7 @@ class MomentumBreakoutBandsStrategies:
             self.compute_values(df)
         diff = self.momentum.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'MomentumRising', -1: 'MomentumFalling', 0: 'MomentumStable'}
@@ -14848,11 +14923,11 @@ class MomentumBreakoutBandsStrategies:
             -1: 'Momentum is decreasing, suggesting strengthening bearish momentum.',
             0: 'Momentum remains stable, indicating no significant change in trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MBB_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -14919,7 +14994,7 @@ class MACDStrategies:
         cond_bull = (macd_prev <= signal_prev) & (self.macd > self.signal)
         cond_bear = (macd_prev >= signal_prev) & (self.macd < self.signal)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'MACD_CrossAbove_Signal', -1: 'MACD_CrossBelow_Signal', 0: 'MACD_Neutral'}
@@ -14928,11 +15003,11 @@ class MACDStrategies:
             -1: 'MACD line crossed below the Signal line, indicating bearish momentum.',
             0: 'No cross detected between MACD and Signal lines, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MACD_SP:{self.short_period}_LP:{self.long_period}_SigP:{self.signal_period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -14960,7 +15035,7 @@ class MACDStrategies:
         cond_bull = self.histogram > 0
         cond_bear = self.histogram < 0
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Histogram_Positive', -1: 'Histogram_Negative', 0: 'Histogram_Neutral'}
@@ -14969,11 +15044,11 @@ class MACDStrategies:
             -1: 'The MACD Histogram is negative, suggesting bearish momentum as MACD is below the Signal line.',
             0: 'The MACD Histogram is neutral, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MACD_SP:{self.short_period}_LP:{self.long_period}_SigP:{self.signal_period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -15000,7 +15075,7 @@ class MACDStrategies:
             self.compute_values(df)
         diff = self.macd.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'MACD_Rising', -1: 'MACD_Falling', 0: 'MACD_Unchanged'}
@@ -15009,11 +15084,11 @@ class MACDStrategies:
             -1: 'The MACD line is falling, indicating increasing bearish momentum.',
             0: 'The MACD line remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'MACD_SP:{self.short_period}_LP:{self.long_period}_SigP:{self.signal_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -15053,16 +15128,7 @@ class MovingStandardDeviationStrategies:
         self.std_series = None
 
     def compute_values(self, df):
-        prices = df['Close'].tolist()
-        std_values = []
-        for i in range(len(prices)):
-            if i < self.period - 1:
-                window = prices[:i + 1]
-            else:
-                window = prices[i - self.period + 1:i + 1]
-            mean_val = sum(window) / len(window)
-            variance = sum((x - mean_val) ** 2 for x in window) / len(window)
-            std_values.append(variance ** 0.5)
+        std_values = rolling_std(df['Close'].values, self.period, min_periods=1)
         self.std_series = pd.Series(std_values, index=df.index)
         return self.std_series
 
@@ -15073,7 +15139,7 @@ class MovingStandardDeviationStrategies:
         cond_bull = (std_prev <= self.baseline) & (self.std_series > self.baseline)
         cond_bear = (std_prev >= self.baseline) & (self.std_series < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'StdDev_Above_Baseline', -1: 'StdDev_Below_Baseline', 0: 'StdDev_Neutral'}
@@ -15082,11 +15148,11 @@ class MovingStandardDeviationStrategies:
             -1: f'Moving Standard Deviation crossed below the baseline of {self.baseline}, indicating decreasing volatility.',
             0: f'Moving Standard Deviation remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StdDev_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -15114,7 +15180,7 @@ class MovingStandardDeviationStrategies:
         cond_bull = self.std_series < self.lower_threshold
         cond_bear = self.std_series > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Low_Volatility', -1: 'High_Volatility', 0: 'Volatility_Neutral'}
@@ -15123,11 +15189,11 @@ class MovingStandardDeviationStrategies:
             -1: f'Moving Standard Deviation is above the upper threshold of {self.upper_threshold}, indicating high volatility.',
             0: f'Moving Standard Deviation is between {self.lower_threshold} and {self.upper_threshold}, indicating normal volatility.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StdDev_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -15154,7 +15220,7 @@ class MovingStandardDeviationStrategies:
             self.compute_values(df)
         diff = self.std_series.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Volatility_Increasing', -1: 'Volatility_Decreasing', 0: 'Volatility_Unchanged'}
@@ -15163,11 +15229,11 @@ class MovingStandardDeviationStrategies:
             -1: 'Moving Standard Deviation is falling, indicating decreasing volatility and potential market consolidation.',
             0: 'Moving Standard Deviation remains unchanged, indicating stable volatility conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StdDev_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -15225,7 +15291,7 @@ class NegativeVolumeIndexStrategies:
         cond_bull = (nvi_prev <= self.baseline) & (self.nvi > self.baseline)
         cond_bear = (nvi_prev >= self.baseline) & (self.nvi < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'NVI_Above_Baseline', -1: 'NVI_Below_Baseline', 0: 'NVI_Neutral'}
@@ -15234,11 +15300,11 @@ class NegativeVolumeIndexStrategies:
             -1: f'NVI crossed below the baseline of {self.baseline}, suggesting potential bearish conditions.',
             0: f'NVI remains around the baseline of {self.baseline}, indicating neutral market sentiment.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'NVI_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -15266,7 +15332,7 @@ class NegativeVolumeIndexStrategies:
         cond_bull = self.nvi > self.upper_threshold
         cond_bear = self.nvi < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'NVI_Over_Upper_Threshold', -1: 'NVI_Under_Lower_Threshold', 0: 'NVI_Within_Thresholds'}
@@ -15275,11 +15341,11 @@ class NegativeVolumeIndexStrategies:
             -1: f'NVI is below the lower threshold of {self.lower_threshold}, indicating strong bearish sentiment.',
             0: f'NVI is between the thresholds of {self.lower_threshold} and {self.upper_threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'NVI_LowerThreshold:{self.lower_threshold}_UpperThreshold:{self.upper_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -15306,7 +15372,7 @@ class NegativeVolumeIndexStrategies:
             self.compute_values(df)
         diff = self.nvi.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'NVI_Rising', -1: 'NVI_Falling', 0: 'NVI_Unchanged'}
@@ -15315,11 +15381,11 @@ class NegativeVolumeIndexStrategies:
             -1: 'NVI is falling, suggesting accumulating bearish momentum during low volume periods.',
             0: 'NVI remains unchanged, indicating a lack of significant movement in low volume conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'NVI_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -15357,10 +15423,11 @@ class NormalizedAverageTrueRangeStrategies:
         self.lower_threshold = lower_threshold
         self.upper_threshold = upper_threshold
 
+    def required_primitives(self):
+        return [('ATR', self.period, self.period, False)]
+
     def compute_values(self, df):
-        prev_close = df['Close'].shift(1)
-        tr = np.maximum(np.maximum(df['High'] - df['Low'], (df['High'] - prev_close).abs()), (df['Low'] - prev_close).abs())
-        atr = pd.Series(tr).rolling(window=self.period, min_periods=self.period).mean()
+        atr = frame_primitives(self, df).get(('ATR', self.period, self.period, False))
         natr = (atr / df['Close']) * 100
         self.natr = pd.Series(natr, index=df.index)
         return self.natr
@@ -15372,7 +15439,7 @@ class NormalizedAverageTrueRangeStrategies:
         cond_bull = (natr_prev <= self.baseline) & (self.natr > self.baseline)
         cond_bear = (natr_prev >= self.baseline) & (self.natr < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'NATR_Volatility_Surge', -1: 'NATR_Volatility_Fade', 0: 'NATR_Neutral'}
@@ -15381,11 +15448,11 @@ class NormalizedAverageTrueRangeStrategies:
             -1: f'Normalized ATR crossed below the baseline of {self.baseline}, indicating a fade in volatility and potential consolidation.',
             0: f'Normalized ATR remains around the baseline of {self.baseline}, indicating stable volatility conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'NATR_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -15413,7 +15480,7 @@ class NormalizedAverageTrueRangeStrategies:
         cond_bull = self.natr < self.lower_threshold
         cond_bear = self.natr > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'NATR_Low_Volatility', -1: 'NATR_High_Volatility', 0: 'NATR_Moderate'}
@@ -15422,11 +15489,11 @@ class NormalizedAverageTrueRangeStrategies:
             -1: f'Normalized ATR is above the upper threshold of {self.upper_threshold}, indicating high volatility that may precede reversals or whipsaws.',
             0: f'Normalized ATR is between {self.lower_threshold} and {self.upper_threshold}, indicating moderate volatility conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'NATR_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -15453,7 +15520,7 @@ class NormalizedAverageTrueRangeStrategies:
             self.natr = self.compute_values(df)
         diff = self.natr.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'NATR_Rising', -1: 'NATR_Falling', 0: 'NATR_Unchanged'}
@@ -15462,11 +15529,11 @@ class NormalizedAverageTrueRangeStrategies:
             -1: 'Normalized ATR is falling, indicating decreasing volatility which may favor trend continuation.',
             0: 'Normalized ATR remains unchanged, indicating stable volatility conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'NATR_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -15519,7 +15586,7 @@ class NormalizedBASPStrategies:
         cond_bull = (nbasp_prev <= self.baseline) & (self.nbasp > self.baseline)
         cond_bear = (nbasp_prev >= self.baseline) & (self.nbasp < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'NBASP_Above_Baseline', -1: 'NBASP_Below_Baseline', 0: 'NBASP_Neutral'}
@@ -15528,11 +15595,11 @@ class NormalizedBASPStrategies:
             -1: f'NormalizedBASP crossed below the baseline of {self.baseline}, indicating the price has moved below its moving average.',
             0: f'NormalizedBASP remains around the baseline of {self.baseline}, indicating no clear directional shift.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'NBASP_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -15560,7 +15627,7 @@ class NormalizedBASPStrategies:
         cond_bull = self.nbasp < self.lower_threshold
         cond_bear = self.nbasp > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'NBASP_Undersold', -1: 'NBASP_Overbought', 0: 'NBASP_Normal'}
@@ -15569,11 +15636,11 @@ class NormalizedBASPStrategies:
             -1: f'NormalizedBASP is above the upper threshold of {self.upper_threshold}, suggesting the price is significantly over its moving average (potential bearish reversal).',
             0: f'NormalizedBASP is between {self.lower_threshold} and {self.upper_threshold}, indicating normal deviation levels.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'NBASP_Period:{self.period}_LowerThreshold:{self.lower_threshold}_UpperThreshold:{self.upper_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -15600,7 +15667,7 @@ class NormalizedBASPStrategies:
             self.compute_values(df)
         diff = self.nbasp.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'NBASP_Rising', -1: 'NBASP_Falling', 0: 'NBASP_Unchanged'}
@@ -15609,11 +15676,11 @@ class NormalizedBASPStrategies:
             -1: 'NormalizedBASP is falling, indicating the price is moving further below its moving average.',
             0: 'NormalizedBASP remains unchanged, indicating stable deviation from its moving average.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'NBASP_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -15671,7 +15738,7 @@ class OnBalanceVolumeStrategies:
         cond_bull = (obv_prev <= self.baseline) & (self.obv > self.baseline)
         cond_bear = (obv_prev >= self.baseline) & (self.obv < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'OBV_Above_Baseline', -1: 'OBV_Below_Baseline', 0: 'OBV_Neutral'}
@@ -15680,11 +15747,11 @@ class OnBalanceVolumeStrategies:
             -1: f'OBV crossed below the baseline of {self.baseline}, indicating distribution and bearish pressure.',
             0: f'OBV remains near the baseline of {self.baseline}, indicating neutral volume flow.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'OBV_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -15712,7 +15779,7 @@ class OnBalanceVolumeStrategies:
         cond_bull = self.obv > self.upper_threshold
         cond_bear = self.obv < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'OBV_Over_Upper_Threshold', -1: 'OBV_Under_Lower_Threshold', 0: 'OBV_Neutral'}
@@ -15721,11 +15788,11 @@ class OnBalanceVolumeStrategies:
             -1: f'OBV is below the lower threshold of {self.lower_threshold}, indicating strong distribution and bearish sentiment.',
             0: f'OBV is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced volume flow.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'OBV_LowerThreshold:{self.lower_threshold}_UpperThreshold:{self.upper_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -15752,7 +15819,7 @@ class OnBalanceVolumeStrategies:
             self.compute_values(df)
         diff = self.obv.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'OBV_Rising', -1: 'OBV_Falling', 0: 'OBV_Unchanged'}
@@ -15761,11 +15828,11 @@ class OnBalanceVolumeStrategies:
             -1: 'OBV is falling, indicating increasing selling pressure and distribution.',
             0: 'OBV remains unchanged, indicating a lack of clear volume-driven trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'OBV_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -15814,7 +15881,7 @@ class OHLC_AverageStrategies:
         cond_bull = (ohlc_prev <= self.baseline) & (self.ohlc_avg > self.baseline)
         cond_bear = (ohlc_prev >= self.baseline) & (self.ohlc_avg < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'OHLC_Avg_Above_Baseline', -1: 'OHLC_Avg_Below_Baseline', 0: 'OHLC_Avg_Neutral'}
@@ -15823,11 +15890,11 @@ class OHLC_AverageStrategies:
             -1: f'OHLC Average crossed below the baseline of {self.baseline}, suggesting bearish momentum.',
             0: f'OHLC Average remains near the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'OHLCAvg_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -15855,7 +15922,7 @@ class OHLC_AverageStrategies:
         cond_bull = self.ohlc_avg < self.lower_threshold
         cond_bear = self.ohlc_avg > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'OHLC_Avg_Undersold', -1: 'OHLC_Avg_Overbought', 0: 'OHLC_Avg_Normal'}
@@ -15864,11 +15931,11 @@ class OHLC_AverageStrategies:
             -1: f'OHLC Average is above the upper threshold of {self.upper_threshold}, suggesting the price is overvalued (potential bearish reversal).',
             0: f'OHLC Average is between {self.lower_threshold} and {self.upper_threshold}, indicating normal price levels.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'OHLCAvg_LowerThreshold:{self.lower_threshold}_UpperThreshold:{self.upper_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -15895,7 +15962,7 @@ class OHLC_AverageStrategies:
             self.compute_values(df)
         diff = self.ohlc_avg.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'OHLC_Avg_Rising', -1: 'OHLC_Avg_Falling', 0: 'OHLC_Avg_Unchanged'}
@@ -15904,11 +15971,11 @@ class OHLC_AverageStrategies:
             -1: 'OHLC Average is falling, indicating downward price momentum.',
             0: 'OHLC Average remains unchanged, indicating no clear trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'OHLCAvg_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -15949,53 +16016,11 @@ class ParabolicStopAndReverseStrategies:
         self.psar = None
 
     def compute_values(self, df):
-        psar_list = []
         if len(df) < 2:
             self.psar = pd.Series([None] * len(df), index=df.index)
             return self.psar
-        if df['Close'].iloc[1] > df['Close'].iloc[0]:
-            trend = 'up'
-            psar = df['Low'].iloc[0]
-            ep = df['High'].iloc[0]
-        else:
-            trend = 'down'
-            psar = df['High'].iloc[0]
-            ep = df['Low'].iloc[0]
-        af = self.initial_af
-        psar_list.append(psar)
-        if trend == 'up':
-            psar = df['Low'].iloc[0]
-            ep = max(df['High'].iloc[0], df['High'].iloc[1])
-        else:
-            psar = df['High'].iloc[0]
-            ep = min(df['Low'].iloc[0], df['Low'].iloc[1])
-        psar_list.append(psar)
-        for i in range(2, len(df)):
-            prev_psar = psar
-            if trend == 'up':
-                psar = prev_psar + af * (ep - prev_psar)
-                psar = min(psar, df['Low'].iloc[i - 1], df['Low'].iloc[i - 2])
-                if df['High'].iloc[i] > ep:
-                    ep = df['High'].iloc[i]
-                    af = min(af + self.initial_af, self.max_af)
-                if df['Low'].iloc[i] < psar:
-                    trend = 'down'
-                    psar = ep
-                    ep = df['Low'].iloc[i]
-                    af = self.initial_af
-            else:
-                psar = prev_psar - af * (prev_psar - ep)
-                psar = max(psar, df['High'].iloc[i - 1], df['High'].iloc[i - 2])
-                if df['Low'].iloc[i] < ep:
-                    ep = df['Low'].iloc[i]
-                    af = min(af + self.initial_af, self.max_af)
-                if df['High'].iloc[i] > psar:
-                    trend = 'up'
-                    psar = ep
-                    ep = df['High'].iloc[i]
-                    af = self.initial_af
-            psar_list.append(psar)
-        self.psar = pd.Series(psar_list, index=df.index)
+        psar = parabolic_sar(df['High'], df['Low'], df['Close'], self.initial_af, self.max_af)
+        self.psar = pd.Series(psar, index=df.index)
         return self.psar
 
     def calculate_scores_zero_cross_strategy(self, df):
@@ -16006,7 +16031,7 @@ class ParabolicStopAndReverseStrategies:
         cond_bull = (diff_prev <= self.baseline) & (diff_current > self.baseline)
         cond_bear = (diff_prev >= self.baseline) & (diff_current < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'PSAR_Bullish_Cross', -1: 'PSAR_Bearish_Cross', 0: 'PSAR_Neutral'}
@@ -16015,11 +16040,11 @@ class ParabolicStopAndReverseStrategies:
             -1: f'Close price crossed below the PSAR, indicating a potential bearish reversal.',
             0: 'No significant PSAR crossover detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PSAR_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -16048,7 +16073,7 @@ class ParabolicStopAndReverseStrategies:
         cond_bull = diff > self.upper_threshold
         cond_bear = diff < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'PSAR_Strong_Bullish', -1: 'PSAR_Strong_Bearish', 0: 'PSAR_Normal'}
@@ -16057,11 +16082,11 @@ class ParabolicStopAndReverseStrategies:
             -1: f'Close is significantly below PSAR (by more than {abs(self.lower_threshold)}), indicating strong bearish momentum.',
             0: 'Close is near PSAR, indicating balanced market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PSAR_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -16088,7 +16113,7 @@ class ParabolicStopAndReverseStrategies:
             self.compute_values(df)
         diff = self.psar.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PSAR_Rising', -1: 'PSAR_Falling', 0: 'PSAR_Unchanged'}
@@ -16097,11 +16122,11 @@ class ParabolicStopAndReverseStrategies:
             -1: 'PSAR is falling, indicating a downtrend continuation.',
             0: 'PSAR remains unchanged, indicating potential consolidation.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PSAR_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -16140,22 +16165,14 @@ class PascalsWeightedMovingAverageStrategies:
         self.pwma = None
 
     def compute_values(self, df):
-        values = []
-        for i in range(len(df)):
-            if i < self.period - 1:
-                window = df['Close'].iloc[:i+1]
-                n = len(window)
-                weights = [math.comb(n-1, k) for k in range(n)]
-                weighted_sum = sum(w * p for w, p in zip(weights, window))
-                total_weight = sum(weights)
-                values.append(weighted_sum / total_weight)
-            else:
-                window = df['Close'].iloc[i-self.period+1:i+1]
-                n = self.period
-                weights = [math.comb(n-1, k) for k in range(n)]
-                weighted_sum = sum(w * p for w, p in zip(weights, window))
-                total_weight = sum(weights)
-                values.append(weighted_sum / total_weight)
+        prices = df['Close'].to_numpy(dtype=float)
+        values = np.empty(len(prices))
+        # Warm-up bars use a shorter binomial row over the partial window
+        for n in range(1, min(self.period, len(prices) + 1)):
+            weights = [math.comb(n - 1, k) for k in range(n)]
+            values[n - 1] = weighted_window_sums(prices[:n], weights)[0] / sum(weights)
+        weights = [math.comb(self.period - 1, k) for k in range(self.period)]
+        values[self.period - 1:] = weighted_window_sums(prices, weights) / sum(weights)
         self.pwma = pd.Series(values, index=df.index)
         return self.pwma
 
@@ -16169,7 +16186,7 @@ class PascalsWeightedMovingAverageStrategies:
         cond_bull = (close_prev - indicator_prev <= 0) & (close_current - indicator_current > 0)
         cond_bear = (close_prev - indicator_prev >= 0) & (close_current - indicator_current < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Above_PWMA', -1: 'Price_Below_PWMA', 0: 'Price_Near_PWMA'}
@@ -16178,11 +16195,11 @@ class PascalsWeightedMovingAverageStrategies:
             -1: 'The close price has crossed below the Pascals Weighted Moving Average, indicating bearish momentum.',
             0: 'The close price remains near the Pascals Weighted Moving Average, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PWMA_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -16211,7 +16228,7 @@ class PascalsWeightedMovingAverageStrategies:
         cond_bull = diff > self.upper_threshold
         cond_bear = diff < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Above_Upper_Threshold', -1: 'Price_Below_Lower_Threshold', 0: 'Price_Near_PWMA'}
@@ -16220,11 +16237,11 @@ class PascalsWeightedMovingAverageStrategies:
             -1: f'The close price is more than {abs(self.lower_threshold)}% below the Pascals Weighted Moving Average, indicating strong bearish momentum.',
             0: f'The close price is within the thresholds, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PWMA_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -16251,7 +16268,7 @@ class PascalsWeightedMovingAverageStrategies:
             self.compute_values(df)
         diff = self.pwma.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PWMA_Rising', -1: 'PWMA_Falling', 0: 'PWMA_Unchanged'}
@@ -16260,11 +16277,11 @@ class PascalsWeightedMovingAverageStrategies:
             -1: 'The Pascals Weighted Moving Average is falling, indicating downward momentum.',
             0: 'The Pascals Weighted Moving Average remains unchanged, indicating a lack of clear trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PWMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -16316,7 +16333,7 @@ class PearsonsCorrelationCoefficientStrategies:
         cond_bull = (pcc_prev <= self.baseline) & (self.pcc > self.baseline)
         cond_bear = (pcc_prev >= self.baseline) & (self.pcc < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'PCC_Above_Baseline', -1: 'PCC_Below_Baseline', 0: 'PCC_Neutral'}
@@ -16325,11 +16342,11 @@ class PearsonsCorrelationCoefficientStrategies:
             -1: f'PCC crossed below the baseline of {self.baseline}, indicating a shift towards a negative correlation.',
             0: f'PCC remains around the baseline of {self.baseline}, indicating neutral correlation.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PCC_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -16357,7 +16374,7 @@ class PearsonsCorrelationCoefficientStrategies:
         cond_bull = self.pcc > self.upper_threshold
         cond_bear = self.pcc < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Strong_Positive_Correlation', -1: 'Strong_Negative_Correlation', 0: 'Moderate_Correlation'}
@@ -16366,11 +16383,11 @@ class PearsonsCorrelationCoefficientStrategies:
             -1: f'PCC is below the lower threshold of {self.lower_threshold}, indicating strong negative correlation between {self.col1} and {self.col2}.',
             0: f'PCC is between {self.lower_threshold} and {self.upper_threshold}, indicating moderate or neutral correlation.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PCC_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -16397,7 +16414,7 @@ class PearsonsCorrelationCoefficientStrategies:
             self.compute_values(df)
         diff = self.pcc.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PCC_Rising', -1: 'PCC_Falling', 0: 'PCC_Unchanged'}
@@ -16406,11 +16423,11 @@ class PearsonsCorrelationCoefficientStrategies:
             -1: 'PCC is falling, indicating a weakening positive correlation or strengthening negative correlation.',
             0: 'PCC remains unchanged, indicating stable correlation levels.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PCC_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -16450,9 +16467,12 @@ class PercentBStrategies:
         self.upper_threshold = upper_threshold
         self.percentb = None
 
+    def required_primitives(self):
+        return [('STD', 'Close', self.period, 1)]
+
     def compute_values(self, df):
         sma = df['Close'].rolling(window=self.period, min_periods=1).mean()
-        std = df['Close'].rolling(window=self.period, min_periods=1).std()
+        std = frame_primitives(self, df).get(('STD', 'Close', self.period, 1))
         upper_band = sma + self.multiplier * std
         lower_band = sma - self.multiplier * std
         self.percentb = (df['Close'] - lower_band) / (upper_band - lower_band)
@@ -16465,7 +16485,7 @@ class PercentBStrategies:
         cond_bull = (percentb_prev <= self.baseline) & (self.percentb > self.baseline)
         cond_bear = (percentb_prev >= self.baseline) & (self.percentb < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'PercentB_Above_Baseline', -1: 'PercentB_Below_Baseline', 0: 'PercentB_Neutral'}
@@ -16474,11 +16494,11 @@ class PercentBStrategies:
             -1: f'PercentB crossed below the baseline of {self.baseline}, indicating a shift toward bearish momentum.',
             0: f'PercentB remains around the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PercentB_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -16506,7 +16526,7 @@ class PercentBStrategies:
         cond_bull = self.percentb < self.lower_threshold
         cond_bear = self.percentb > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Oversold', -1: 'Overbought', 0: 'Normal'}
@@ -16515,11 +16535,11 @@ class PercentBStrategies:
             -1: f'PercentB is above the upper threshold of {self.upper_threshold}, indicating overbought conditions and potential bearish reversal.',
             0: f'PercentB is between {self.lower_threshold} and {self.upper_threshold}, indicating normal market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PercentB_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -16546,7 +16566,7 @@ class PercentBStrategies:
             self.compute_values(df)
         diff = self.percentb.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PercentB_Rising', -1: 'PercentB_Falling', 0: 'PercentB_Unchanged'}
@@ -16555,11 +16575,11 @@ class PercentBStrategies:
             -1: 'PercentB is falling, indicating the price is moving downward from overbought levels.',
             0: 'PercentB remains unchanged, indicating a lack of directional movement.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PercentB_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -16613,7 +16633,7 @@ class PercentagePriceOscillatorStrategies:
         cond_bull = (ppo_prev <= self.baseline) & (self.ppo > self.baseline)
         cond_bear = (ppo_prev >= self.baseline) & (self.ppo < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'PPO_Above_Baseline', -1: 'PPO_Below_Baseline', 0: 'PPO_Neutral'}
@@ -16622,11 +16642,11 @@ class PercentagePriceOscillatorStrategies:
             -1: f'PPO crossed below the baseline of {self.baseline}, indicating bearish momentum as the fast MA falls below the slow MA.',
             0: f'PPO remains near the baseline of {self.baseline}, indicating a neutral trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PPO_FP:{self.fast_period}_SP:{self.slow_period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -16654,7 +16674,7 @@ class PercentagePriceOscillatorStrategies:
         cond_bull = self.ppo < self.lower_threshold
         cond_bear = self.ppo > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'PPO_Oversold', -1: 'PPO_Overbought', 0: 'PPO_Normal'}
@@ -16663,11 +16683,11 @@ class PercentagePriceOscillatorStrategies:
             -1: f'PPO is above the upper threshold of {self.upper_threshold}, suggesting overbought conditions and a potential bearish reversal.',
             0: f'PPO is between {self.lower_threshold} and {self.upper_threshold}, indicating normal market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PPO_FP:{self.fast_period}_SP:{self.slow_period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -16694,7 +16714,7 @@ class PercentagePriceOscillatorStrategies:
             self.compute_values(df)
         diff = self.ppo.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PPO_Rising', -1: 'PPO_Falling', 0: 'PPO_Unchanged'}
@@ -16703,11 +16723,11 @@ class PercentagePriceOscillatorStrategies:
             -1: 'PPO is falling, indicating strengthening bearish momentum as the fast MA lags further behind the slow MA.',
             0: 'PPO remains unchanged, indicating a lack of clear momentum shift.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PPO_FP:{self.fast_period}_SP:{self.slow_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -16760,7 +16780,7 @@ class PercentageVolumeOscillatorStrategies:
         cond_bull = (pvo_prev <= self.baseline) & (self.pvo > self.baseline)
         cond_bear = (pvo_prev >= self.baseline) & (self.pvo < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'PVO_Above_Baseline', -1: 'PVO_Below_Baseline', 0: 'PVO_Neutral'}
@@ -16769,11 +16789,11 @@ class PercentageVolumeOscillatorStrategies:
             -1: f'PVO crossed below the baseline of {self.baseline}, indicating falling short-term volume momentum relative to the long-term average.',
             0: f'PVO remains near the baseline of {self.baseline}, indicating neutral volume momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PVO_FP:{self.fast_period}_SP:{self.slow_period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -16801,7 +16821,7 @@ class PercentageVolumeOscillatorStrategies:
         cond_bull = self.pvo < self.lower_threshold
         cond_bear = self.pvo > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'PVO_Undersold', -1: 'PVO_Overbought', 0: 'PVO_Normal'}
@@ -16810,11 +16830,11 @@ class PercentageVolumeOscillatorStrategies:
             -1: f'PVO is above the upper threshold of {self.upper_threshold}, suggesting strong volume momentum and potential bearish conditions.',
             0: f'PVO is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced volume activity.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PVO_FP:{self.fast_period}_SP:{self.slow_period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -16841,7 +16861,7 @@ class PercentageVolumeOscillatorStrategies:
             self.compute_values(df)
         diff = self.pvo.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PVO_Rising', -1: 'PVO_Falling', 0: 'PVO_Unchanged'}
@@ -16850,11 +16870,11 @@ class PercentageVolumeOscillatorStrategies:
             -1: 'PVO is falling, indicating decreasing short-term volume momentum relative to the long-term average.',
             0: 'PVO remains unchanged, indicating stable volume momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PVO_FP:{self.fast_period}_SP:{self.slow_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -16913,7 +16933,7 @@ class PivotPointsStrategies:
         cond_bull = (close_prev <= self.pivot) & (close_current > self.pivot)
         cond_bear = (close_prev >= self.pivot) & (close_current < self.pivot)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Above_Pivot', -1: 'Price_Below_Pivot', 0: 'Price_Near_Pivot'}
@@ -16922,11 +16942,11 @@ class PivotPointsStrategies:
             -1: 'The price has crossed below the Pivot point, suggesting bearish sentiment.',
             0: 'The price remains near the Pivot point, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'Pivot_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -16954,7 +16974,7 @@ class PivotPointsStrategies:
         cond_bull = df['Close'] > self.r1
         cond_bear = df['Close'] < self.s1
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Above_R1', -1: 'Price_Below_S1', 0: 'Within_R1_S1'}
@@ -16963,11 +16983,11 @@ class PivotPointsStrategies:
             -1: 'The price is below the first support level (S1), suggesting strong bearish momentum.',
             0: 'The price is between the first support and resistance levels, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'Pivot_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -16994,7 +17014,7 @@ class PivotPointsStrategies:
             self.compute_values(df)
         diff = self.pivot.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Pivot_Rising', -1: 'Pivot_Falling', 0: 'Pivot_Unchanged'}
@@ -17003,11 +17023,11 @@ class PivotPointsStrategies:
             -1: 'The Pivot point is falling, suggesting a bearish shift in market sentiment.',
             0: 'The Pivot point remains unchanged, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'Pivot_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -17046,14 +17066,13 @@ class PlusDirectionalIndicatorStrategies:
         self.upper_threshold = upper_threshold
         self.plus_di = None
 
+    def required_primitives(self):
+        return [('DM',), ('TR', True)]
+
     def compute_values(self, df):
-        high_diff = df['High'] - df['High'].shift(1)
-        low_diff = df['Low'].shift(1) - df['Low']
-        plus_dm = np.where((high_diff > low_diff) & (high_diff > 0), high_diff, 0)
-        tr1 = df['High'] - df['Low']
-        tr2 = (df['High'] - df['Close'].shift(1)).abs()
-        tr3 = (df['Low'] - df['Close'].shift(1)).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        primitives = frame_primitives(self, df)
+        plus_dm = primitives.get(('DM',))[0]
+        tr = primitives.get(('TR', True))
         sum_plus_dm = pd.Series(plus_dm, index=df.index).rolling(window=self.period, min_periods=1).sum()
         sum_tr = tr.rolling(window=self.period, min_periods=1).sum()
         self.plus_di = 100 * (sum_plus_dm / sum_tr)
@@ -17066,7 +17085,7 @@ class PlusDirectionalIndicatorStrategies:
         cond_bull = (pdi_prev <= self.baseline) & (self.plus_di > self.baseline)
         cond_bear = (pdi_prev >= self.baseline) & (self.plus_di < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'PlusDI_Above_Baseline', -1: 'PlusDI_Below_Baseline', 0: 'PlusDI_Neutral'}
@@ -17075,11 +17094,11 @@ class PlusDirectionalIndicatorStrategies:
             -1: f'PlusDI crossed below the baseline of {self.baseline}, suggesting weakening bullish strength or potential bearish shift.',
             0: f'PlusDI remains around the baseline of {self.baseline}, indicating neutral directional strength.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PlusDI_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -17107,7 +17126,7 @@ class PlusDirectionalIndicatorStrategies:
         cond_bull = self.plus_di > self.upper_threshold
         cond_bear = self.plus_di < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Strong_Bullish', -1: 'Weak_Bullish', 0: 'Neutral'}
@@ -17116,11 +17135,11 @@ class PlusDirectionalIndicatorStrategies:
             -1: f'PlusDI is below the lower threshold of {self.lower_threshold}, indicating weak bullish signals or potential bearish pressure.',
             0: f'PlusDI is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced directional strength.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PlusDI_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -17147,7 +17166,7 @@ class PlusDirectionalIndicatorStrategies:
             self.compute_values(df)
         diff = self.plus_di.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PlusDI_Rising', -1: 'PlusDI_Falling', 0: 'PlusDI_Unchanged'}
@@ -17156,11 +17175,11 @@ class PlusDirectionalIndicatorStrategies:
             -1: 'PlusDI is falling, indicating a weakening bullish trend or emerging bearish sentiment.',
             0: 'PlusDI remains unchanged, indicating stable directional strength.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PlusDI_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -17199,10 +17218,11 @@ class PlusDirectionalMovementStrategies:
         self.upper_threshold = upper_threshold
         self.plus_dm = None
 
+    def required_primitives(self):
+        return [('DM',)]
+
     def compute_values(self, df):
-        high_diff = df['High'] - df['High'].shift(1)
-        low_diff = df['Low'].shift(1) - df['Low']
-        self.plus_dm = pd.Series(np.where((high_diff > low_diff) & (high_diff > 0), high_diff, 0), index=df.index)
+        self.plus_dm = pd.Series(frame_primitives(self, df).get(('DM',))[0], index=df.index)
         return self.plus_dm
 
     def calculate_scores_zero_cross_strategy(self, df):
@@ -17212,7 +17232,7 @@ class PlusDirectionalMovementStrategies:
         cond_bull = (pdm_prev <= self.baseline) & (self.plus_dm > self.baseline)
         cond_bear = (pdm_prev > self.baseline) & (self.plus_dm <= self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'PlusDM_Crossed_Above_Baseline', -1: 'PlusDM_Crossed_Below_Baseline', 0: 'PlusDM_Neutral'}
@@ -17221,11 +17241,11 @@ class PlusDirectionalMovementStrategies:
             -1: f'PlusDirectionalMovement dropped to zero from a positive value, suggesting a loss of upward momentum.',
             0: 'No significant change in PlusDirectionalMovement was observed.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'PlusDM_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -17253,7 +17273,7 @@ class PlusDirectionalMovementStrategies:
         cond_bull = self.plus_dm > self.upper_threshold
         cond_bear = self.plus_dm < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Strong_Upward_Movement', -1: 'Weak_Upward_Movement', 0: 'Moderate_Movement'}
@@ -17262,11 +17282,11 @@ class PlusDirectionalMovementStrategies:
             -1: f'PlusDirectionalMovement is below the lower threshold of {self.lower_threshold}, suggesting little to no upward movement.',
             0: f'PlusDirectionalMovement is between {self.lower_threshold} and {self.upper_threshold}, indicating moderate movement.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'PlusDM_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -17293,7 +17313,7 @@ class PlusDirectionalMovementStrategies:
             self.compute_values(df)
         diff = self.plus_dm.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PlusDM_Rising', -1: 'PlusDM_Falling', 0: 'PlusDM_Unchanged'}
@@ -17302,11 +17322,11 @@ class PlusDirectionalMovementStrategies:
             -1: 'PlusDirectionalMovement is falling, indicating a reduction in upward movement.',
             0: 'PlusDirectionalMovement remains unchanged, indicating stable conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'PlusDM_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -17363,7 +17383,7 @@ class PositiveVolumeIndexStrategies:
         cond_bull = (pvi_prev <= self.baseline) & (self.pvi > self.baseline)
         cond_bear = (pvi_prev >= self.baseline) & (self.pvi < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'PVI_Above_Baseline', -1: 'PVI_Below_Baseline', 0: 'PVI_Neutral'}
@@ -17372,11 +17392,11 @@ class PositiveVolumeIndexStrategies:
             -1: f'PVI crossed below the baseline of {self.baseline}, suggesting bearish conditions on high-volume days.',
             0: f'PVI remains around the baseline of {self.baseline}, indicating neutral market sentiment.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'PVI_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -17404,7 +17424,7 @@ class PositiveVolumeIndexStrategies:
         cond_bull = self.pvi > self.upper_threshold
         cond_bear = self.pvi < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'PVI_Over_Upper_Threshold', -1: 'PVI_Under_Lower_Threshold', 0: 'PVI_Neutral'}
@@ -17413,11 +17433,11 @@ class PositiveVolumeIndexStrategies:
             -1: f'PVI is below the lower threshold of {self.lower_threshold}, indicating weak bullish volume activity or bearish sentiment.',
             0: f'PVI is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'PVI_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -17444,7 +17464,7 @@ class PositiveVolumeIndexStrategies:
             self.compute_values(df)
         diff = self.pvi.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PVI_Rising', -1: 'PVI_Falling', 0: 'PVI_Unchanged'}
@@ -17453,11 +17473,11 @@ class PositiveVolumeIndexStrategies:
             -1: 'PVI is falling, indicating decreasing bullish momentum or emerging bearish conditions on high-volume days.',
             0: 'PVI remains unchanged, indicating stable market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'PVI_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -17511,7 +17531,7 @@ class PrettyGoodOscillatorStrategies:
         cond_bull = (pgo_prev <= self.baseline) & (self.pgo > self.baseline)
         cond_bear = (pgo_prev >= self.baseline) & (self.pgo < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'PGO_Above_Baseline', -1: 'PGO_Below_Baseline', 0: 'PGO_Neutral'}
@@ -17520,11 +17540,11 @@ class PrettyGoodOscillatorStrategies:
             -1: f'PrettyGoodOscillator crossed below the baseline of {self.baseline}, indicating bearish momentum.',
             0: f'PrettyGoodOscillator remains near the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PGO_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -17552,7 +17572,7 @@ class PrettyGoodOscillatorStrategies:
         cond_bull = self.pgo < self.lower_threshold
         cond_bear = self.pgo > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Oversold', -1: 'Overbought', 0: 'Normal'}
@@ -17561,11 +17581,11 @@ class PrettyGoodOscillatorStrategies:
             -1: f'PrettyGoodOscillator is above the upper threshold of {self.upper_threshold}, suggesting overbought conditions and potential bearish reversal.',
             0: f'PrettyGoodOscillator is between {self.lower_threshold} and {self.upper_threshold}, indicating normal market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PGO_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -17592,7 +17612,7 @@ class PrettyGoodOscillatorStrategies:
             self.compute_values(df)
         diff = self.pgo.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PGO_Rising', -1: 'PGO_Falling', 0: 'PGO_Unchanged'}
@@ -17601,11 +17621,11 @@ class PrettyGoodOscillatorStrategies:
             -1: 'PrettyGoodOscillator is falling, indicating increasing bearish momentum.',
             0: 'PrettyGoodOscillator remains unchanged, indicating stable conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PGO_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -17656,7 +17676,7 @@ class PriceDistanceStrategies:
         cond_bull = (pd_prev <= self.baseline) & (self.price_distance > self.baseline)
         cond_bear = (pd_prev >= self.baseline) & (self.price_distance < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'PriceDist_Above_Baseline', -1: 'PriceDist_Below_Baseline', 0: 'PriceDist_Neutral'}
@@ -17665,11 +17685,11 @@ class PriceDistanceStrategies:
             -1: f'PriceDistance crossed below the baseline of {self.baseline}, indicating the price is significantly below its moving average.',
             0: f'PriceDistance remains near the baseline of {self.baseline}, suggesting stable price behavior relative to its average.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PriceDist_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -17697,7 +17717,7 @@ class PriceDistanceStrategies:
         cond_bull = self.price_distance > self.upper_threshold
         cond_bear = self.price_distance < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'PriceDist_Overbought', -1: 'PriceDist_Oversold', 0: 'PriceDist_Normal'}
@@ -17706,11 +17726,11 @@ class PriceDistanceStrategies:
             -1: f'PriceDistance is below the lower threshold of {self.lower_threshold}, suggesting the price is significantly below its moving average (oversold).',
             0: f'PriceDistance is between {self.lower_threshold} and {self.upper_threshold}, indicating normal conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PriceDist_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -17737,7 +17757,7 @@ class PriceDistanceStrategies:
             self.compute_values(df)
         diff = self.price_distance.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PriceDist_Rising', -1: 'PriceDist_Falling', 0: 'PriceDist_Unchanged'}
@@ -17746,11 +17766,11 @@ class PriceDistanceStrategies:
             -1: 'PriceDistance is falling, indicating that the price is moving further below its moving average.',
             0: 'PriceDistance remains unchanged, suggesting stable relative pricing.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PriceDist_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -17803,7 +17823,7 @@ class PriceVolumeRankStrategies:
         cond_bull = (pvr_prev <= self.baseline) & (self.pvr > self.baseline)
         cond_bear = (pvr_prev >= self.baseline) & (self.pvr < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'PVR_Above_Baseline', -1: 'PVR_Below_Baseline', 0: 'PVR_Neutral'}
@@ -17812,11 +17832,11 @@ class PriceVolumeRankStrategies:
             -1: f'PriceVolumeRank crossed below the baseline of {self.baseline}, indicating weakening price-volume performance.',
             0: f'PriceVolumeRank remains near the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PVR_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -17844,7 +17864,7 @@ class PriceVolumeRankStrategies:
         cond_bull = self.pvr > self.upper_threshold
         cond_bear = self.pvr < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'PVR_High', -1: 'PVR_Low', 0: 'PVR_Normal'}
@@ -17853,11 +17873,11 @@ class PriceVolumeRankStrategies:
             -1: f'PriceVolumeRank is below the lower threshold of {self.lower_threshold}, indicating exceptionally weak price-volume performance.',
             0: f'PriceVolumeRank is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PVR_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -17884,7 +17904,7 @@ class PriceVolumeRankStrategies:
             self.compute_values(df)
         diff = self.pvr.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PVR_Rising', -1: 'PVR_Falling', 0: 'PVR_Unchanged'}
@@ -17893,11 +17913,11 @@ class PriceVolumeRankStrategies:
             -1: 'PriceVolumeRank is falling, indicating increasing bearish momentum in the price-volume relationship.',
             0: 'PriceVolumeRank remains unchanged, indicating stable price-volume conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PVR_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -17949,7 +17969,7 @@ class PriceVolumeTrendStrategies:
         cond_bull = (pvt_prev <= self.baseline) & (self.pvt > self.baseline)
         cond_bear = (pvt_prev >= self.baseline) & (self.pvt < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'PVT_Above_Baseline', -1: 'PVT_Below_Baseline', 0: 'PVT_Neutral'}
@@ -17958,11 +17978,11 @@ class PriceVolumeTrendStrategies:
             -1: f'PriceVolumeTrend crossed below the baseline of {self.baseline}, suggesting bearish momentum.',
             0: f'PriceVolumeTrend remains around the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'PVT_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -17990,7 +18010,7 @@ class PriceVolumeTrendStrategies:
         cond_bull = self.pvt > self.upper_threshold
         cond_bear = self.pvt < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'PVT_High', -1: 'PVT_Low', 0: 'PVT_Normal'}
@@ -17999,11 +18019,11 @@ class PriceVolumeTrendStrategies:
             -1: f'PriceVolumeTrend is below the lower threshold of {self.lower_threshold}, indicating strong bearish volume-price momentum.',
             0: f'PriceVolumeTrend is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'PVT_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -18030,7 +18050,7 @@ class PriceVolumeTrendStrategies:
             self.compute_values(df)
         diff = self.pvt.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PVT_Rising', -1: 'PVT_Falling', 0: 'PVT_Unchanged'}
@@ -18039,11 +18059,11 @@ class PriceVolumeTrendStrategies:
             -1: 'PriceVolumeTrend is falling, indicating increasing bearish momentum.',
             0: 'PriceVolumeTrend remains unchanged, indicating stable market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'PVT_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -18095,7 +18115,7 @@ class PriceVolumeStrategies:
         cond_bull = (pv_prev <= self.baseline) & (self.price_volume > self.baseline)
         cond_bear = (pv_prev >= self.baseline) & (self.price_volume < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'PV_Above_Baseline', -1: 'PV_Below_Baseline', 0: 'PV_Neutral'}
@@ -18104,11 +18124,11 @@ class PriceVolumeStrategies:
             -1: f'PriceVolume crossed below the baseline of {self.baseline}, suggesting that the current price-volume product is lower than its moving average.',
             0: f'PriceVolume remains near the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PV_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -18136,7 +18156,7 @@ class PriceVolumeStrategies:
         cond_bull = self.price_volume > self.upper_threshold
         cond_bear = self.price_volume < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'PV_High', -1: 'PV_Low', 0: 'PV_Normal'}
@@ -18145,11 +18165,11 @@ class PriceVolumeStrategies:
             -1: f'PriceVolume is below the lower threshold of {self.lower_threshold}, suggesting exceptionally weak price-volume performance.',
             0: f'PriceVolume is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PV_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -18176,7 +18196,7 @@ class PriceVolumeStrategies:
             self.compute_values(df)
         diff = self.price_volume.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PV_Rising', -1: 'PV_Falling', 0: 'PV_Unchanged'}
@@ -18185,11 +18205,11 @@ class PriceVolumeStrategies:
             -1: 'PriceVolume is falling, indicating that the current price-volume product is diverging negatively from its average.',
             0: 'PriceVolume remains unchanged, suggesting stability in the price-volume relationship.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PV_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -18240,7 +18260,7 @@ class PsychologicalLineStrategies:
         cond_bull = (psy_prev <= self.baseline) & (self.psy > self.baseline)
         cond_bear = (psy_prev >= self.baseline) & (self.psy < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'PSY_Above_Baseline', -1: 'PSY_Below_Baseline', 0: 'PSY_Neutral'}
@@ -18249,11 +18269,11 @@ class PsychologicalLineStrategies:
             -1: f'Psychological Line crossed below the baseline of {self.baseline}, suggesting potential bearish momentum.',
             0: f'Psychological Line remains around the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PSY_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -18281,7 +18301,7 @@ class PsychologicalLineStrategies:
         cond_bull = self.psy < self.lower_threshold
         cond_bear = self.psy > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Oversold', -1: 'Overbought', 0: 'Neutral'}
@@ -18290,11 +18310,11 @@ class PsychologicalLineStrategies:
             -1: f'Psychological Line is above the upper threshold of {self.upper_threshold}, indicating overbought conditions and a potential bearish reversal.',
             0: f'Psychological Line is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PSY_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -18321,7 +18341,7 @@ class PsychologicalLineStrategies:
             self.compute_values(df)
         diff = self.psy.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PSY_Rising', -1: 'PSY_Falling', 0: 'PSY_Unchanged'}
@@ -18330,11 +18350,11 @@ class PsychologicalLineStrategies:
             -1: 'Psychological Line is falling, indicating increasing bearish momentum.',
             0: 'Psychological Line remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PSY_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -18384,7 +18404,7 @@ class PriceVolumeStrategies:
         cond_bull = (pv_prev <= self.baseline) & (self.price_volume > self.baseline)
         cond_bear = (pv_prev >= self.baseline) & (self.price_volume < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'PV_Above_Baseline', -1: 'PV_Below_Baseline', 0: 'PV_Neutral'}
@@ -18393,11 +18413,11 @@ class PriceVolumeStrategies:
             -1: f'PriceVolume crossed below the baseline of {self.baseline}, suggesting the current price-volume product is weaker than its average.',
             0: f'PriceVolume remains near the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PV_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -18425,7 +18445,7 @@ class PriceVolumeStrategies:
         cond_bull = self.price_volume > self.upper_threshold
         cond_bear = self.price_volume < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'PV_High', -1: 'PV_Low', 0: 'PV_Normal'}
@@ -18434,11 +18454,11 @@ class PriceVolumeStrategies:
             -1: f'PriceVolume is below the lower threshold of {self.lower_threshold}, indicating exceptionally weak price-volume performance.',
             0: f'PriceVolume is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PV_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -18465,7 +18485,7 @@ class PriceVolumeStrategies:
             self.compute_values(df)
         diff = self.price_volume.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PV_Rising', -1: 'PV_Falling', 0: 'PV_Unchanged'}
@@ -18474,11 +18494,11 @@ class PriceVolumeStrategies:
             -1: 'PriceVolume is falling, indicating that the price-volume product is diverging negatively from its average.',
             0: 'PriceVolume remains unchanged, suggesting stable price-volume dynamics.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'PV_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -18530,7 +18550,7 @@ class QStickStrategies:
         cond_bull = (qstick_prev <= self.baseline) & (self.qstick > self.baseline)
         cond_bear = (qstick_prev >= self.baseline) & (self.qstick < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'QStick_Above_Zero', -1: 'QStick_Below_Zero', 0: 'QStick_Neutral'}
@@ -18539,11 +18559,11 @@ class QStickStrategies:
             -1: 'QStick crossed below zero, indicating bearish market sentiment.',
             0: 'QStick remains neutral around zero, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'QStick_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -18571,7 +18591,7 @@ class QStickStrategies:
         cond_bull = self.qstick > self.upper_threshold
         cond_bear = self.qstick < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'QStick_Strong_Bullish', -1: 'QStick_Strong_Bearish', 0: 'QStick_Neutral'}
@@ -18580,11 +18600,11 @@ class QStickStrategies:
             -1: f'QStick is below the lower threshold of {self.lower_threshold}, indicating strong bearish momentum.',
             0: 'QStick is within the threshold range, indicating no strong directional bias.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'QStick_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -18611,7 +18631,7 @@ class QStickStrategies:
             self.qstick = self.compute_values(df)
         diff = self.qstick.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'QStick_Rising', -1: 'QStick_Falling', 0: 'QStick_Unchanged'}
@@ -18620,11 +18640,11 @@ class QStickStrategies:
             -1: 'QStick is falling, indicating strengthening bearish momentum.',
             0: 'QStick remains unchanged, indicating a lack of clear directional movement.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'QStick_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -18676,7 +18696,7 @@ class QuantitativeQualitativeEstimationStrategies:
         cond_bull = (qqe_prev <= self.baseline) & (self.qqe > self.baseline)
         cond_bear = (qqe_prev >= self.baseline) & (self.qqe < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'QQE_Above_Baseline', -1: 'QQE_Below_Baseline', 0: 'QQE_Neutral'}
@@ -18685,11 +18705,11 @@ class QuantitativeQualitativeEstimationStrategies:
             -1: f'QQE crossed below the baseline of {self.baseline}, suggesting bearish conditions.',
             0: f'QQE remains near the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'QQE_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -18717,7 +18737,7 @@ class QuantitativeQualitativeEstimationStrategies:
         cond_bull = self.qqe > self.upper_threshold
         cond_bear = self.qqe < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'QQE_High', -1: 'QQE_Low', 0: 'QQE_Normal'}
@@ -18726,11 +18746,11 @@ class QuantitativeQualitativeEstimationStrategies:
             -1: f'QQE is below the lower threshold of {self.lower_threshold}, indicating strong bearish sentiment.',
             0: f'QQE is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'QQE_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -18757,7 +18777,7 @@ class QuantitativeQualitativeEstimationStrategies:
             self.compute_values(df)
         diff = self.qqe.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'QQE_Rising', -1: 'QQE_Falling', 0: 'QQE_Unchanged'}
@@ -18766,11 +18786,11 @@ class QuantitativeQualitativeEstimationStrategies:
             -1: 'QQE is falling, indicating increasing bearish momentum.',
             0: 'QQE remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'QQE_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -18818,7 +18838,7 @@ class RateOfChangeStrategies:
         cond_bull = (roc_prev <= 0) & (self.roc > 0)
         cond_bear = (roc_prev >= 0) & (self.roc < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'ROC_Above_Zero', -1: 'ROC_Below_Zero', 0: 'ROC_Neutral'}
@@ -18827,11 +18847,11 @@ class RateOfChangeStrategies:
             -1: 'ROC crossed below zero, indicating bearish momentum.',
             0: 'ROC remains neutral around zero.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ROC_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -18859,7 +18879,7 @@ class RateOfChangeStrategies:
         cond_bull = self.roc > self.upper_threshold
         cond_bear = self.roc < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'ROC_High', -1: 'ROC_Low', 0: 'ROC_Midrange'}
@@ -18868,11 +18888,11 @@ class RateOfChangeStrategies:
             -1: f'ROC is below the lower threshold of {self.lower_threshold}, indicating strong bearish momentum.',
             0: 'ROC is within the defined thresholds, indicating moderate momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ROC_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -18899,7 +18919,7 @@ class RateOfChangeStrategies:
             self.roc = self.compute_values(df)
         diff = self.roc.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'ROC_Rising', -1: 'ROC_Falling', 0: 'ROC_Unchanged'}
@@ -18908,11 +18928,11 @@ class RateOfChangeStrategies:
             -1: 'ROC is decreasing, indicating strengthening bearish momentum.',
             0: 'ROC remains unchanged, indicating stable momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ROC_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -18966,7 +18986,7 @@ class RelativeStrengthIndexStrategies:
         cond_bull = (rsi_prev <= self.baseline) & (self.rsi > self.baseline)
         cond_bear = (rsi_prev >= self.baseline) & (self.rsi < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'RSI_Above_Baseline', -1: 'RSI_Below_Baseline', 0: 'RSI_Neutral'}
@@ -18975,11 +18995,11 @@ class RelativeStrengthIndexStrategies:
             -1: f'RSI crossed below the baseline of {self.baseline}, indicating bearish momentum.',
             0: f'RSI remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'RSI_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -19007,7 +19027,7 @@ class RelativeStrengthIndexStrategies:
         cond_bull = self.rsi < self.lower_threshold
         cond_bear = self.rsi > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'RSI_Oversold', -1: 'RSI_Overbought', 0: 'RSI_Neutral'}
@@ -19016,11 +19036,11 @@ class RelativeStrengthIndexStrategies:
             -1: f'RSI is above the upper threshold of {self.upper_threshold}, indicating overbought conditions and potential bearish reversal.',
             0: 'RSI is within the normal range, indicating balanced market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'RSI_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -19047,7 +19067,7 @@ class RelativeStrengthIndexStrategies:
             self.rsi = self.compute_values(df)
         diff = self.rsi.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'RSI_Rising', -1: 'RSI_Falling', 0: 'RSI_Unchanged'}
@@ -19056,11 +19076,11 @@ class RelativeStrengthIndexStrategies:
             -1: 'RSI is falling, indicating increasing bearish momentum.',
             0: 'RSI remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'RSI_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -19120,7 +19140,7 @@ class RelativeStrengthXtraStrategies:
         cond_bull = (rsxtra_prev <= self.baseline) & (self.rsxtra > self.baseline)
         cond_bear = (rsxtra_prev >= self.baseline) & (self.rsxtra < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'RSXTRA_Above_Baseline', -1: 'RSXTRA_Below_Baseline', 0: 'RSXTRA_Neutral'}
@@ -19129,11 +19149,11 @@ class RelativeStrengthXtraStrategies:
             -1: f'RSXTRA crossed below the baseline of {self.baseline}, suggesting bearish momentum.',
             0: f'RSXTRA remains around the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'RSXTRA_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -19161,7 +19181,7 @@ class RelativeStrengthXtraStrategies:
         cond_bull = self.rsxtra < self.lower_threshold
         cond_bear = self.rsxtra > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'RSXTRA_Oversold', -1: 'RSXTRA_Overbought', 0: 'RSXTRA_Neutral'}
@@ -19170,11 +19190,11 @@ class RelativeStrengthXtraStrategies:
             -1: f'RSXTRA is above the upper threshold of {self.upper_threshold}, indicating potential overbought conditions and a bearish reversal.',
             0: 'RSXTRA is within normal levels, suggesting neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'RSXTRA_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -19201,7 +19221,7 @@ class RelativeStrengthXtraStrategies:
             self.rsxtra = self.compute_values(df)
         diff = self.rsxtra.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'RSXTRA_Rising', -1: 'RSXTRA_Falling', 0: 'RSXTRA_Unchanged'}
@@ -19210,11 +19230,11 @@ class RelativeStrengthXtraStrategies:
             -1: 'RSXTRA is falling, indicating strengthening bearish momentum.',
             0: 'RSXTRA remains unchanged, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'RSXTRA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -19270,7 +19290,7 @@ class RelativeVigorIndexStrategies:
         cond_bull = (rvi_prev <= self.baseline) & (self.rvi > self.baseline)
         cond_bear = (rvi_prev >= self.baseline) & (self.rvi < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'RVI_Above_Baseline', -1: 'RVI_Below_Baseline', 0: 'RVI_Neutral'}
@@ -19279,11 +19299,11 @@ class RelativeVigorIndexStrategies:
             -1: f'RVI crossed below the baseline of {self.baseline}, indicating bearish momentum.',
             0: f'RVI remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'RVI_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -19311,7 +19331,7 @@ class RelativeVigorIndexStrategies:
         cond_bull = self.rvi < self.lower_threshold
         cond_bear = self.rvi > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'RVI_Oversold', -1: 'RVI_Overbought', 0: 'RVI_Neutral'}
@@ -19320,11 +19340,11 @@ class RelativeVigorIndexStrategies:
             -1: f'RVI is above the upper threshold of {self.upper_threshold}, indicating overbought conditions and a potential bearish reversal.',
             0: f'RVI is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'RVI_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -19351,7 +19371,7 @@ class RelativeVigorIndexStrategies:
             self.rvi = self.compute_values(df)
         diff = self.rvi.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'RVI_Rising', -1: 'RVI_Falling', 0: 'RVI_Unchanged'}
@@ -19360,11 +19380,11 @@ class RelativeVigorIndexStrategies:
             -1: 'RVI is falling, indicating strengthening bearish momentum.',
             0: 'RVI remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'RVI_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -19416,7 +19436,7 @@ class RelativeVolatilityIndexStrategies:
         cond_bull = (rvi_prev <= self.baseline) & (self.rvi > self.baseline)
         cond_bear = (rvi_prev >= self.baseline) & (self.rvi < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'RVI_Above_Baseline', -1: 'RVI_Below_Baseline', 0: 'RVI_Neutral'}
@@ -19425,11 +19445,11 @@ class RelativeVolatilityIndexStrategies:
             -1: f'RVI crossed below the baseline of {self.baseline}, indicating bearish volatility dominance.',
             0: f'RVI remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'RVI_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -19457,7 +19477,7 @@ class RelativeVolatilityIndexStrategies:
         cond_bull = self.rvi < self.lower_threshold
         cond_bear = self.rvi > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'RVI_Oversold', -1: 'RVI_Overbought', 0: 'RVI_Neutral'}
@@ -19466,11 +19486,11 @@ class RelativeVolatilityIndexStrategies:
             -1: f'RVI is above the upper threshold of {self.upper_threshold}, indicating overbought conditions and a potential bearish reversal.',
             0: f'RVI is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced volatility.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'RVI_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -19497,7 +19517,7 @@ class RelativeVolatilityIndexStrategies:
             self.rvi = self.compute_values(df)
         diff = self.rvi.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'RVI_Rising', -1: 'RVI_Falling', 0: 'RVI_Unchanged'}
@@ -19506,11 +19526,11 @@ class RelativeVolatilityIndexStrategies:
             -1: 'RVI is falling, indicating increasing bearish volatility dominance.',
             0: 'RVI remains unchanged, indicating balanced volatility.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'RVI_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -19549,9 +19569,13 @@ class SchaffTrendCycleStrategies:
         self.upper_threshold = upper_threshold
         self.lower_threshold = lower_threshold
 
+    def required_primitives(self):
+        return [('EMA', 'Close', self.fast_period), ('EMA', 'Close', self.slow_period)]
+
     def compute_values(self, df):
-        fast_ema = df['Close'].ewm(span=self.fast_period, adjust=False).mean()
-        slow_ema = df['Close'].ewm(span=self.slow_period, adjust=False).mean()
+        primitives = frame_primitives(self, df)
+        fast_ema = primitives.get(('EMA', 'Close', self.fast_period))
+        slow_ema = primitives.get(('EMA', 'Close', self.slow_period))
         macd = fast_ema - slow_ema
         lowest_macd = macd.rolling(window=self.cycle_period, min_periods=1).min()
         highest_macd = macd.rolling(window=self.cycle_period, min_periods=1).max()
@@ -19568,7 +19592,7 @@ class SchaffTrendCycleStrategies:
         cond_bull = (stc_prev <= self.baseline) & (self.stc > self.baseline)
         cond_bear = (stc_prev >= self.baseline) & (self.stc < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'STC_Above_Baseline', -1: 'STC_Below_Baseline', 0: 'STC_Neutral'}
@@ -19577,11 +19601,11 @@ class SchaffTrendCycleStrategies:
             -1: f'STC crossed below the baseline of {self.baseline}, indicating bearish momentum.',
             0: f'STC remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'STC_Fast:{self.fast_period}_Slow:{self.slow_period}_Cycle:{self.cycle_period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -19609,7 +19633,7 @@ class SchaffTrendCycleStrategies:
         cond_bull = self.stc < self.lower_threshold
         cond_bear = self.stc > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'STC_Oversold', -1: 'STC_Overbought', 0: 'STC_Neutral'}
@@ -19618,11 +19642,11 @@ class SchaffTrendCycleStrategies:
             -1: f'STC is above the upper threshold of {self.upper_threshold}, indicating overbought conditions and a potential bearish reversal.',
             0: f'STC is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'STC_Fast:{self.fast_period}_Slow:{self.slow_period}_Cycle:{self.cycle_period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -19649,7 +19673,7 @@ class SchaffTrendCycleStrategies:
             self.stc = self.compute_values(df)
         diff = self.stc.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'STC_Rising', -1: 'STC_Falling', 0: 'STC_Unchanged'}
@@ -19658,11 +19682,11 @@ class SchaffTrendCycleStrategies:
             -1: 'STC is falling, indicating increasing bearish momentum.',
             0: 'STC remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'STC_Fast:{self.fast_period}_Slow:{self.slow_period}_Cycle:{self.cycle_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -19713,7 +19737,7 @@ class ShortRunStrategies:
         cond_bull = (sr_prev <= self.baseline) & (self.sr > self.baseline)
         cond_bear = (sr_prev >= self.baseline) & (self.sr < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'ShortRun_Above_Baseline', -1: 'ShortRun_Below_Baseline', 0: 'ShortRun_Neutral'}
@@ -19722,11 +19746,11 @@ class ShortRunStrategies:
             -1: f'ShortRun crossed below the baseline of {self.baseline}, indicating bearish momentum.',
             0: f'ShortRun remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ShortRun_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -19754,7 +19778,7 @@ class ShortRunStrategies:
         cond_bull = self.sr > self.upper_threshold
         cond_bear = self.sr < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'ShortRun_StrongBullish', -1: 'ShortRun_StrongBearish', 0: 'ShortRun_Neutral'}
@@ -19763,11 +19787,11 @@ class ShortRunStrategies:
             -1: f'ShortRun is below the lower threshold of {self.lower_threshold}, indicating strong bearish momentum.',
             0: f'ShortRun is between {self.lower_threshold} and {self.upper_threshold}, indicating moderate momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ShortRun_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -19794,7 +19818,7 @@ class ShortRunStrategies:
             self.sr = self.compute_values(df)
         diff = self.sr.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'ShortRun_Rising', -1: 'ShortRun_Falling', 0: 'ShortRun_Unchanged'}
@@ -19803,11 +19827,11 @@ class ShortRunStrategies:
             -1: 'ShortRun is falling, indicating increasing bearish momentum.',
             0: 'ShortRun remains unchanged, indicating balanced momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ShortRun_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -19846,12 +19870,14 @@ class SineWeightedMovingAverageStrategies:
 
     def compute_values(self, df):
         full_weights = np.sin(np.arange(1, self.period + 1) * np.pi / (self.period + 1))
-        def weighted_avg(x):
-            L = len(x)
-            local_weights = full_weights[-L:]
-            return np.dot(x, local_weights) / np.sum(local_weights)
-        swma = df['Close'].rolling(window=self.period, min_periods=1).apply(weighted_avg, raw=True)
-        return pd.Series(swma, index=df.index)
+        prices = df['Close'].to_numpy(dtype=float)
+        swma = np.empty(len(prices))
+        # Warm-up bars use the trailing sine weights over the partial window
+        for n in range(1, min(self.period, len(prices) + 1)):
+            local_weights = full_weights[-n:]
+            swma[n - 1] = np.dot(prices[:n], local_weights) / np.sum(local_weights)
+        swma[self.period - 1:] = weighted_window_sums(prices, full_weights) / np.sum(full_weights)
+        return pd.Series(swma, index=df.index, name=df['Close'].name)
 
     def calculate_scores_zero_cross_strategy(self, df):
         if not hasattr(self, 'swma') or self.swma is None:
@@ -19861,7 +19887,7 @@ class SineWeightedMovingAverageStrategies:
         cond_bull = (diff_prev <= self.baseline) & (diff > self.baseline)
         cond_bear = (diff_prev >= self.baseline) & (diff < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Above_SWMA', -1: 'Price_Below_SWMA', 0: 'No_Crossover'}
@@ -19870,11 +19896,11 @@ class SineWeightedMovingAverageStrategies:
             -1: 'Price has crossed below the SineWeightedMovingAverage, indicating bearish momentum.',
             0: 'No crossover detected between price and the SineWeightedMovingAverage.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SWMA_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -19903,7 +19929,7 @@ class SineWeightedMovingAverageStrategies:
         cond_bull = diff > self.upper_threshold
         cond_bear = diff < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Much_Above_SWMA', -1: 'Price_Much_Below_SWMA', 0: 'Price_Near_SWMA'}
@@ -19912,11 +19938,11 @@ class SineWeightedMovingAverageStrategies:
             -1: f'The price is lower than the SWMA by more than {abs(self.lower_threshold)}, indicating strong bearish conditions.',
             0: 'The price is close to the SWMA, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SWMA_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -19943,7 +19969,7 @@ class SineWeightedMovingAverageStrategies:
             self.swma = self.compute_values(df)
         slope = self.swma.diff()
         signals = np.where(slope > 0, 1, np.where(slope < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'SWMA_Rising', -1: 'SWMA_Falling', 0: 'SWMA_Unchanged'}
@@ -19952,11 +19978,11 @@ class SineWeightedMovingAverageStrategies:
             -1: 'The SineWeightedMovingAverage is falling, indicating increasing bearish momentum.',
             0: 'The SineWeightedMovingAverage is unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SWMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -19994,19 +20020,8 @@ class SlopeStrategies:
         self.lower_threshold = lower_threshold
 
     def compute_values(self, df):
-        def linreg_slope(arr):
-            n = len(arr)
-            x = np.arange(n)
-            sum_x = x.sum()
-            sum_x2 = (x * x).sum()
-            sum_y = arr.sum()
-            sum_xy = (x * arr).sum()
-            denominator = n * sum_x2 - sum_x ** 2
-            if denominator == 0:
-                return 0
-            return (n * sum_xy - sum_x * sum_y) / denominator
-        slope_values = df['Close'].rolling(window=self.period, min_periods=1).apply(linreg_slope, raw=True)
-        return pd.Series(slope_values, index=df.index)
+        slope_values, _ = rolling_linear_regression(df['Close'].values, self.period, min_periods=1)
+        return pd.Series(slope_values, index=df.index, name=df['Close'].name)
 
     def calculate_scores_zero_cross_strategy(self, df):
         if not hasattr(self, 'slope') or self.slope is None:
@@ -20015,7 +20030,7 @@ class SlopeStrategies:
         cond_bull = (slope_prev <= self.baseline) & (self.slope > self.baseline)
         cond_bear = (slope_prev >= self.baseline) & (self.slope < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Slope_Above_Baseline', -1: 'Slope_Below_Baseline', 0: 'Slope_Neutral'}
@@ -20024,11 +20039,11 @@ class SlopeStrategies:
             -1: f'The slope crossed below the baseline of {self.baseline}, indicating a shift to bearish momentum.',
             0: f'The slope remains around the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Slope_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -20056,7 +20071,7 @@ class SlopeStrategies:
         cond_bull = self.slope > self.upper_threshold
         cond_bear = self.slope < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Slope_High', -1: 'Slope_Low', 0: 'Slope_Moderate'}
@@ -20065,11 +20080,11 @@ class SlopeStrategies:
             -1: f'The slope is below the lower threshold of {self.lower_threshold}, indicating strong bearish momentum.',
             0: f'The slope is between {self.lower_threshold} and {self.upper_threshold}, indicating moderate conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Slope_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -20096,7 +20111,7 @@ class SlopeStrategies:
             self.slope = self.compute_values(df)
         diff = self.slope.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Slope_Rising', -1: 'Slope_Falling', 0: 'Slope_Unchanged'}
@@ -20105,11 +20120,11 @@ class SlopeStrategies:
             -1: 'The slope is decreasing, indicating an acceleration in bearish momentum.',
             0: 'There is no significant change in the slope, indicating stable conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Slope_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -20167,7 +20182,7 @@ class SmiErgodicOscillatorStrategies:
         cond_bull = (smi_eo_prev <= self.baseline) & (self.smi_eo > self.baseline)
         cond_bear = (smi_eo_prev >= self.baseline) & (self.smi_eo < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'SMI_EO_Above_Baseline', -1: 'SMI_EO_Below_Baseline', 0: 'SMI_EO_Neutral'}
@@ -20176,11 +20191,11 @@ class SmiErgodicOscillatorStrategies:
             -1: f'SMI Ergodic Oscillator crossed below the baseline of {self.baseline}, indicating bearish momentum.',
             0: f'SMI Ergodic Oscillator remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SMI_EO_Period:{self.period}_SignalPeriod:{self.signal_period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -20208,7 +20223,7 @@ class SmiErgodicOscillatorStrategies:
         cond_bull = self.smi_eo > self.upper_threshold
         cond_bear = self.smi_eo < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'SMI_EO_StrongBullish', -1: 'SMI_EO_StrongBearish', 0: 'SMI_EO_Neutral'}
@@ -20217,11 +20232,11 @@ class SmiErgodicOscillatorStrategies:
             -1: f'SMI Ergodic Oscillator is below the lower threshold of {self.lower_threshold}, indicating strong bearish momentum.',
             0: f'SMI Ergodic Oscillator is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SMI_EO_Period:{self.period}_SignalPeriod:{self.signal_period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -20248,7 +20263,7 @@ class SmiErgodicOscillatorStrategies:
             self.smi_eo = self.compute_values(df)
         diff = self.smi_eo.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'SMI_EO_Rising', -1: 'SMI_EO_Falling', 0: 'SMI_EO_Unchanged'}
@@ -20257,11 +20272,11 @@ class SmiErgodicOscillatorStrategies:
             -1: 'SMI Ergodic Oscillator is falling, indicating increasing bearish momentum.',
             0: 'SMI Ergodic Oscillator remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SMI_EO_Period:{self.period}_SignalPeriod:{self.signal_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -20315,7 +20330,7 @@ class SmoothedExponentialMovingAverageStrategies:
         cond_bull = (diff_prev <= self.baseline) & (diff > self.baseline)
         cond_bear = (diff_prev >= self.baseline) & (diff < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Above_SEMA', -1: 'Price_Below_SEMA', 0: 'No_Crossover'}
@@ -20324,11 +20339,11 @@ class SmoothedExponentialMovingAverageStrategies:
             -1: 'Price crossed below the Smoothed Exponential Moving Average, indicating bearish momentum.',
             0: 'No crossover detected between price and the Smoothed Exponential Moving Average.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SEMA_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -20357,7 +20372,7 @@ class SmoothedExponentialMovingAverageStrategies:
         cond_bull = diff > self.upper_threshold
         cond_bear = diff < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Strong_Bullish', -1: 'Strong_Bearish', 0: 'Neutral'}
@@ -20366,11 +20381,11 @@ class SmoothedExponentialMovingAverageStrategies:
             -1: f'Price is below SEMA by more than {abs(self.lower_threshold)}, indicating strong bearish momentum.',
             0: 'Price is within the neutral range relative to SEMA.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SEMA_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -20397,7 +20412,7 @@ class SmoothedExponentialMovingAverageStrategies:
             self.sema = self.compute_values(df)
         diff = self.sema.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'SEMA_Rising', -1: 'SEMA_Falling', 0: 'SEMA_Unchanged'}
@@ -20406,11 +20421,11 @@ class SmoothedExponentialMovingAverageStrategies:
             -1: 'The Smoothed Exponential Moving Average is falling, indicating increasing bearish momentum.',
             0: 'The Smoothed Exponential Moving Average is unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SEMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -20463,7 +20478,7 @@ class SmoothedSimpleMovingAverageStrategies:
         cond_bull = (diff_prev <= self.baseline) & (diff > self.baseline)
         cond_bear = (diff_prev >= self.baseline) & (diff < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Above_SSMA', -1: 'Price_Below_SSMA', 0: 'No_Crossover'}
@@ -20472,11 +20487,11 @@ class SmoothedSimpleMovingAverageStrategies:
             -1: 'Price crossed below the Smoothed Simple Moving Average, indicating bearish momentum.',
             0: 'No crossover detected between price and the Smoothed Simple Moving Average.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SSMA_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -20505,7 +20520,7 @@ class SmoothedSimpleMovingAverageStrategies:
         cond_bull = diff > self.upper_threshold
         cond_bear = diff < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Strong_Bullish', -1: 'Strong_Bearish', 0: 'Neutral'}
@@ -20514,11 +20529,11 @@ class SmoothedSimpleMovingAverageStrategies:
             -1: f'Price is below SSMA by more than {abs(self.lower_threshold)}, indicating strong bearish momentum.',
             0: 'Price is within the neutral range relative to SSMA.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SSMA_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -20545,7 +20560,7 @@ class SmoothedSimpleMovingAverageStrategies:
             self.ssma = self.compute_values(df)
         diff = self.ssma.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'SSMA_Rising', -1: 'SSMA_Falling', 0: 'SSMA_Unchanged'}
@@ -20554,11 +20569,11 @@ class SmoothedSimpleMovingAverageStrategies:
             -1: 'The Smoothed Simple Moving Average is falling, indicating increasing bearish momentum.',
             0: 'The Smoothed Simple Moving Average is unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SSMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -20597,14 +20612,13 @@ class SqueezeStrategies:
         self.upper_threshold = upper_threshold
         self.lower_threshold = lower_threshold
 
+    def required_primitives(self):
+        return [('STD', 'Close', self.period, 1), ('ATR', self.period, 1, True)]
+
     def compute_values(self, df):
-        stdev = pd.Series(df['Close']).rolling(window=self.period, min_periods=1).std()
-        prev_close = df['Close'].shift(1)
-        tr1 = df['High'] - df['Low']
-        tr2 = (df['High'] - prev_close).abs()
-        tr3 = (df['Low'] - prev_close).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(window=self.period, min_periods=1).mean()
+        primitives = frame_primitives(self, df)
+        stdev = primitives.get(('STD', 'Close', self.period, 1))
+        atr = primitives.get(('ATR', self.period, 1, True))
         bb_range = 2 * self.bb_mult * stdev
         kc_range = 2 * self.kc_mult * atr
         squeeze_value = kc_range - bb_range
@@ -20617,7 +20631,7 @@ class SqueezeStrategies:
         cond_bull = (sqz_prev <= self.baseline) & (self.sqz > self.baseline)
         cond_bear = (sqz_prev >= self.baseline) & (self.sqz < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Squeeze_On', -1: 'Squeeze_Off', 0: 'No_Change'}
@@ -20626,11 +20640,11 @@ class SqueezeStrategies:
             -1: f'The Squeeze indicator crossed below the baseline of {self.baseline}, suggesting an exit from the squeeze and potential volatility expansion.',
             0: f'The Squeeze indicator remains unchanged relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Squeeze_Period:{self.period}_BBmult:{self.bb_mult}_KCmult:{self.kc_mult}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -20658,7 +20672,7 @@ class SqueezeStrategies:
         cond_bull = self.sqz > self.upper_threshold
         cond_bear = self.sqz < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Strong_Squeeze_On', -1: 'Strong_Squeeze_Off', 0: 'Neutral'}
@@ -20667,11 +20681,11 @@ class SqueezeStrategies:
             -1: f'The Squeeze indicator is below the lower threshold of {self.lower_threshold}, indicating a release from squeeze and potential volatility expansion.',
             0: f'The Squeeze indicator is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Squeeze_Period:{self.period}_BBmult:{self.bb_mult}_KCmult:{self.kc_mult}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -20698,7 +20712,7 @@ class SqueezeStrategies:
             self.sqz = self.compute_values(df)
         diff = self.sqz.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Squeeze_Rising', -1: 'Squeeze_Falling', 0: 'Squeeze_Unchanged'}
@@ -20707,11 +20721,11 @@ class SqueezeStrategies:
             -1: 'The Squeeze indicator is falling, suggesting decreasing low volatility and a potential volatility expansion.',
             0: 'The Squeeze indicator is unchanged, indicating stable conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Squeeze_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -20751,14 +20765,13 @@ class SqueezeProStrategies:
         self.upper_threshold = upper_threshold
         self.lower_threshold = lower_threshold
 
+    def required_primitives(self):
+        return [('STD', 'Close', self.period, 1), ('ATR', self.period, 1, True)]
+
     def compute_values(self, df):
-        stdev = pd.Series(df['Close']).rolling(window=self.period, min_periods=1).std()
-        prev_close = df['Close'].shift(1)
-        tr1 = df['High'] - df['Low']
-        tr2 = (df['High'] - prev_close).abs()
-        tr3 = (df['Low'] - prev_close).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(window=self.period, min_periods=1).mean()
+        primitives = frame_primitives(self, df)
+        stdev = primitives.get(('STD', 'Close', self.period, 1))
+        atr = primitives.get(('ATR', self.period, 1, True))
         bb_range = 2 * self.bb_mult * stdev
         kc_range = 2 * self.kc_mult * atr
         raw_squeeze = kc_range - bb_range
@@ -20774,7 +20787,7 @@ class SqueezeProStrategies:
         cond_bull = (sqz_prev <= self.baseline) & (self.sqz_pro > self.baseline)
         cond_bear = (sqz_prev >= self.baseline) & (self.sqz_pro < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'SqueezePro_Bullish', -1: 'SqueezePro_Bearish', 0: 'SqueezePro_Neutral'}
@@ -20783,11 +20796,11 @@ class SqueezeProStrategies:
            -1: f'SqueezePro crossed below the baseline of {self.baseline}, indicating bearish breakout potential.',
             0: f'SqueezePro remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SqueezePro_Period:{self.period}_BBmult:{self.bb_mult}_KCmult:{self.kc_mult}_MomentumPeriod:{self.momentum_period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -20815,7 +20828,7 @@ class SqueezeProStrategies:
         cond_bull = self.sqz_pro > self.upper_threshold
         cond_bear = self.sqz_pro < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Strong_Bullish', -1: 'Strong_Bearish', 0: 'Neutral'}
@@ -20824,11 +20837,11 @@ class SqueezeProStrategies:
            -1: f'SqueezePro is below the lower threshold of {self.lower_threshold}, indicating strong bearish momentum.',
             0: f'SqueezePro is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SqueezePro_Period:{self.period}_BBmult:{self.bb_mult}_KCmult:{self.kc_mult}_MomentumPeriod:{self.momentum_period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -20855,7 +20868,7 @@ class SqueezeProStrategies:
             self.sqz_pro = self.compute_values(df)
         diff = self.sqz_pro.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'SqueezePro_Rising', -1: 'SqueezePro_Falling', 0: 'SqueezePro_Unchanged'}
@@ -20864,11 +20877,11 @@ class SqueezeProStrategies:
            -1: 'SqueezePro is falling, indicating increasing bearish momentum and potential breakdown.',
             0: 'SqueezePro remains unchanged, indicating stable volatility conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SqueezePro_Period:{self.period}_MomentumPeriod:{self.momentum_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -20905,8 +20918,11 @@ class StandardDeviationStrategies:
         self.upper_threshold = upper_threshold
         self.lower_threshold = lower_threshold
 
+    def required_primitives(self):
+        return [('STD', 'Close', self.period, 1)]
+
     def compute_values(self, df):
-        std_dev = df['Close'].rolling(window=self.period, min_periods=1).std()
+        std_dev = frame_primitives(self, df).get(('STD', 'Close', self.period, 1))
         return pd.Series(std_dev, index=df.index)
 
     def calculate_scores_zero_cross_strategy(self, df):
@@ -20916,7 +20932,7 @@ class StandardDeviationStrategies:
         cond_bull = (std_prev <= self.baseline) & (self.std_dev > self.baseline)
         cond_bear = (std_prev >= self.baseline) & (self.std_dev < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'StdDev_Above_Baseline', -1: 'StdDev_Below_Baseline', 0: 'StdDev_Neutral'}
@@ -20925,11 +20941,11 @@ class StandardDeviationStrategies:
            -1: f'Standard Deviation crossed below the baseline of {self.baseline}, indicating decreasing volatility.',
             0: f'Standard Deviation remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StdDev_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -20957,7 +20973,7 @@ class StandardDeviationStrategies:
         cond_bull = self.std_dev < self.lower_threshold
         cond_bear = self.std_dev > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Low_Volatility', -1: 'High_Volatility', 0: 'Moderate_Volatility'}
@@ -20966,11 +20982,11 @@ class StandardDeviationStrategies:
            -1: f'Standard Deviation is above the upper threshold of {self.upper_threshold}, indicating high volatility that may signal trend exhaustion.',
             0: f'Standard Deviation is between {self.lower_threshold} and {self.upper_threshold}, indicating moderate volatility.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StdDev_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -20997,7 +21013,7 @@ class StandardDeviationStrategies:
             self.std_dev = self.compute_values(df)
         diff = self.std_dev.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'StdDev_Rising', -1: 'StdDev_Falling', 0: 'StdDev_Unchanged'}
@@ -21006,11 +21022,11 @@ class StandardDeviationStrategies:
            -1: 'Standard Deviation is falling, indicating decreasing volatility.',
             0: 'Standard Deviation is unchanged, indicating stable volatility.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StdDev_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -21062,7 +21078,7 @@ class StochasticStrategies:
         cond_bull = (stoch_prev <= self.baseline) & (self.stoch > self.baseline)
         cond_bear = (stoch_prev >= self.baseline) & (self.stoch < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Stoch_Above_Baseline', -1: 'Stoch_Below_Baseline', 0: 'Stoch_Neutral'}
@@ -21071,11 +21087,11 @@ class StochasticStrategies:
            -1: f'Stoch crossed below the baseline of {self.baseline}, indicating a potential bearish trend.',
             0: f'Stoch remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Stoch_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -21103,7 +21119,7 @@ class StochasticStrategies:
         cond_bull = self.stoch < self.lower_threshold
         cond_bear = self.stoch > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Oversold', -1: 'Overbought', 0: 'Neutral'}
@@ -21112,11 +21128,11 @@ class StochasticStrategies:
            -1: f'Stoch is above the upper threshold of {self.upper_threshold}, indicating overbought (bearish) conditions.',
             0: f'Stoch is within the normal range between {self.lower_threshold} and {self.upper_threshold}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Stoch_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -21143,7 +21159,7 @@ class StochasticStrategies:
             self.stoch = self.compute_values(df)
         diff = self.stoch.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Stoch_Rising', -1: 'Stoch_Falling', 0: 'Stoch_Unchanged'}
@@ -21152,11 +21168,11 @@ class StochasticStrategies:
            -1: 'Stochastic is falling, indicating increasing bearish momentum.',
             0: 'Stochastic remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Stoch_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -21207,7 +21223,7 @@ class StochasticFastStrategies:
         cond_bull = (stoch_prev <= self.baseline) & (self.stoch_fast > self.baseline)
         cond_bear = (stoch_prev >= self.baseline) & (self.stoch_fast < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'StochFast_Above_Baseline', -1: 'StochFast_Below_Baseline', 0: 'StochFast_Neutral'}
@@ -21216,11 +21232,11 @@ class StochasticFastStrategies:
            -1: f'Stochastic Fast crossed below the baseline of {self.baseline}, indicating bearish momentum.',
             0: f'Stochastic Fast remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StochFast_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -21248,7 +21264,7 @@ class StochasticFastStrategies:
         cond_bull = self.stoch_fast < self.lower_threshold
         cond_bear = self.stoch_fast > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'StochFast_Oversold', -1: 'StochFast_Overbought', 0: 'StochFast_Neutral'}
@@ -21257,11 +21273,11 @@ class StochasticFastStrategies:
            -1: f'Stochastic Fast is above the upper threshold of {self.upper_threshold}, indicating overbought conditions and potential bearish reversal.',
             0: f'Stochastic Fast is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StochFast_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -21288,7 +21304,7 @@ class StochasticFastStrategies:
             self.stoch_fast = self.compute_values(df)
         diff = self.stoch_fast.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'StochFast_Rising', -1: 'StochFast_Falling', 0: 'StochFast_Unchanged'}
@@ -21297,11 +21313,11 @@ class StochasticFastStrategies:
            -1: 'Stochastic Fast is falling, indicating increasing bearish momentum.',
             0: 'Stochastic Fast remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StochFast_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -21352,7 +21368,7 @@ class StochasticOscillatorStrategies:
         cond_bull = (stoch_prev <= self.baseline) & (self.stoch_osc > self.baseline)
         cond_bear = (stoch_prev >= self.baseline) & (self.stoch_osc < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'StochOsc_Above_Baseline', -1: 'StochOsc_Below_Baseline', 0: 'StochOsc_Neutral'}
@@ -21361,11 +21377,11 @@ class StochasticOscillatorStrategies:
             -1: f'Stochastic Oscillator crossed below the baseline of {self.baseline}, indicating bearish momentum.',
             0: f'Stochastic Oscillator remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StochOsc_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -21393,7 +21409,7 @@ class StochasticOscillatorStrategies:
         cond_bull = self.stoch_osc < self.lower_threshold
         cond_bear = self.stoch_osc > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Oversold', -1: 'Overbought', 0: 'Neutral'}
@@ -21402,11 +21418,11 @@ class StochasticOscillatorStrategies:
             -1: f'Stochastic Oscillator is above the upper threshold of {self.upper_threshold}, indicating overbought (bearish) conditions.',
             0: f'Stochastic Oscillator is within the range of {self.lower_threshold} to {self.upper_threshold}, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StochOsc_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -21433,7 +21449,7 @@ class StochasticOscillatorStrategies:
             self.stoch_osc = self.compute_values(df)
         diff = self.stoch_osc.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'StochOsc_Rising', -1: 'StochOsc_Falling', 0: 'StochOsc_Unchanged'}
@@ -21442,11 +21458,11 @@ class StochasticOscillatorStrategies:
             -1: 'Stochastic Oscillator is falling, indicating increasing bearish momentum.',
             0: 'Stochastic Oscillator remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StochOsc_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -21497,7 +21513,7 @@ class StochasticOscillatorKStrategies:
         cond_bull = (stoch_prev <= self.baseline) & (self.stoch_k > self.baseline)
         cond_bear = (stoch_prev >= self.baseline) & (self.stoch_k < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'StochK_Above_Baseline', -1: 'StochK_Below_Baseline', 0: 'StochK_Neutral'}
@@ -21506,11 +21522,11 @@ class StochasticOscillatorKStrategies:
            -1: f'Stochastic Oscillator %K crossed below the baseline of {self.baseline}, indicating bearish momentum.',
             0: f'Stochastic Oscillator %K remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StochK_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -21538,7 +21554,7 @@ class StochasticOscillatorKStrategies:
         cond_bull = self.stoch_k < self.lower_threshold
         cond_bear = self.stoch_k > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Oversold', -1: 'Overbought', 0: 'Neutral'}
@@ -21547,11 +21563,11 @@ class StochasticOscillatorKStrategies:
            -1: f'Stochastic Oscillator %K is above the upper threshold of {self.upper_threshold}, indicating overbought conditions (bearish reversal potential).',
             0: f'Stochastic Oscillator %K is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StochK_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -21578,7 +21594,7 @@ class StochasticOscillatorKStrategies:
             self.stoch_k = self.compute_values(df)
         diff = self.stoch_k.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'StochK_Rising', -1: 'StochK_Falling', 0: 'StochK_Unchanged'}
@@ -21587,11 +21603,11 @@ class StochasticOscillatorKStrategies:
            -1: 'Stochastic Oscillator %K is falling, indicating increasing bearish momentum.',
             0: 'Stochastic Oscillator %K remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StochK_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -21649,7 +21665,7 @@ class StochasticRSIStrategies:
         cond_bull = (stoch_prev <= self.baseline) & (self.stoch_rsi > self.baseline)
         cond_bear = (stoch_prev >= self.baseline) & (self.stoch_rsi < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'StochRSI_Above_Baseline', -1: 'StochRSI_Below_Baseline', 0: 'StochRSI_Neutral'}
@@ -21658,11 +21674,11 @@ class StochasticRSIStrategies:
             -1: f'StochRSI crossed below the baseline of {self.baseline}, suggesting bearish momentum.',
             0: f'StochRSI remains near the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StochRSI_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -21690,7 +21706,7 @@ class StochasticRSIStrategies:
         cond_bull = self.stoch_rsi < self.lower_threshold
         cond_bear = self.stoch_rsi > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'StochRSI_Oversold', -1: 'StochRSI_Overbought', 0: 'StochRSI_Neutral'}
@@ -21699,11 +21715,11 @@ class StochasticRSIStrategies:
             -1: f'StochRSI is above the upper threshold of {self.upper_threshold}, indicating overbought conditions and a potential bearish reversal.',
             0: f'StochRSI is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StochRSI_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -21730,7 +21746,7 @@ class StochasticRSIStrategies:
             self.stoch_rsi = self.compute_values(df)
         diff = self.stoch_rsi.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'StochRSI_Rising', -1: 'StochRSI_Falling', 0: 'StochRSI_Unchanged'}
@@ -21739,11 +21755,11 @@ class StochasticRSIStrategies:
             -1: 'StochRSI is falling, indicating increasing bearish momentum.',
             0: 'StochRSI remains unchanged, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StochRSI_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -21799,7 +21815,7 @@ class StochasticOscillatorDStrategies:
         cond_bull = (stoch_prev <= self.baseline) & (self.stoch_d > self.baseline)
         cond_bear = (stoch_prev >= self.baseline) & (self.stoch_d < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'StochOscD_Above_Baseline', -1: 'StochOscD_Below_Baseline', 0: 'StochOscD_Neutral'}
@@ -21808,11 +21824,11 @@ class StochasticOscillatorDStrategies:
             -1: f'Stochastic Oscillator %D crossed below the baseline of {self.baseline}, indicating bearish momentum.',
             0: f'Stochastic Oscillator %D remains neutral relative to the baseline of {self.baseline}.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StochOscD_Period:{self.period}_DPeriod:{self.d_period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -21840,7 +21856,7 @@ class StochasticOscillatorDStrategies:
         cond_bull = self.stoch_d < self.lower_threshold
         cond_bear = self.stoch_d > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Oversold', -1: 'Overbought', 0: 'Neutral'}
@@ -21849,11 +21865,11 @@ class StochasticOscillatorDStrategies:
             -1: f'Stochastic Oscillator %D is above the upper threshold of {self.upper_threshold}, indicating overbought conditions with bearish reversal potential.',
             0: f'Stochastic Oscillator %D is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StochOscD_Period:{self.period}_DPeriod:{self.d_period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -21880,7 +21896,7 @@ class StochasticOscillatorDStrategies:
             self.stoch_d = self.compute_values(df)
         diff = self.stoch_d.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'StochOscD_Rising', -1: 'StochOscD_Falling', 0: 'StochOscD_Unchanged'}
@@ -21889,11 +21905,11 @@ class StochasticOscillatorDStrategies:
             -1: 'Stochastic Oscillator %D is falling, indicating increasing bearish momentum.',
             0: 'Stochastic Oscillator %D remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'StochOscD_Period:{self.period}_DPeriod:{self.d_period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -21933,55 +21949,9 @@ class StopAndReverseStrategies:
         self.sar = None
 
     def compute_values(self, df):
-        n = len(df)
-        sar = [0] * n
-        if n == 0:
+        if len(df) == 0:
             return pd.Series([])
-        if df['Close'].iloc[1] > df['Close'].iloc[0]:
-            trend = 1
-            sar[0] = df['Low'].iloc[0]
-            ep = df['High'].iloc[0]
-        else:
-            trend = -1
-            sar[0] = df['High'].iloc[0]
-            ep = df['Low'].iloc[0]
-        af = self.initial_af
-        for i in range(1, n):
-            current_high = df['High'].iloc[i]
-            current_low = df['Low'].iloc[i]
-            previous_sar = sar[i - 1]
-            if trend == 1:
-                sar_i = previous_sar + af * (ep - previous_sar)
-                if i >= 2:
-                    sar_i = min(sar_i, df['Low'].iloc[i - 1], df['Low'].iloc[i - 2])
-                else:
-                    sar_i = min(sar_i, df['Low'].iloc[i - 1])
-                if current_low < sar_i:
-                    trend = -1
-                    sar_i = ep
-                    af = self.initial_af
-                    ep = current_low
-                else:
-                    if current_high > ep:
-                        ep = current_high
-                        af = min(af + self.initial_af, self.max_af)
-                sar[i] = sar_i
-            else:
-                sar_i = previous_sar - af * (previous_sar - ep)
-                if i >= 2:
-                    sar_i = max(sar_i, df['High'].iloc[i - 1], df['High'].iloc[i - 2])
-                else:
-                    sar_i = max(sar_i, df['High'].iloc[i - 1])
-                if current_high > sar_i:
-                    trend = 1
-                    sar_i = ep
-                    af = self.initial_af
-                    ep = current_high
-                else:
-                    if current_low < ep:
-                        ep = current_low
-                        af = min(af + self.initial_af, self.max_af)
-                sar[i] = sar_i
+        sar = stop_and_reverse(df['High'], df['Low'], df['Close'], self.initial_af, self.max_af)
         self.sar = pd.Series(sar, index=df.index)
         return self.sar
 
@@ -21993,7 +21963,7 @@ class StopAndReverseStrategies:
         cond_bull = (close_prev < sar_prev) & (df['Close'] > self.sar)
         cond_bear = (close_prev > sar_prev) & (df['Close'] < self.sar)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'SAR_Bullish_Reversal', -1: 'SAR_Bearish_Reversal', 0: 'SAR_Neutral'}
@@ -22002,11 +21972,11 @@ class StopAndReverseStrategies:
             -1: f'Price crossed below the SAR, indicating a bearish stop and reverse.',
             0: f'No clear stop and reverse signal detected relative to the SAR.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SAR_SAR_{self.initial_af}_{self.max_af}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -22035,7 +22005,7 @@ class StopAndReverseStrategies:
         cond_bull = diff > self.upper_threshold
         cond_bear = diff < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Strong_Bullish', -1: 'Strong_Bearish', 0: 'Neutral'}
@@ -22044,11 +22014,11 @@ class StopAndReverseStrategies:
             -1: f'Price is significantly below the SAR by more than {abs(self.lower_threshold)}, indicating strong bearish momentum.',
             0: f'Price is near the SAR, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SAR_Threshold_Signal_Upper:{self.upper_threshold}_Lower:{self.lower_threshold}'
         if append:
             if ta_indicator_value:
@@ -22075,7 +22045,7 @@ class StopAndReverseStrategies:
             self.sar = self.compute_values(df)
         diff = self.sar.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'SAR_Rising', -1: 'SAR_Falling', 0: 'SAR_Unchanged'}
@@ -22084,11 +22054,11 @@ class StopAndReverseStrategies:
             -1: 'The SAR is falling, indicating strengthening bearish momentum.',
             0: 'The SAR remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'SAR_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -22138,7 +22108,7 @@ class SummationStrategies:
         cond_bull = (summation_prev <= self.baseline) & (self.summation > self.baseline)
         cond_bear = (summation_prev >= self.baseline) & (self.summation < self.baseline)
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Summation_Above_Zero', -1: 'Summation_Below_Zero', 0: 'Summation_Neutral'}
@@ -22147,11 +22117,11 @@ class SummationStrategies:
             -1: f'Summation crossed below zero, indicating a shift to bearish momentum.',
             0: 'Summation remains neutral around zero, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Summation_Period:{self.period}_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -22179,7 +22149,7 @@ class SummationStrategies:
         cond_bull = self.summation > self.upper_threshold
         cond_bear = self.summation < self.lower_threshold
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Summation_High', -1: 'Summation_Low', 0: 'Summation_Neutral'}
@@ -22188,11 +22158,11 @@ class SummationStrategies:
             -1: f'Summation is below the negative threshold of {self.lower_threshold}, suggesting strong bearish conditions.',
             0: 'Summation is within the threshold range, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Summation_Period:{self.period}_Upper_Threshold:{self.upper_threshold}_Lower_Threshold:{self.lower_threshold}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -22219,7 +22189,7 @@ class SummationStrategies:
             self.summation = self.compute_values(df)
         diff = self.summation.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Summation_Rising', -1: 'Summation_Falling', 0: 'Summation_Unchanged'}
@@ -22228,11 +22198,11 @@ class SummationStrategies:
             -1: 'Summation is falling, indicating strengthening bearish momentum.',
             0: 'Summation shows no change, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Summation_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -22269,50 +22239,17 @@ class SupertrendStrategies:
         self.supertrend = None
         self.trend = None
 
+    def required_primitives(self):
+        return [('ATR', self.period, 1, True)]
+
     def compute_values(self, df):
-        high_low = df['High'] - df['Low']
-        high_close = (df['High'] - df['Close'].shift(1)).abs()
-        low_close = (df['Low'] - df['Close'].shift(1)).abs()
-        tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        atr = tr.rolling(window=self.period, min_periods=1).mean()
+        atr = frame_primitives(self, df).get(('ATR', self.period, 1, True))
         typical_price = (df['High'] + df['Low']) / 2
         basic_ub = typical_price + self.multiplier * atr
         basic_lb = typical_price - self.multiplier * atr
-        final_ub_list = [0] * len(df)
-        final_lb_list = [0] * len(df)
-        for i in range(len(df)):
-            if i == 0:
-                final_ub_list[i] = basic_ub.iloc[i]
-                final_lb_list[i] = basic_lb.iloc[i]
-            else:
-                if (basic_ub.iloc[i] < final_ub_list[i-1]) or (df['Close'].iloc[i-1] > final_ub_list[i-1]):
-                    final_ub_list[i] = basic_ub.iloc[i]
-                else:
-                    final_ub_list[i] = final_ub_list[i-1]
-                if (basic_lb.iloc[i] > final_lb_list[i-1]) or (df['Close'].iloc[i-1] < final_lb_list[i-1]):
-                    final_lb_list[i] = basic_lb.iloc[i]
-                else:
-                    final_lb_list[i] = final_lb_list[i-1]
-        final_ub = pd.Series(final_ub_list, index=df.index)
-        final_lb = pd.Series(final_lb_list, index=df.index)
-        supertrend_list = [None] * len(df)
-        trend_list = [0] * len(df)
-        for i in range(len(df)):
-            if i == 0:
-                supertrend_list[i] = None
-                trend_list[i] = 1
-            else:
-                if df['Close'].iloc[i] <= final_ub.iloc[i]:
-                    supertrend_list[i] = final_ub.iloc[i]
-                    trend_list[i] = -1
-                elif df['Close'].iloc[i] >= final_lb.iloc[i]:
-                    supertrend_list[i] = final_lb.iloc[i]
-                    trend_list[i] = 1
-                else:
-                    supertrend_list[i] = supertrend_list[i-1]
-                    trend_list[i] = trend_list[i-1]
-        self.supertrend = pd.Series(supertrend_list, index=df.index)
-        self.trend = pd.Series(trend_list, index=df.index)
+        supertrend, trend = supertrend_path(df['Close'], basic_ub, basic_lb)
+        self.supertrend = pd.Series(supertrend, index=df.index)
+        self.trend = pd.Series(trend, index=df.index)
         return self.supertrend, self.trend
 
     def calculate_scores_zero_cross_strategy(self, df):
@@ -22320,7 +22257,7 @@ class SupertrendStrategies:
             self.compute_values(df)
         trend_prev = self.trend.shift(1)
         signals = np.where((trend_prev == -1) & (self.trend == 1), 1, np.where((trend_prev == 1) & (self.trend == -1), -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'ST_TrendShift_Bullish', -1: 'ST_TrendShift_Bearish', 0: 'ST_TrendShift_Neutral'}
@@ -22329,11 +22266,11 @@ class SupertrendStrategies:
             -1: 'Supertrend shifted from bullish to bearish, indicating a potential bearish reversal.',
             0: 'No trend shift detected in Supertrend, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ST_Period:{self.period}_Multiplier:{self.multiplier}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -22363,7 +22300,7 @@ class SupertrendStrategies:
         cond_bull = (close_prev < st_prev) & (df['Close'] > self.supertrend)
         cond_bear = (close_prev > st_prev) & (df['Close'] < self.supertrend)
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'PriceAbove_ST', -1: 'PriceBelow_ST', 0: 'PriceAround_ST'}
@@ -22372,11 +22309,11 @@ class SupertrendStrategies:
             -1: 'Closing price crossed below the Supertrend value, indicating bearish momentum.',
             0: 'No significant price cross relative to Supertrend detected, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ST_Period:{self.period}_Multiplier:{self.multiplier}_PriceCross_Signal'
         if append:
             if ta_indicator_value:
@@ -22403,7 +22340,7 @@ class SupertrendStrategies:
             self.compute_values(df)
         diff = (df['Close'] - self.supertrend).diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'PriceGap_Widening', -1: 'PriceGap_Narrowing', 0: 'PriceGap_Unchanged'}
@@ -22412,11 +22349,11 @@ class SupertrendStrategies:
             -1: 'The gap between the closing price and Supertrend is narrowing or reversing, indicating bearish pressure.',
             0: 'No change in the price gap relative to Supertrend, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ST_Period:{self.period}_Multiplier:{self.multiplier}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -22465,17 +22402,10 @@ class SymmetricWeightedMovingAverageStrategies:
 
     def compute_values(self, df):
         weights = self.compute_weights()
-        swma_list = []
         price_series = df[self.price_column]
-        for i in range(len(price_series)):
-            if i < self.period - 1:
-                swma_list.append(None)
-            else:
-                window = price_series.iloc[i - self.period + 1 : i + 1]
-                weighted_sum = sum(w * price for w, price in zip(weights, window))
-                swma_value = weighted_sum / sum(weights)
-                swma_list.append(swma_value)
-        self.swma = pd.Series(swma_list, index=df.index)
+        swma = np.full(len(price_series), np.nan)
+        swma[self.period - 1:] = weighted_window_sums(price_series.to_numpy(), weights) / sum(weights)
+        self.swma = pd.Series(swma, index=df.index)
         return self.swma
 
     def calculate_scores_price_cross_strategy(self, df):
@@ -22487,7 +22417,7 @@ class SymmetricWeightedMovingAverageStrategies:
         cond_bull = (price_prev <= swma_prev) & (price > self.swma)
         cond_bear = (price_prev >= swma_prev) & (price < self.swma)
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'PriceAbove_SWMA', -1: 'PriceBelow_SWMA', 0: 'PriceNeutral'}
@@ -22496,11 +22426,11 @@ class SymmetricWeightedMovingAverageStrategies:
             -1: 'Price crossed below the SWMA, indicating bearish momentum.',
             0: 'No significant price cross relative to the SWMA, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SWMA_Period:{self.period}_PriceCross_Signal'
         if append:
             if ta_indicator_value:
@@ -22527,7 +22457,7 @@ class SymmetricWeightedMovingAverageStrategies:
             self.compute_values(df)
         diff = self.swma.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'SWMA_Rising', -1: 'SWMA_Falling', 0: 'SWMA_Unchanged'}
@@ -22536,11 +22466,11 @@ class SymmetricWeightedMovingAverageStrategies:
             -1: 'SWMA is falling, indicating a bearish trend.',
             0: 'SWMA is flat, indicating neutral trend conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SWMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -22570,7 +22500,7 @@ class SymmetricWeightedMovingAverageStrategies:
         cond_bull = diff > self.pos_threshold
         cond_bear = diff < self.neg_threshold
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'PriceMuchAbove_SWMA', -1: 'PriceMuchBelow_SWMA', 0: 'PriceAround_SWMA'}
@@ -22579,11 +22509,11 @@ class SymmetricWeightedMovingAverageStrategies:
             -1: 'Price is significantly below the SWMA, indicating strong bearish conditions.',
             0: 'Price is close to the SWMA, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'SWMA_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -22622,9 +22552,11 @@ class T3MovingAverageStrategies:
         self.neg_threshold = neg_threshold
         self.t3 = None
 
+    def required_primitives(self):
+        return [('EMA', self.price_column, self.period)]
+
     def compute_values(self, df):
-        price = df[self.price_column]
-        ema1 = price.ewm(span=self.period, adjust=False).mean()
+        ema1 = frame_primitives(self, df).get(('EMA', self.price_column, self.period))
         ema2 = ema1.ewm(span=self.period, adjust=False).mean()
         ema3 = ema2.ewm(span=self.period, adjust=False).mean()
         ema4 = ema3.ewm(span=self.period, adjust=False).mean()
@@ -22645,7 +22577,7 @@ class T3MovingAverageStrategies:
         cond_bull = (price_prev <= t3_prev) & (price > self.t3)
         cond_bear = (price_prev >= t3_prev) & (price < self.t3)
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_cross_map(self, series):
         mapping_value = {1: 'PriceAbove_T3', -1: 'PriceBelow_T3', 0: 'PriceNeutral'}
@@ -22654,11 +22586,11 @@ class T3MovingAverageStrategies:
             -1: 'Price crossed below the T3 Moving Average, indicating bearish momentum.',
             0: 'No significant price cross relative to the T3 Moving Average, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_cross_strategy(df)
-        value, explanation = self.price_cross_map(score)
+        value, explanation = self.price_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'T3MA_Period:{self.period}_PriceCross_Signal'
         if append:
             if ta_indicator_value:
@@ -22685,7 +22617,7 @@ class T3MovingAverageStrategies:
             self.compute_values(df)
         diff = self.t3.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'T3_Rising', -1: 'T3_Falling', 0: 'T3_Unchanged'}
@@ -22694,11 +22626,11 @@ class T3MovingAverageStrategies:
             -1: 'The T3 Moving Average is falling, indicating bearish trend strength.',
             0: 'The T3 Moving Average is unchanged, indicating neutral trend conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'T3MA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -22728,7 +22660,7 @@ class T3MovingAverageStrategies:
         cond_bull = diff > self.pos_threshold
         cond_bear = diff < self.neg_threshold
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'PriceMuchAbove_T3', -1: 'PriceMuchBelow_T3', 0: 'PriceAround_T3'}
@@ -22737,11 +22669,11 @@ class T3MovingAverageStrategies:
             -1: 'Price is significantly below the T3 Moving Average, indicating strong bearish conditions.',
             0: 'Price is close to the T3 Moving Average, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'T3MA_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -22780,31 +22712,21 @@ class TDSequentialStrategies:
         self.sell_setup = None
 
     def compute_values(self, df):
-        buy_counts = [0] * len(df)
-        sell_counts = [0] * len(df)
-        closes = df['Close'].tolist()
-        for i in range(len(df)):
-            if i < 4:
-                buy_counts[i] = 0
-                sell_counts[i] = 0
-            else:
-                if closes[i] < closes[i - 4]:
-                    buy_counts[i] = buy_counts[i - 1] + 1
-                else:
-                    buy_counts[i] = 0
-                if closes[i] > closes[i - 4]:
-                    sell_counts[i] = sell_counts[i - 1] + 1
-                else:
-                    sell_counts[i] = 0
-        self.buy_setup = pd.Series(buy_counts, index=df.index)
-        self.sell_setup = pd.Series(sell_counts, index=df.index)
+        closes = df['Close'].to_numpy(dtype=float)
+        # Setup counts are run lengths of close vs close four bars earlier (no count before bar 4)
+        buy_condition = np.zeros(len(closes), dtype=bool)
+        sell_condition = np.zeros(len(closes), dtype=bool)
+        buy_condition[4:] = closes[4:] < closes[:-4]
+        sell_condition[4:] = closes[4:] > closes[:-4]
+        self.buy_setup = pd.Series(run_lengths(buy_condition), index=df.index)
+        self.sell_setup = pd.Series(run_lengths(sell_condition), index=df.index)
         return self.buy_setup, self.sell_setup
 
     def calculate_scores_setup_completion_strategy(self, df):
         if self.buy_setup is None or self.sell_setup is None:
             self.compute_values(df)
         signals = np.select([self.buy_setup == self.completion_count, self.sell_setup == self.completion_count], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def setup_completion_map(self, series):
         mapping_value = {1: 'TDSequential_Buy_Setup_Complete', -1: 'TDSequential_Sell_Setup_Complete', 0: 'TDSequential_No_Completion'}
@@ -22813,11 +22735,11 @@ class TDSequentialStrategies:
             -1: f'Sell setup count reached {self.completion_count}, indicating a potential bearish reversal.',
             0: f'No setup completion detected at the {self.completion_count} count threshold.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_setup_completion_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_setup_completion_strategy(df)
-        value, explanation = self.setup_completion_map(score)
+        value, explanation = self.setup_completion_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TDSeq_Completion_Count:{self.completion_count}_Signal'
         if append:
             if ta_indicator_value:
@@ -22845,7 +22767,7 @@ class TDSequentialStrategies:
         if self.buy_setup is None or self.sell_setup is None:
             self.compute_values(df)
         signals = np.select([self.buy_setup >= self.threshold, self.sell_setup >= self.threshold], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'TDSequential_Buy_Setup_Threshold', -1: 'TDSequential_Sell_Setup_Threshold', 0: 'TDSequential_Setup_Neutral'}
@@ -22854,11 +22776,11 @@ class TDSequentialStrategies:
             -1: f'Sell setup count is at or above the threshold of {self.threshold}, suggesting an impending bearish reversal.',
             0: f'Neither setup count has reached the threshold of {self.threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TDSeq_Threshold:{self.threshold}_Signal'
         if append:
             if ta_indicator_value:
@@ -22910,7 +22832,7 @@ class TrendSignalsStrategies:
         cond_bull = (ts_prev <= 0) & (ts_current > 0)
         cond_bear = (ts_prev >= 0) & (ts_current < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'TrendSignals_Cross_Above_Zero', -1: 'TrendSignals_Cross_Below_Zero', 0: 'TrendSignals_Neutral'}
@@ -22919,11 +22841,11 @@ class TrendSignalsStrategies:
             -1: 'TrendSignals crossed below zero, indicating a shift to bearish conditions.',
             0: 'TrendSignals remains around zero, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'TS_Strategy_ZeroCross'
         if append:
             if ta_indicator_value:
@@ -22951,7 +22873,7 @@ class TrendSignalsStrategies:
         cond_bull = self.trend_signal > self.threshold
         cond_bear = self.trend_signal < -self.threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'TrendSignals_Above_Threshold', -1: 'TrendSignals_Below_Threshold', 0: 'TrendSignals_Neutral'}
@@ -22960,11 +22882,11 @@ class TrendSignalsStrategies:
             -1: f'TrendSignals is below the negative threshold of {-self.threshold}, indicating bearish conditions.',
             0: f'TrendSignals is within the threshold range, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'TS_Strategy_Threshold'
         if append:
             if ta_indicator_value:
@@ -22991,7 +22913,7 @@ class TrendSignalsStrategies:
             self.compute_values(df)
         diff = self.trend_signal.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'TrendSignals_Rising', -1: 'TrendSignals_Falling', 0: 'TrendSignals_Unchanged'}
@@ -23000,11 +22922,11 @@ class TrendSignalsStrategies:
             -1: 'TrendSignals is falling, indicating strengthening bearish momentum.',
             0: 'TrendSignals is unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'TS_Strategy_Slope'
         if append:
             if ta_indicator_value:
@@ -23055,7 +22977,7 @@ class TriangularMovingAverageStrategies:
         cond_bull = (price_prev <= tma_prev) & (price_current > tma_current)
         cond_bear = (price_prev >= tma_prev) & (price_current < tma_current)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_crossover_map(self, series):
         mapping_value = {1: 'Price_Above_TMA', -1: 'Price_Below_TMA', 0: 'Price_Neutral'}
@@ -23064,11 +22986,11 @@ class TriangularMovingAverageStrategies:
             -1: 'Price has crossed below the Triangular Moving Average, indicating bearish conditions.',
             0: 'No significant price crossover with the Triangular Moving Average detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_crossover_strategy(df)
-        value, explanation = self.price_crossover_map(score)
+        value, explanation = self.price_crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TMA_Period:{self.period}_PriceCrossover_Signal'
         if append:
             if ta_indicator_value:
@@ -23095,7 +23017,7 @@ class TriangularMovingAverageStrategies:
             self.compute_values(df)
         diff = self.tma.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'TMA_Rising', -1: 'TMA_Falling', 0: 'TMA_Unchanged'}
@@ -23104,11 +23026,11 @@ class TriangularMovingAverageStrategies:
             -1: 'Triangular Moving Average is falling, indicating bearish momentum.',
             0: 'Triangular Moving Average remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -23137,7 +23059,7 @@ class TriangularMovingAverageStrategies:
         cond_bull = ratio > self.threshold_percentage
         cond_bear = ratio < -self.threshold_percentage
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Above_Threshold', -1: 'Price_Below_Threshold', 0: 'Price_Near_TMA'}
@@ -23146,11 +23068,11 @@ class TriangularMovingAverageStrategies:
             -1: f'Price is more than {self.threshold_percentage * 100}% below the TMA, indicating strong bearish conditions.',
             0: f'Price is within {self.threshold_percentage * 100}% of the TMA, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TMA_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -23202,7 +23124,7 @@ class TripleExponentialMovingAverageOscillatorStrategies:
         cond_bull = (trix_prev <= 0) & (trix_current > 0)
         cond_bear = (trix_prev >= 0) & (trix_current < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'TRIX_Cross_Above_Zero', -1: 'TRIX_Cross_Below_Zero', 0: 'TRIX_Neutral'}
@@ -23211,11 +23133,11 @@ class TripleExponentialMovingAverageOscillatorStrategies:
             -1: 'TRIX crossed below zero, indicating a bearish momentum shift.',
             0: 'TRIX remains around zero, indicating no clear momentum shift.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TRIX_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -23242,7 +23164,7 @@ class TripleExponentialMovingAverageOscillatorStrategies:
             self.compute_values(df)
         diff = self.trix.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'TRIX_Rising', -1: 'TRIX_Falling', 0: 'TRIX_Unchanged'}
@@ -23251,11 +23173,11 @@ class TripleExponentialMovingAverageOscillatorStrategies:
             -1: 'TRIX is falling, indicating strengthening bearish momentum.',
             0: 'TRIX remains unchanged, indicating a lack of momentum shift.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TRIX_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -23283,7 +23205,7 @@ class TripleExponentialMovingAverageOscillatorStrategies:
         cond_bull = self.trix > self.threshold_value
         cond_bear = self.trix < -self.threshold_value
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'TRIX_Above_Threshold', -1: 'TRIX_Below_Threshold', 0: 'TRIX_Near_Zero'}
@@ -23292,11 +23214,11 @@ class TripleExponentialMovingAverageOscillatorStrategies:
             -1: f'TRIX is below the negative threshold of {-self.threshold_value}, indicating strong bearish momentum.',
             0: f'TRIX is within the threshold range, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TRIX_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -23348,7 +23270,7 @@ class TrixStrategies:
         cond_bull = (trix_prev <= 0) & (trix_current > 0)
         cond_bear = (trix_prev >= 0) & (trix_current < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'TRIX_Cross_Above_Zero', -1: 'TRIX_Cross_Below_Zero', 0: 'TRIX_Neutral'}
@@ -23357,11 +23279,11 @@ class TrixStrategies:
             -1: 'TRIX crossed below zero, indicating bearish momentum.',
             0: 'TRIX remains around zero, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TRIX_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -23388,7 +23310,7 @@ class TrixStrategies:
             self.compute_values(df)
         diff = self.trix.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'TRIX_Rising', -1: 'TRIX_Falling', 0: 'TRIX_Unchanged'}
@@ -23397,11 +23319,11 @@ class TrixStrategies:
             -1: 'TRIX is falling, indicating strengthening bearish momentum.',
             0: 'TRIX remains unchanged, indicating no clear momentum shift.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TRIX_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -23429,7 +23351,7 @@ class TrixStrategies:
         cond_bull = self.trix > self.threshold_value
         cond_bear = self.trix < -self.threshold_value
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'TRIX_Above_Threshold', -1: 'TRIX_Below_Threshold', 0: 'TRIX_Neutral'}
@@ -23438,11 +23360,11 @@ class TrixStrategies:
             -1: f'TRIX is below the negative threshold of {-self.threshold_value}, indicating strong bearish momentum.',
             0: f'TRIX is within the threshold range, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TRIX_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -23492,7 +23414,7 @@ class TwiggsMoneyIndexStrategies:
         cond_bull = (tmi_prev <= 0) & (tmi_current > 0)
         cond_bear = (tmi_prev >= 0) & (tmi_current < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'TMI_Cross_Above_Zero', -1: 'TMI_Cross_Below_Zero', 0: 'TMI_Neutral'}
@@ -23501,11 +23423,11 @@ class TwiggsMoneyIndexStrategies:
             -1: 'Twiggs Money Index crossed below zero, indicating a shift to bearish selling pressure.',
             0: 'Twiggs Money Index remains around zero, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TMI_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -23533,7 +23455,7 @@ class TwiggsMoneyIndexStrategies:
         cond_bull = self.tmi > self.upper_threshold
         cond_bear = self.tmi < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'TMI_Above_Upper_Threshold', -1: 'TMI_Below_Lower_Threshold', 0: 'TMI_Neutral'}
@@ -23542,11 +23464,11 @@ class TwiggsMoneyIndexStrategies:
             -1: f'Twiggs Money Index is below the lower threshold of {self.lower_threshold}, indicating strong bearish distribution.',
             0: f'Twiggs Money Index is between the set thresholds, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TMI_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -23573,7 +23495,7 @@ class TwiggsMoneyIndexStrategies:
             self.compute_values(df)
         diff = self.tmi.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'TMI_Rising', -1: 'TMI_Falling', 0: 'TMI_Unchanged'}
@@ -23582,11 +23504,11 @@ class TwiggsMoneyIndexStrategies:
             -1: 'Twiggs Money Index is falling, indicating increasing bearish money flow.',
             0: 'Twiggs Money Index is unchanged, indicating balanced market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TMI_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -23622,8 +23544,11 @@ class TTMTrendStrategies:
         self.threshold_percentage = threshold_percentage
         self.ttm = None
 
+    def required_primitives(self):
+        return [('EMA', 'Close', self.period)]
+
     def compute_values(self, df):
-        ema1 = df['Close'].ewm(span=self.period, adjust=False).mean()
+        ema1 = frame_primitives(self, df).get(('EMA', 'Close', self.period))
         ema2 = ema1.ewm(span=self.period, adjust=False).mean()
         self.ttm = ema1 - ema2
         return self.ttm
@@ -23636,7 +23561,7 @@ class TTMTrendStrategies:
         cond_bull = (ttm_prev <= 0) & (ttm_current > 0)
         cond_bear = (ttm_prev >= 0) & (ttm_current < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'TTMTrend_Cross_Above_Zero', -1: 'TTMTrend_Cross_Below_Zero', 0: 'TTMTrend_Neutral'}
@@ -23645,11 +23570,11 @@ class TTMTrendStrategies:
             -1: 'TTM Trend crossed below zero, indicating a bearish trend shift.',
             0: 'TTM Trend remains around zero, indicating no clear trend shift.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TTMTrend_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -23681,7 +23606,7 @@ class TTMTrendStrategies:
         cond_bull = (price_prev <= ttm_prev) & (price_current > ttm_current)
         cond_bear = (price_prev >= ttm_prev) & (price_current < ttm_current)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_crossover_map(self, series):
         mapping_value = {1: 'Price_Above_TTMTrend', -1: 'Price_Below_TTMTrend', 0: 'Price_Neutral'}
@@ -23690,11 +23615,11 @@ class TTMTrendStrategies:
             -1: 'Price crossed below the TTM Trend line, indicating bearish conditions.',
             0: 'No significant price crossover with the TTM Trend line detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_crossover_strategy(df)
-        value, explanation = self.price_crossover_map(score)
+        value, explanation = self.price_crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TTMTrend_Period:{self.period}_PriceCrossover_Signal'
         if append:
             if ta_indicator_value:
@@ -23721,7 +23646,7 @@ class TTMTrendStrategies:
             self.compute_values(df)
         diff = self.ttm.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'TTMTrend_Rising', -1: 'TTMTrend_Falling', 0: 'TTMTrend_Unchanged'}
@@ -23730,11 +23655,11 @@ class TTMTrendStrategies:
             -1: 'TTM Trend is falling, indicating strengthening bearish momentum.',
             0: 'TTM Trend is unchanged, indicating a lack of momentum shift.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'TTMTrend_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -23771,8 +23696,11 @@ class TypicalPriceStrategies:
         self.threshold_percentage = threshold_percentage
         self.tp = None
 
+    def required_primitives(self):
+        return [('TYPICAL_PRICE',)]
+
     def compute_values(self, df):
-        self.tp = (df['High'] + df['Low'] + df['Close']) / 3
+        self.tp = frame_primitives(self, df).get(('TYPICAL_PRICE',))
         return self.tp
 
     def calculate_scores_price_crossover_strategy(self, df):
@@ -23785,7 +23713,7 @@ class TypicalPriceStrategies:
         cond_bull = (close_prev <= tp_prev) & (close_current > tp_current)
         cond_bear = (close_prev >= tp_prev) & (close_current < tp_current)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_crossover_map(self, series):
         mapping_value = {1: 'Close_Above_TP', -1: 'Close_Below_TP', 0: 'TP_Neutral'}
@@ -23794,11 +23722,11 @@ class TypicalPriceStrategies:
             -1: 'The closing price has crossed below the Typical Price, suggesting bearish conditions.',
             0: 'No significant crossover between the closing price and the Typical Price.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_crossover_strategy(df)
-        value, explanation = self.price_crossover_map(score)
+        value, explanation = self.price_crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'TP_PriceCrossover_Signal'
         if append:
             if ta_indicator_value:
@@ -23825,7 +23753,7 @@ class TypicalPriceStrategies:
             self.compute_values(df)
         diff = self.tp.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'TP_Rising', -1: 'TP_Falling', 0: 'TP_Unchanged'}
@@ -23834,11 +23762,11 @@ class TypicalPriceStrategies:
             -1: 'The Typical Price is falling, indicating downward momentum.',
             0: 'The Typical Price remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'TP_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -23867,7 +23795,7 @@ class TypicalPriceStrategies:
         cond_bull = diff_ratio > self.threshold_percentage
         cond_bear = diff_ratio < -self.threshold_percentage
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Close_Significantly_Above_TP', -1: 'Close_Significantly_Below_TP', 0: 'Close_Near_TP'}
@@ -23876,11 +23804,11 @@ class TypicalPriceStrategies:
             -1: f'The closing price is more than {self.threshold_percentage * 100}% below the Typical Price, indicating strong bearish pressure.',
             0: f'The closing price is within {self.threshold_percentage * 100}% of the Typical Price, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'TP_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -23937,7 +23865,7 @@ class UltimateOscillatorStrategies:
         cond_bull = (uo_prev <= self.baseline) & (uo_current > self.baseline)
         cond_bear = (uo_prev >= self.baseline) & (uo_current < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'UO_Cross_Above_Baseline', -1: 'UO_Cross_Below_Baseline', 0: 'UO_Neutral'}
@@ -23946,11 +23874,11 @@ class UltimateOscillatorStrategies:
             -1: f'UO crossed below the baseline of {self.baseline}, suggesting bearish momentum.',
             0: f'UO remains around the baseline of {self.baseline}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'UO_Baseline:{self.baseline}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -23978,7 +23906,7 @@ class UltimateOscillatorStrategies:
         cond_bull = self.uo < self.lower_threshold
         cond_bear = self.uo > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'UO_Oversold', -1: 'UO_Overbought', 0: 'UO_Neutral'}
@@ -23987,11 +23915,11 @@ class UltimateOscillatorStrategies:
             -1: f'UO is above {self.upper_threshold}, indicating overbought conditions and potential bearish reversal.',
             0: f'UO is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'UO_Threshold_Low:{self.lower_threshold}_High:{self.upper_threshold}_Signal'
         if append:
             if ta_indicator_value:
@@ -24018,7 +23946,7 @@ class UltimateOscillatorStrategies:
             self.compute_values(df)
         diff = self.uo.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'UO_Rising', -1: 'UO_Falling', 0: 'UO_Unchanged'}
@@ -24027,11 +23955,11 @@ class UltimateOscillatorStrategies:
             -1: 'UO is falling, suggesting increasing bearish momentum.',
             0: 'UO remains unchanged, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'UO_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -24087,7 +24015,7 @@ class UlcerIndexStrategies:
         cond_bull = self.ui < self.lower_threshold
         cond_bear = self.ui > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Low_Risk', -1: 'High_Risk', 0: 'Moderate_Risk'}
@@ -24096,11 +24024,11 @@ class UlcerIndexStrategies:
             -1: f'Ulcer Index is above {self.upper_threshold}, indicating high downside risk and an unfavorable environment.',
             0: f'Ulcer Index is between {self.lower_threshold} and {self.upper_threshold}, indicating moderate risk.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'UI_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -24127,7 +24055,7 @@ class UlcerIndexStrategies:
             self.compute_values(df)
         diff = self.ui.diff()
         signals = np.where(diff < 0, 1, np.where(diff > 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'UI_Falling', -1: 'UI_Rising', 0: 'UI_Unchanged'}
@@ -24136,11 +24064,11 @@ class UlcerIndexStrategies:
             -1: 'Ulcer Index is rising, indicating increasing downside risk and a potentially bearish environment.',
             0: 'Ulcer Index remains unchanged, indicating stable risk conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'UI_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -24174,7 +24102,7 @@ class UlcerIndexStrategies:
         cond_bull = (ui_prev >= ui_ma_prev) & (ui_current < ui_ma_current)
         cond_bear = (ui_prev <= ui_ma_prev) & (ui_current > ui_ma_current)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def ma_crossover_map(self, series):
         mapping_value = {1: 'UI_Cross_Below_MA', -1: 'UI_Cross_Above_MA', 0: 'UI_MA_Neutral'}
@@ -24183,11 +24111,11 @@ class UlcerIndexStrategies:
             -1: 'Ulcer Index crossed above its moving average, suggesting an increase in risk and a bearish signal.',
             0: 'No significant crossover between Ulcer Index and its moving average.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_ma_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_ma_crossover_strategy(df)
-        value, explanation = self.ma_crossover_map(score)
+        value, explanation = self.ma_crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'UI_Period:{self.period}_MA_Crossover_Signal'
         if append:
             if ta_indicator_value:
@@ -24239,7 +24167,7 @@ class UpDownStrategies:
         cond_bull = (updown_prev <= 0) & (updown_current > 0)
         cond_bear = (updown_prev >= 0) & (updown_current < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'UpDown_Cross_Above_Zero', -1: 'UpDown_Cross_Below_Zero', 0: 'UpDown_Neutral'}
@@ -24248,11 +24176,11 @@ class UpDownStrategies:
             -1: 'UpDown indicator crossed below zero, indicating a shift towards more down days and bearish sentiment.',
             0: 'UpDown indicator remains around zero, indicating balanced market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'UpDown_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -24280,7 +24208,7 @@ class UpDownStrategies:
         cond_bull = self.updown > self.upper_threshold
         cond_bear = self.updown < self.lower_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'UpDown_Above_Upper_Threshold', -1: 'UpDown_Below_Lower_Threshold', 0: 'UpDown_Neutral'}
@@ -24289,11 +24217,11 @@ class UpDownStrategies:
             -1: f'UpDown indicator is below {self.lower_threshold}, indicating strong bearish bias with many more down days.',
             0: f'UpDown indicator is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'UpDown_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -24320,7 +24248,7 @@ class UpDownStrategies:
             self.compute_values(df)
         diff = self.updown.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'UpDown_Rising', -1: 'UpDown_Falling', 0: 'UpDown_Unchanged'}
@@ -24329,11 +24257,11 @@ class UpDownStrategies:
             -1: 'UpDown indicator is falling, suggesting an increasing number of down days and growing bearish momentum.',
             0: 'UpDown indicator is unchanged, indicating no significant change in market bias.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'UpDown_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -24392,7 +24320,7 @@ class VariableIndexDynamicAverageStrategies:
         cond_bull = (close_prev <= vidya_prev) & (close_current > vidya_current)
         cond_bear = (close_prev >= vidya_prev) & (close_current < vidya_current)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_crossover_map(self, series):
         mapping_value = {1: 'Price_Above_VIDYA', -1: 'Price_Below_VIDYA', 0: 'Price_Neutral'}
@@ -24401,11 +24329,11 @@ class VariableIndexDynamicAverageStrategies:
             -1: 'The closing price crossed below the Variable Index Dynamic Average, indicating bearish momentum.',
             0: 'No significant crossover between the closing price and the VIDYA was detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_crossover_strategy(df)
-        value, explanation = self.price_crossover_map(score)
+        value, explanation = self.price_crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'VIDYA_PriceCrossover_Signal'
         if append:
             if ta_indicator_value:
@@ -24432,7 +24360,7 @@ class VariableIndexDynamicAverageStrategies:
             self.compute_values(df)
         diff = self.vidya.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'VIDYA_Rising', -1: 'VIDYA_Falling', 0: 'VIDYA_Unchanged'}
@@ -24441,11 +24369,11 @@ class VariableIndexDynamicAverageStrategies:
             -1: 'VIDYA is falling, suggesting increasing bearish momentum.',
             0: 'VIDYA remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'VIDYA_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -24474,7 +24402,7 @@ class VariableIndexDynamicAverageStrategies:
         cond_bull = diff_ratio > self.threshold_percentage
         cond_bear = diff_ratio < -self.threshold_percentage
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Significantly_Above_VIDYA', -1: 'Price_Significantly_Below_VIDYA', 0: 'Price_Near_VIDYA'}
@@ -24483,11 +24411,11 @@ class VariableIndexDynamicAverageStrategies:
             -1: f'The closing price is more than {self.threshold_percentage * 100}% below VIDYA, indicating strong bearish conditions.',
             0: f'The closing price is within {self.threshold_percentage * 100}% of VIDYA, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'VIDYA_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -24546,7 +24474,7 @@ class VarianceStrategies:
         cond_bull = (diff_prev >= 0) & (diff_current < 0)
         cond_bear = (diff_prev <= 0) & (diff_current > 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def crossover_map(self, series):
         mapping_value = {1: 'Variance_Below_MA', -1: 'Variance_Above_MA', 0: 'Variance_Neutral'}
@@ -24555,11 +24483,11 @@ class VarianceStrategies:
             -1: 'Variance has risen above its moving average, indicating an expansion in volatility (a bearish signal).',
             0: 'No significant crossover between Variance and its moving average.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_crossover_strategy(df)
-        value, explanation = self.crossover_map(score)
+        value, explanation = self.crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Variance_Period:{self.period}_Crossover_Signal'
         if append:
             if ta_indicator_value:
@@ -24587,7 +24515,7 @@ class VarianceStrategies:
         cond_bull = self.variance < self.lower_threshold
         cond_bear = self.variance > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Low_Variance', -1: 'High_Variance', 0: 'Moderate_Variance'}
@@ -24596,11 +24524,11 @@ class VarianceStrategies:
             -1: f'Variance is above {self.upper_threshold}, indicating high volatility and increased risk (a bearish signal).',
             0: f'Variance is between {self.lower_threshold} and {self.upper_threshold}, suggesting moderate volatility.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Variance_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -24627,7 +24555,7 @@ class VarianceStrategies:
             self.compute_values(df)
         diff = self.variance.diff()
         signals = np.where(diff < 0, 1, np.where(diff > 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Variance_Decreasing', -1: 'Variance_Increasing', 0: 'Variance_Unchanged'}
@@ -24636,11 +24564,11 @@ class VarianceStrategies:
             -1: 'Variance is increasing, indicating rising volatility and potential risk (a bearish signal).',
             0: 'Variance remains unchanged, indicating stable volatility conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'Variance_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -24691,7 +24619,7 @@ class VerticalHorizontalFilterStrategies:
         cond_bull = self.vhf > self.trending_threshold
         cond_bear = self.vhf < self.range_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Trending', -1: 'Ranging', 0: 'Neutral'}
@@ -24700,11 +24628,11 @@ class VerticalHorizontalFilterStrategies:
             -1: f'VHF is below {self.range_threshold}, indicating a ranging market where trends are weak.',
             0: f'VHF is between {self.range_threshold} and {self.trending_threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VHF_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -24731,7 +24659,7 @@ class VerticalHorizontalFilterStrategies:
             self.compute_values(df)
         diff = self.vhf.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'VHF_Rising', -1: 'VHF_Falling', 0: 'VHF_Unchanged'}
@@ -24740,11 +24668,11 @@ class VerticalHorizontalFilterStrategies:
             -1: 'VHF is falling, suggesting that the market is becoming more range-bound.',
             0: 'VHF remains unchanged, indicating stable market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VHF_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -24775,7 +24703,7 @@ class VerticalHorizontalFilterStrategies:
         cond_bull = (vhf_prev < ma_prev) & (self.vhf >= ma_vhf)
         cond_bear = (vhf_prev > ma_prev) & (self.vhf <= ma_vhf)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def ma_crossover_map(self, series):
         mapping_value = {1: 'VHF_Crossed_Above_MA', -1: 'VHF_Crossed_Below_MA', 0: 'VHF_MA_Neutral'}
@@ -24784,11 +24712,11 @@ class VerticalHorizontalFilterStrategies:
             -1: 'VHF crossed below its moving average, suggesting a loss of trend strength.',
             0: 'No significant crossover between VHF and its moving average.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_ma_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_ma_crossover_strategy(df)
-        value, explanation = self.ma_crossover_map(score)
+        value, explanation = self.ma_crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VHF_Period:{self.period}_MA_Crossover_Signal'
         if append:
             if ta_indicator_value:
@@ -24838,7 +24766,7 @@ class VolumeAdjustedMovingAverageStrategies:
         cond_bull = (close_prev <= vama_prev) & (close_current > vama_current)
         cond_bear = (close_prev >= vama_prev) & (close_current < vama_current)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_crossover_map(self, series):
         mapping_value = {1: 'Price_Above_VAMA', -1: 'Price_Below_VAMA', 0: 'Price_Neutral'}
@@ -24847,11 +24775,11 @@ class VolumeAdjustedMovingAverageStrategies:
             -1: 'The closing price crossed below the Volume Adjusted Moving Average, indicating bearish momentum.',
             0: 'No significant crossover between the closing price and the VAMA was detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_crossover_strategy(df)
-        value, explanation = self.price_crossover_map(score)
+        value, explanation = self.price_crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'VAMA_PriceCrossover_Signal'
         if append:
             if ta_indicator_value:
@@ -24878,7 +24806,7 @@ class VolumeAdjustedMovingAverageStrategies:
             self.compute_values(df)
         diff = self.vama.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'VAMA_Rising', -1: 'VAMA_Falling', 0: 'VAMA_Unchanged'}
@@ -24887,11 +24815,11 @@ class VolumeAdjustedMovingAverageStrategies:
             -1: 'The VAMA is falling, indicating increasing bearish momentum.',
             0: 'The VAMA remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'VAMA_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -24920,7 +24848,7 @@ class VolumeAdjustedMovingAverageStrategies:
         cond_bull = diff_ratio > self.threshold_percentage
         cond_bear = diff_ratio < -self.threshold_percentage
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Significantly_Above_VAMA', -1: 'Price_Significantly_Below_VAMA', 0: 'Price_Near_VAMA'}
@@ -24929,11 +24857,11 @@ class VolumeAdjustedMovingAverageStrategies:
             -1: f'The closing price is more than {self.threshold_percentage * 100}% below the VAMA, indicating strong bearish conditions.',
             0: f'The closing price is within {self.threshold_percentage * 100}% of the VAMA, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'VAMA_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -24987,7 +24915,7 @@ class VolumeFlowIndicatorStrategies:
         cond_bull = (vfi_prev <= 0) & (vfi_current > 0)
         cond_bear = (vfi_prev >= 0) & (vfi_current < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'VFI_Cross_Above_Zero', -1: 'VFI_Cross_Below_Zero', 0: 'VFI_Neutral'}
@@ -24996,11 +24924,11 @@ class VolumeFlowIndicatorStrategies:
             -1: 'VFI crossed below zero, indicating a shift towards negative volume flow and bearish conditions.',
             0: 'VFI remains around zero, indicating neutral volume flow.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VFI_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -25028,7 +24956,7 @@ class VolumeFlowIndicatorStrategies:
         cond_bull = self.vfi < self.lower_threshold
         cond_bear = self.vfi > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'VFI_Oversold', -1: 'VFI_Overbought', 0: 'VFI_Neutral'}
@@ -25037,11 +24965,11 @@ class VolumeFlowIndicatorStrategies:
             -1: f'VFI is above {self.upper_threshold}, indicating overbought conditions and potential bearish reversal.',
             0: f'VFI is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced volume flow.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VFI_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -25068,7 +24996,7 @@ class VolumeFlowIndicatorStrategies:
             self.compute_values(df)
         diff = self.vfi.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'VFI_Rising', -1: 'VFI_Falling', 0: 'VFI_Unchanged'}
@@ -25077,11 +25005,11 @@ class VolumeFlowIndicatorStrategies:
             -1: 'VFI is falling, indicating increasing negative volume flow and bearish momentum.',
             0: 'VFI remains unchanged, indicating stable volume flow.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VFI_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -25126,7 +25054,7 @@ class VolumePriceTrendStrategies:
             self.compute_values(df)
         diff = self.vpt.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'VPT_Rising', -1: 'VPT_Falling', 0: 'VPT_Unchanged'}
@@ -25135,11 +25063,11 @@ class VolumePriceTrendStrategies:
             -1: 'The Volume Price Trend is falling, indicating distribution and bearish momentum.',
             0: 'The Volume Price Trend remains unchanged, indicating neutral market conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'VPT_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -25170,7 +25098,7 @@ class VolumePriceTrendStrategies:
         cond_bull = (vpt_prev < ma_prev) & (self.vpt >= ma_vpt)
         cond_bear = (vpt_prev > ma_prev) & (self.vpt <= ma_vpt)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def ma_crossover_map(self, series):
         mapping_value = {1: 'VPT_Cross_Above_MA', -1: 'VPT_Cross_Below_MA', 0: 'VPT_MA_Neutral'}
@@ -25179,11 +25107,11 @@ class VolumePriceTrendStrategies:
             -1: f'Volume Price Trend crossed below its {self.ma_period}-period moving average, suggesting bearish confirmation.',
             0: f'No significant crossover between Volume Price Trend and its moving average.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_ma_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_ma_crossover_strategy(df)
-        value, explanation = self.ma_crossover_map(score)
+        value, explanation = self.ma_crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VPT_MA_Crossover_Signal'
         if append:
             if ta_indicator_value:
@@ -25213,7 +25141,7 @@ class VolumePriceTrendStrategies:
         cond_bull = pct_change > self.threshold_percentage
         cond_bear = pct_change < -self.threshold_percentage
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'VPT_Significantly_Rising', -1: 'VPT_Significantly_Falling', 0: 'VPT_Near_MA'}
@@ -25222,11 +25150,11 @@ class VolumePriceTrendStrategies:
             -1: f'The percentage change in VPT is below -{self.threshold_percentage*100}%, indicating strong bearish distribution.',
             0: f'The change in VPT is within ±{self.threshold_percentage*100}%, indicating moderate movement.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'VPT_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -25306,7 +25234,7 @@ class VolumeProfileStrategies:
         if self.volume_profile is None:
             self.compute_values(df)
         score = np.where(df['Close'] > self.poc, 1, np.where(df['Close'] < self.poc, -1, 0))
-        return pd.Series(score, index=df.index)
+        return pd.Series(score, index=df.index, dtype=np.int8)
 
     def poc_breakout_map(self, series):
         mapping_value = {1: 'Close_Above_POC', -1: 'Close_Below_POC', 0: 'Close_At_POC'}
@@ -25315,11 +25243,11 @@ class VolumeProfileStrategies:
             -1: f'The current closing price is below the POC ({self.poc}), indicating bearish breakout conditions.',
             0: f'The current closing price is at the POC ({self.poc}), indicating neutral breakout conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_poc_breakout_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_poc_breakout_strategy(df)
-        value, explanation = self.poc_breakout_map(score)
+        value, explanation = self.poc_breakout_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VP_Period:{self.period}_POC_Breakout_Signal'
         if append:
             if ta_indicator_value:
@@ -25345,7 +25273,7 @@ class VolumeProfileStrategies:
         if self.volume_profile is None:
             self.compute_values(df)
         score = np.where(df['Close'] > self.value_area_high, -1, np.where(df['Close'] < self.value_area_low, 1, 0))
-        return pd.Series(score, index=df.index)
+        return pd.Series(score, index=df.index, dtype=np.int8)
 
     def value_area_map(self, series):
         mapping_value = {1: 'Below_Value_Area', -1: 'Above_Value_Area', 0: 'Within_Value_Area'}
@@ -25354,11 +25282,11 @@ class VolumeProfileStrategies:
             -1: f'The current closing price is above the value area (high boundary: {self.value_area_high}), indicating potential bearish reversal.',
             0: f'The current closing price is within the value area (between {self.value_area_low} and {self.value_area_high}), indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_value_area_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_value_area_strategy(df)
-        value, explanation = self.value_area_map(score)
+        value, explanation = self.value_area_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VP_Period:{self.period}_ValueArea_Rejection_Signal'
         if append:
             if ta_indicator_value:
@@ -25383,20 +25311,8 @@ class VolumeProfileStrategies:
         return df_copy
 
     def compute_rolling_poc(self, df):
-        rolling_poc = []
-        indices = df.index
-        for i in range(len(df)):
-            if i < self.period - 1:
-                rolling_poc.append(np.nan)
-            else:
-                window_df = df.iloc[i - self.period + 1:i + 1]
-                bins = np.floor(window_df['Close'] / self.bin_size) * self.bin_size
-                window_df_bins = pd.DataFrame({'PriceBin': bins, 'Volume': window_df['Volume']})
-                volume_profile = window_df_bins.groupby('PriceBin')['Volume'].sum()
-                volume_profile = volume_profile.sort_index()
-                poc_value = volume_profile.idxmax()
-                rolling_poc.append(poc_value)
-        self.rolling_poc = pd.Series(rolling_poc, index=indices)
+        profile = rolling_volume_profile(df['Close'].values, df['Volume'].values, self.period, self.bin_size)
+        self.rolling_poc = pd.Series(profile['poc'], index=df.index)
         return self.rolling_poc
 
     def calculate_scores_cluster_shift_strategy(self, df):
@@ -25404,7 +25320,7 @@ class VolumeProfileStrategies:
             self.compute_rolling_poc(df)
         poc_diff = self.rolling_poc.diff()
         score = np.where(poc_diff > 0, 1, np.where(poc_diff < 0, -1, 0))
-        return pd.Series(score, index=df.index)
+        return pd.Series(score, index=df.index, dtype=np.int8)
 
     def cluster_shift_map(self, series):
         mapping_value = {1: 'POC_Shift_Up', -1: 'POC_Shift_Down', 0: 'POC_Stable'}
@@ -25413,11 +25329,11 @@ class VolumeProfileStrategies:
             -1: 'The rolling POC is shifting downward, indicating volume is clustering at lower price levels (bearish signal).',
             0: 'The rolling POC remains stable, indicating no significant shift in volume clustering.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_cluster_shift_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_cluster_shift_strategy(df)
-        value, explanation = self.cluster_shift_map(score)
+        value, explanation = self.cluster_shift_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VP_Period:{self.period}_ClusterShift_Signal'
         if append:
             if ta_indicator_value:
@@ -25456,8 +25372,11 @@ class VolumeWeightedAveragePriceStrategies:
         self.threshold = threshold
         self.vwap = None
 
+    def required_primitives(self):
+        return [('TYPICAL_PRICE',)]
+
     def compute_values(self, df):
-        typical_price = (df['High'] + df['Low'] + df['Close']) / 3
+        typical_price = frame_primitives(self, df).get(('TYPICAL_PRICE',))
         cum_pv = (typical_price * df['Volume']).cumsum()
         cum_vol = df['Volume'].cumsum().replace(0, 1)
         vwap = cum_pv / cum_vol
@@ -25473,7 +25392,7 @@ class VolumeWeightedAveragePriceStrategies:
         cond_bull = (price_prev <= vwap_prev) & (price > self.vwap)
         cond_bear = (price_prev >= vwap_prev) & (price < self.vwap)
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Above_VWAP', -1: 'Price_Below_VWAP', 0: 'Neutral'}
@@ -25482,11 +25401,11 @@ class VolumeWeightedAveragePriceStrategies:
             -1: 'Price crossed below VWAP indicating potential bearish trend.',
             0: 'No clear crossover signal between price and VWAP.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'VWAP_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -25516,7 +25435,7 @@ class VolumeWeightedAveragePriceStrategies:
         cond_bull = pct_diff <= -self.threshold
         cond_bear = pct_diff >= self.threshold
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Significantly_Below_VWAP', -1: 'Price_Significantly_Above_VWAP', 0: 'Price_Near_VWAP'}
@@ -25525,11 +25444,11 @@ class VolumeWeightedAveragePriceStrategies:
             -1: f'Price is above VWAP by at least {self.threshold*100:.1f}%, suggesting overbought conditions and potential bearish reversal.',
             0: 'Price is within the threshold range of VWAP, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'VWAP_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -25556,7 +25475,7 @@ class VolumeWeightedAveragePriceStrategies:
             self.compute_values(df)
         diff = self.vwap.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'VWAP_Rising', -1: 'VWAP_Falling', 0: 'VWAP_Unchanged'}
@@ -25565,11 +25484,11 @@ class VolumeWeightedAveragePriceStrategies:
             -1: 'VWAP is falling, indicating bearish momentum.',
             0: 'VWAP is unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'VWAP_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -25619,7 +25538,7 @@ class VolumeWeightedMovingAverageStrategies:
         cond_bull = (price_prev <= vwma_prev) & (price > self.vwma)
         cond_bear = (price_prev >= vwma_prev) & (price < self.vwma)
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'Price_Above_VWMA', -1: 'Price_Below_VWMA', 0: 'VWMA_Neutral'}
@@ -25628,11 +25547,11 @@ class VolumeWeightedMovingAverageStrategies:
             -1: 'Closing price crossed below VWMA indicating bearish momentum.',
             0: 'No crossover signal between closing price and VWMA.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VWMA_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -25662,7 +25581,7 @@ class VolumeWeightedMovingAverageStrategies:
         cond_bull = pct_diff <= -self.threshold
         cond_bear = pct_diff >= self.threshold
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Price_Significantly_Below_VWMA', -1: 'Price_Significantly_Above_VWMA', 0: 'Price_Near_VWMA'}
@@ -25671,11 +25590,11 @@ class VolumeWeightedMovingAverageStrategies:
             -1: f'Price is above VWMA by at least {self.threshold*100:.1f}%, suggesting potential bearish reversal.',
             0: 'Price is within the threshold range of VWMA, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VWMA_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -25702,7 +25621,7 @@ class VolumeWeightedMovingAverageStrategies:
             self.compute_values(df)
         diff = self.vwma.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'VWMA_Rising', -1: 'VWMA_Falling', 0: 'VWMA_Unchanged'}
@@ -25711,11 +25630,11 @@ class VolumeWeightedMovingAverageStrategies:
             -1: 'VWMA is falling, indicating bearish momentum.',
             0: 'VWMA remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VWMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -25770,7 +25689,7 @@ class VolumeZoneOscillatorStrategies:
         cond_bull = (vzo_prev <= self.baseline) & (self.vzo > self.baseline)
         cond_bear = (vzo_prev >= self.baseline) & (self.vzo < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'VZO_Crossed_Above_0', -1: 'VZO_Crossed_Below_0', 0: 'VZO_Neutral'}
@@ -25779,11 +25698,11 @@ class VolumeZoneOscillatorStrategies:
             -1: 'VZO crossed below 0, indicating a shift to dominant selling volume (bearish signal).',
             0: 'VZO remains around 0, indicating balanced volume between up and down days (neutral signal).'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VZO_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -25809,7 +25728,7 @@ class VolumeZoneOscillatorStrategies:
         if self.vzo is None:
             self.compute_values(df)
         signals = np.select([self.vzo > self.upper_threshold, self.vzo < self.lower_threshold], [1, -1], default=0)
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'VZO_Above_Upper_Threshold', -1: 'VZO_Below_Lower_Threshold', 0: 'VZO_Neutral'}
@@ -25818,11 +25737,11 @@ class VolumeZoneOscillatorStrategies:
             -1: f'VZO is below the lower threshold of {self.lower_threshold}, indicating strong selling volume (bearish signal).',
             0: f'VZO is between {self.lower_threshold} and {self.upper_threshold}, indicating balanced volume (neutral signal).'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VZO_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -25849,7 +25768,7 @@ class VolumeZoneOscillatorStrategies:
             self.compute_values(df)
         diff = self.vzo.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'VZO_Rising', -1: 'VZO_Falling', 0: 'VZO_Stable'}
@@ -25858,11 +25777,11 @@ class VolumeZoneOscillatorStrategies:
             -1: 'VZO is falling, indicating increasing dominance of selling volume (bearish signal).',
             0: 'VZO is stable, indicating no significant change in volume dynamics (neutral signal).'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VZO_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -25916,7 +25835,7 @@ class VolumeWeightedMACDStrategies:
         cond_bull = (macd_prev <= signal_prev) & (self.macd_line > self.signal_line)
         cond_bear = (macd_prev >= signal_prev) & (self.macd_line < self.signal_line)
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'MACD_Above_Signal', -1: 'MACD_Below_Signal', 0: 'MACD_Neutral'}
@@ -25925,11 +25844,11 @@ class VolumeWeightedMACDStrategies:
             -1: 'MACD line crossed below the signal line, indicating bearish momentum.',
             0: 'No significant crossover between MACD and signal line.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VW_MACD_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -25957,7 +25876,7 @@ class VolumeWeightedMACDStrategies:
         cond_bull = self.macd_line > self.threshold
         cond_bear = self.macd_line < self.threshold
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'MACD_Above_Threshold', -1: 'MACD_Below_Threshold', 0: 'MACD_Neutral'}
@@ -25966,11 +25885,11 @@ class VolumeWeightedMACDStrategies:
             -1: f'MACD line is below the threshold of {self.threshold}, indicating bearish momentum.',
             0: 'MACD is neutral relative to the threshold.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VW_MACD_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -25997,7 +25916,7 @@ class VolumeWeightedMACDStrategies:
             self.compute_values(df)
         diff = self.macd_line.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'MACD_Rising', -1: 'MACD_Falling', 0: 'MACD_Unchanged'}
@@ -26006,11 +25925,11 @@ class VolumeWeightedMACDStrategies:
             -1: 'MACD line is falling, suggesting strengthening bearish momentum.',
             0: 'MACD line remains unchanged, indicating no clear momentum shift.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VW_MACD_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -26047,11 +25966,11 @@ class VortexIndicatorStrategies:
         self.vi_plus = None
         self.vi_minus = None
 
+    def required_primitives(self):
+        return [('TR', True)]
+
     def compute_values(self, df):
-        tr1 = df['High'] - df['Low']
-        tr2 = (df['High'] - df['Close'].shift(1)).abs()
-        tr3 = (df['Low'] - df['Close'].shift(1)).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        tr = frame_primitives(self, df).get(('TR', True))
         vi_plus = (abs(df['High'] - df['Low'].shift(1))).rolling(window=self.period, min_periods=1).sum() / tr.rolling(window=self.period, min_periods=1).sum().replace(0, 1)
         vi_minus = (abs(df['Low'] - df['High'].shift(1))).rolling(window=self.period, min_periods=1).sum() / tr.rolling(window=self.period, min_periods=1).sum().replace(0, 1)
         self.vi_plus = vi_plus
@@ -26066,7 +25985,7 @@ class VortexIndicatorStrategies:
         cond_bull = (vi_plus_prev <= vi_minus_prev) & (self.vi_plus > self.vi_minus)
         cond_bear = (vi_plus_prev >= vi_minus_prev) & (self.vi_plus < self.vi_minus)
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'VI+_Crossed_Above_VI-', -1: 'VI+_Crossed_Below_VI-', 0: 'VI_Neutral'}
@@ -26075,11 +25994,11 @@ class VortexIndicatorStrategies:
             -1: 'VI+ crossed below VI-, indicating a bearish trend reversal.',
             0: 'No significant crossover between VI+ and VI-.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VI_Period:{self.period}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -26107,7 +26026,7 @@ class VortexIndicatorStrategies:
         cond_bull = (self.vi_plus > self.threshold) & (self.vi_plus > self.vi_minus)
         cond_bear = (self.vi_minus > self.threshold) & (self.vi_minus > self.vi_plus)
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'VI+_Above_Threshold', -1: 'VI-_Above_Threshold', 0: 'VI_Neutral'}
@@ -26116,11 +26035,11 @@ class VortexIndicatorStrategies:
             -1: f'VI- is above the threshold of {self.threshold} and higher than VI+, indicating bearish trend.',
             0: 'Both VI+ and VI- are below the threshold, indicating a weak trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VI_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -26147,7 +26066,7 @@ class VortexIndicatorStrategies:
             self.compute_values(df)
         diff = (self.vi_plus - self.vi_minus).diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Increasing_VI_Gap', -1: 'Decreasing_VI_Gap', 0: 'Stable_VI_Gap'}
@@ -26156,11 +26075,11 @@ class VortexIndicatorStrategies:
             -1: 'The gap between VI+ and VI- is decreasing, suggesting strengthening bearish momentum.',
             0: 'No significant change in the gap between VI+ and VI-, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'VI_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -26200,8 +26119,11 @@ class WaveTrendOscillatorStrategies:
         self.wt1 = None
         self.wt2 = None
 
+    def required_primitives(self):
+        return [('TYPICAL_PRICE',)]
+
     def compute_values(self, df):
-        tp = (df['High'] + df['Low'] + df['Close']) / 3
+        tp = frame_primitives(self, df).get(('TYPICAL_PRICE',))
         esa = tp.ewm(span=self.period1, adjust=False).mean()
         d = abs(tp - esa).ewm(span=self.period1, adjust=False).mean()
         ci = (tp - esa) / (0.015 * d.replace(0, 1))
@@ -26219,7 +26141,7 @@ class WaveTrendOscillatorStrategies:
         cond_bull = (wt1_prev <= wt2_prev) & (self.wt1 > self.wt2)
         cond_bear = (wt1_prev >= wt2_prev) & (self.wt1 < self.wt2)
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'WT1_Crossed_Above_Signal', -1: 'WT1_Crossed_Below_Signal', 0: 'WT_Neutral'}
@@ -26228,11 +26150,11 @@ class WaveTrendOscillatorStrategies:
             -1: 'WT1 crossed below WT2, indicating a potential bearish reversal.',
             0: 'No significant crossover between WT1 and WT2.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WT_Period1:{self.period1}_Period2:{self.period2}_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -26260,7 +26182,7 @@ class WaveTrendOscillatorStrategies:
         cond_bull = self.wt1 < self.lower_threshold
         cond_bear = self.wt1 > self.upper_threshold
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'WT_Below_Lower_Threshold', -1: 'WT_Above_Upper_Threshold', 0: 'WT_Neutral'}
@@ -26269,11 +26191,11 @@ class WaveTrendOscillatorStrategies:
             -1: f'WT1 is above the upper threshold of {self.upper_threshold}, suggesting overbought conditions and potential bearish reversal.',
             0: 'WT1 is within the normal range, indicating balanced conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WT_Period1:{self.period1}_Period2:{self.period2}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -26300,7 +26222,7 @@ class WaveTrendOscillatorStrategies:
             self.compute_values(df)
         diff = self.wt1.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'WT1_Rising', -1: 'WT1_Falling', 0: 'WT1_Unchanged'}
@@ -26309,11 +26231,11 @@ class WaveTrendOscillatorStrategies:
             -1: 'WT1 is falling, indicating increasing bearish momentum.',
             0: 'WT1 remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WT_Period1:{self.period1}_Period2:{self.period2}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -26362,7 +26284,7 @@ class WeightedClosingPriceStrategies:
         cond_bull = (diff_prev <= 0) & (diff > 0)
         cond_bear = (diff_prev >= 0) & (diff < 0)
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'WCP_Above_Close', -1: 'WCP_Below_Close', 0: 'WCP_Neutral'}
@@ -26371,11 +26293,11 @@ class WeightedClosingPriceStrategies:
             -1: 'Weighted Closing Price crossed below the closing price, indicating bearish momentum.',
             0: 'No significant crossover between Weighted Closing Price and closing price.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'WCP_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -26405,7 +26327,7 @@ class WeightedClosingPriceStrategies:
         cond_bull = pct_diff >= self.threshold
         cond_bear = pct_diff <= -self.threshold
         signals = np.where(cond_bull, 1, np.where(cond_bear, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'WCP_Above_SMA', -1: 'WCP_Below_SMA', 0: 'WCP_Near_SMA'}
@@ -26414,11 +26336,11 @@ class WeightedClosingPriceStrategies:
             -1: f'Weighted Closing Price is below its {self.sma_period}-period SMA by at least {self.threshold*100:.1f}%, indicating bearish conditions.',
             0: f'Weighted Closing Price is near its {self.sma_period}-period SMA, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WCP_SMA_Period:{self.sma_period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -26445,7 +26367,7 @@ class WeightedClosingPriceStrategies:
             self.compute_values(df)
         diff = self.wcl.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'WCP_Rising', -1: 'WCP_Falling', 0: 'WCP_Unchanged'}
@@ -26454,11 +26376,11 @@ class WeightedClosingPriceStrategies:
             -1: 'Weighted Closing Price is falling, indicating bearish momentum.',
             0: 'Weighted Closing Price remains unchanged, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'WCP_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -26495,9 +26417,13 @@ class WeightedMovingAverageStrategies:
 
     def compute_values(self, df):
         w = list(range(1, self.period + 1))
-        def weighted_avg(series):
-            return sum(series[i] * w[i] for i in range(len(series))) / sum(w)
-        return df['Close'].rolling(window=self.period, min_periods=1).apply(weighted_avg, raw=True)
+        prices = df['Close'].to_numpy(dtype=float)
+        wma = np.empty(len(prices))
+        # Warm-up bars weight the partial window by 1..n but still divide by the full-period weight sum
+        warmup = min(self.period - 1, len(prices))
+        wma[:warmup] = np.cumsum(prices[:warmup] * w[:warmup]) / sum(w)
+        wma[warmup:] = weighted_window_sums(prices, w) / sum(w)
+        return pd.Series(wma, index=df.index, name=df['Close'].name)
 
     def calculate_scores_price_crossover_strategy(self, df):
         wma = self.compute_values(df)
@@ -26508,7 +26434,7 @@ class WeightedMovingAverageStrategies:
         cond_bear = (price_prev >= wma_prev) & (price < wma)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
         self.wma = wma
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_crossover_map(self, series):
         mapping_value = {1: 'Price_Cross_Above_WMA', -1: 'Price_Cross_Below_WMA', 0: 'No_Crossover'}
@@ -26517,11 +26443,11 @@ class WeightedMovingAverageStrategies:
             -1: 'Price crossed below the Weighted Moving Average, indicating bearish momentum.',
             0: 'No price crossover relative to the Weighted Moving Average.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_crossover_strategy(df)
-        value, explanation = self.price_crossover_map(score)
+        value, explanation = self.price_crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WMA_Period:{self.period}_PriceCrossover_Signal'
         if append:
             if ta_indicator_value:
@@ -26548,7 +26474,7 @@ class WeightedMovingAverageStrategies:
         diff = wma.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
         self.wma = wma
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'WMA_Rising', -1: 'WMA_Falling', 0: 'WMA_Unchanged'}
@@ -26557,11 +26483,11 @@ class WeightedMovingAverageStrategies:
             -1: 'Weighted Moving Average is falling, suggesting bearish trend.',
             0: 'Weighted Moving Average remains unchanged, suggesting neutral trend.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -26591,7 +26517,7 @@ class WeightedMovingAverageStrategies:
         cond_bear = deviation < -self.deviation_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
         self.wma = wma
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def deviation_map(self, series):
         mapping_value = {1: 'Price_Above_WMA', -1: 'Price_Below_WMA', 0: 'Price_Near_WMA'}
@@ -26600,11 +26526,11 @@ class WeightedMovingAverageStrategies:
             -1: f'Price is below the Weighted Moving Average by more than {self.deviation_threshold*100:.2f}%, indicating bearish conditions.',
             0: 'Price is within the acceptable deviation range of the Weighted Moving Average, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_deviation_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_deviation_strategy(df)
-        value, explanation = self.deviation_map(score)
+        value, explanation = self.deviation_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WMA_Period:{self.period}_DeviationThreshold:{self.deviation_threshold}_Signal'
         if append:
             if ta_indicator_value:
@@ -26653,7 +26579,7 @@ class WeightedOnBalanceVolumeStrategies:
         cond_bear = (wobv_prev >= 0) & (wobv < 0)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
         self.wobv = wobv
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def zero_cross_map(self, series):
         mapping_value = {1: 'WOBV_Above_Zero', -1: 'WOBV_Below_Zero', 0: 'WOBV_Neutral'}
@@ -26662,11 +26588,11 @@ class WeightedOnBalanceVolumeStrategies:
             -1: 'Weighted On Balance Volume crossed below zero, indicating bearish volume pressure.',
             0: 'No significant zero cross observed in Weighted On Balance Volume.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_zero_cross_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_zero_cross_strategy(df)
-        value, explanation = self.zero_cross_map(score)
+        value, explanation = self.zero_cross_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'WOBV_ZeroCross_Signal'
         if append:
             if ta_indicator_value:
@@ -26693,7 +26619,7 @@ class WeightedOnBalanceVolumeStrategies:
         diff = wobv.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
         self.wobv = wobv
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'WOBV_Rising', -1: 'WOBV_Falling', 0: 'WOBV_Unchanged'}
@@ -26702,11 +26628,11 @@ class WeightedOnBalanceVolumeStrategies:
             -1: 'Weighted On Balance Volume is falling, suggesting increasing bearish volume flow.',
             0: 'Weighted On Balance Volume remains unchanged, indicating neutral volume pressure.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = 'WOBV_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -26738,7 +26664,7 @@ class WeightedOnBalanceVolumeStrategies:
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
         self.wobv = wobv
         self.ma = ma
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def ma_crossover_map(self, series):
         mapping_value = {1: 'WOBV_Above_MA', -1: 'WOBV_Below_MA', 0: 'No_MA_Crossover'}
@@ -26747,11 +26673,11 @@ class WeightedOnBalanceVolumeStrategies:
             -1: f'Weighted On Balance Volume crossed below its {self.ma_period}-period moving average, indicating bearish momentum.',
             0: f'No crossover between Weighted On Balance Volume and its {self.ma_period}-period moving average detected.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_ma_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_ma_crossover_strategy(df)
-        value, explanation = self.ma_crossover_map(score)
+        value, explanation = self.ma_crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WOBV_MA_Crossover_Signal_MA_Period:{self.ma_period}'
         if append:
             if ta_indicator_value:
@@ -26800,7 +26726,7 @@ class WilliamsRStrategies:
         cond_bear = wr > self.upper_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
         self.wr = wr
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def threshold_map(self, series):
         mapping_value = {1: 'Oversold', -1: 'Overbought', 0: 'Neutral'}
@@ -26809,11 +26735,11 @@ class WilliamsRStrategies:
             -1: f'Williams %R is above {self.upper_threshold}, indicating overbought conditions and potential bearish reversal.',
             0: f'Williams %R is between {self.lower_threshold} and {self.upper_threshold}, indicating neutral conditions.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_threshold_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_threshold_strategy(df)
-        value, explanation = self.threshold_map(score)
+        value, explanation = self.threshold_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WR_Period:{self.period}_Threshold_Signal'
         if append:
             if ta_indicator_value:
@@ -26840,7 +26766,7 @@ class WilliamsRStrategies:
         diff = wr.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
         self.wr = wr
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'Rising', -1: 'Falling', 0: 'Unchanged'}
@@ -26849,11 +26775,11 @@ class WilliamsRStrategies:
             -1: 'Williams %R is falling, suggesting increasing bearish momentum.',
             0: 'Williams %R remains unchanged, suggesting neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WR_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -26882,7 +26808,7 @@ class WilliamsRStrategies:
         cond_bear = (wr_prev >= self.baseline) & (wr < self.baseline)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
         self.wr = wr
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def baseline_map(self, series):
         mapping_value = {1: 'Crossed_Above_Baseline', -1: 'Crossed_Below_Baseline', 0: 'No_Crossover'}
@@ -26891,11 +26817,11 @@ class WilliamsRStrategies:
             -1: f'Williams %R crossed below the baseline of {self.baseline}, indicating a bearish shift.',
             0: f'Williams %R did not cross the baseline of {self.baseline}, indicating neutral momentum.'
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_baseline_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_baseline_crossover_strategy(df)
-        value, explanation = self.baseline_map(score)
+        value, explanation = self.baseline_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WR_Period:{self.period}_Baseline:{self.baseline}_Crossover_Signal'
         if append:
             if ta_indicator_value:
@@ -26932,13 +26858,7 @@ class WildersMovingAverageStrategies:
 
     def compute_values(self, df):
         close = df['Close']
-        wma = pd.Series(index=close.index, dtype=float)
-        for i in range(len(close)):
-            if i < self.period:
-                wma.iloc[i] = close.iloc[:i+1].mean()
-            else:
-                wma.iloc[i] = (wma.iloc[i-1]*(self.period - 1) + close.iloc[i]) / self.period
-        return wma
+        return pd.Series(wilder_filter(close.values, self.period), index=close.index, dtype=float)
 
     def calculate_scores_price_crossover_strategy(self, df):
         wma = self.compute_values(df)
@@ -26949,7 +26869,7 @@ class WildersMovingAverageStrategies:
         cond_bear = (price_prev >= wma_prev) & (price < wma)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
         self.wma = wma
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_crossover_map(self, series):
         mapping_value = {1: 'Price_Cross_Above_WMA', -1: 'Price_Cross_Below_WMA', 0: 'No_Crossover'}
@@ -26958,11 +26878,11 @@ class WildersMovingAverageStrategies:
             -1: "Price crossed below Wilder's Moving Average, indicating bearish momentum.",
             0: "No price crossover relative to Wilder's Moving Average detected."
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_crossover_strategy(df)
-        value, explanation = self.price_crossover_map(score)
+        value, explanation = self.price_crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WMA_Period:{self.period}_PriceCrossover_Signal'
         if append:
             if ta_indicator_value:
@@ -26989,7 +26909,7 @@ class WildersMovingAverageStrategies:
         diff = wma.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
         self.wma = wma
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'WMA_Rising', -1: 'WMA_Falling', 0: 'WMA_Unchanged'}
@@ -26998,11 +26918,11 @@ class WildersMovingAverageStrategies:
             -1: "Wilder's Moving Average is falling, indicating bearish trend momentum.",
             0: "Wilder's Moving Average is unchanged, indicating neutral trend."
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -27032,7 +26952,7 @@ class WildersMovingAverageStrategies:
         cond_bear = deviation < -self.deviation_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
         self.wma = wma
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def deviation_map(self, series):
         mapping_value = {1: 'Price_Above_WMA', -1: 'Price_Below_WMA', 0: 'Price_Near_WMA'}
@@ -27041,11 +26961,11 @@ class WildersMovingAverageStrategies:
             -1: f"Price is below Wilder's Moving Average by more than {self.deviation_threshold*100:.2f}%, indicating bearish conditions.",
             0: "Price is within the acceptable deviation range of Wilder's Moving Average, indicating neutral conditions."
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_deviation_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_deviation_strategy(df)
-        value, explanation = self.deviation_map(score)
+        value, explanation = self.deviation_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'WMA_Period:{self.period}_DeviationThreshold:{self.deviation_threshold}_Signal'
         if append:
             if ta_indicator_value:
@@ -27095,7 +27015,7 @@ class ZeroLagExponentialMovingAverageStrategies:
         cond_bear = (price_prev >= zlema_prev) & (price < zlema)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
         self.zlema = zlema
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_crossover_map(self, series):
         mapping_value = {1: 'Price_Cross_Above_ZLEMA', -1: 'Price_Cross_Below_ZLEMA', 0: 'No_Crossover'}
@@ -27104,11 +27024,11 @@ class ZeroLagExponentialMovingAverageStrategies:
             -1: "Price crossed below the Zero Lag EMA, indicating bearish momentum.",
             0: "No price crossover relative to the Zero Lag EMA detected."
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_crossover_strategy(df)
-        value, explanation = self.price_crossover_map(score)
+        value, explanation = self.price_crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ZLEMA_Period:{self.period}_PriceCrossover_Signal'
         if append:
             if ta_indicator_value:
@@ -27135,7 +27055,7 @@ class ZeroLagExponentialMovingAverageStrategies:
         diff = zlema.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
         self.zlema = zlema
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'ZLEMA_Rising', -1: 'ZLEMA_Falling', 0: 'ZLEMA_Unchanged'}
@@ -27144,11 +27064,11 @@ class ZeroLagExponentialMovingAverageStrategies:
             -1: "Zero Lag EMA is falling, suggesting bearish trend momentum.",
             0: "Zero Lag EMA remains unchanged, indicating neutral momentum."
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ZLEMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -27178,7 +27098,7 @@ class ZeroLagExponentialMovingAverageStrategies:
         cond_bear = deviation < -self.deviation_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
         self.zlema = zlema
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def deviation_map(self, series):
         mapping_value = {1: 'Price_Above_ZLEMA', -1: 'Price_Below_ZLEMA', 0: 'Price_Near_ZLEMA'}
@@ -27187,11 +27107,11 @@ class ZeroLagExponentialMovingAverageStrategies:
             -1: f"Price is below the Zero Lag EMA by more than {self.deviation_threshold*100:.2f}%, indicating bearish weakness.",
             0: "Price is within the acceptable deviation range of the Zero Lag EMA, indicating neutral conditions."
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_deviation_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_deviation_strategy(df)
-        value, explanation = self.deviation_map(score)
+        value, explanation = self.deviation_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ZLEMA_Period:{self.period}_DeviationThreshold:{self.deviation_threshold}_Signal'
         if append:
             if ta_indicator_value:
@@ -27241,7 +27161,7 @@ class ZeroLagSimpleMovingAverageStrategies:
         cond_bear = (price_prev >= zlsma_prev) & (price < zlsma)
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
         self.zlsma = zlsma
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def price_crossover_map(self, series):
         mapping_value = {1: 'Price_Cross_Above_ZLSMA', -1: 'Price_Cross_Below_ZLSMA', 0: 'No_Crossover'}
@@ -27250,11 +27170,11 @@ class ZeroLagSimpleMovingAverageStrategies:
             -1: "Price crossed below the Zero Lag SMA, indicating bearish momentum.",
             0: "No price crossover relative to the Zero Lag SMA detected."
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_price_crossover_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_price_crossover_strategy(df)
-        value, explanation = self.price_crossover_map(score)
+        value, explanation = self.price_crossover_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ZLSMA_Period:{self.period}_PriceCrossover_Signal'
         if append:
             if ta_indicator_value:
@@ -27281,7 +27201,7 @@ class ZeroLagSimpleMovingAverageStrategies:
         diff = zlsma.diff()
         signals = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
         self.zlsma = zlsma
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def slope_map(self, series):
         mapping_value = {1: 'ZLSMA_Rising', -1: 'ZLSMA_Falling', 0: 'ZLSMA_Unchanged'}
@@ -27290,11 +27210,11 @@ class ZeroLagSimpleMovingAverageStrategies:
             -1: "Zero Lag SMA is falling, suggesting bearish momentum.",
             0: "Zero Lag SMA remains unchanged, indicating neutral trend."
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_slope_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_slope_strategy(df)
-        value, explanation = self.slope_map(score)
+        value, explanation = self.slope_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ZLSMA_Period:{self.period}_Slope_Signal'
         if append:
             if ta_indicator_value:
@@ -27324,7 +27244,7 @@ class ZeroLagSimpleMovingAverageStrategies:
         cond_bear = deviation < -self.deviation_threshold
         signals = np.select([cond_bull, cond_bear], [1, -1], default=0)
         self.zlsma = zlsma
-        return pd.Series(signals, index=df.index)
+        return pd.Series(signals, index=df.index, dtype=np.int8)
 
     def deviation_map(self, series):
         mapping_value = {1: 'Price_Above_ZLSMA', -1: 'Price_Below_ZLSMA', 0: 'Price_Near_ZLSMA'}
@@ -27333,11 +27253,11 @@ class ZeroLagSimpleMovingAverageStrategies:
             -1: f"Price is below the Zero Lag SMA by more than {self.deviation_threshold*100:.2f}%, indicating bearish conditions.",
             0: "Price is within the acceptable deviation range of the Zero Lag SMA, indicating neutral conditions."
         }
-        return series.map(mapping_value), series.map(mapping_explanation)
+        return signal_labels(series, mapping_value), signal_labels(series, mapping_explanation)
 
     def calculate_deviation_values(self, df, append=True, ta_indicator_value=False, signal_score=True, signal_value=False, signal_explanation=False):
         score = self.calculate_scores_deviation_strategy(df)
-        value, explanation = self.deviation_map(score)
+        value, explanation = self.deviation_map(score) if signal_value or signal_explanation else (None, None)
         column_prefix = f'ZLSMA_Period:{self.period}_DeviationThreshold:{self.deviation_threshold}_Signal'
         if append:
             if ta_indicator_value:
@@ -27367,3 +27287,9 @@ class ZeroLagSimpleMovingAverageStrategies:
 
 
   
+
+
+# Every strategy class of the library checks the frame before reading its memos
+for _cls in [value for name, value in list(globals().items())
+             if isinstance(value, type) and name.endswith('Strategies') and value.__module__ == __name__]:
+    bind_to_frames(_cls)
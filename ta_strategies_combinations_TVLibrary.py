@@ -1,9 +1,18 @@
 from ta_strategies_TVLibrary import *
+from indicators import IndicatorCache, data_fingerprint, normalize_params
+from primitives import PrimitiveStore, plan_primitives
 
 import pandas as pd
 import numpy as np
 import math
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import fnmatch
+import functools
+import inspect
+import os
+import re
+import tempfile
+import warnings
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import logging
 
 # Configure logging for better debugging
@@ -11,13 +20,77 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def _run_single_strategy(strategy_item, df, append, ta_indicator_value, signal_score, signal_value, signal_explanation):
+"""STRATEGY CLASSES MEMOIZE THEIR INDICATOR ON self (if self.aberration is None: ...), SO ONE SHARED INSTANCE
+RUN ON A SECOND TICKER QUIETLY REUSED THE FIRST TICKER'S VALUES. THE RUNNERS NOW TREAT EVERY INSTANCE AS A
+READ-ONLY TEMPLATE: EACH RUN WORKS ON A FRESH COPY BUILT FROM THE SETTINGS THE INSTANCE WAS CONSTRUCTED WITH,
+AND ITS compute_values GOES THROUGH strategy_value_cache, KEYED BY THE FRAME FINGERPRINT, THE STRATEGY CLASS
+AND THOSE SETTINGS. A HIT RESTORES BOTH THE RETURN VALUE AND EVERY ATTRIBUTE compute_values SET ON self, SO
+A TEMPLATE USED DIRECTLY DROPS ITS OWN MEMOS ON A NEW FRAME (SEE frame_bound IN THE LIBRARY), AND EITHER WAY
+EACH INDICATOR IS STILL COMPUTED ONCE PER FRAME"""
+
+SETTING_TYPES = (int, float, str, bool, type(None), tuple, list, np.generic)
+
+
+def strategy_settings(instance):
+    """Constructor settings of a strategy instance (its attributes without any memoized values)"""
+    return memo_free_state(instance)
+
+
+def settings_key(settings):
+    """Hashable cache key part for strategy settings, ignoring anything that is not a plain setting"""
+    return tuple(sorted((name, normalize_params(value)) for name, value in settings.items()
+                        if isinstance(value, SETTING_TYPES)))
+
+
+def bind_strategy(instance, settings=None, fingerprint=None, cache=None, primitives=None):
+    """Fresh working copy of a strategy for one frame, with compute_values served from the value cache
+    and shared primitives (TR, EMA, ...) read from the frame's PrimitiveStore when one is given"""
+    settings = strategy_settings(instance) if settings is None else settings
+    working = object.__new__(type(instance))
+    working.__dict__.update(settings)
+    if primitives is not None:
+        working.primitive_store = primitives
+    cache = strategy_value_cache if cache is None else cache
+    if fingerprint is None or not cache.enabled:
+        return working
+
+    compute_values = working.compute_values
+    key = (fingerprint, type(instance).__name__, settings_key(settings))
+
+    def cached_compute_values(df):
+        hit = cache.get(key)
+        if hit is not None:
+            result, state = hit
+            working.__dict__.update(state)
+            return result
+        before = dict(working.__dict__)
+        result = compute_values(df)
+        state = tuple((name, value) for name, value in working.__dict__.items()
+                      if name != 'compute_values' and (name not in before or before[name] is not value))
+        cache.put(key, (result, state))
+        return result
+
+    working.compute_values = cached_compute_values
+    return working
+
+
+# Global cache of compute_values results shared by every strategy runner in this process
+strategy_value_cache = IndicatorCache()
+
+
+def _run_single_strategy(strategy_item, df, append, ta_indicator_value, signal_score, signal_value, signal_explanation,
+                         selection=None, settings=None, fingerprint=None, primitives=None):
     """
     Helper function to run a single strategy in parallel.
+    Runs on a working copy bound to df, so the shared instance is never modified.
+    Only the sub-strategies listed for it in selection (from select_strategies) are computed.
     Returns tuple of (strategy_name, result_dataframe)
     """
-    name, instance = strategy_item
+    name, template = strategy_item
     try:
+        instance = bind_strategy(template, settings, fingerprint, primitives=primitives)
+        if selection is not None:
+            restrict_sub_strategies(instance, selection[name])
         result_df = instance.run_all_strategies(
             df,
             append=append,
@@ -33,8 +106,374 @@ def _run_single_strategy(strategy_item, df, append, ta_indicator_value, signal_s
         return name, pd.DataFrame()
 
 
-class AllStrategies:
-    def __init__(self, max_workers=4):
+"""THE THREAD POOL USED TO LET EVERY STRATEGY WRITE df[...] INTO THE CALLER'S FRAME AT THE SAME TIME AND
+CONCATENATED RESULTS IN WHATEVER ORDER THE FUTURES FINISHED. WORKERS NOW ALWAYS RUN WITH append=False AND
+ONLY RETURN THEIR RESULT COLUMNS; THE PARENT CONCATENATES THEM ONCE IN strategy_instances ORDER AND, WHEN
+append=True, ADDS THEM TO df IN A SINGLE ASSIGNMENT. IN 'process' MODE THE NUMERIC COLUMNS OF df ARE
+WRITTEN ONCE TO MEMORY-MAPPED .npy FILES THAT EVERY WORKER OPENS READ-ONLY, SO THE GIL-BOUND PANDAS WORK
+RUNS ON SEPARATE CORES WITHOUT PICKLING THE FRAME FOR EACH OF THE ~180 TASKS"""
+
+EXECUTION_MODES = ('thread', 'process')
+
+# Frame rebuilt from the memory-mapped columns once per worker process, its fingerprint and primitives
+_shared_frame = None
+_shared_fingerprint = None
+_shared_primitives = None
+
+
+def share_frame_columns(df, directory):
+    """Write the numeric columns of df to read-only .npy files and return the spec workers attach to"""
+    columns = []
+    for position, column in enumerate(df.columns):
+        values = df[column].to_numpy()
+        if values.dtype.kind not in 'iufb':
+            continue
+        path = os.path.join(directory, f"column_{position}.npy")
+        mapped = np.lib.format.open_memmap(path, mode='w+', dtype=values.dtype, shape=values.shape)
+        mapped[:] = values
+        mapped.flush()
+        del mapped
+        columns.append((column, path))
+    return {'columns': columns, 'index': df.index}
+
+
+def attach_shared_frame(spec):
+    """Rebuild a DataFrame over the memory-mapped columns without copying them"""
+    data = {column: pd.Series(np.load(path, mmap_mode='r'), index=spec['index'], copy=False)
+            for column, path in spec['columns']}
+    return pd.DataFrame(data, index=spec['index'], copy=False)
+
+
+def _init_shared_frame(spec):
+    """Process pool initializer: attach the shared OHLCV columns once per worker"""
+    global _shared_frame, _shared_fingerprint, _shared_primitives
+    _shared_frame = attach_shared_frame(spec)
+    _shared_fingerprint = spec['fingerprint']
+    # Each worker process computes a primitive the first time one of its strategies asks for it
+    _shared_primitives = PrimitiveStore(_shared_frame)
+
+
+def _run_shared_strategy(task):
+    """Run one strategy worker in a worker process against the shared read-only frame"""
+    worker, strategy_item, settings, args = task
+    # Strategies that stash helper columns write them into this shallow copy, never into the mapped arrays
+    return worker(strategy_item, _shared_frame.copy(deep=False), *args,
+                  settings=settings, fingerprint=_shared_fingerprint, primitives=_shared_primitives)
+
+
+def execute_strategies(worker, items, df, args, max_workers=4, mode='thread', strategy_settings_map=None,
+                       primitives=None):
+    """
+    Run worker(item, df, *args) for every (name, instance) item and return the outputs in registration order.
+    In 'thread' mode the primitives the strategies declare are planned and computed once into a PrimitiveStore
+    for df (pass one in to inspect its stats) that every working copy reads from.
+    """
+    if mode not in EXECUTION_MODES:
+        raise ValueError(f"Unknown execution mode '{mode}'. Use one of {EXECUTION_MODES}")
+    if strategy_settings_map is None:
+        strategy_settings_map = {name: strategy_settings(instance) for name, instance in items}
+    # Hashed once per run instead of once per strategy
+    fingerprint = data_fingerprint(df)
+
+    if mode == 'process':
+        with tempfile.TemporaryDirectory(prefix='shared_ohlcv_') as directory:
+            spec = share_frame_columns(df, directory)
+            spec['fingerprint'] = fingerprint
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_shared_frame,
+                                     initargs=(spec,)) as executor:
+                # map yields in submission order, so the column order never depends on scheduling
+                tasks = [(worker, item, strategy_settings_map[item[0]], args) for item in items]
+                return list(executor.map(_run_shared_strategy, tasks))
+
+    primitives = PrimitiveStore(df) if primitives is None else primitives
+    plan, demand = plan_primitives(instance for _, instance in items)
+    primitives.prepare(plan)
+    logger.debug(f"Shared primitives: {len(plan)} computed once for {sum(demand.values())} declarations")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(worker, item, df, *args, settings=strategy_settings_map[item[0]],
+                                   fingerprint=fingerprint, primitives=primitives)
+                   for item in items]
+        outputs = []
+        for (name, _), future in zip(items, futures):
+            try:
+                outputs.append(future.result())
+            except Exception as e:
+                logger.error(f"Strategy {name} generated an exception: {e}")
+                outputs.append((name, None))
+        return outputs
+
+
+def run_strategy_collection(strategy_instances, df, max_workers=4, mode='thread', append=True,
+                            ta_indicator_value=False, signal_score=True, signal_value=False,
+                            signal_explanation=False, strategy_settings_map=None, selection=None, primitives=None):
+    """Run every (selected) strategy instance and return ({name: result_df} in registration order, combined frame)"""
+    items = [(name, instance) for name, instance in strategy_instances.items() if selection is None or name in selection]
+    outputs = execute_strategies(
+        _run_single_strategy, items, df,
+        (False, ta_indicator_value, signal_score, signal_value, signal_explanation, selection),
+        max_workers=max_workers, mode=mode, strategy_settings_map=strategy_settings_map, primitives=primitives
+    )
+
+    results = {name: pd.DataFrame() if result is None else result for name, result in outputs}
+    valid_results = [result for result in results.values() if not result.empty]
+    combined = pd.concat(valid_results, axis=1) if valid_results else pd.DataFrame()
+
+    if append and not combined.empty:
+        # Later strategies win on a repeated column name, as they did when each wrote into df in turn
+        new_columns = combined.loc[:, ~combined.columns.duplicated(keep='last')]
+        with warnings.catch_warnings():
+            # df is extended in place for the caller, so the column-by-column insert warning is expected
+            warnings.simplefilter('ignore', pd.errors.PerformanceWarning)
+            df[list(new_columns.columns)] = new_columns
+    return results, combined
+
+
+"""run_strategy_collection RETURNS HUNDREDS OF int8 SCORE COLUMNS GLUED TOGETHER BY pd.concat UNDER LONG STRING
+NAMES. run_score_matrix IS THE COLUMNAR ALTERNATIVE: EACH WORKER CALLS THE SELECTED calculate_scores_<sub>_strategy
+METHODS DIRECTLY, WITHOUT BUILDING ANY PER-SUB-STRATEGY FRAME, AND RETURNS THEIR int8 ARRAYS (THE COLUMN NAME
+calculate_<sub>_values GIVES IS TAKEN FROM IT ONCE PER SETTINGS), AND THE PARENT COPIES THEM INTO ONE
+PREALLOCATED (bars x signals) int8 MATRIX. THE NAMES, CLASSES, SUB-STRATEGIES AND PARAMETERS LIVE IN A SEPARATE
+METADATA TABLE, ONE ROW PER MATRIX COLUMN, SO SCORING, VOTING OR ML CODE CAN USE THE MATRIX DIRECTLY"""
+
+SUB_STRATEGY_METHOD = re.compile(r'calculate_(\w+)_values')
+
+
+def sub_strategy_names(strategy_class):
+    """Sub-strategies of a strategy class (zero_cross, threshold, ...) in definition order"""
+    return [match.group(1) for match in map(SUB_STRATEGY_METHOD.fullmatch, vars(strategy_class)) if match]
+
+
+# Score column name of each (class, settings, sub-strategy); it depends on the settings only
+score_column_names = {}
+
+
+def sub_strategy_scores(instance, sub, df, settings):
+    """(column name, int8 scores) of one sub-strategy; the name comes from calculate_<sub>_values the first time
+    these settings are scored, with the computed scores handed back to it instead of being recomputed"""
+    method = f'calculate_scores_{sub}_strategy'
+    score = getattr(instance, method)(df)
+    key = (type(instance).__name__, settings_key(settings), sub)
+    name = score_column_names.get(key)
+    if name is None:
+        setattr(instance, method, lambda frame: score)
+        try:
+            frame = getattr(instance, f'calculate_{sub}_values')(df, append=False)
+        finally:
+            delattr(instance, method)
+        name = score_column_names[key] = frame.columns[0]
+    return name, score.to_numpy(dtype=np.int8)
+
+
+def strategy_params(settings):
+    """Plain constructor parameters of a strategy (memo attributes that start as None are left out)"""
+    return {name: value for name, value in settings.items() if isinstance(value, SETTING_TYPES) and value is not None}
+
+
+def _run_single_scores(strategy_item, df, selection=None, settings=None, fingerprint=None, primitives=None):
+    """
+    Run one strategy for its (selected) signal scores only.
+    Returns tuple of (strategy_name, [(column_name, int8 scores, sub_strategy), ...])
+    """
+    name, template = strategy_item
+    try:
+        settings = strategy_settings(template) if settings is None else settings
+        instance = bind_strategy(template, settings, fingerprint, primitives=primitives)
+        subs = active_sub_strategies(type(template)) if selection is None else selection[name]
+        return name, [(*sub_strategy_scores(instance, sub, df, settings), sub) for sub in subs]
+    except Exception as e:
+        logger.error(f"Error running strategy {name}: {e}")
+        return name, []
+
+
+def run_score_matrix(strategy_instances, df, max_workers=4, mode='thread', strategy_settings_map=None, selection=None,
+                     primitives=None):
+    """Run every (selected) strategy instance and return (int8 score matrix of shape (bars, signals), column metadata)"""
+    items = [(name, instance) for name, instance in strategy_instances.items() if selection is None or name in selection]
+    if strategy_settings_map is None:
+        strategy_settings_map = {name: strategy_settings(instance) for name, instance in items}
+    outputs = execute_strategies(_run_single_scores, items, df, (selection,), max_workers=max_workers, mode=mode,
+                                 strategy_settings_map=strategy_settings_map, primitives=primitives)
+
+    signals = [(name, column, sub, values) for name, result in outputs for column, values, sub in result or ()]
+    scores = np.empty((len(df), len(signals)), dtype=np.int8)
+    for position, (_, _, _, values) in enumerate(signals):
+        scores[:, position] = values
+    metadata = pd.DataFrame({
+        'column': [column for _, column, _, _ in signals],
+        'strategy': [name for name, _, _, _ in signals],
+        'sub_strategy': [sub for _, _, sub, _ in signals],
+        'params': [strategy_params(strategy_settings_map[name]) for name, _, _, _ in signals]
+    })
+    return scores, metadata
+
+
+"""EVERY RUNNER USED TO BUILD AND RUN ALL OF ITS CLASSES AND EVERY SUB-STRATEGY OF EACH (ZERO CROSS, THRESHOLD,
+SLOPE, ...). select_strategies TURNS include / exclude PATTERNS (fnmatch GLOBS ON CLASS NAMES), CATEGORIES AND
+SUB-STRATEGY PATTERNS INTO A {class name: selected sub-strategies} PLAN. CLASSES OUTSIDE THE PLAN ARE NEVER RUN,
+AND IN THE WORKING COPY OF A SELECTED CLASS EVERY UNSELECTED calculate_<sub>_values RETURNS AN EMPTY FRAME, SO
+ITS compute_values ONLY RUNS WHEN A SELECTED SIGNAL ASKS FOR THE INDICATOR. THE REPORT COUNTS WHAT WAS SKIPPED"""
+
+
+def active_sub_strategies(strategy_class):
+    """Sub-strategies the class's own run_all_strategies actually calls"""
+    called = inspect.unwrap(strategy_class.run_all_strategies).__code__.co_names
+    return [sub for sub in sub_strategy_names(strategy_class) if f'calculate_{sub}_values' in called]
+
+
+def as_patterns(patterns):
+    """Accept one pattern or a list of them"""
+    return [patterns] if isinstance(patterns, str) else list(patterns)
+
+
+def matching(names, patterns):
+    """Names matching any of the glob patterns, in their original order"""
+    return [name for name in names if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)]
+
+
+@functools.lru_cache(maxsize=None)
+def strategy_categories():
+    """{category: frozenset of class names} taken from the category runners"""
+    return {category: frozenset(runner(max_workers=1).strategy_instances)
+            for category, runner in CATEGORY_RUNNERS.items()}
+
+
+def select_strategies(strategy_instances, include=None, exclude=None, categories=None, sub_strategies=None):
+    """
+    Plan a filtered run. Returns (selection, report): selection maps each class name that will run to the
+    tuple of its selected sub-strategies (in registration order); report counts the skipped classes and
+    sub-strategies. include / exclude are class names or glob patterns, categories are keys of
+    CATEGORY_RUNNERS and sub_strategies are sub-strategy names or glob patterns (e.g. 'threshold', '*cross*').
+    """
+    names = list(strategy_instances)
+    selected = names
+    if include is not None:
+        for pattern in as_patterns(include):
+            if not matching(names, [pattern]):
+                raise ValueError(f"No strategy matches '{pattern}'")
+        selected = matching(selected, as_patterns(include))
+    if categories is not None:
+        known = strategy_categories()
+        for category in as_patterns(categories):
+            if category not in known:
+                raise ValueError(f"Unknown strategy category '{category}'. Use one of {tuple(known)}")
+        wanted = set().union(*(known[category] for category in as_patterns(categories)))
+        selected = [name for name in selected if name in wanted]
+    if exclude is not None:
+        excluded = set(matching(selected, as_patterns(exclude)))
+        selected = [name for name in selected if name not in excluded]
+
+    available = {name: active_sub_strategies(type(strategy_instances[name])) for name in names}
+    selection = {}
+    for name in selected:
+        subs = available[name] if sub_strategies is None else matching(available[name], as_patterns(sub_strategies))
+        if subs:
+            selection[name] = tuple(subs)
+    if sub_strategies is not None:
+        for pattern in as_patterns(sub_strategies):
+            if not any(matching(available[name], [pattern]) for name in selected):
+                raise ValueError(f"No selected strategy has a sub-strategy matching '{pattern}'")
+
+    skipped = {name: [sub for sub in subs if sub not in selection.get(name, ())]
+               for name, subs in available.items()}
+    total = sum(len(subs) for subs in available.values())
+    run = sum(len(subs) for subs in selection.values())
+    report = {
+        'strategies': len(selection),
+        'strategies_skipped': len(names) - len(selection),
+        'sub_strategies': run,
+        'sub_strategies_skipped': total - run,
+        'skipped_fraction': (total - run) / total if total else 0.0,
+        'skipped': {name: subs for name, subs in skipped.items() if subs}
+    }
+    return selection, report
+
+
+def log_selection(report):
+    """Log how much work a selection skips"""
+    logger.info(f"Selection runs {report['sub_strategies']} sub-strategies in {report['strategies']} strategies, "
+                f"skipping {report['strategies_skipped']} strategies and {report['sub_strategies_skipped']} "
+                f"sub-strategies ({report['skipped_fraction']:.0%} of the signals)")
+
+
+def restrict_sub_strategies(instance, selected):
+    """Make every unselected calculate_<sub>_values of a working copy return an empty frame without computing"""
+    for sub in sub_strategy_names(type(instance)):
+        if sub not in selected:
+            setattr(instance, f'calculate_{sub}_values', lambda *args, **kwargs: pd.DataFrame())
+
+
+class StrategyRunner:
+    """Runs a list of strategy classes in parallel; the runners below only choose the classes"""
+    label = ''  # category word in the log messages, e.g. 'trend '
+
+    def __init__(self, strategy_classes, max_workers=4, mode='thread'):
+        # Instantiate each strategy and store the instance in a dictionary
+        self.strategy_instances = {}
+        for cls in strategy_classes:
+            self.strategy_instances[cls.__name__] = cls()
+        # Settings are captured before any run, so the instances act as read-only templates
+        self.strategy_settings = {name: strategy_settings(instance) for name, instance in self.strategy_instances.items()}
+
+        # Set max_workers and pool type ('thread' or 'process') for parallel processing
+        self.max_workers = max_workers
+        self.mode = mode
+        # Skipped-work report of the last filtered run (None when nothing was filtered)
+        self.selection_report = None
+
+    def run_all_strategies(self, df, append=True, ta_indicator_value=False, 
+                           signal_score=True, signal_value=False, signal_explanation=False,
+                           include=None, exclude=None, categories=None, sub_strategies=None):
+        """
+        Runs the `run_all_strategies` method for each strategy instance using the provided DataFrame in parallel.
+        The results are stored as attributes (e.g., AberrationStrategies_df) and then concatenated
+        horizontally into one DataFrame, always in the order the strategies are listed.
+        include / exclude / categories / sub_strategies restrict the run (see select_strategies); what the
+        filter skipped is kept in self.selection_report.
+        """
+        selection = self.select(include, exclude, categories, sub_strategies)
+        logger.info(f"Running {len(self.strategy_instances) if selection is None else len(selection)} {self.label}strategies in parallel with {self.max_workers} {self.mode} workers")
+
+        results, combined = run_strategy_collection(
+            self.strategy_instances, df, max_workers=self.max_workers, mode=self.mode, append=append,
+            ta_indicator_value=ta_indicator_value, signal_score=signal_score,
+            signal_value=signal_value, signal_explanation=signal_explanation,
+            strategy_settings_map=self.strategy_settings, selection=selection
+        )
+        for name, result_df in results.items():
+            setattr(self, f"{name}_df", result_df)
+
+        logger.info(f"Completed all {len(results)} {self.label}strategies")
+
+        if combined.empty:
+            logger.warning(f"No valid {self.label}strategy results to concatenate")
+        return combined
+
+    def run_score_matrix(self, df, include=None, exclude=None, categories=None, sub_strategies=None):
+        """
+        Columnar alternative to run_all_strategies: returns (scores, metadata), where scores is a contiguous
+        int8 array of shape (bars, signals) and metadata has one row per score column with its column name,
+        strategy class, sub-strategy and parameters. Nothing is appended to df and no frames are concatenated.
+        """
+        selection = self.select(include, exclude, categories, sub_strategies)
+        logger.info(f"Scoring {len(self.strategy_instances) if selection is None else len(selection)} strategies "
+                    f"with {self.max_workers} {self.mode} workers")
+        return run_score_matrix(self.strategy_instances, df, max_workers=self.max_workers, mode=self.mode,
+                                strategy_settings_map=self.strategy_settings, selection=selection)
+
+    def select(self, include=None, exclude=None, categories=None, sub_strategies=None):
+        """Selection plan for a filtered run (None when nothing is filtered); the report goes to self.selection_report"""
+        if include is None and exclude is None and categories is None and sub_strategies is None:
+            self.selection_report = None
+            return None
+        selection, self.selection_report = select_strategies(self.strategy_instances, include, exclude,
+                                                             categories, sub_strategies)
+        log_selection(self.selection_report)
+        return selection
+
+
+class AllStrategies(StrategyRunner):
+    def __init__(self, max_workers=4, mode='thread'):
         # List all strategy classes
         strategy_classes = [
             AberrationStrategies,
@@ -215,62 +654,13 @@ class AllStrategies:
             ZeroLagExponentialMovingAverageStrategies,
             ZeroLagSimpleMovingAverageStrategies,
         ]
-        # Instantiate each strategy and store the instance in a dictionary
-        self.strategy_instances = {}
-        for cls in strategy_classes:
-            self.strategy_instances[cls.__name__] = cls()
-        
-        # Set max_workers for parallel processing
-        self.max_workers = max_workers
+        super().__init__(strategy_classes, max_workers, mode)
 
-    def run_all_strategies(self, df, append=True, ta_indicator_value=False, 
-                           signal_score=True, signal_value=False, signal_explanation=False):
-        """
-        Runs the `run_all_strategies` method for each strategy instance using the provided DataFrame in parallel.
-        The results are stored as attributes (e.g., AberrationStrategies_df) and then concatenated
-        horizontally into one DataFrame.
-        """
-        results = {}
-        
-        logger.info(f"Running {len(self.strategy_instances)} strategies in parallel with {self.max_workers} workers")
-        
-        # Use ThreadPoolExecutor for parallel execution
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all strategy tasks
-            future_to_strategy = {
-                executor.submit(
-                    _run_single_strategy, 
-                    (name, instance), 
-                    df, append, ta_indicator_value, signal_score, signal_value, signal_explanation
-                ): name for name, instance in self.strategy_instances.items()
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_strategy):
-                try:
-                    name, result_df = future.result()
-                    results[name] = result_df
-                    setattr(self, f"{name}_df", result_df)
-                    logger.debug(f"Completed strategy: {name}")
-                except Exception as e:
-                    strategy_name = future_to_strategy[future]
-                    logger.error(f"Strategy {strategy_name} generated an exception: {e}")
-                    results[strategy_name] = pd.DataFrame()
-                    setattr(self, f"{strategy_name}_df", pd.DataFrame())
-        
-        logger.info(f"Completed all {len(results)} strategies")
-        
-        # Filter out empty DataFrames before concatenation
-        valid_results = [df for df in results.values() if not df.empty]
-        
-        if valid_results:
-            return pd.concat(valid_results, axis=1)
-        else:
-            logger.warning("No valid strategy results to concatenate")
-            return pd.DataFrame()
-
-class AllTrendStrategies:
-    def __init__(self, max_workers=4):
+
+class AllTrendStrategies(StrategyRunner):
+    label = 'trend '
+
+    def __init__(self, max_workers=4, mode='thread'):
         # List all strategy classes (assumed imported/defined elsewhere)
         trend_strategies = [
             AdaptivePriceZoneStrategies,
@@ -353,62 +743,13 @@ class AllTrendStrategies:
             ZeroLagExponentialMovingAverageStrategies,
             ZeroLagSimpleMovingAverageStrategies,
         ]
-        # Instantiate each strategy and store the instance in a dictionary
-        self.strategy_instances = {}
-        for cls in trend_strategies:
-            self.strategy_instances[cls.__name__] = cls()
-        
-        # Set max_workers for parallel processing
-        self.max_workers = max_workers
+        super().__init__(trend_strategies, max_workers, mode)
 
-    def run_all_strategies(self, df, append=True, ta_indicator_value=False, 
-                           signal_score=True, signal_value=False, signal_explanation=False):
-        """
-        Runs the `run_all_strategies` method for each strategy instance using the provided DataFrame in parallel.
-        The results are stored as attributes (e.g., AberrationStrategies_df) and then concatenated
-        horizontally into one DataFrame.
-        """
-        results = {}
-        
-        logger.info(f"Running {len(self.strategy_instances)} trend strategies in parallel with {self.max_workers} workers")
-        
-        # Use ThreadPoolExecutor for parallel execution
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all strategy tasks
-            future_to_strategy = {
-                executor.submit(
-                    _run_single_strategy, 
-                    (name, instance), 
-                    df, append, ta_indicator_value, signal_score, signal_value, signal_explanation
-                ): name for name, instance in self.strategy_instances.items()
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_strategy):
-                try:
-                    name, result_df = future.result()
-                    results[name] = result_df
-                    setattr(self, f"{name}_df", result_df)
-                    logger.debug(f"Completed trend strategy: {name}")
-                except Exception as e:
-                    strategy_name = future_to_strategy[future]
-                    logger.error(f"Trend strategy {strategy_name} generated an exception: {e}")
-                    results[strategy_name] = pd.DataFrame()
-                    setattr(self, f"{strategy_name}_df", pd.DataFrame())
-        
-        logger.info(f"Completed all {len(results)} trend strategies")
-        
-        # Filter out empty DataFrames before concatenation
-        valid_results = [df for df in results.values() if not df.empty]
-        
-        if valid_results:
-            return pd.concat(valid_results, axis=1)
-        else:
-            logger.warning("No valid trend strategy results to concatenate")
-            return pd.DataFrame()
-
-class AllMomentumStrategies:
-    def __init__(self, max_workers=4):
+
+class AllMomentumStrategies(StrategyRunner):
+    label = 'momentum '
+
+    def __init__(self, max_workers=4, mode='thread'):
         # List all strategy classes (assumed imported/defined elsewhere)
         momentum_strategies = [
             AbsolutePriceOscillatorStrategies,
@@ -457,62 +798,13 @@ class AllMomentumStrategies:
             WaveTrendOscillatorStrategies,
             WilliamsRStrategies,
         ]
-        # Instantiate each strategy and store the instance in a dictionary
-        self.strategy_instances = {}
-        for cls in momentum_strategies:
-            self.strategy_instances[cls.__name__] = cls()
-        
-        # Set max_workers for parallel processing
-        self.max_workers = max_workers
+        super().__init__(momentum_strategies, max_workers, mode)
 
-    def run_all_strategies(self, df, append=True, ta_indicator_value=False, 
-                           signal_score=True, signal_value=False, signal_explanation=False):
-        """
-        Runs the `run_all_strategies` method for each strategy instance using the provided DataFrame in parallel.
-        The results are stored as attributes (e.g., AberrationStrategies_df) and then concatenated
-        horizontally into one DataFrame.
-        """
-        results = {}
-        
-        logger.info(f"Running {len(self.strategy_instances)} momentum strategies in parallel with {self.max_workers} workers")
-        
-        # Use ThreadPoolExecutor for parallel execution
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all strategy tasks
-            future_to_strategy = {
-                executor.submit(
-                    _run_single_strategy, 
-                    (name, instance), 
-                    df, append, ta_indicator_value, signal_score, signal_value, signal_explanation
-                ): name for name, instance in self.strategy_instances.items()
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_strategy):
-                try:
-                    name, result_df = future.result()
-                    results[name] = result_df
-                    setattr(self, f"{name}_df", result_df)
-                    logger.debug(f"Completed momentum strategy: {name}")
-                except Exception as e:
-                    strategy_name = future_to_strategy[future]
-                    logger.error(f"Momentum strategy {strategy_name} generated an exception: {e}")
-                    results[strategy_name] = pd.DataFrame()
-                    setattr(self, f"{strategy_name}_df", pd.DataFrame())
-        
-        logger.info(f"Completed all {len(results)} momentum strategies")
-        
-        # Filter out empty DataFrames before concatenation
-        valid_results = [df for df in results.values() if not df.empty]
-        
-        if valid_results:
-            return pd.concat(valid_results, axis=1)
-        else:
-            logger.warning("No valid momentum strategy results to concatenate")
-            return pd.DataFrame()
-
-class AllVolatilityStrategies:
-    def __init__(self, max_workers=4):
+
+class AllVolatilityStrategies(StrategyRunner):
+    label = 'volatility '
+
+    def __init__(self, max_workers=4, mode='thread'):
         # List all strategy classes (assumed imported/defined elsewhere)
         volatility_strategies = [
             AccelerationBandsStrategies,
@@ -536,62 +828,13 @@ class AllVolatilityStrategies:
             VarianceStrategies,
             PriceDistanceStrategies,
         ]
-        # Instantiate each strategy and store the instance in a dictionary
-        self.strategy_instances = {}
-        for cls in volatility_strategies:
-            self.strategy_instances[cls.__name__] = cls()
-        
-        # Set max_workers for parallel processing
-        self.max_workers = max_workers
+        super().__init__(volatility_strategies, max_workers, mode)
 
-    def run_all_strategies(self, df, append=True, ta_indicator_value=False, 
-                           signal_score=True, signal_value=False, signal_explanation=False):
-        """
-        Runs the `run_all_strategies` method for each strategy instance using the provided DataFrame in parallel.
-        The results are stored as attributes (e.g., AberrationStrategies_df) and then concatenated
-        horizontally into one DataFrame.
-        """
-        results = {}
-        
-        logger.info(f"Running {len(self.strategy_instances)} volatility strategies in parallel with {self.max_workers} workers")
-        
-        # Use ThreadPoolExecutor for parallel execution
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all strategy tasks
-            future_to_strategy = {
-                executor.submit(
-                    _run_single_strategy, 
-                    (name, instance), 
-                    df, append, ta_indicator_value, signal_score, signal_value, signal_explanation
-                ): name for name, instance in self.strategy_instances.items()
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_strategy):
-                try:
-                    name, result_df = future.result()
-                    results[name] = result_df
-                    setattr(self, f"{name}_df", result_df)
-                    logger.debug(f"Completed volatility strategy: {name}")
-                except Exception as e:
-                    strategy_name = future_to_strategy[future]
-                    logger.error(f"Volatility strategy {strategy_name} generated an exception: {e}")
-                    results[strategy_name] = pd.DataFrame()
-                    setattr(self, f"{strategy_name}_df", pd.DataFrame())
-        
-        logger.info(f"Completed all {len(results)} volatility strategies")
-        
-        # Filter out empty DataFrames before concatenation
-        valid_results = [df for df in results.values() if not df.empty]
-        
-        if valid_results:
-            return pd.concat(valid_results, axis=1)
-        else:
-            logger.warning("No valid volatility strategy results to concatenate")
-            return pd.DataFrame()
-
-class AllVolumeStrategies:
-    def __init__(self, max_workers=4):
+
+class AllVolumeStrategies(StrategyRunner):
+    label = 'volume '
+
+    def __init__(self, max_workers=4, mode='thread'):
         # List all strategy classes (assumed imported/defined elsewhere)
         volume_strategies = [
             AccumulationDistributionLineStrategies,
@@ -622,56 +865,13 @@ class AllVolumeStrategies:
             VolumeWeightedMACDStrategies,
             WeightedOnBalanceVolumeStrategies,
         ]
-        # Instantiate each strategy and store the instance in a dictionary
-        self.strategy_instances = {}
-        for cls in volume_strategies:
-            self.strategy_instances[cls.__name__] = cls()
-        
-        # Set max_workers for parallel processing
-        self.max_workers = max_workers
+        super().__init__(volume_strategies, max_workers, mode)
 
-    def run_all_strategies(self, df, append=True, ta_indicator_value=False, 
-                           signal_score=True, signal_value=False, signal_explanation=False):
-        """
-        Runs the `run_all_strategies` method for each strategy instance using the provided DataFrame in parallel.
-        The results are stored as attributes (e.g., AberrationStrategies_df) and then concatenated
-        horizontally into one DataFrame.
-        """
-        results = {}
-        
-        logger.info(f"Running {len(self.strategy_instances)} volume strategies in parallel with {self.max_workers} workers")
-        
-        # Use ThreadPoolExecutor for parallel execution
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all strategy tasks
-            future_to_strategy = {
-                executor.submit(
-                    _run_single_strategy, 
-                    (name, instance), 
-                    df, append, ta_indicator_value, signal_score, signal_value, signal_explanation
-                ): name for name, instance in self.strategy_instances.items()
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_strategy):
-                try:
-                    name, result_df = future.result()
-                    results[name] = result_df
-                    setattr(self, f"{name}_df", result_df)
-                    logger.debug(f"Completed volume strategy: {name}")
-                except Exception as e:
-                    strategy_name = future_to_strategy[future]
-                    logger.error(f"Volume strategy {strategy_name} generated an exception: {e}")
-                    results[strategy_name] = pd.DataFrame()
-                    setattr(self, f"{strategy_name}_df", pd.DataFrame())
-        
-        logger.info(f"Completed all {len(results)} volume strategies")
-        
-        # Filter out empty DataFrames before concatenation
-        valid_results = [df for df in results.values() if not df.empty]
-        
-        if valid_results:
-            return pd.concat(valid_results, axis=1)
-        else:
-            logger.warning("No valid volume strategy results to concatenate")
-            return pd.DataFrame()
\ No newline at end of file
+
+# Category runners behind select_strategies(categories=...)
+CATEGORY_RUNNERS = {
+    'trend': AllTrendStrategies,
+    'momentum': AllMomentumStrategies,
+    'volatility': AllVolatilityStrategies,
+    'volume': AllVolumeStrategies
+}